@@ -0,0 +1,57 @@
+"""요리 API 입장 우선순위
+
+입장 제어는 의도 분류(LLM 호출) 전에 결정해야 하므로, classify_intent 프롬프트의
+키워드 기준으로 쿼리의 처리 비용을 대략 추정합니다.
+
+    cheap      질문 답변 (question) - LLM 1회, 이미지 없음
+    standard   음식 추천 / 단일 레시피 (+ 이미지 1장)
+    expensive  복수 레시피 (요리 수만큼 LLM 생성 + 이미지)
+
+우선순위(작을수록 먼저) = 비용 순위 + (익명 사용자면 ANONYMOUS_PENALTY)
+→ 인증 사용자의 질문이 가장 먼저, 익명 사용자의 복수 레시피가 가장 나중에 입장합니다.
+"""
+import re
+from typing import Optional, Tuple
+
+# classify_intent 프롬프트의 키워드 기준과 동일
+_RECIPE_KEYWORDS = ("만드는 법", "레시피", "어떻게 만들어", "조리법", "요리법")
+_RECOMMEND_KEYWORDS = ("추천", "뭐 먹을까", "메뉴 제안", "어떤 음식", "소개")
+_QUESTION_KEYWORDS = ("칼로리", "영양", "얼마나", "?", "뭐야", "차이")
+
+# 여러 요리를 나열한 레시피 요청 (예: "김치찌개, 된장찌개 레시피", "불고기랑 잡채 만드는 법", "레시피 3개")
+_MULTIPLE_DISHES = re.compile(r",|、|\S(?:와|과|랑|하고|이랑) \S|그리고|\d+\s*(?:개|가지)")
+
+COST_RANK = {"cheap": 0, "standard": 1, "expensive": 2}
+ANONYMOUS_PENALTY = 2
+
+
+def estimate_cost(query: str) -> str:
+    """쿼리 처리 비용 등급 추정
+
+    Args:
+        query: 사용자 쿼리
+
+    Returns:
+        str: "cheap" | "standard" | "expensive"
+    """
+    if any(k in query for k in _RECIPE_KEYWORDS):
+        return "expensive" if _MULTIPLE_DISHES.search(query) else "standard"
+    if any(k in query for k in _RECOMMEND_KEYWORDS):
+        return "standard"
+    if any(k in query for k in _QUESTION_KEYWORDS):
+        return "cheap"
+    return "standard"  # 분류 기준에 없으면 레시피 생성으로 처리됨
+
+
+def admission_priority(query: str, user_id: Optional[str]) -> Tuple[int, str]:
+    """입장 우선순위와 비용 등급
+
+    Args:
+        query: 사용자 쿼리
+        user_id: 사용자 ID (None이면 익명)
+
+    Returns:
+        (priority, cost): 예) ("김치찌개 칼로리는?", "user1") → (0, "cheap")
+    """
+    cost = estimate_cost(query)
+    return COST_RANK[cost] + (0 if user_id else ANONYMOUS_PENALTY), cost
@@ -1,17 +1,83 @@
-from fastapi import APIRouter, Depends
-from typing import Optional
-from app.cooking_assistant.models.schemas import CookingRequest, CookingResponse
-from app.core.dependencies import get_optional_user
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from typing import AsyncIterator, Dict, List, Optional
+from app.cooking_assistant.api.admission import admission_priority
+from app.cooking_assistant.models.schemas import (
+    CookingBatchItem, CookingBatchRequest, CookingRequest, CookingResponse, ErrorResponse, JobResponse
+)
+from app.cooking_assistant.models.response_codes import ResponseCode
+from app.core.admission import AdmissionRejectedError, get_admission_controller
+from app.core.dependencies import get_optional_user, get_request_deadline, is_admin
+from app.core.deadline import Deadline
+from app.core.disconnect import cancel_on_disconnect, ClientDisconnectedError
+from app.core.config import get_settings
 from app.cooking_assistant.services.cooking_service import CookingService
 from app.core.decorators import get_dependency
+from app.core.health import get_health_monitor, register_health_check
+from app.core.job_queue import Job, JobQueue
+from app.core.metrics import counter, gauge, histogram
+from app.core.tracing import get_tracer, parse_traceparent
+from app.core.server_timing import ServerTiming, server_timing_scope
+from app.core.profiling import get_request_profiler
+from app.core.structured_logging import current_request_id
+import asyncio
+import logging
+import math
+import time
 
 router = APIRouter()
+logger = logging.getLogger(__name__)
+tracer = get_tracer(__name__)
+
+_request_duration = histogram(
+    "cooking_request_duration_seconds",
+    "요리 API 요청 처리 시간 (의도, 응답 코드별)",
+    ["intent", "code"]
+)
+_requests_in_flight = gauge(
+    "cooking_requests_in_flight",
+    "처리 중인 요리 API 요청 수"
+).labels()
+
+_batch_queries = counter(
+    "cooking_batch_queries_total",
+    "일괄 요청 쿼리 수 (executed: 실행, deduplicated: 같은 배치의 동일 쿼리 결과 공유)",
+    ["result"]
+)
+_batch_executed = _batch_queries.labels("executed")
+_batch_deduplicated = _batch_queries.labels("deduplicated")
+
+register_health_check("requests", lambda: {"in_flight": int(_requests_in_flight.value)})
+
+
+def _check_admission() -> dict:
+    """대기열이 가득 차면 degraded (로드 밸런서가 다른 워커로 보내도록)"""
+    admission = get_admission_controller()
+    snapshot = admission.snapshot()
+    if admission.enabled and snapshot["queued"] >= admission.max_queue:
+        snapshot["status"] = "degraded"
+    return snapshot
+
+
+register_health_check("admission", _check_admission)
+
+
+def _overloaded_response(e: AdmissionRejectedError) -> ErrorResponse:
+    """입장 거절 에러 응답 (단건: 503 본문, 일괄: 해당 줄)"""
+    retry_after = math.ceil(e.retry_after)
+    return ErrorResponse(
+        code=ResponseCode.SERVER_OVERLOADED,
+        message=f"요청이 많아 처리할 수 없습니다. {retry_after}초 후 다시 시도하세요",
+        data={"reason": e.reason, "retry_after": retry_after}
+    )
 
 
 @router.post("/cooking", response_model=CookingResponse)
 async def handle_cooking_query(
     request: CookingRequest,
+    http_request: Request,
     user_id: Optional[str] = Depends(get_optional_user),
+    deadline: Deadline = Depends(get_request_deadline),
     service: CookingService = Depends(get_dependency(CookingService))
 ):
     """
@@ -31,6 +97,9 @@ async def handle_cooking_query(
         user_id: 사용자 ID (선택적 인증)
             - Authorization 헤더의 Bearer 토큰에서 추출
             - 토큰이 없으면 None (익명 사용자)
+        deadline: 요청 처리 기한
+            - X-Request-Deadline 헤더(초)로 지정 가능
+            - 기한이 부족하면 이미지/부가 의도를 생략한 부분 응답 반환
         service: CookingService (Service Layer)
             - 비즈니스 로직 조합 및 DTO 변환 담당
             - Workflow/Repository/API 호출 가능
@@ -47,12 +116,272 @@ async def handle_cooking_query(
         - 토큰이 있으면 user_id를 Service에 전달하여 개인화 가능
         - Service가 모든 비즈니스 로직 및 DTO 변환을 처리
         - Service는 AI Workflow 외에도 DB 조회, 외부 API 호출 가능
+        - 클라이언트가 연결을 끊으면 진행 중인 Workflow(LLM/이미지 호출)를 취소
+        - 입장 제어: 동시 실행 수를 넘으면 우선순위 대기열에서 대기
+          (인증 사용자 / 질문처럼 가벼운 쿼리 우선, 익명 복수 레시피가 가장 나중)
+          기한 안에 처리할 수 없으면 503 + Retry-After (SERVER_OVERLOADED)
+        - Server-Timing 헤더로 구간별 소요 시간 제공
+          (queue, classify, generate, recommend, answer, image, dto, serialize, total)
+        - 프로파일링이 켜져 있으면 일부 요청을 샘플링하여 프로파일 수집
+          (관리자는 X-Profile: 1 헤더로 강제 가능, 결과는 /api/admin/profiles)
+    """
+    intent, code = "unknown", ResponseCode.INTERNAL_ERROR
+    settings = get_settings()
+    timing = ServerTiming()
+    profiler = get_request_profiler()
+    force_profile = (
+        http_request.headers.get(settings.profiling_header) == "1" and is_admin(user_id)
+    )
+    capture = profiler.start(request.query, user_id=user_id, force=force_profile)
+    admission = get_admission_controller()
+    priority, cost = admission_priority(request.query, user_id)
+    _requests_in_flight.inc()
+    start = time.perf_counter()
+
+    with tracer.start_as_current_span(
+        "POST /api/cooking",
+        attributes={
+            "http.method": "POST",
+            "http.route": "/api/cooking",
+            "user.authenticated": user_id is not None,
+            "admission.priority": priority,
+            "request.id": current_request_id(),
+        },
+        parent=parse_traceparent(http_request.headers.get("traceparent"))
+    ) as span:
+        async def admitted_query():
+            # 입장 대기 → Service 실행 (Workflow → DTO 변환 포함, user_id/deadline 전달)
+            async with admission.admit(priority, cost=cost, deadline=deadline) as waited:
+                timing.add("queue", waited)
+                return await service.process_cooking_query(
+                    request.query,
+                    user_id=user_id,
+                    deadline=deadline
+                )
+
+        try:
+            with server_timing_scope(timing):
+                response = await cancel_on_disconnect(
+                    http_request,
+                    admitted_query(),
+                    poll_interval=settings.disconnect_poll_interval
+                )
+            intent, code = response.intent or "unknown", response.code
+
+            # 직접 직렬화하여 직렬화 시간도 Server-Timing에 포함
+            with timing.measure("serialize"):
+                body = response.model_dump_json()
+            timing.add("total", time.perf_counter() - start)
+
+            headers = {"Server-Timing": timing.to_header()} if settings.server_timing_enabled else None
+            return Response(content=body, media_type="application/json", headers=headers)
+        except AdmissionRejectedError as e:
+            # 기한 안에 처리할 수 없으므로 업스트림 호출 없이 즉시 거절
+            code = ResponseCode.SERVER_OVERLOADED
+            span.set_attribute("admission.rejected", e.reason)
+            return Response(
+                content=_overloaded_response(e).model_dump_json(),
+                status_code=503,
+                media_type="application/json",
+                headers={"Retry-After": str(math.ceil(e.retry_after))}
+            )
+        except ClientDisconnectedError:
+            # 클라이언트가 이미 떠났으므로 본문 없이 종료 (499: Client Closed Request)
+            code = ResponseCode.CLIENT_DISCONNECTED
+            return Response(status_code=499)
+        finally:
+            _requests_in_flight.dec()
+            _request_duration.labels(intent, code).observe(time.perf_counter() - start)
+            span.set_attributes({"intent": intent, "response.code": code})
+            if capture is not None:
+                profile = profiler.finish(capture, intent=intent, timings=timing.to_dict())
+                span.set_attribute("profile.id", profile.id)
+
+
+@router.post("/cooking/batch")
+async def handle_cooking_batch(
+    batch: CookingBatchRequest,
+    user_id: Optional[str] = Depends(get_optional_user),
+    deadline: Deadline = Depends(get_request_deadline),
+    service: CookingService = Depends(get_dependency(CookingService))
+):
+    """
+    요리 AI 어시스턴트 일괄 API (NDJSON 스트리밍)
+
+    식단 계획처럼 여러 쿼리를 한 번의 HTTP 요청으로 처리합니다.
+    쿼리들은 batch_concurrency개씩 동시에 실행되며, 결과는 끝나는 순서대로
+    한 줄씩 전송됩니다. (application/x-ndjson, 줄마다 CookingBatchItem)
+
+        {"index": 2, "response": {"status": "success", "code": "QUESTION_ANSWERED", ...}}
+        {"index": 0, "response": {"status": "success", "code": "RECIPE_CREATED", ...}}
+
+    Args:
+        batch: 일괄 요청
+            - requests: CookingRequest 목록 (최대 batch_max_size개, 초과 시 422)
+        user_id: 사용자 ID (선택적 인증, 모든 쿼리에 적용)
+        deadline: 요청 처리 기한 (배치 전체에 공유)
+        service: CookingService (Service Layer)
+
+    Returns:
+        StreamingResponse: 완료 순서의 CookingBatchItem NDJSON
+
+    Note:
+        - 같은 배치 안의 동일 쿼리(공백 정규화 후 완전 일치)는 한 번만 실행하고 결과를 공유
+          (배치 안에서만 중복 제거, 다른 요청/배치에서 처리 중인 같은 쿼리와는 합치지 않음)
+        - 쿼리마다 입장 제어를 거치므로 과부하 시 해당 줄만 SERVER_OVERLOADED 에러 응답
+        - 쿼리 하나가 실패해도 나머지 결과는 계속 전송
+        - 클라이언트가 연결을 끊으면 남은 쿼리의 Workflow를 모두 취소
     """
-    # Service 실행 (Workflow → DTO 변환 포함, user_id 전달)
-    return await service.process_cooking_query(request.query, user_id=user_id)
+    settings = get_settings()
+    if len(batch.requests) > settings.batch_max_size:
+        raise HTTPException(
+            status_code=422,
+            detail=f"한 번에 최대 {settings.batch_max_size}개까지 요청할 수 있습니다"
+        )
+
+    # 정규화한 쿼리 → 요청 위치 목록 (동일 쿼리는 한 번만 실행)
+    indices: Dict[str, List[int]] = {}
+    for index, item in enumerate(batch.requests):
+        indices.setdefault(" ".join(item.query.split()), []).append(index)
+    _batch_executed.inc(len(indices))
+    _batch_deduplicated.inc(len(batch.requests) - len(indices))
+
+    return StreamingResponse(
+        _stream_batch(indices, service, user_id, deadline, settings.batch_concurrency),
+        media_type="application/x-ndjson"
+    )
+
+
+async def _stream_batch(
+    indices: Dict[str, List[int]],
+    service: CookingService,
+    user_id: Optional[str],
+    deadline: Deadline,
+    concurrency: int
+) -> AsyncIterator[str]:
+    """쿼리를 동시 실행하고 끝나는 순서대로 NDJSON 줄 생성
+
+    indices의 키(배치 안에서 중복 제거된 쿼리)마다 한 번씩 실행합니다.
+    스트림이 중단되면 남은 작업을 취소하고 취소가 끝날 때까지 기다립니다.
+    """
+    admission = get_admission_controller()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(query: str):
+        async with semaphore:
+            priority, cost = admission_priority(query, user_id)
+            try:
+                async with admission.admit(priority, cost=cost, deadline=deadline):
+                    response = await service.process_cooking_query(query, user_id=user_id, deadline=deadline)
+            except AdmissionRejectedError as e:
+                response = _overloaded_response(e)
+            except Exception as e:
+                logger.exception("[Batch] 쿼리 처리 실패")
+                response = ErrorResponse(code=ResponseCode.INTERNAL_ERROR, message=f"처리 중 오류: {e}")
+            return query, response
+
+    with tracer.start_as_current_span(
+        "POST /api/cooking/batch",
+        attributes={
+            "http.method": "POST",
+            "http.route": "/api/cooking/batch",
+            "user.authenticated": user_id is not None,
+            "request.id": current_request_id(),
+            "batch.unique_queries": len(indices),
+        }
+    ):
+        tasks = [asyncio.create_task(run(query)) for query in indices]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                query, response = await next_done
+                for index in indices[query]:
+                    yield CookingBatchItem(index=index, response=response).model_dump_json() + "\n"
+        finally:
+            # 클라이언트 연결 종료 등으로 스트림이 중단되면 남은 Workflow 취소
+            # (취소 처리(prediction 취소, 입장 슬롯 반납 등)가 끝날 때까지 대기)
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def _job_response(job: Job) -> JobResponse:
+    return JobResponse(
+        job_id=job.id,
+        status=job.status,
+        attempts=job.attempts,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        result=job.result,
+        error=job.error
+    )
+
+
+@router.post("/cooking/jobs", status_code=202, response_model=JobResponse)
+async def create_cooking_job(
+    request: CookingRequest,
+    response: Response,
+    user_id: Optional[str] = Depends(get_optional_user),
+    queue: JobQueue = Depends(get_dependency(JobQueue))
+):
+    """
+    요리 AI 어시스턴트 비동기 작업 등록
+
+    오래 걸리는 요청(복수 레시피 + 이미지 등)을 작업 큐에 넣고 바로 응답합니다.
+    별도 워커 프로세스(python -m app.cooking_assistant.worker)가 처리하며,
+    결과는 GET /api/cooking/jobs/{job_id}로 조회합니다.
+
+    Args:
+        request: 요리 쿼리 요청 (/api/cooking과 동일)
+        user_id: 사용자 ID (선택적 인증, 토큰으로 등록한 작업은 같은 사용자만 조회 가능)
+        queue: JobQueue (SQLite 영속 작업 큐)
+
+    Returns:
+        JobResponse: queued 상태 (202, Location 헤더에 조회 경로)
+    """
+    job = await asyncio.to_thread(queue.enqueue, {"query": request.query}, user_id=user_id)
+    response.headers["Location"] = f"/api/cooking/jobs/{job.id}"
+    return _job_response(job)
+
+
+@router.get("/cooking/jobs/{job_id}", response_model=JobResponse)
+async def get_cooking_job(
+    job_id: str,
+    user_id: Optional[str] = Depends(get_optional_user),
+    queue: JobQueue = Depends(get_dependency(JobQueue))
+):
+    """
+    비동기 작업 상태 / 결과 조회
+
+    Returns:
+        JobResponse: queued | running | succeeded (result) | failed (error, result)
+
+    Raises:
+        HTTPException: 404 - 작업이 없거나 다른 사용자의 작업
+    """
+    job = await asyncio.to_thread(queue.get, job_id)
+    if job is None or (job.user_id is not None and job.user_id != user_id):
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    return _job_response(job)
 
 
 @router.get("/health")
 async def health_check():
-    """헬스 체크 엔드포인트"""
-    return {"status": "healthy", "service": "cooking-assistant"}
\ No newline at end of file
+    """헬스 체크 엔드포인트
+
+    업스트림별 Circuit Breaker 상태와 심층 체크 결과를 함께 반환합니다.
+    (백그라운드에서 갱신된 캐시를 읽으므로 호출당 체크 비용 없음)
+    (프로세스 생존 여부 확인용이므로 회로가 열려도 status는 "healthy" 유지, 준비 상태는 /ready)
+    """
+    snapshot = get_health_monitor().current()
+    upstreams = snapshot["checks"].get("upstreams", {})
+
+    # 캐시된 dict는 이미 JSON 직렬화 가능하므로 jsonable_encoder 변환을 건너뜀
+    return JSONResponse({
+        "status": "healthy",
+        "service": "cooking-assistant",
+        "upstreams": upstreams.get("upstreams", {}),
+        "open_circuits": upstreams.get("open_circuits", []),
+        "checks": snapshot["checks"],
+        "checked_at": snapshot["checked_at"]
+    })
@@ -19,4 +19,7 @@ class ResponseCode:
     IMAGE_GENERATION_FAILED = "IMAGE_GENERATION_FAILED"
     INTERNAL_ERROR = "INTERNAL_ERROR"
     WORKFLOW_ERROR = "WORKFLOW_ERROR"
-    INVALID_INTENT = "INVALID_INTENT"
\ No newline at end of file
+    INVALID_INTENT = "INVALID_INTENT"
+    CLIENT_DISCONNECTED = "CLIENT_DISCONNECTED"
+    RATE_LIMIT_EXCEEDED = "RATE_LIMIT_EXCEEDED"
+    SERVER_OVERLOADED = "SERVER_OVERLOADED"
@@ -10,6 +10,11 @@ class CookingRequest(BaseModel):
     query: str = Field(..., description="요리 관련 쿼리 (예: '파스타 카르보나라 만드는 법', '매운 음식 추천해줘', '김치찌개 칼로리는?')")
 
 
+class CookingBatchRequest(BaseModel):
+    """일괄 요청 (식단 계획 등 여러 쿼리를 한 번에)"""
+    requests: List[CookingRequest] = Field(..., min_length=1, description="요리 쿼리 목록 (최대 batch_max_size개)")
+
+
 # ============ Response DTOs ============
 
 class ResponseMetadata(BaseModel):
@@ -17,6 +22,10 @@ class ResponseMetadata(BaseModel):
     entities: Dict[str, Any] = Field(default_factory=dict, description="추출된 엔티티")
     confidence: float = Field(default=0.0, description="의도 파악 확신도")
     secondary_intents_processed: List[str] = Field(default_factory=list, description="처리된 부가 의도들")
+    partial: bool = Field(default=False, description="요청 기한 부족으로 일부 작업이 생략된 부분 응답 여부")
+    skipped_intents: List[str] = Field(default_factory=list, description="기한 부족으로 생략된 부가 의도들")
+    token_usage: Optional[Dict[str, Any]] = Field(None, description="LLM 토큰 사용량 (token_usage_in_response 설정 시)")
+    timings: Optional[Dict[str, float]] = Field(None, description="구간별 소요 시간 ms (server_timing_in_response 설정 시)")
     timestamp: datetime = Field(default_factory=datetime.now, description="응답 생성 시각")
 
 
@@ -106,4 +115,22 @@ class ErrorResponse(BaseModel):
 
 # ============ Union Type (FastAPI response_model용) ============
 
-CookingResponse = Union[RecipeResponse, RecommendationResponse, QuestionResponse, ErrorResponse]
\ No newline at end of file
+CookingResponse = Union[RecipeResponse, RecommendationResponse, QuestionResponse, ErrorResponse]
+
+
+class CookingBatchItem(BaseModel):
+    """일괄 요청 결과 한 줄 (NDJSON, 완료 순서로 전송)"""
+    index: int = Field(..., description="요청 목록에서의 위치 (0부터)")
+    response: CookingResponse
+
+
+class JobResponse(BaseModel):
+    """비동기 작업 상태 / 결과"""
+    job_id: str
+    status: Literal["queued", "running", "succeeded", "failed"]
+    attempts: int = Field(0, description="시도 횟수 (워커 장애 시 재시도 포함)")
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[CookingResponse] = Field(None, description="처리 결과 (succeeded, 처리 중 에러 응답이면 failed)")
+    error: Optional[str] = Field(None, description="실패 사유 (failed)")
@@ -6,6 +6,8 @@ Adapter를 교체하려면 이 파일만 수정하면 됩니다.
 from injector import Module, singleton, provider
 from app.core.config import Settings, get_settings
 from app.core.prompt_loader import PromptLoader
+from app.core.quota import QuotaManager, create_quota_manager
+from app.core.job_queue import JobQueue
 
 # Framework-level ports (reusable)
 from app.core.ports.llm_port import ILLMPort
@@ -15,6 +17,19 @@ from app.core.ports.image_port import IImagePort
 from app.core.adapters.llm.anthropic_adapter import AnthropicLLMAdapter
 from app.core.adapters.image.replicate_adapter import ReplicateImageAdapter
 
+# Fake adapters (부하 테스트, settings.adapter_mode = "fake")
+from app.core.adapters.llm.fake_adapter import FakeLLMAdapter
+from app.core.adapters.image.fake_adapter import FakeImageAdapter
+
+# Cassette adapters (기록/재생, settings.adapter_mode = "record" | "replay")
+from app.core.adapters.cassette import CassetteReplayer, get_cassette_writer, load_cassette
+from app.core.adapters.llm.cassette_adapter import RecordingLLMAdapter, ReplayLLMAdapter
+from app.core.adapters.image.cassette_adapter import RecordingImageAdapter, ReplayImageAdapter
+
+# Guarded adapters (circuit breaker 등 공통 보호 계층)
+from app.core.adapters.llm.guarded_adapter import GuardedLLMAdapter
+from app.core.adapters.image.guarded_adapter import GuardedImageAdapter
+
 
 class CookingModule(Module):
     """Cooking Assistant DI Configuration
@@ -47,8 +62,19 @@ class CookingModule(Module):
         OpenAIAdapter, OllamaAdapter로 교체 가능합니다.
 
         Note: PromptLoader dependency removed from adapter (pure adapter pattern)
+        Note: GuardedLLMAdapter로 감싸 업스트림 장애 시 빠르게 실패합니다
+        Note: adapter_mode="fake"이면 FakeLLMAdapter (부하 테스트용)
+        Note: adapter_mode="record"/"replay"이면 카세트 기록/재생
         """
-        return AnthropicLLMAdapter(settings=settings)
+        if settings.adapter_mode == "fake":
+            inner: ILLMPort = FakeLLMAdapter(settings=settings)
+        elif settings.adapter_mode == "replay":
+            inner = ReplayLLMAdapter(_cassette_replayer(settings))
+        else:
+            inner = AnthropicLLMAdapter(settings=settings)
+            if settings.adapter_mode == "record":
+                inner = RecordingLLMAdapter(inner, get_cassette_writer(settings.cassette_path))
+        return GuardedLLMAdapter(inner, settings=settings, upstream="anthropic")
 
     @singleton
     @provider
@@ -57,5 +83,44 @@ class CookingModule(Module):
 
         ReplicateImageAdapter를 사용합니다.
         DALLEAdapter로 교체 가능합니다.
+        GuardedImageAdapter로 감싸 회로가 열리면 이미지 생성을 생략합니다.
+        adapter_mode="fake"이면 FakeImageAdapter (부하 테스트용)
+        adapter_mode="record"/"replay"이면 카세트 기록/재생
+        """
+        if settings.adapter_mode == "fake":
+            inner: IImagePort = FakeImageAdapter(settings=settings)
+        elif settings.adapter_mode == "replay":
+            inner = ReplayImageAdapter(_cassette_replayer(settings))
+        else:
+            inner = ReplicateImageAdapter(settings=settings)
+            if settings.adapter_mode == "record":
+                inner = RecordingImageAdapter(inner, get_cassette_writer(settings.cassette_path))
+        return GuardedImageAdapter(inner, settings=settings, upstream="replicate")
+
+    @singleton
+    @provider
+    def provide_quota_manager(self, settings: Settings) -> QuotaManager:
+        """QuotaManager 제공 (Singleton)
+
+        quota_backend 설정으로 카운터 저장소를 선택합니다. (memory | sqlite)
         """
-        return ReplicateImageAdapter(settings=settings)
+        return create_quota_manager(settings)
+
+    @singleton
+    @provider
+    def provide_job_queue(self, settings: Settings) -> JobQueue:
+        """JobQueue 제공 (Singleton)
+
+        API(/api/cooking/jobs)와 워커 프로세스가 같은 SQLite 파일(job_db_path)을 공유합니다.
+        """
+        return JobQueue(
+            settings.job_db_path,
+            lease_seconds=settings.job_lease_seconds,
+            max_attempts=settings.job_max_attempts
+        )
+
+
+def _cassette_replayer(settings: Settings) -> CassetteReplayer:
+    """adapter_mode="replay"용 카세트 재생기 (LLM/이미지가 같은 카세트 공유)"""
+    cassette = load_cassette(settings.cassette_path, fallback_to_prompt_id=settings.cassette_match_prompt_id)
+    return CassetteReplayer(cassette, latency_scale=settings.cassette_latency_scale)
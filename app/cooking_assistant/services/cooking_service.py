@@ -33,13 +33,23 @@ from app.cooking_assistant.exceptions import (
     ImageGenerationError,
     WorkflowError,
     ParsingError,
-    ValidationError
+    ValidationError,
+    RateLimitExceededError
 )
+from app.core.deadline import Deadline
+from app.core.disconnect import record_cancelled_request
+from app.core.config import Settings
+from app.core.usage import UsageLedger, usage_scope, get_usage_aggregator
+from app.core.quota import QuotaManager, TOKENS, IMAGES
+from app.core.tracing import get_tracer
+from app.core.server_timing import current_server_timing, measure_phase
+import asyncio
 import logging
 from dataclasses import asdict
-from typing import Union, Optional, List
+from typing import Union, Optional, List, Dict
 
 logger = logging.getLogger(__name__)
+tracer = get_tracer(__name__)
 
 
 @singleton
@@ -54,6 +64,8 @@ class CookingService:
 
     Attributes:
         workflow: LangGraph 워크플로우
+        settings: 애플리케이션 설정 (토큰 사용량 노출/가격)
+        quota: 사용자별 토큰/이미지 한도
         # 향후 추가 가능:
         # recipe_repository: IRecipeRepository (DB 조회)
         # nutrition_api: INutritionAPI (외부 API)
@@ -62,7 +74,9 @@ class CookingService:
     @inject
     def __init__(
         self,
-        workflow: CookingWorkflow
+        workflow: CookingWorkflow,
+        settings: Settings,
+        quota: QuotaManager
         # recipe_repository: IRecipeRepository = None,
         # nutrition_api: INutritionAPI = None
     ):
@@ -70,51 +84,109 @@ class CookingService:
 
         Args:
             workflow: LangGraph 워크플로우
+            settings: 애플리케이션 설정
+            quota: 사용자별 한도 관리자
         """
         self.workflow = workflow
+        self.settings = settings
+        self.quota = quota
 
     async def process_cooking_query(
         self,
         query: str,
-        user_id: Optional[str] = None
+        user_id: Optional[str] = None,
+        deadline: Optional[Deadline] = None
     ) -> CookingResponse:
         """요리 관련 쿼리 처리 (AI Workflow)
 
         전체 흐름:
+        0. 사용 한도 확인 (초과 시 Workflow 실행 없이 RATE_LIMIT_EXCEEDED 응답)
         1. Workflow 실행 (Domain Entity 반환)
         2. Domain → DTO 변환
         3. 에러 처리 및 응답 생성
+        4. 토큰 사용량 집계 (요청 → state["token_usage"], 사용자별 누적, 한도 차감)
+        (전체 구간은 CookingService.process_cooking_query span으로 기록)
 
         Args:
             query: 사용자 쿼리
                 예: "파스타 카르보나라 만드는 법"
             user_id: 사용자 ID (선택적, 인증된 경우 전달됨)
+            deadline: 요청 처리 기한 (선택적)
+                - 예산이 부족하면 이미지/부가 의도를 생략한 부분 응답 반환
 
         Returns:
             CookingResponse: 의도별 응답 DTO
         """
-        logger.info(f"[Service] 쿼리 처리 시작 - user_id: {user_id}, query: {query[:50]}...")
+        with tracer.start_as_current_span(
+            "CookingService.process_cooking_query",
+            attributes={"user.authenticated": user_id is not None, "query.length": len(query)}
+        ) as span:
+            ledger = UsageLedger()
+            response = await self._process(query, user_id, deadline, ledger)
+
+            span.set_attributes({
+                "intent": response.intent or "",
+                "response.code": response.code,
+                "llm.calls": ledger.total.calls,
+                "llm.input_tokens": ledger.total.input_tokens,
+                "llm.output_tokens": ledger.total.output_tokens,
+                "llm.cache_read_tokens": ledger.total.cache_read_tokens,
+            })
+            if response.status == "error":
+                span.set_status("ERROR", response.code)
+            return response
+
+    async def _process(
+        self,
+        query: str,
+        user_id: Optional[str],
+        deadline: Optional[Deadline],
+        ledger: UsageLedger
+    ) -> CookingResponse:
+        """process_cooking_query 본체 (사용량은 ledger에 기록)"""
+        logger.info("[Service] 쿼리 처리 시작 - user_id: %s, query: %s...", user_id, query[:50])
+
+        images = 0
 
         try:
+            # 0. 사용 한도 확인 (업스트림 호출 전, 토큰 한도만 요청 거절)
+            violation = await self.quota.check(user_id, resources=(TOKENS,))
+            if violation:
+                raise RateLimitExceededError(
+                    f"사용 한도를 초과했습니다 ({violation.resource}/{violation.window}). "
+                    f"{violation.retry_after:.0f}초 후 다시 시도하세요",
+                    code=ResponseCode.RATE_LIMIT_EXCEEDED,
+                    details=violation.to_dict()
+                )
+
             # 1. 초기 상태 생성
             initial_state = create_initial_state(query)
             initial_state["user_id"] = user_id
+            initial_state["deadline"] = deadline
+
+            # 이미지 한도 소진 시 이미지 생성만 생략 (텍스트 응답은 처리, 부분 응답)
+            if await self.quota.check(user_id, resources=(IMAGES,)):
+                initial_state["blocked_intents"] = ["generate_image"]
 
-            # 2. Workflow 직접 실행
-            result: CookingState = await self.workflow.run(initial_state)
+            # 2. Workflow 직접 실행 (LLM 호출 사용량은 ledger에 기록)
+            with usage_scope(ledger):
+                result: CookingState = await self.workflow.run(initial_state)
+            result["token_usage"] = ledger.to_dict(self.settings.llm_token_prices)
+            images = len(result.get("image_urls") or []) or int(bool(result.get("image_url")))
 
-            logger.info(f"[Service] Workflow 실행 완료")
+            logger.info("[Service] Workflow 실행 완료")
 
             # 3. Domain → DTO 변환
-            response = self._to_dto(result)
+            with measure_phase("dto"):
+                response = self._to_dto(result)
 
-            logger.info(f"[Service] DTO 변환 완료 - intent: {result['primary_intent']}")
+            logger.info("[Service] DTO 변환 완료 - intent: %s", result['primary_intent'])
 
             return response
 
         except ImageGenerationError as e:
             # 이미지 생성 실패는 레시피는 반환 (우아한 성능 저하)
-            logger.warning(f"[Service] 이미지 생성 실패: {e}")
+            logger.warning("[Service] 이미지 생성 실패: %s", e)
 
             # 이미지 없이 레시피 응답 생성
             response = self._to_dto(result)
@@ -125,9 +197,18 @@ class CookingService:
 
             return response
 
+        except RateLimitExceededError as e:
+            # 사용 한도 초과 (Workflow 미실행)
+            logger.warning("[Service] 사용 한도 초과 - user_id: %s, %s", user_id, e.details)
+            return ErrorResponse(
+                code=e.code,
+                message=e.message,
+                data=e.details
+            )
+
         except LLMServiceError as e:
             # LLM 서비스 오류 (치명적)
-            logger.error(f"[Service] LLM 서비스 오류: {e}", exc_info=True)
+            logger.error("[Service] LLM 서비스 오류: %s", e, exc_info=True)
             return ErrorResponse(
                 code=e.code or ResponseCode.INTERNAL_ERROR,
                 message=f"AI 서비스 오류: {e.message}",
@@ -136,7 +217,7 @@ class CookingService:
 
         except (ParsingError, ValidationError) as e:
             # 데이터 파싱/검증 실패
-            logger.error(f"[Service] 데이터 처리 오류: {e}", exc_info=True)
+            logger.error("[Service] 데이터 처리 오류: %s", e, exc_info=True)
             return ErrorResponse(
                 code=e.code or ResponseCode.INTERNAL_ERROR,
                 message=f"데이터 처리 오류: {e.message}",
@@ -145,7 +226,7 @@ class CookingService:
 
         except WorkflowError as e:
             # 워크플로우 실행 오류
-            logger.error(f"[Service] 워크플로우 오류: {e}", exc_info=True)
+            logger.error("[Service] 워크플로우 오류: %s", e, exc_info=True)
             return ErrorResponse(
                 code=e.code or ResponseCode.INTERNAL_ERROR,
                 message=f"워크플로우 실행 오류: {e.message}",
@@ -154,7 +235,7 @@ class CookingService:
 
         except DomainException as e:
             # 기타 도메인 예외
-            logger.error(f"[Service] 도메인 오류: {e}", exc_info=True)
+            logger.error("[Service] 도메인 오류: %s", e, exc_info=True)
             return ErrorResponse(
                 code=e.code or ResponseCode.INTERNAL_ERROR,
                 message=e.message,
@@ -163,12 +244,29 @@ class CookingService:
 
         except Exception as e:
             # 예상치 못한 오류
-            logger.error(f"[Service] 예상치 못한 오류: {e}", exc_info=True)
+            logger.error("[Service] 예상치 못한 오류: %s", e, exc_info=True)
             return ErrorResponse(
                 code=ResponseCode.INTERNAL_ERROR,
                 message=f"서버 오류: {str(e)}"
             )
 
+        except asyncio.CancelledError:
+            # 클라이언트 연결 종료/종료 드레인 등으로 취소 (이미 사용한 토큰, 중단된 호출 기록)
+            record_cancelled_request(ledger)
+            raise
+
+        finally:
+            # 실패한 요청도 이미 사용한 토큰은 사용자 누적/한도에 반영
+            if ledger.total.calls or images:
+                await self.quota.charge(user_id, tokens=ledger.total.total_tokens, images=images)
+            if ledger.total.calls:
+                get_usage_aggregator().record(user_id, ledger.total)
+                logger.info(
+                    "[Service] 토큰 사용량 - user_id: %s, input: %s, output: %s, cache_read: %s",
+                    user_id, ledger.total.input_tokens, ledger.total.output_tokens,
+                    ledger.total.cache_read_tokens
+                )
+
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 향후 DB 조회 예시 (레시피 저장 기능 추가 시)
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -229,7 +327,11 @@ class CookingService:
         metadata = ResponseMetadata(
             entities=state.get("entities", {}),
             confidence=state.get("confidence", 0.0),
-            secondary_intents_processed=state.get("processed_secondary_intents", [])
+            secondary_intents_processed=state.get("processed_secondary_intents", []),
+            partial=bool(state.get("skipped_intents")),
+            skipped_intents=state.get("skipped_intents", []),
+            token_usage=state.get("token_usage") if self.settings.token_usage_in_response else None,
+            timings=self._current_timings()
         )
 
         # Secondary intents 결과 수집
@@ -255,6 +357,13 @@ class CookingService:
 
         return response
 
+    def _current_timings(self) -> Optional[Dict[str, float]]:
+        """ResponseMetadata.timings (server_timing_in_response 설정 시, DTO 변환 이전 구간까지)"""
+        if not self.settings.server_timing_in_response:
+            return None
+        timing = current_server_timing()
+        return timing.to_dict() if timing is not None else None
+
     def _create_recipe_response(self, state: CookingState, metadata: ResponseMetadata) -> Union[RecipeResponse, ErrorResponse]:
         """레시피 응답 DTO 생성 (Entity → DTO 변환)"""
         try:
@@ -289,7 +398,7 @@ class CookingService:
             )
 
         except Exception as e:
-            logger.error(f"[Service] 레시피 DTO 변환 실패: {e}")
+            logger.error("[Service] 레시피 DTO 변환 실패: %s", e)
             return ErrorResponse(
                 code=ResponseCode.RECIPE_PARSE_ERROR,
                 intent="recipe_create",
@@ -331,7 +440,7 @@ class CookingService:
             )
 
         except Exception as e:
-            logger.error(f"[Service] 추천 DTO 변환 실패: {e}")
+            logger.error("[Service] 추천 DTO 변환 실패: %s", e)
             return ErrorResponse(
                 code=ResponseCode.RECOMMENDATION_PARSE_ERROR,
                 intent="recommend",
@@ -364,7 +473,7 @@ class CookingService:
             )
 
         except Exception as e:
-            logger.error(f"[Service] 답변 DTO 변환 실패: {e}")
+            logger.error("[Service] 답변 DTO 변환 실패: %s", e)
             return ErrorResponse(
                 code=ResponseCode.QUESTION_PARSE_ERROR,
                 intent="question",
@@ -392,7 +501,7 @@ class CookingService:
                 if result:
                     results.append(result)
             except Exception as e:
-                logger.warning(f"[Service] Secondary intent '{intent}' 결과 추출 실패: {e}")
+                logger.warning("[Service] Secondary intent '%s' 결과 추출 실패: %s", intent, e)
                 # 실패해도 계속 진행 (다른 intent 결과는 포함)
                 continue
 
@@ -462,5 +571,5 @@ class CookingService:
                 )
 
         # 결과가 없는 경우
-        logger.debug(f"[Service] Intent '{intent}'에 대한 결과가 state에 없습니다")
+        logger.debug("[Service] Intent '%s'에 대한 결과가 state에 없습니다", intent)
         return None
@@ -0,0 +1,187 @@
+"""Cooking Worker - 비동기 작업 처리 프로세스
+
+/api/cooking/jobs로 등록된 작업을 JobQueue(SQLite)에서 가져와 CookingService로 처리합니다.
+API 프로세스와 분리되어 있으므로 오래 걸리는 복수 레시피/이미지 생성이 API 워커를 점유하지 않고,
+워커 수는 API와 별개로 늘릴 수 있습니다. (같은 job_db_path를 보는 프로세스를 여러 개 실행)
+
+실행:
+    python -m app.cooking_assistant.worker [--concurrency N] [--worker-id ID]
+
+종료 (SIGTERM / SIGINT):
+    1. 새 작업 가져오기 중지
+    2. 처리 중 작업이 끝날 때까지 shutdown_grace_period 동안 대기
+    3. 종료 훅: 미완료 작업을 대기열로 되돌림 ("jobs") → 어댑터 HTTP 클라이언트 close ("clients")
+"""
+from typing import List, Optional
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import time
+
+from injector import Injector
+
+from app.cooking_assistant.services.cooking_service import CookingService
+from app.core.config import Settings, get_settings
+from app.core.deadline import Deadline
+from app.core.dependencies import get_injector, resolve_dependencies
+from app.core.job_queue import Job, JobQueue
+from app.core.metrics import histogram
+from app.core.ports.image_port import IImagePort
+from app.core.ports.llm_port import ILLMPort
+from app.core.shutdown import ShutdownCoordinator, get_shutdown_coordinator, register_shutdown_hook
+from app.core.structured_logging import configure_logging
+
+logger = logging.getLogger(__name__)
+
+_job_duration = histogram("job_duration_seconds", "비동기 작업 처리 시간 (결과 상태별)", ["status"])
+
+
+class CookingWorker:
+    """작업 큐 소비자
+
+    Attributes:
+        worker_id: 작업 점유자 식별자 (기본: 호스트명-PID)
+        concurrency: 동시에 처리할 작업 수
+    """
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        service: CookingService,
+        settings: Settings,
+        worker_id: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        coordinator: Optional[ShutdownCoordinator] = None
+    ):
+        self.queue = queue
+        self.service = service
+        self.settings = settings
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self.concurrency = concurrency or settings.job_worker_concurrency
+        self.coordinator = coordinator or get_shutdown_coordinator()
+        self._stopping = asyncio.Event()
+        self._last_purge = 0.0
+
+    async def process(self, job: Job) -> None:
+        """작업 하나 처리 (처리 중 작업으로 집계되어 종료 시 완료를 기다림)"""
+        start = time.perf_counter()
+        async with self.coordinator.track():
+            deadline = Deadline.after(self.settings.job_deadline, self.settings.deadline_optional_reserve)
+            try:
+                response = await self.service.process_cooking_query(
+                    job.payload["query"],
+                    user_id=job.user_id,
+                    deadline=deadline
+                )
+            except Exception as e:
+                logger.exception("[Worker] 작업 실패: %s", job.id)
+                await asyncio.to_thread(self.queue.finish, job.id, self.worker_id, error=f"{type(e).__name__}: {e}")
+                _job_duration.labels("failed").observe(time.perf_counter() - start)
+                return
+
+            error = response.message if response.status == "error" else None
+            await asyncio.to_thread(
+                self.queue.finish, job.id, self.worker_id, result=response.model_dump(mode="json"), error=error
+            )
+            _job_duration.labels("failed" if error else "succeeded").observe(time.perf_counter() - start)
+
+    async def run_once(self) -> bool:
+        """대기 작업 하나를 가져와 처리
+
+        Returns:
+            bool: 처리한 작업이 있으면 True
+        """
+        job = await asyncio.to_thread(self.queue.claim, self.worker_id)
+        if job is None:
+            return False
+        logger.info("[Worker] 작업 시작: %s (시도 %s회)", job.id, job.attempts)
+        await self.process(job)
+        return True
+
+    async def _consume(self) -> None:
+        while not self._stopping.is_set():
+            if await self.run_once():
+                continue
+            await self._purge_finished()
+            try:
+                await asyncio.wait_for(self._stopping.wait(), self.settings.job_poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _purge_finished(self) -> None:
+        """보관 기간이 지난 작업 삭제 (유휴 시 최대 1분에 1회)"""
+        now = time.time()
+        if now - self._last_purge < 60:
+            return
+        self._last_purge = now
+        purged = await asyncio.to_thread(self.queue.purge, now - self.settings.job_result_ttl)
+        if purged:
+            logger.info("[Worker] 보관 기간이 지난 작업 %s건 삭제", purged)
+
+    async def run(self) -> None:
+        """stop() 호출 전까지 concurrency개 소비 루프 실행"""
+        logger.info("[Worker] 시작 - id: %s, 동시 처리: %s", self.worker_id, self.concurrency)
+        consumers: List[asyncio.Task] = [asyncio.create_task(self._consume()) for _ in range(self.concurrency)]
+        await self._stopping.wait()
+        await self.coordinator.shutdown(self.settings.shutdown_grace_period)
+        for consumer in consumers:
+            consumer.cancel()
+        await asyncio.gather(*consumers, return_exceptions=True)
+        logger.info("[Worker] 종료 - id: %s", self.worker_id)
+
+    def stop(self) -> None:
+        """새 작업 가져오기 중지 (run()이 드레인 후 반환)"""
+        self._stopping.set()
+
+
+async def _close_clients(injector: Injector) -> None:
+    """어댑터의 풀링된 HTTP 클라이언트 close (종료 훅)"""
+    await injector.get(ILLMPort).aclose()
+    await injector.get(IImagePort).aclose()
+
+
+async def serve(concurrency: Optional[int] = None, worker_id: Optional[str] = None) -> None:
+    """워커 실행 (SIGTERM/SIGINT 시 그레이스풀 종료)"""
+    settings = get_settings()
+    injector = get_injector()
+    services = resolve_dependencies(injector, (CookingService, JobQueue))
+    worker = CookingWorker(
+        services[JobQueue],
+        services[CookingService],
+        settings,
+        worker_id=worker_id,
+        concurrency=concurrency
+    )
+
+    # 등록 역순 실행: 미완료 작업 반납 → 클라이언트 close
+    register_shutdown_hook("clients", lambda: _close_clients(injector))
+    register_shutdown_hook("jobs", lambda: asyncio.to_thread(worker.queue.release, worker.worker_id))
+
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.stop)
+
+    await worker.run()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="요리 AI 어시스턴트 비동기 작업 워커")
+    parser.add_argument("--concurrency", type=int, default=None, help="동시 처리 작업 수 (기본: job_worker_concurrency)")
+    parser.add_argument("--worker-id", default=None, help="워커 식별자 (기본: 호스트명-PID)")
+    args = parser.parse_args()
+
+    settings = get_settings()
+    configure_logging(
+        level=settings.log_level,
+        json_format=settings.log_json,
+        use_queue=settings.log_queue,
+        sample_rates=settings.log_sample_rates
+    )
+    asyncio.run(serve(concurrency=args.concurrency, worker_id=args.worker_id))
+
+
+if __name__ == "__main__":
+    main()
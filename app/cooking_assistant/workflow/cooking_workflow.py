@@ -3,7 +3,6 @@
 LangGraph StateGraph를 구성하여 워크플로우를 정의합니다.
 """
 from app.core.decorators import singleton, inject
-from langgraph.graph import StateGraph, END
 from app.cooking_assistant.workflow.states.cooking_state import CookingState
 from app.cooking_assistant.workflow.nodes.intent_classifier_node import IntentClassifierNode
 from app.cooking_assistant.workflow.nodes.recipe_generator_node import RecipeGeneratorNode
@@ -11,8 +10,12 @@ from app.cooking_assistant.workflow.nodes.image_generator_node import ImageGener
 from app.cooking_assistant.workflow.nodes.recommender_node import RecommenderNode
 from app.cooking_assistant.workflow.nodes.question_answerer_node import QuestionAnswererNode
 from app.cooking_assistant.workflow.edges.intent_router import route_by_intent, check_secondary_intents
+from typing import TYPE_CHECKING
 import logging
 
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,12 +69,17 @@ class CookingWorkflow:
         # 그래프 빌드
         self.graph = self._build_graph()
 
-    def _build_graph(self) -> StateGraph:
+    def _build_graph(self) -> "StateGraph":
         """워크플로우 구성 (오케스트레이션만 담당)
 
+        langgraph는 import 비용이 커서(~0.6초) 그래프 빌드 시점에 로드합니다.
+        (운영은 lifespan 워밍업에서 빌드하므로 첫 요청이 비용을 내지 않음)
+
         Returns:
             StateGraph: 컴파일된 LangGraph StateGraph
         """
+        from langgraph.graph import StateGraph
+
         workflow = StateGraph(CookingState)
 
         # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -120,7 +128,7 @@ class CookingWorkflow:
 
     def _add_secondary_intent_routing(
         self,
-        workflow: StateGraph,
+        workflow: "StateGraph",
         node_names: list[str]
     ) -> None:
         """Secondary intent 라우팅 공통 로직
@@ -131,6 +139,8 @@ class CookingWorkflow:
             workflow: LangGraph StateGraph
             node_names: Secondary intent 라우팅을 추가할 노드 이름 리스트
         """
+        from langgraph.graph import END
+
         # 공통 라우팅 맵 (DRY 원칙)
         routing = {
             "recipe_generator": "recipe_generator",
@@ -156,7 +166,7 @@ class CookingWorkflow:
         Returns:
             CookingState: 최종 상태
         """
-        logger.info(f"[Workflow] 시작: {initial_state['user_query'][:50]}...")
+        logger.info("[Workflow] 시작: %s...", initial_state['user_query'][:50])
         result = await self.graph.ainvoke(initial_state)
-        logger.info(f"[Workflow] 완료")
+        logger.info("[Workflow] 완료")
         return result
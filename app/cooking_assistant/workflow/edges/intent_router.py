@@ -32,7 +32,7 @@ def route_by_intent(state: CookingState) -> str:
 
     next_node = routing_map.get(intent, "recipe_generator")  # 기본값: 레시피 생성
 
-    logger.info(f"[Router] primary_intent={intent} → {next_node}")
+    logger.info("[Router] primary_intent=%s → %s", intent, next_node)
 
     return next_node
 
@@ -58,8 +58,8 @@ def check_secondary_intents(state: CookingState) -> str:
         # 다음 실행할 intent (리스트 첫 번째, pop하지 않음)
         next_intent = secondary_intents[0]
         logger.info(
-            f"[Router] Secondary intent: {next_intent} "
-            f"(남은 intents: {len(secondary_intents)})"
+            "[Router] Secondary intent: %s (남은 intents: %s)",
+            next_intent, len(secondary_intents)
         )
 
         routing_map = {
@@ -71,5 +71,5 @@ def check_secondary_intents(state: CookingState) -> str:
 
         return routing_map.get(next_intent, "end")
 
-    logger.info(f"[Router] 모든 intent 완료 → end")
+    logger.info("[Router] 모든 intent 완료 → end")
     return "end"
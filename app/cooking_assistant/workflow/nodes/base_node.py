@@ -4,9 +4,37 @@
 """
 from abc import ABC, abstractmethod
 from app.cooking_assistant.workflow.states.cooking_state import CookingState
+from app.core.deadline import deadline_scope
+from app.core.metrics import gauge, histogram
+from app.core.usage import usage_intent_scope
+from app.core.tracing import get_tracer
+from app.core.server_timing import record_phase
+import asyncio
 import logging
+import time
 
 logger = logging.getLogger(__name__)
+tracer = get_tracer(__name__)
+
+_node_duration = histogram(
+    "workflow_node_duration_seconds",
+    "워크플로우 노드 실행 시간 (secondary intent 처리 포함)",
+    ["node"]
+)
+_nodes_in_flight = gauge(
+    "workflow_nodes_in_flight",
+    "실행 중인 워크플로우 노드 수",
+    ["node"]
+)
+
+# Server-Timing 구간 이름 (intent_name → phase)
+_TIMING_PHASES = {
+    "": "classify",
+    "recipe_create": "generate",
+    "recommend": "recommend",
+    "question": "answer",
+    "generate_image": "image",
+}
 
 
 class BaseNode(ABC):
@@ -14,7 +42,11 @@ class BaseNode(ABC):
 
     책임:
     - Secondary intent 공통 처리
-    - 로깅 공통 처리
+    - 요청 기한(deadline) 적용: 남은 예산을 타임아웃으로 사용,
+      예산이 부족하면 secondary intent 작업 생략 (부분 응답)
+    - 사용 한도 초과로 막힌 secondary intent(blocked_intents) 생략 (부분 응답)
+    - 로깅/메트릭/트레이싱 공통 처리 (노드별 실행 시간 히스토그램, node.* span,
+      Server-Timing 구간)
     - 하위 클래스는 execute()만 구현
 
     Attributes:
@@ -30,13 +62,22 @@ class BaseNode(ABC):
                          빈 문자열("")이면 secondary intent 처리 안함
         """
         self.intent_name = intent_name
+        # 핫 패스에서 라벨 조회를 피하기 위해 child를 미리 보관
+        node_name = self.__class__.__name__
+        self._duration = _node_duration.labels(node_name)
+        self._in_flight = _nodes_in_flight.labels(node_name)
+        # 토큰 사용량 집계 기준 (의도 분류 노드는 intent_name이 없음)
+        self._usage_intent = intent_name or "intent_classification"
+        self._span_name = f"node.{node_name}"
+        self._timing_phase = _TIMING_PHASES.get(intent_name or "", node_name)
 
     async def __call__(self, state: CookingState) -> CookingState:
         """LangGraph 노드 실행 (공통 로직)
 
         1. Secondary intent 처리 (자신의 intent 제거)
-        2. 하위 클래스의 execute() 호출
-        3. 공통 로깅
+           - 기한이 얼마 남지 않았거나 한도 초과로 막힌 intent면 실행하지 않고 생략 목록에 기록
+        2. 하위 클래스의 execute() 호출 (남은 예산을 타임아웃으로 적용)
+        3. 공통 로깅 및 실행 시간 기록
 
         Args:
             state: 현재 워크플로우 상태
@@ -44,16 +85,102 @@ class BaseNode(ABC):
         Returns:
             CookingState: 업데이트된 상태
         """
+        deadline = state.get("deadline")
+        is_secondary = self._is_secondary_turn(state)
+
+        # 0. 선택 작업(secondary intent)은 한도 초과로 막혔거나 예산이 부족하면 생략
+        if is_secondary:
+            if self.intent_name in state.get("blocked_intents", ()):
+                skip_reason = "한도 초과"
+            elif deadline is not None and not deadline.allows_optional_work():
+                skip_reason = "기한 부족"
+            else:
+                skip_reason = None
+            if skip_reason:
+                with tracer.start_as_current_span(
+                    self._span_name,
+                    attributes={"intent": self._usage_intent, "skipped": True}
+                ):
+                    self._skip_secondary_intent(state, skip_reason)
+                return state
+
         # 1. Secondary intent 처리 (워크플로우 상태 관리)
         self._handle_secondary_intent(state)
 
         # 2. 노드 고유 기능 실행
-        logger.info(f"[Node:{self.__class__.__name__}] 시작")
-        result = await self.execute(state)
-        logger.info(f"[Node:{self.__class__.__name__}] 완료")
+        logger.info("[Node:%s] 시작", self.__class__.__name__)
+
+        self._in_flight.inc()
+        start = time.perf_counter()
+        try:
+            with tracer.start_as_current_span(
+                self._span_name,
+                attributes={"intent": self._usage_intent, "secondary": is_secondary}
+            ) as span, usage_intent_scope(self._usage_intent):
+                if deadline is None:
+                    result = await self.execute(state)
+                else:
+                    span.set_attribute("deadline.remaining", round(deadline.remaining(), 3))
+                    with deadline_scope(deadline):
+                        try:
+                            result = await asyncio.wait_for(self.execute(state), deadline.remaining())
+                        except asyncio.TimeoutError:
+                            span.set_attribute("deadline.exceeded", True)
+                            result = self._on_deadline_exceeded(state, is_secondary)
+                if state.get("error"):
+                    span.set_status("ERROR", state["error"])
+        finally:
+            elapsed = time.perf_counter() - start
+            self._duration.observe(elapsed)
+            record_phase(self._timing_phase, elapsed)
+            self._in_flight.dec()
+
+        logger.info("[Node:%s] 완료", self.__class__.__name__)
 
         return result
 
+    def _is_secondary_turn(self, state: CookingState) -> bool:
+        """이번 실행이 secondary intent 처리인지 여부"""
+        if not self.intent_name:
+            return False
+        secondary_intents = state.get("secondary_intents", [])
+        return bool(secondary_intents) and secondary_intents[0] == self.intent_name
+
+    def _skip_secondary_intent(self, state: CookingState, reason: str) -> None:
+        """secondary intent 생략 (부분 응답으로 기록)
+
+        Args:
+            reason: 생략 사유 (로그용, 예: "기한 부족", "한도 초과")
+        """
+        skipped_intent = state["secondary_intents"].pop(0)
+
+        skipped_list = state.get("skipped_intents", [])
+        skipped_list.append(skipped_intent)
+        state["skipped_intents"] = skipped_list
+
+        logger.warning(
+            "[%s] %s로 secondary intent '%s' 생략",
+            self.__class__.__name__, reason, skipped_intent
+        )
+
+    def _on_deadline_exceeded(self, state: CookingState, is_secondary: bool) -> CookingState:
+        """실행 중 기한 초과 처리
+
+        secondary intent는 생략된 것으로 기록하고(부분 응답),
+        primary intent는 에러로 기록합니다.
+        """
+        logger.warning("[Node:%s] 요청 기한 초과", self.__class__.__name__)
+
+        if is_secondary:
+            processed_list = state.get("processed_secondary_intents", [])
+            if processed_list and processed_list[-1] == self.intent_name:
+                processed_list.pop()
+            state.setdefault("skipped_intents", []).append(self.intent_name)
+        else:
+            state["error"] = "요청 처리 기한을 초과했습니다"
+
+        return state
+
     def _handle_secondary_intent(self, state: CookingState) -> None:
         """Secondary intent 처리 (공통 로직)
 
@@ -79,8 +206,8 @@ class BaseNode(ABC):
             state["processed_secondary_intents"] = processed_list
 
             logger.info(
-                f"[{self.__class__.__name__}] "
-                f"Secondary intent '{self.intent_name}' 처리 완료 및 기록"
+                "[%s] Secondary intent '%s' 처리 완료 및 기록",
+                self.__class__.__name__, self.intent_name
             )
 
     @abstractmethod
@@ -29,8 +29,8 @@ class ImageGeneratorNode(BaseNode):
             state["image_url"] = image_url
             
             if image_url:
-                logger.info(f"[ImageGeneratorNode] 이미지 생성 성공")
+                logger.info("[ImageGeneratorNode] 이미지 생성 성공")
         except Exception as e:
-            logger.error(f"[ImageGeneratorNode] 이미지 생성 실패: {str(e)}")
+            logger.error("[ImageGeneratorNode] 이미지 생성 실패: %s", e)
             state["image_url"] = None
         return state
@@ -27,8 +27,8 @@ class IntentClassifierNode(BaseNode):
             state["entities"] = result.get("entities", {})
             state["confidence"] = result.get("confidence", 0.0)
             
-            logger.info(f"[IntentClassifierNode] 의도 분류: {state['primary_intent']}")
+            logger.info("[IntentClassifierNode] 의도 분류: %s", state['primary_intent'])
         except Exception as e:
-            logger.error(f"[IntentClassifierNode] 의도 분류 실패: {str(e)}")
+            logger.error("[IntentClassifierNode] 의도 분류 실패: %s", e)
             state["error"] = f"의도 분류 실패: {str(e)}"
         return state
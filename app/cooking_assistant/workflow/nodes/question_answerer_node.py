@@ -32,8 +32,8 @@ class QuestionAnswererNode(BaseNode):
                 additional_tips=answer_data.get("additional_tips", [])
             )
             state["answer"] = answer
-            logger.info(f"[QuestionAnswererNode] 답변 완료")
+            logger.info("[QuestionAnswererNode] 답변 완료")
         except Exception as e:
-            logger.error(f"[QuestionAnswererNode] 질문 답변 실패: {str(e)}")
+            logger.error("[QuestionAnswererNode] 질문 답변 실패: %s", e)
             state["error"] = f"질문 답변 실패: {str(e)}"
         return state
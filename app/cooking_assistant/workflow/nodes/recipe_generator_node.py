@@ -82,7 +82,7 @@ class RecipeGeneratorNode(BaseNode):
                     recipe.validate()  # 비즈니스 규칙 검증
                 state["recipes"] = recipes
                 state["dish_names"] = [r.title for r in recipes]
-                logger.info(f"[RecipeGeneratorNode] {len(recipes)}개 레시피 생성 완료")
+                logger.info("[RecipeGeneratorNode] %s개 레시피 생성 완료", len(recipes))
 
             elif isinstance(recipe_data, dict):
                 # 단일 레시피
@@ -90,7 +90,7 @@ class RecipeGeneratorNode(BaseNode):
                 recipe.validate()
                 state["recipe"] = recipe
                 state["dish_names"] = [recipe.title] if recipe.title else []
-                logger.info(f"[RecipeGeneratorNode] 레시피 생성 완료: {recipe.title}")
+                logger.info("[RecipeGeneratorNode] 레시피 생성 완료: %s", recipe.title)
 
             else:
                 raise TypeError(
@@ -99,7 +99,7 @@ class RecipeGeneratorNode(BaseNode):
                 )
 
         except Exception as e:
-            logger.error(f"[RecipeGeneratorNode] 레시피 생성 실패: {str(e)}")
+            logger.error("[RecipeGeneratorNode] 레시피 생성 실패: %s", e)
             state["error"] = f"레시피 생성 실패: {str(e)}"
 
         return state
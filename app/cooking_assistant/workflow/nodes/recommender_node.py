@@ -89,10 +89,10 @@ class RecommenderNode(BaseNode):
             state["recommendation"] = recommendation
             state["dish_names"] = recommendation.get_dish_names()
 
-            logger.info(f"[RecommenderNode] {recommendation.get_count()}개 음식 추천 완료")
+            logger.info("[RecommenderNode] %s개 음식 추천 완료", recommendation.get_count())
 
         except Exception as e:
-            logger.error(f"[RecommenderNode] 음식 추천 실패: {str(e)}")
+            logger.error("[RecommenderNode] 음식 추천 실패: %s", e)
             state["error"] = f"음식 추천 실패: {str(e)}"
 
         return state
@@ -6,6 +6,7 @@ from typing import TypedDict, Optional, List, Dict, Any
 from app.cooking_assistant.entities.recipe import Recipe
 from app.cooking_assistant.entities.question import Answer
 from app.cooking_assistant.entities.recommendation import Recommendation
+from app.core.deadline import Deadline
 
 
 class CookingState(TypedDict):
@@ -17,9 +18,12 @@ class CookingState(TypedDict):
     Attributes:
         user_query: 사용자 입력 쿼리
         user_id: 사용자 ID (인증된 경우, 개인화 기능용)
+        deadline: 요청 처리 기한 (None이면 기한 없음)
         primary_intent: 주 의도 (recipe_create, recommend, question)
         secondary_intents: 부가 의도 리스트 (순차 실행)
         processed_secondary_intents: 처리 완료된 부가 의도 리스트 (NEW: 버그 수정용)
+        skipped_intents: 기한 부족/한도 초과로 생략된 부가 의도 리스트 (부분 응답)
+        blocked_intents: 사용 한도 초과로 실행하지 않을 부가 의도 (예: 이미지 한도 소진 시 generate_image)
         entities: 추출된 엔티티 (요리명, 재료, 제약조건 등)
         confidence: 의도 파악 확신도 (0.0 ~ 1.0)
         recipe: 단일 레시피 엔티티 (NEW: Recipe 객체)
@@ -30,16 +34,20 @@ class CookingState(TypedDict):
         image_prompt: 이미지 생성 프롬프트
         image_url: 생성된 이미지 URL
         image_urls: 이미지 URL 목록 (복수 레시피용)
+        token_usage: 요청의 LLM 토큰 사용량 (합계, prompt_id별, intent별)
         error: 오류 메시지
     """
     # Query info
     user_query: str
     user_id: Optional[str]
+    deadline: Optional[Deadline]
 
     # Intent classification
     primary_intent: str
     secondary_intents: List[str]              # Remaining intents to process
     processed_secondary_intents: List[str]    # NEW: Completed intents
+    skipped_intents: List[str]                # Skipped for lack of time budget or quota
+    blocked_intents: List[str]                # Not allowed to run (quota exhausted)
     entities: Dict[str, Any]
     confidence: float
 
@@ -57,6 +65,9 @@ class CookingState(TypedDict):
     image_url: Optional[str]
     image_urls: List[str]
 
+    # Token usage (UsageLedger.to_dict)
+    token_usage: Dict[str, Any]
+
     # Error handling
     error: Optional[str]
 
@@ -83,9 +94,12 @@ def create_initial_state(query: str) -> CookingState:
     return {
         "user_query": query,
         "user_id": None,
+        "deadline": None,
         "primary_intent": "",
         "secondary_intents": [],
         "processed_secondary_intents": [],  # NEW: Track processed intents
+        "skipped_intents": [],
+        "blocked_intents": [],
         "entities": {},
         "confidence": 0.0,
 
@@ -99,5 +113,6 @@ def create_initial_state(query: str) -> CookingState:
         "image_prompt": "",
         "image_url": None,
         "image_urls": [],
+        "token_usage": {},
         "error": None
     }
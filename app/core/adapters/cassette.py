@@ -0,0 +1,343 @@
+"""Cassette - LLM/이미지 호출 기록(record) / 재생(replay) 저장소
+
+운영 트래픽의 업스트림 호출을 gzip JSONL 파일(카세트)에 기록해 두고,
+새 빌드를 유료 API 없이 같은 응답/지연 시간으로 오프라인 재생하기 위한 공통 부분입니다.
+(Recording*/Replay* 어댑터에서 사용)
+
+카세트 한 줄(CassetteEntry):
+    {"kind": "llm", "method": "generate_recipe", "prompt_id": "cooking.generate_recipe_single",
+     "prompt_hash": "9f2c...", "latency": 2.31, "response": {...}, "error": null,
+     "request_id": "...", "ts": 1730000000.0}
+
+재생 시 매칭 순서:
+    1. (method, prompt_hash) - 같은 렌더링 프롬프트
+    2. (method, prompt_id) - 프롬프트 템플릿이 바뀐 빌드 (fallback_to_prompt_id=True일 때)
+    같은 키에 기록이 여러 개면 기록 순서대로 돌아가며 반환합니다.
+
+Example:
+    >>> writer = get_cassette_writer("data/cassettes/traffic-{pid}.jsonl.gz")
+    >>> writer.write(CassetteEntry(kind="llm", method="classify_intent", ...))
+    >>> cassette = load_cassette("data/cassettes/traffic-*.jsonl.gz")
+    >>> entry = cassette.match("llm", "classify_intent", prompt, prompt_id="cooking.classify_intent")
+"""
+from app.core.prompt_loader import current_prompt_id
+from app.core.structured_logging import current_request_id
+from dataclasses import dataclass, asdict, field
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+import asyncio
+import atexit
+import glob
+import gzip
+import hashlib
+import json
+import logging
+import os
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class CassetteMissError(LookupError):
+    """재생할 기록이 카세트에 없음"""
+
+
+class ReplayedUpstreamError(RuntimeError):
+    """기록 당시 업스트림 호출이 실패했던 항목을 재생"""
+
+
+def prompt_hash(prompt: str) -> str:
+    """렌더링된 프롬프트의 해시 (카세트 매칭 키)"""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:32]
+
+
+@dataclass
+class CassetteEntry:
+    """업스트림 호출 1건의 기록
+
+    Attributes:
+        kind: "llm" | "image"
+        method: 포트 메서드명 (예: "generate_recipe")
+        prompt_id: 렌더링된 prompt_id (없으면 None)
+        prompt_hash: 렌더링된 프롬프트 해시
+        latency: 호출 소요 시간 (초)
+        response: 응답 (JSON 직렬화 가능한 값)
+        error: 실패 시 "예외 타입: 메시지"
+        request_id: 기록 당시 요청 ID
+        ts: 기록 시각 (epoch 초)
+    """
+    kind: str
+    method: str
+    prompt_id: Optional[str]
+    prompt_hash: str
+    latency: float
+    response: Any = None
+    error: Optional[str] = None
+    request_id: Optional[str] = None
+    ts: float = field(default_factory=time.time)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 기록 (record)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class CassetteWriter:
+    """카세트 파일에 호출 기록 추가 (gzip JSONL)
+
+    구조 (tracing의 JsonLinesSpanExporter와 같은 방식):
+        write()는 큐에 넣기만 하고, 백그라운드 스레드가 직렬화/gzip 압축/파일 기록을 담당합니다.
+        (이벤트 루프에서 압축/디스크 I/O가 일어나지 않음)
+
+    flush_every건마다 디스크에 내려씁니다. 프로세스가 여러 개면
+    경로에 "{pid}"를 넣어 워커별 파일로 나누세요. (예: "traffic-{pid}.jsonl.gz")
+    """
+
+    _STOP = object()
+
+    def __init__(self, path: str, flush_every: int = 50):
+        """
+        Args:
+            path: 카세트 경로 ("{pid}"는 프로세스 ID로 치환)
+            flush_every: 몇 건마다 flush할지
+        """
+        self.path = path.format(pid=os.getpid())
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # 추가 모드: 기존 카세트 뒤에 gzip 멤버를 이어 붙임 (gzip.open으로 한 번에 읽힘)
+        self._file = gzip.open(self.path, "at", encoding="utf-8")
+        self._flush_every = max(1, flush_every)
+        self._closed = False
+        self.count = 0
+        # SimpleQueue: C 구현, put이 락 대기 없이 끝남 (크기 제한 없음)
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._drain, name="cassette-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, entry: CassetteEntry) -> None:
+        if self._closed:
+            return
+        self._queue.put(entry)
+        self.count += 1
+
+    def close(self) -> None:
+        """남은 기록을 모두 쓰고 기록 스레드 종료"""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._thread.join()
+        logger.info("[Cassette] 기록 종료: %s (%s건)", self.path, self.count)
+
+    def _drain(self) -> None:
+        """큐를 비울 때마다 모인 기록을 한 번에 압축/기록 (백그라운드 스레드)"""
+        pending = 0
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = any(item is self._STOP for item in batch)
+            entries = [item for item in batch if item is not self._STOP]
+            try:
+                self._file.write("".join(
+                    json.dumps(asdict(entry), ensure_ascii=False, default=str) + "\n"
+                    for entry in entries
+                ))
+                pending += len(entries)
+                if pending >= self._flush_every:
+                    self._file.flush()
+                    pending = 0
+            except Exception as e:
+                logger.warning("[Cassette] 기록 실패: %s", e)
+        self._file.close()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 재생 (replay)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class Cassette:
+    """재생용 카세트 (메모리 색인)
+
+    Attributes:
+        entries: 로드된 전체 기록
+        fallback_to_prompt_id: 해시가 없으면 같은 prompt_id 기록으로 대체할지
+    """
+
+    def __init__(self, entries: List[CassetteEntry], fallback_to_prompt_id: bool = True):
+        self.entries = entries
+        self.fallback_to_prompt_id = fallback_to_prompt_id
+        self._by_hash: Dict[Tuple[str, str, str], List[CassetteEntry]] = {}
+        self._by_prompt_id: Dict[Tuple[str, str, Optional[str]], List[CassetteEntry]] = {}
+        self._cursor: Dict[Tuple, int] = {}
+
+        for entry in entries:
+            self._by_hash.setdefault((entry.kind, entry.method, entry.prompt_hash), []).append(entry)
+            self._by_prompt_id.setdefault((entry.kind, entry.method, entry.prompt_id), []).append(entry)
+
+    @classmethod
+    def load(cls, pattern: str, fallback_to_prompt_id: bool = True) -> "Cassette":
+        """카세트 파일 로드
+
+        Args:
+            pattern: 경로 또는 glob 패턴 (여러 워커 파일을 한 번에 로드)
+            fallback_to_prompt_id: prompt_id 매칭 허용 여부
+
+        Raises:
+            FileNotFoundError: 일치하는 파일이 없는 경우
+        """
+        paths = sorted(glob.glob(pattern))
+        if not paths:
+            raise FileNotFoundError(f"[Cassette] 카세트 파일이 없습니다: {pattern}")
+
+        entries: List[CassetteEntry] = []
+        for path in paths:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entries.append(CassetteEntry(**json.loads(line)))
+
+        logger.info("[Cassette] 로드 완료: %s개 파일, %s건", len(paths), len(entries))
+        return cls(entries, fallback_to_prompt_id=fallback_to_prompt_id)
+
+    def match(self, kind: str, method: str, prompt: str, prompt_id: Optional[str] = None) -> CassetteEntry:
+        """프롬프트에 해당하는 기록 조회
+
+        Raises:
+            CassetteMissError: 일치하는 기록이 없는 경우
+        """
+        key = (kind, method, prompt_hash(prompt))
+        candidates = self._by_hash.get(key)
+
+        if not candidates and self.fallback_to_prompt_id and prompt_id:
+            key = (kind, method, prompt_id)
+            candidates = self._by_prompt_id.get(key)
+
+        if not candidates:
+            raise CassetteMissError(
+                f"[Cassette] 기록 없음: {kind}.{method} (prompt_id={prompt_id})"
+            )
+
+        index = self._cursor.get(key, 0)
+        self._cursor[key] = index + 1
+        return candidates[index % len(candidates)]
+
+    def summary(self) -> Dict[str, Any]:
+        """method별 기록 수 / 평균 지연 시간"""
+        stats: Dict[str, Dict[str, float]] = {}
+        for entry in self.entries:
+            item = stats.setdefault(f"{entry.kind}.{entry.method}", {"count": 0, "errors": 0, "latency": 0.0})
+            item["count"] += 1
+            item["errors"] += 1 if entry.error else 0
+            item["latency"] += entry.latency
+        for item in stats.values():
+            item["latency"] = round(item["latency"] / item["count"], 4)
+        return {"entries": len(self.entries), "methods": stats}
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 글로벌 (LLM/이미지 어댑터가 같은 카세트를 공유)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_writers: Dict[str, CassetteWriter] = {}
+_cassettes: Dict[Tuple[str, bool], Cassette] = {}
+_lock = threading.Lock()
+
+
+def get_cassette_writer(path: str) -> CassetteWriter:
+    """경로별 카세트 기록기 (프로세스 종료 시 자동 close)"""
+    with _lock:
+        if path not in _writers:
+            if not _writers:
+                atexit.register(close_cassette_writers)
+            _writers[path] = CassetteWriter(path)
+            logger.info("[Cassette] 기록 시작: %s", _writers[path].path)
+        return _writers[path]
+
+
+def close_cassette_writers() -> None:
+    """열려 있는 카세트 기록기 모두 close (버퍼 flush)"""
+    with _lock:
+        for writer in _writers.values():
+            writer.close()
+        _writers.clear()
+
+
+def load_cassette(pattern: str, fallback_to_prompt_id: bool = True) -> Cassette:
+    """카세트 로드 (같은 패턴은 1회만 로드, "{pid}"는 모든 워커 파일)"""
+    pattern = pattern.replace("{pid}", "*")
+    key = (pattern, fallback_to_prompt_id)
+    with _lock:
+        if key not in _cassettes:
+            _cassettes[key] = Cassette.load(pattern, fallback_to_prompt_id=fallback_to_prompt_id)
+        return _cassettes[key]
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 어댑터 공통
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class CassetteReplayer:
+    """기록된 응답을 기록된 지연 시간(× scale)만큼 기다린 뒤 반환
+
+    Attributes:
+        cassette: 재생할 카세트
+        latency_scale: 지연 시간 배율 (0이면 대기 없음, 0.5면 2배속)
+    """
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 1.0):
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+
+    async def replay(self, kind: str, method: str, prompt: str) -> Any:
+        """
+        Raises:
+            CassetteMissError: 일치하는 기록이 없는 경우
+            ReplayedUpstreamError: 기록 당시 실패한 호출
+        """
+        entry = self.cassette.match(kind, method, prompt, prompt_id=current_prompt_id())
+        delay = entry.latency * self.latency_scale
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if entry.error:
+            raise ReplayedUpstreamError(f"[Cassette] 기록된 오류 재생: {entry.error}")
+        return entry.response
+
+
+async def record_call(writer: CassetteWriter, kind: str, method: str, prompt: str, call: Awaitable[Any]) -> Any:
+    """내부 Adapter 호출 결과/소요 시간을 카세트에 기록
+
+    취소(CancelledError)된 호출은 응답이 없으므로 기록하지 않습니다.
+
+    Args:
+        writer: 카세트 기록기
+        kind: "llm" | "image"
+        method: 포트 메서드명
+        prompt: 렌더링된 프롬프트
+        call: 내부 Adapter 호출 코루틴
+    """
+    entry = CassetteEntry(
+        kind=kind,
+        method=method,
+        prompt_id=current_prompt_id(),
+        prompt_hash=prompt_hash(prompt),
+        latency=0.0,
+        request_id=current_request_id()
+    )
+    start = time.perf_counter()
+    try:
+        entry.response = await call
+    except Exception as e:
+        entry.error = f"{type(e).__name__}: {e}"
+        entry.latency = round(time.perf_counter() - start, 4)
+        writer.write(entry)
+        raise
+
+    entry.latency = round(time.perf_counter() - start, 4)
+    writer.write(entry)
+    return entry.response
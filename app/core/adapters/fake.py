@@ -0,0 +1,66 @@
+"""Fake Adapter 공통 - 지연 시간 분포 / 오류 주입
+
+유료 API를 호출하지 않고 앱 자체의 처리량을 측정하기 위한 Fake 어댑터의 공통 부분입니다.
+(FakeLLMAdapter, FakeImageAdapter에서 사용)
+
+LatencyModel:
+    - 로그정규 분포 (중앙값 median, 꼬리 두께 sigma) → 실제 LLM 응답 시간처럼 긴 꼬리
+    - 메서드별 중앙값 재정의 가능
+    - error_rate 비율로 FakeUpstreamError 발생 (서킷 브레이커/헤징 동작 확인용)
+
+Example:
+    >>> model = LatencyModel(median=0.8, sigma=0.4, error_rate=0.01, seed=42)
+    >>> await model.wait("classify_intent")  # 0.8초 안팎 대기, 1% 확률로 예외
+"""
+from typing import Dict, Optional
+import asyncio
+import math
+import random
+
+
+class FakeUpstreamError(RuntimeError):
+    """Fake 어댑터가 주입한 업스트림 오류"""
+
+
+class LatencyModel:
+    """로그정규 지연 시간 + 오류 주입
+
+    Attributes:
+        median: 중앙 지연 시간 (초)
+        sigma: 로그정규 분포 표준편차 (0이면 항상 median)
+        error_rate: 오류 비율 (0~1)
+        overrides: 메서드별 중앙 지연 시간 (초)
+    """
+
+    def __init__(
+        self,
+        median: float,
+        sigma: float = 0.4,
+        error_rate: float = 0.0,
+        overrides: Optional[Dict[str, float]] = None,
+        seed: Optional[int] = None
+    ):
+        self.median = median
+        self.sigma = sigma
+        self.error_rate = error_rate
+        self.overrides = dict(overrides or {})
+        self._random = random.Random(seed)
+
+    def sample(self, method: str) -> float:
+        """지연 시간 1회 샘플 (초)"""
+        median = self.overrides.get(method, self.median)
+        if median <= 0:
+            return 0.0
+        if self.sigma <= 0:
+            return median
+        return self._random.lognormvariate(math.log(median), self.sigma)
+
+    async def wait(self, method: str) -> None:
+        """샘플링한 시간만큼 대기 후 error_rate 확률로 FakeUpstreamError
+
+        Raises:
+            FakeUpstreamError: 오류 주입 시
+        """
+        await asyncio.sleep(self.sample(method))
+        if self.error_rate > 0 and self._random.random() < self.error_rate:
+            raise FakeUpstreamError(f"[Fake] 주입된 오류: {method}")
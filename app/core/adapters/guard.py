@@ -0,0 +1,200 @@
+"""AdapterGuard - 어댑터 호출 공통 보호 계층
+
+Port 구현체(Adapter)를 감싸는 Guarded Adapter들이 공유하는 호출 래퍼입니다.
+업스트림 API 호출 자체는 내부 Adapter가 담당하고,
+여기서는 회로 차단(Circuit Breaker), 지연 시간 통계, 적응형 타임아웃, 요청 기한 등
+인프라 관심사만 처리합니다.
+"""
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+import time
+import asyncio
+
+from app.core.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from app.core.deadline import DeadlineExceededError, effective_timeout
+from app.core.latency import LatencyTracker
+from app.core.timeouts import AdaptiveTimeoutPolicy
+from app.core.prompt_loader import current_prompt_id
+from app.core.metrics import counter, gauge, histogram
+from app.core.tracing import get_tracer, get_current_span
+from app.core.usage import record_cancelled_call
+from app.core.config import Settings
+
+T = TypeVar("T")
+
+tracer = get_tracer(__name__)
+
+_cancelled_calls = counter(
+    "upstream_calls_cancelled_total",
+    "진행 중 취소된 업스트림 호출 수 (클라이언트 연결 종료, 노드 기한 초과 등)",
+    ["upstream", "method"]
+)
+_call_duration = histogram(
+    "upstream_call_duration_seconds",
+    "Port 메서드별 업스트림 호출 지연 시간",
+    ["upstream", "method", "outcome"]
+)
+_in_flight = gauge(
+    "upstream_calls_in_flight",
+    "진행 중인 업스트림 호출 수",
+    ["upstream"]
+)
+
+
+class AdapterGuard:
+    """업스트림 호출 보호 (Circuit Breaker + 지연 시간 통계 + 적응형 타임아웃)
+
+    지연 시간 통계와 타임아웃은 "method:prompt_id" 키로 관리합니다.
+    (예: "generate_recipe:cooking.generate_recipe_multiple")
+
+    Attributes:
+        upstream: 업스트림 이름 (예: "anthropic", "replicate")
+        breaker: 업스트림 회로 차단기
+        latency: 키별 성공 호출 지연 시간 (hedging, 적응형 타임아웃에서 사용)
+        timeouts: 적응형 타임아웃 정책
+    """
+
+    def __init__(
+        self,
+        upstream: str,
+        settings: Settings,
+        default_timeout: float,
+        timeout_overrides: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            upstream: 업스트림 이름
+            settings: 애플리케이션 설정 (circuit_*, timeout_* 값 사용)
+            default_timeout: 기본 타임아웃이자 적응형 타임아웃 상한 (초)
+            timeout_overrides: 고정 타임아웃 ("method" 또는 "method:prompt_id" → 초)
+        """
+        self.upstream = upstream
+        self.settings = settings
+        self.breaker: CircuitBreaker = get_circuit_breaker(
+            upstream,
+            failure_rate_threshold=settings.circuit_failure_rate_threshold,
+            slow_call_threshold=settings.circuit_slow_call_threshold,
+            slow_call_rate_threshold=settings.circuit_slow_call_rate_threshold,
+            window_size=settings.circuit_window_size,
+            minimum_calls=settings.circuit_minimum_calls,
+            open_duration=settings.circuit_open_duration,
+            half_open_max_calls=settings.circuit_half_open_max_calls
+        )
+        self.latency = LatencyTracker(window_size=settings.latency_window_size)
+        self.timeouts = AdaptiveTimeoutPolicy(
+            self.latency,
+            default=default_timeout,
+            overrides=timeout_overrides,
+            enabled=settings.adaptive_timeout_enabled,
+            percentile=settings.adaptive_timeout_percentile,
+            factor=settings.adaptive_timeout_factor,
+            min_timeout=settings.adaptive_timeout_min,
+            min_samples=settings.adaptive_timeout_min_samples
+        )
+        self._in_flight = _in_flight.labels(upstream)
+
+    def stats_key(self, method: str) -> str:
+        """지연 시간 통계 키 (현재 렌더링된 prompt_id 포함)"""
+        prompt_id = current_prompt_id()
+        return f"{method}:{prompt_id}" if prompt_id else method
+
+    async def call(
+        self,
+        method: str,
+        func: Callable[[], Awaitable[T]],
+        is_failure: Optional[Callable[[T], bool]] = None
+    ) -> T:
+        """보호된 업스트림 호출
+
+        Args:
+            method: Port 메서드 이름 (예: "classify_intent")
+            func: 실제 호출을 수행하는 코루틴 팩토리
+            is_failure: 예외 없이 반환된 결과를 실패로 판단하는 함수
+                        (예: 이미지 포트의 None 반환)
+
+        Returns:
+            T: 내부 Adapter의 반환값
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있는 경우 (업스트림 호출 없음)
+            DeadlineExceededError: 요청 기한 안에 끝나지 않은 경우
+            asyncio.TimeoutError: 적응형 타임아웃을 초과한 경우
+            Exception: 내부 Adapter에서 발생한 예외
+
+        Note:
+            타임아웃은 적응형 타임아웃과 요청 기한(deadline_scope)의 남은 예산 중 작은 값입니다.
+            기한 초과는 업스트림 장애가 아니므로 회로 통계에 기록하지 않고,
+            적응형 타임아웃 초과는 실패로 기록합니다.
+        """
+        key = self.stats_key(method)
+        call_timeout = self.timeouts.timeout_for(method, key)
+        timeout = effective_timeout(call_timeout)
+
+        with tracer.start_as_current_span(
+            f"{self.upstream}.{method}",
+            attributes={
+                "upstream": self.upstream,
+                "prompt_id": current_prompt_id() or "",
+                "timeout": round(timeout, 3),
+                "circuit.state": self.breaker.state.value,
+            }
+        ):
+            return await self._call(method, key, func, is_failure, call_timeout, timeout)
+
+    async def _call(
+        self,
+        method: str,
+        key: str,
+        func: Callable[[], Awaitable[T]],
+        is_failure: Optional[Callable[[T], bool]],
+        call_timeout: float,
+        timeout: float
+    ) -> T:
+        """회로 차단/타임아웃/통계 기록 (call()의 본체)"""
+        deadline_bound = timeout < call_timeout
+
+        if timeout <= 0:
+            raise DeadlineExceededError(f"{self.upstream}.{method}: 요청 기한 초과")
+
+        self.breaker.before_call()
+
+        in_flight = self._in_flight
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            result = await asyncio.wait_for(func(), timeout)
+        except asyncio.CancelledError:
+            self.breaker.release()
+            _cancelled_calls.labels(self.upstream, method).inc()
+            record_cancelled_call(method)
+            self._observe(method, "cancelled", start)
+            raise
+        except asyncio.TimeoutError:
+            if deadline_bound:
+                self.breaker.release()
+                self._observe(method, "deadline", start)
+                raise DeadlineExceededError(f"{self.upstream}.{method}: 요청 기한 초과")
+            # 타임아웃 값을 샘플로 남겨 다음 타임아웃이 점차 넓어지도록 함
+            self.latency.record(key, timeout)
+            self.breaker.record_failure(self._observe(method, "timeout", start))
+            raise asyncio.TimeoutError(f"{self.upstream}.{key}: {timeout:.1f}초 타임아웃")
+        except Exception:
+            self.breaker.record_failure(self._observe(method, "error", start))
+            raise
+        finally:
+            in_flight.dec()
+
+        if is_failure is not None and is_failure(result):
+            self.breaker.record_failure(self._observe(method, "error", start))
+        else:
+            elapsed = self._observe(method, "success", start)
+            self.breaker.record_success(elapsed)
+            self.latency.record(key, elapsed)
+
+        return result
+
+    def _observe(self, method: str, outcome: str, start: float) -> float:
+        """호출 지연 시간을 히스토그램/span에 기록하고 반환"""
+        elapsed = time.perf_counter() - start
+        _call_duration.labels(self.upstream, method, outcome).observe(elapsed)
+        get_current_span().set_attribute("outcome", outcome)
+        return elapsed
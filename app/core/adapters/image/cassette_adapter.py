@@ -0,0 +1,44 @@
+"""Cassette 이미지 어댑터 - 호출 기록(record) / 재생(replay)
+
+RecordingImageAdapter: 실제 Adapter를 감싸 모든 호출을 카세트에 기록 (adapter_mode="record")
+ReplayImageAdapter: 카세트의 URL을 기록된 지연 시간으로 돌려줌 (adapter_mode="replay")
+"""
+from app.core.adapters.cassette import CassetteReplayer, CassetteWriter, record_call
+from app.core.ports.image_port import IImagePort
+from typing import Optional
+
+
+class RecordingImageAdapter(IImagePort):
+    """호출 기록 이미지 어댑터 (IImagePort 데코레이터)
+
+    Attributes:
+        inner: 실제 이미지 Adapter (예: ReplicateImageAdapter)
+        writer: 카세트 기록기
+    """
+
+    def __init__(self, inner: IImagePort, writer: CassetteWriter):
+        self.inner = inner
+        self.writer = writer
+
+    async def generate_image(self, prompt: str) -> Optional[str]:
+        return await record_call(self.writer, "image", "generate_image", prompt, self.inner.generate_image(prompt))
+
+    def warmup(self) -> None:
+        self.inner.warmup()
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class ReplayImageAdapter(IImagePort):
+    """카세트 재생 이미지 어댑터 (IImagePort 구현체)
+
+    Attributes:
+        replayer: 카세트 재생기
+    """
+
+    def __init__(self, replayer: CassetteReplayer):
+        self.replayer = replayer
+
+    async def generate_image(self, prompt: str) -> Optional[str]:
+        return await self.replayer.replay("image", "generate_image", prompt)
@@ -0,0 +1,41 @@
+"""FakeImageAdapter - 부하 테스트용 가짜 이미지 어댑터
+
+IImagePort를 구현하며 실제 API 대신 프롬프트 해시 기반의 고정 URL을 반환합니다.
+지연 시간은 LatencyModel(로그정규 분포)로 흉내내고, 오류 비율도 주입할 수 있습니다.
+
+settings.adapter_mode = "fake"이면 CookingModule이 이 어댑터를 바인딩합니다.
+"""
+from app.core.decorators import singleton, inject
+from app.core.ports.image_port import IImagePort
+from app.core.config import Settings
+from app.core.adapters.fake import LatencyModel
+from typing import Optional
+import hashlib
+
+
+@singleton
+class FakeImageAdapter(IImagePort):
+    """가짜 이미지 어댑터 (IImagePort 구현체)
+
+    Attributes:
+        latency: 지연 시간/오류 주입 모델
+    """
+
+    @inject
+    def __init__(self, settings: Settings):
+        """의존성 주입: Settings
+
+        Args:
+            settings: fake_image_latency, fake_latency_sigma, fake_image_error_rate 등
+        """
+        self.latency = LatencyModel(
+            median=settings.fake_image_latency,
+            sigma=settings.fake_latency_sigma,
+            error_rate=settings.fake_image_error_rate,
+            seed=settings.fake_seed
+        )
+
+    async def generate_image(self, prompt: str) -> Optional[str]:
+        await self.latency.wait("generate_image")
+        digest = hashlib.sha1(prompt.encode("utf-8")).hexdigest()[:16]
+        return f"https://images.fake.local/{digest}.webp"
@@ -0,0 +1,59 @@
+"""GuardedImageAdapter - 보호 계층이 적용된 이미지 어댑터
+
+다른 IImagePort 구현체를 감싸 Circuit Breaker 등 공통 보호 로직을 적용합니다.
+(Decorator Pattern: 내부 Adapter는 Pure Adapter 원칙을 그대로 유지)
+"""
+from app.core.adapters.guard import AdapterGuard
+from app.core.circuit_breaker import CircuitOpenError
+from app.core.ports.image_port import IImagePort
+from app.core.config import Settings
+from typing import Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class GuardedImageAdapter(IImagePort):
+    """보호 계층 이미지 어댑터 (IImagePort 데코레이터)
+
+    이미지 생성은 실패해도 치명적이지 않으므로,
+    회로가 열려 있거나 타임아웃/요청 기한을 넘기면 None을 반환합니다.
+    (→ CookingService의 "이미지 생성 실패" 응답 경로)
+
+    Attributes:
+        inner: 실제 이미지 Adapter (예: ReplicateImageAdapter)
+        guard: 업스트림 호출 보호 계층
+    """
+
+    def __init__(self, inner: IImagePort, settings: Settings, upstream: str = "replicate"):
+        """
+        Args:
+            inner: 감쌀 이미지 Adapter
+            settings: 애플리케이션 설정
+            upstream: 업스트림 이름 (회로 차단기 식별자)
+        """
+        self.inner = inner
+        self.guard = AdapterGuard(
+            upstream,
+            settings,
+            default_timeout=settings.image_timeout,
+            timeout_overrides=settings.image_timeout_overrides
+        )
+
+    def warmup(self) -> None:
+        self.inner.warmup()
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    async def generate_image(self, prompt: str) -> Optional[str]:
+        try:
+            return await self.guard.call(
+                "generate_image",
+                lambda: self.inner.generate_image(prompt),
+                is_failure=lambda url: url is None
+            )
+        except (CircuitOpenError, asyncio.TimeoutError) as e:
+            logger.warning("[GuardedImage] 이미지 생성 생략: %s", e)
+            return None
@@ -9,10 +9,13 @@ Pure Adapter 원칙:
 from app.core.decorators import singleton, inject
 from app.core.ports.image_port import IImagePort
 from app.core.config import Settings
-import replicate
+from app.core.tracing import get_current_span
 from typing import Optional
+import asyncio
 import logging
 
+import httpx
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,6 +35,8 @@ class ReplicateImageAdapter(IImagePort):
     Attributes:
         settings: 애플리케이션 설정
         api_token: Replicate API 토큰
+        transport: 어댑터가 소유하는 비동기 HTTP transport (연결 풀, aclose()에서 close)
+        client: Replicate API 클라이언트
     """
 
     @inject
@@ -41,8 +46,19 @@ class ReplicateImageAdapter(IImagePort):
         Args:
             settings: 애플리케이션 설정 (이미지 모델명, API 토큰, 재시도 횟수 등)
         """
+        import replicate  # 어댑터 생성 시점에 로드 (lifespan 워밍업)
+
         self.settings = settings
         self.api_token = settings.replicate_api_token
+        # replicate.Client는 HTTP 클라이언트를 주입받지 않고 close도 없으므로 연결 풀(transport)을
+        # 직접 만들어 넘기고 직접 닫음 (생성 시 SSL 컨텍스트까지 만들어 첫 요청에서 지연되지 않음)
+        # 이 어댑터는 비동기 API만 사용하므로 transport도 비동기용만 전달
+        self.transport = httpx.AsyncHTTPTransport()
+        self.client = replicate.Client(api_token=self.api_token, transport=self.transport)
+
+    async def aclose(self) -> None:
+        """소유한 연결 풀(transport) close (앱 종료 시)"""
+        await self.transport.aclose()
 
     async def generate_image(self, prompt: str) -> Optional[str]:
         """Replicate Flux Schnell 모델로 이미지 생성
@@ -57,27 +73,57 @@ class ReplicateImageAdapter(IImagePort):
 
         for attempt in range(retries):
             try:
-                logger.info(f"[Replicate] 이미지 생성 시도 {attempt + 1}/{retries}")
-
-                output = replicate.run(
-                    self.settings.image_model,
-                    input={
-                        "prompt": prompt,
-                        "num_outputs": self.settings.image_num_outputs,
-                        "aspect_ratio": self.settings.image_aspect_ratio,
-                        "output_format": self.settings.image_output_format,
-                        "output_quality": self.settings.image_output_quality
-                    }
-                )
+                logger.info("[Replicate] 이미지 생성 시도 %s/%s", attempt + 1, retries)
+                get_current_span().set_attribute("image.retry_count", attempt)
+
+                output = await self._run_prediction(prompt)
 
                 # output은 리스트 형태로 반환됨
                 if output and len(output) > 0:
-                    logger.info(f"[Replicate] 이미지 생성 성공: {output[0]}")
+                    logger.info("[Replicate] 이미지 생성 성공: %s", output[0])
                     return output[0]
 
             except Exception as e:
-                logger.error(f"[Replicate] 시도 {attempt + 1} 실패: {str(e)}")
+                logger.error("[Replicate] 시도 %s 실패: %s", attempt + 1, e)
                 if attempt == retries - 1:
                     return None
 
         return None
+
+    async def _run_prediction(self, prompt: str):
+        """Prediction 생성 후 완료까지 대기 (비동기)
+
+        호출이 취소되면(클라이언트 연결 종료 등) Replicate의 prediction도 취소하여
+        더 이상 GPU 시간이 과금되지 않도록 합니다.
+
+        Args:
+            prompt: 이미지 생성 프롬프트
+
+        Returns:
+            prediction output (이미지 URL 리스트) 또는 None
+        """
+        prediction = await self.client.predictions.async_create(
+            model=self.settings.image_model,
+            input={
+                "prompt": prompt,
+                "num_outputs": self.settings.image_num_outputs,
+                "aspect_ratio": self.settings.image_aspect_ratio,
+                "output_format": self.settings.image_output_format,
+                "output_quality": self.settings.image_output_quality
+            }
+        )
+
+        try:
+            await prediction.async_wait()
+        except asyncio.CancelledError:
+            logger.info("[Replicate] 호출 취소 → prediction 취소: %s", prediction.id)
+            try:
+                await prediction.async_cancel()
+            except Exception as e:
+                logger.warning("[Replicate] prediction 취소 실패: %s", e)
+            raise
+
+        if prediction.status != "succeeded":
+            raise RuntimeError(f"prediction {prediction.status}: {prediction.error}")
+
+        return prediction.output
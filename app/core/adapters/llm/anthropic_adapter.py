@@ -9,15 +9,37 @@ Pure Adapter 원칙:
 from app.core.decorators import singleton, inject
 from app.core.ports.llm_port import ILLMPort
 from app.core.config import Settings
-from langchain_anthropic import ChatAnthropic
+from app.core.usage import TokenUsage, record_token_usage
 from langchain_core.messages import HumanMessage
-from typing import Dict, Any
+from functools import cached_property, lru_cache
+from typing import Dict, Any, Optional
 import json
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _chat_anthropic_class() -> type:
+    """어댑터가 만든 HTTP 클라이언트를 쓰는 ChatAnthropic (지연 import)
+
+    langchain-anthropic 0.3.x의 ChatAnthropic은 비동기 HTTP 클라이언트를 주입받는 인자가 없고
+    모듈 전역 lru_cache 클라이언트를 모든 인스턴스가 공유합니다.
+    SDK 클라이언트 생성 지점만 바꿔 http_async_client로 받은 클라이언트를 사용하게 합니다.
+    """
+    import anthropic
+    from langchain_anthropic import ChatAnthropic
+
+    class _ChatAnthropic(ChatAnthropic):
+        http_async_client: Optional[Any] = None
+
+        @cached_property
+        def _async_client(self) -> anthropic.AsyncClient:
+            return anthropic.AsyncClient(**self._client_params, http_client=self.http_async_client)
+
+    return _ChatAnthropic
+
+
 @singleton
 class AnthropicLLMAdapter(ILLMPort):
     """Anthropic Claude 어댑터 (ILLMPort 구현체)
@@ -33,6 +55,7 @@ class AnthropicLLMAdapter(ILLMPort):
 
     Attributes:
         settings: 애플리케이션 설정
+        http_client: 어댑터가 소유하는 비동기 HTTP 클라이언트 (연결 풀, aclose()에서 close)
         llm: LangChain ChatAnthropic 인스턴스
     """
 
@@ -43,15 +66,26 @@ class AnthropicLLMAdapter(ILLMPort):
         Args:
             settings: 애플리케이션 설정 (LLM 모델명, API 키, 타임아웃 등)
         """
+        # langchain_anthropic은 import 비용이 커서(~1초) 어댑터 생성 시점에 로드
+        # (fake/replay 모드나 스크립트에서는 로드하지 않음, 운영은 lifespan 워밍업에서 로드)
+        import anthropic
+
         self.settings = settings
-        self.llm = ChatAnthropic(
+        # 연결 풀(SSL 컨텍스트 포함)은 생성 시 만들어 첫 요청에서 지연되지 않음
+        self.http_client = anthropic.DefaultAsyncHttpxClient()
+        self.llm = _chat_anthropic_class()(
             model=settings.llm_model,
             api_key=settings.anthropic_api_key,
             timeout=settings.llm_timeout,
             temperature=settings.llm_temperature,
-            max_tokens=settings.llm_max_tokens
+            max_tokens=settings.llm_max_tokens,
+            http_async_client=self.http_client
         )
 
+    async def aclose(self) -> None:
+        """소유한 비동기 HTTP 클라이언트 close (앱 종료 시)"""
+        await self.http_client.aclose()
+
     async def classify_intent(self, prompt: str) -> Dict[str, Any]:
         """의도 분류 (Pure adapter: prompt → API → result)
 
@@ -64,16 +98,17 @@ class AnthropicLLMAdapter(ILLMPort):
         logger.info("[Anthropic] 의도 분류 요청")
 
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
+            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
+            self._record_usage(response)
             result_json = self._extract_json(response.content)
             result = json.loads(result_json)
 
-            logger.info(f"[Anthropic] 의도 분류 완료: {result.get('primary_intent')}")
+            logger.info("[Anthropic] 의도 분류 완료: %s", result.get('primary_intent'))
 
             return result
 
         except Exception as e:
-            logger.error(f"[Anthropic] 의도 분류 실패: {str(e)}")
+            logger.error("[Anthropic] 의도 분류 실패: %s", e)
             raise
 
     async def generate_recipe(self, prompt: str) -> Dict[str, Any]:
@@ -88,7 +123,8 @@ class AnthropicLLMAdapter(ILLMPort):
         logger.info("[Anthropic] 레시피 생성 요청")
 
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
+            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
+            self._record_usage(response)
             result_json = self._extract_json(response.content)
             result = json.loads(result_json)
 
@@ -97,7 +133,7 @@ class AnthropicLLMAdapter(ILLMPort):
             return result
 
         except Exception as e:
-            logger.error(f"[Anthropic] 레시피 생성 실패: {str(e)}")
+            logger.error("[Anthropic] 레시피 생성 실패: %s", e)
             raise
 
     async def recommend_dishes(self, prompt: str) -> Dict[str, Any]:
@@ -112,7 +148,8 @@ class AnthropicLLMAdapter(ILLMPort):
         logger.info("[Anthropic] 음식 추천 요청")
 
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
+            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
+            self._record_usage(response)
             result_json = self._extract_json(response.content)
             result = json.loads(result_json)
 
@@ -121,7 +158,7 @@ class AnthropicLLMAdapter(ILLMPort):
             return result
 
         except Exception as e:
-            logger.error(f"[Anthropic] 음식 추천 실패: {str(e)}")
+            logger.error("[Anthropic] 음식 추천 실패: %s", e)
             raise
 
     async def answer_question(self, prompt: str) -> Dict[str, Any]:
@@ -136,7 +173,8 @@ class AnthropicLLMAdapter(ILLMPort):
         logger.info("[Anthropic] 질문 답변 요청")
 
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
+            response = await self.llm.ainvoke([HumanMessage(content=prompt)])
+            self._record_usage(response)
             result_json = self._extract_json(response.content)
             result = json.loads(result_json)
 
@@ -145,13 +183,22 @@ class AnthropicLLMAdapter(ILLMPort):
             return result
 
         except Exception as e:
-            logger.error(f"[Anthropic] 질문 답변 실패: {str(e)}")
+            logger.error("[Anthropic] 질문 답변 실패: %s", e)
             raise
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # Private Methods (유틸리티)
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
+    def _record_usage(self, response: Any) -> None:
+        """응답의 토큰 사용량(usage_metadata) 기록
+
+        Args:
+            response: LangChain AIMessage
+        """
+        usage = TokenUsage.from_usage_metadata(getattr(response, "usage_metadata", None))
+        record_token_usage("anthropic", usage)
+
     def _extract_json(self, content: str) -> str:
         """마크다운 코드 블록에서 JSON 추출
 
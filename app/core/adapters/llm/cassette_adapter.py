@@ -0,0 +1,68 @@
+"""Cassette LLM 어댑터 - 호출 기록(record) / 재생(replay)
+
+RecordingLLMAdapter: 실제 Adapter를 감싸 모든 호출을 카세트에 기록 (adapter_mode="record")
+ReplayLLMAdapter: 카세트의 응답을 기록된 지연 시간으로 돌려줌 (adapter_mode="replay")
+
+두 어댑터 모두 GuardedLLMAdapter 안쪽에 바인딩되므로,
+기록되는 지연 시간은 순수 업스트림 호출 시간이고 재생 시 보호 계층은 실제와 동일하게 동작합니다.
+"""
+from app.core.adapters.cassette import CassetteReplayer, CassetteWriter, record_call
+from app.core.ports.llm_port import ILLMPort
+from typing import Any, Dict
+
+
+class RecordingLLMAdapter(ILLMPort):
+    """호출 기록 LLM 어댑터 (ILLMPort 데코레이터)
+
+    Attributes:
+        inner: 실제 LLM Adapter (예: AnthropicLLMAdapter)
+        writer: 카세트 기록기
+    """
+
+    def __init__(self, inner: ILLMPort, writer: CassetteWriter):
+        self.inner = inner
+        self.writer = writer
+
+    async def classify_intent(self, prompt: str) -> Dict[str, Any]:
+        return await record_call(self.writer, "llm", "classify_intent", prompt, self.inner.classify_intent(prompt))
+
+    async def generate_recipe(self, prompt: str) -> Dict[str, Any]:
+        return await record_call(self.writer, "llm", "generate_recipe", prompt, self.inner.generate_recipe(prompt))
+
+    async def recommend_dishes(self, prompt: str) -> Dict[str, Any]:
+        return await record_call(self.writer, "llm", "recommend_dishes", prompt, self.inner.recommend_dishes(prompt))
+
+    async def answer_question(self, prompt: str) -> Dict[str, Any]:
+        return await record_call(self.writer, "llm", "answer_question", prompt, self.inner.answer_question(prompt))
+
+    def warmup(self) -> None:
+        self.inner.warmup()
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+
+class ReplayLLMAdapter(ILLMPort):
+    """카세트 재생 LLM 어댑터 (ILLMPort 구현체)
+
+    기록이 없으면 CassetteMissError, 기록 당시 실패한 호출은 ReplayedUpstreamError가 발생하며
+    노드는 기존 예외 처리 경로(state["error"])로 처리합니다.
+
+    Attributes:
+        replayer: 카세트 재생기
+    """
+
+    def __init__(self, replayer: CassetteReplayer):
+        self.replayer = replayer
+
+    async def classify_intent(self, prompt: str) -> Dict[str, Any]:
+        return await self.replayer.replay("llm", "classify_intent", prompt)
+
+    async def generate_recipe(self, prompt: str) -> Dict[str, Any]:
+        return await self.replayer.replay("llm", "generate_recipe", prompt)
+
+    async def recommend_dishes(self, prompt: str) -> Dict[str, Any]:
+        return await self.replayer.replay("llm", "recommend_dishes", prompt)
+
+    async def answer_question(self, prompt: str) -> Dict[str, Any]:
+        return await self.replayer.replay("llm", "answer_question", prompt)
@@ -0,0 +1,146 @@
+"""FakeLLMAdapter - 부하 테스트용 가짜 LLM 어댑터
+
+ILLMPort를 구현하며 실제 API 대신 렌더링된 프롬프트를 보고
+노드가 기대하는 형식의 JSON을 만들어 반환합니다.
+지연 시간은 LatencyModel(로그정규 분포)로 흉내내고, 오류 비율도 주입할 수 있습니다.
+
+settings.adapter_mode = "fake"이면 CookingModule이 이 어댑터를 바인딩합니다.
+GuardedLLMAdapter로 감싸므로 서킷 브레이커/헤징/메트릭 경로는 실제와 동일하게 동작합니다.
+"""
+from app.core.decorators import singleton, inject
+from app.core.ports.llm_port import ILLMPort
+from app.core.config import Settings
+from app.core.adapters.fake import LatencyModel
+from app.core.usage import TokenUsage, record_token_usage
+from typing import Any, Dict
+import json
+import re
+
+_QUERY = re.compile(r'입력: "(.*)"')
+_REQUESTED = re.compile(r'사용자(?:가| 질문:) "(.*?)"')
+_DISHES = re.compile(r"요리명: (.+)")
+_RECIPE_COUNT = re.compile(r"(\d+)개의 레시피")
+_DISH_COUNT = re.compile(r"음식 (\d+)가지")
+
+# classify_intent 프롬프트의 키워드 기준과 동일
+_RECIPE_KEYWORDS = ("만드는 법", "레시피", "어떻게 만들어", "조리법", "요리법")
+_RECOMMEND_KEYWORDS = ("추천", "뭐 먹을까", "메뉴 제안", "어떤 음식", "소개")
+_QUESTION_KEYWORDS = ("칼로리", "영양", "얼마나", "?", "뭐야", "차이")
+
+_KNOWN_DISHES = (
+    "김치찌개", "된장찌개", "순두부찌개", "부대찌개", "불고기", "비빔밥", "잡채", "떡볶이",
+    "파스타", "카르보나라", "스테이크", "리조또", "초밥", "라멘", "짜장면", "마파두부",
+)
+
+
+@singleton
+class FakeLLMAdapter(ILLMPort):
+    """가짜 LLM 어댑터 (ILLMPort 구현체)
+
+    Attributes:
+        latency: 지연 시간/오류 주입 모델
+    """
+
+    @inject
+    def __init__(self, settings: Settings):
+        """의존성 주입: Settings
+
+        Args:
+            settings: fake_llm_latency, fake_llm_latency_sigma, fake_llm_error_rate 등
+        """
+        self.latency = LatencyModel(
+            median=settings.fake_llm_latency,
+            sigma=settings.fake_latency_sigma,
+            error_rate=settings.fake_llm_error_rate,
+            overrides=settings.fake_llm_latency_overrides,
+            seed=settings.fake_seed
+        )
+
+    async def classify_intent(self, prompt: str) -> Dict[str, Any]:
+        match = _QUERY.findall(prompt)
+        query = match[-1] if match else prompt
+        intents = [
+            intent for intent, keywords in (
+                ("recipe_create", _RECIPE_KEYWORDS),
+                ("recommend", _RECOMMEND_KEYWORDS),
+                ("question", _QUESTION_KEYWORDS),
+            )
+            if any(keyword in query for keyword in keywords)
+        ] or ["recipe_create"]
+
+        dishes = [dish for dish in _KNOWN_DISHES if dish in query]
+        entities: Dict[str, Any] = {"dishes": dishes} if dishes else {}
+        if len(dishes) > 1:
+            entities["count"] = len(dishes)
+
+        return await self._respond("classify_intent", prompt, {
+            "primary_intent": intents[0],
+            "secondary_intents": intents[1:],
+            "entities": entities,
+            "confidence": 0.9,
+        })
+
+    async def generate_recipe(self, prompt: str) -> Any:
+        dishes_line = _DISHES.search(prompt)
+        dishes = [d.strip() for d in dishes_line.group(1).split(",")] if dishes_line else []
+        count_match = _RECIPE_COUNT.search(prompt)
+
+        if "JSON 배열" in prompt:
+            count = int(count_match.group(1)) if count_match else max(len(dishes), 1)
+            titles = (dishes + [f"추천 요리 {i + 1}" for i in range(count)])[:count]
+            return await self._respond("generate_recipe", prompt, [_recipe(title) for title in titles])
+
+        title = dishes[0] if dishes else _requested(prompt)
+        return await self._respond("generate_recipe", prompt, _recipe(title))
+
+    async def recommend_dishes(self, prompt: str) -> Dict[str, Any]:
+        count_match = _DISH_COUNT.search(prompt)
+        count = int(count_match.group(1)) if count_match else 3
+        names = (list(_KNOWN_DISHES) * (count // len(_KNOWN_DISHES) + 1))[:count]
+        return await self._respond("recommend_dishes", prompt, {
+            "recommendations": [
+                {
+                    "name": name,
+                    "description": f"{name}은(는) 누구나 좋아하는 대표 메뉴입니다.",
+                    "reason": "요청하신 조건에 잘 맞습니다.",
+                }
+                for name in names
+            ]
+        })
+
+    async def answer_question(self, prompt: str) -> Dict[str, Any]:
+        question = _requested(prompt)
+        return await self._respond("answer_question", prompt, {
+            "answer": f"'{question}'에 대한 답변입니다. 일반적으로 1인분 기준 약 400kcal입니다.",
+            "additional_tips": ["재료 양을 조절하면 칼로리를 낮출 수 있습니다."],
+        })
+
+    async def _respond(self, method: str, prompt: str, result: Any) -> Any:
+        """지연 시간 대기 후 토큰 사용량(대략값)을 기록하고 결과 반환"""
+        await self.latency.wait(method)
+        record_token_usage("anthropic", TokenUsage(
+            input_tokens=len(prompt) // 2,
+            output_tokens=len(json.dumps(result, ensure_ascii=False)) // 2,
+            calls=1
+        ))
+        return result
+
+
+def _requested(prompt: str) -> str:
+    match = _REQUESTED.search(prompt)
+    return match.group(1) if match else "요리"
+
+
+def _recipe(title: str) -> Dict[str, Any]:
+    return {
+        "title": title if len(title) >= 2 else f"{title} 요리",
+        "ingredients": ["주재료 200g", "양파 1/2개", "대파 1대", "간장 1큰술", "참기름 약간"],
+        "steps": [
+            "1. 재료를 손질하여 먹기 좋은 크기로 썬다",
+            "2. 팬에 기름을 두르고 양파와 대파를 볶는다",
+            "3. 주재료를 넣고 간장으로 간을 한다",
+            "4. 불을 끄고 참기름을 둘러 마무리한다",
+        ],
+        "cooking_time": "30분",
+        "difficulty": "쉬움",
+    }
@@ -0,0 +1,83 @@
+"""GuardedLLMAdapter - 보호 계층이 적용된 LLM 어댑터
+
+다른 ILLMPort 구현체를 감싸 Circuit Breaker, Hedged Request 등
+공통 보호 로직을 적용합니다.
+(Decorator Pattern: 내부 Adapter는 Pure Adapter 원칙을 그대로 유지)
+"""
+from app.core.adapters.guard import AdapterGuard
+from app.core.hedging import Hedger
+from app.core.ports.llm_port import ILLMPort
+from app.core.config import Settings
+from typing import Awaitable, Callable, Dict, Any, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class GuardedLLMAdapter(ILLMPort):
+    """보호 계층 LLM 어댑터 (ILLMPort 데코레이터)
+
+    업스트림 장애 시 회로를 열어 타임아웃까지 기다리지 않고 즉시 실패합니다.
+    회로가 열려 있으면 CircuitOpenError가 발생하며,
+    노드는 기존 예외 처리 경로(state["error"])로 처리합니다.
+
+    호출 타임아웃은 메서드/프롬프트별 관측 지연 시간으로 조정됩니다 (AdaptiveTimeoutPolicy).
+    llm_hedging_enabled=True이면 메서드/프롬프트별 p95를 넘긴 호출에 hedge 요청을 보냅니다.
+
+    Attributes:
+        inner: 실제 LLM Adapter (예: AnthropicLLMAdapter)
+        guard: 업스트림 호출 보호 계층
+        hedger: Hedged Request 실행기 (비활성화 시 None)
+    """
+
+    def __init__(self, inner: ILLMPort, settings: Settings, upstream: str = "anthropic"):
+        """
+        Args:
+            inner: 감쌀 LLM Adapter
+            settings: 애플리케이션 설정
+            upstream: 업스트림 이름 (회로 차단기 식별자)
+        """
+        self.inner = inner
+        self.guard = AdapterGuard(
+            upstream,
+            settings,
+            default_timeout=settings.llm_timeout,
+            timeout_overrides=settings.llm_timeout_overrides
+        )
+        self.hedger: Optional[Hedger] = None
+
+        if settings.llm_hedging_enabled:
+            self.hedger = Hedger(
+                upstream,
+                self.guard.latency,
+                percentile=settings.llm_hedge_percentile,
+                min_samples=settings.llm_hedge_min_samples,
+                min_delay=settings.llm_hedge_min_delay,
+                max_ratio=settings.llm_hedge_max_ratio
+            )
+
+    async def classify_intent(self, prompt: str) -> Dict[str, Any]:
+        return await self._call("classify_intent", lambda: self.inner.classify_intent(prompt))
+
+    async def generate_recipe(self, prompt: str) -> Dict[str, Any]:
+        return await self._call("generate_recipe", lambda: self.inner.generate_recipe(prompt))
+
+    async def recommend_dishes(self, prompt: str) -> Dict[str, Any]:
+        return await self._call("recommend_dishes", lambda: self.inner.recommend_dishes(prompt))
+
+    async def answer_question(self, prompt: str) -> Dict[str, Any]:
+        return await self._call("answer_question", lambda: self.inner.answer_question(prompt))
+
+    def warmup(self) -> None:
+        self.inner.warmup()
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    async def _call(self, method: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """보호 계층을 거쳐 내부 Adapter 호출"""
+        if self.hedger is None:
+            return await self.guard.call(method, factory)
+
+        key = self.guard.stats_key(method)
+        return await self.guard.call(method, lambda: self.hedger.run(key, factory))
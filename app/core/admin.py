@@ -0,0 +1,192 @@
+"""Admin API - 운영 진단용 관리자 엔드포인트
+
+모든 엔드포인트는 get_admin_user(settings.admin_user_ids)로 보호됩니다.
+app.main에서 "/api/admin" prefix로 등록합니다.
+
+Endpoints:
+    - GET  /profiling: 프로파일러 상태
+    - POST /profiling: 프로파일러 런타임 설정 (enabled, sample_rate, mode)
+    - GET  /profiles: 보관 중인 프로파일 목록
+    - GET  /profiles/{id}: 프로파일 요약 + 상위 항목 텍스트
+    - GET  /profiles/{id}/download: 원본 다운로드 (.prof / .folded)
+    - GET  /memory: RSS/tracemalloc 상태, 캐시/싱글톤 크기
+    - POST /memory/tracemalloc/start, /memory/tracemalloc/stop
+    - POST /memory/snapshots: 스냅샷 저장
+    - GET  /memory/top: 상위 할당 위치
+    - GET  /memory/diff: 스냅샷 간 차이
+    - GET  /startup: 앱 시작 구간별 소요 시간
+    - POST /drain: 종료 드레인 시작 (배포 preStop 훅용, 이후 새 요청 503)
+"""
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel, Field
+from app.core.dependencies import get_admin_user, get_injector
+from app.core.memory import cache_report, get_memory_tracer, singleton_report
+from app.core.profiling import RequestProfile, get_request_profiler
+from app.core.shutdown import get_shutdown_coordinator
+from app.core.startup import get_startup_report
+
+router = APIRouter(dependencies=[Depends(get_admin_user)])
+
+
+class ProfilingConfig(BaseModel):
+    """프로파일러 설정 변경 요청 (지정한 항목만 변경)"""
+    enabled: Optional[bool] = None
+    sample_rate: Optional[float] = Field(default=None, ge=0.0, le=1.0)
+    mode: Optional[str] = Field(default=None, pattern="^(cprofile|sampling)$")
+
+
+def _get_profile(profile_id: str) -> RequestProfile:
+    profile = get_request_profiler().get(profile_id)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="프로파일을 찾을 수 없습니다")
+    return profile
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 프로파일링
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+@router.get("/profiling")
+async def get_profiling_status():
+    """프로파일러 상태"""
+    return get_request_profiler().status()
+
+
+@router.post("/profiling")
+async def configure_profiler(config: ProfilingConfig):
+    """프로파일러 런타임 설정 (재배포 없이 샘플링 on/off)"""
+    profiler = get_request_profiler()
+    profiler.configure(enabled=config.enabled, sample_rate=config.sample_rate, mode=config.mode)
+    return profiler.status()
+
+
+@router.get("/profiles")
+async def list_profiles():
+    """보관 중인 프로파일 목록 (최신순)"""
+    return {"profiles": get_request_profiler().list()}
+
+
+@router.delete("/profiles")
+async def clear_profiles():
+    """보관 중인 프로파일 삭제"""
+    get_request_profiler().clear()
+    return {"profiles": []}
+
+
+@router.get("/profiles/{profile_id}")
+async def get_profile(profile_id: str, limit: int = 30):
+    """프로파일 요약 + 상위 항목 (cprofile: 누적 시간순, sampling: 샘플 수순)"""
+    profile = _get_profile(profile_id)
+    return {**profile.summary(), "top": profile.top(limit)}
+
+
+@router.get("/profiles/{profile_id}/download")
+async def download_profile(profile_id: str):
+    """프로파일 원본 다운로드
+
+    - cprofile: pstats 파일 (.prof, snakeviz/pstats로 열기)
+    - sampling: collapsed stack (.folded, flamegraph.pl/speedscope로 열기)
+    """
+    profile = _get_profile(profile_id)
+    return Response(
+        content=profile.data,
+        media_type="application/octet-stream",
+        headers={"Content-Disposition": f'attachment; filename="{profile.filename}"'}
+    )
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 메모리
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# 스냅샷/통계 계산은 수십~수백 ms 걸리므로 동기 함수로 선언하여 스레드풀에서 실행
+_KEY_TYPE = Query("lineno", pattern="^(lineno|filename|traceback)$")
+
+
+def _memory_call(func, *args, **kwargs):
+    """tracemalloc 꺼짐 → 409, 없는 스냅샷 → 404"""
+    try:
+        return func(*args, **kwargs)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    except KeyError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=f"스냅샷을 찾을 수 없습니다: {e}")
+
+
+@router.get("/memory")
+def get_memory_status():
+    """워커 메모리 상태 (RSS, tracemalloc, 캐시/싱글톤 크기)"""
+    return {
+        **get_memory_tracer().status(),
+        "caches": cache_report(),
+        "singletons": singleton_report(get_injector()),
+    }
+
+
+@router.post("/memory/tracemalloc/start")
+async def start_tracemalloc(nframes: int = 10):
+    """tracemalloc 시작 (켜져 있는 동안 할당 오버헤드 발생)"""
+    tracer = get_memory_tracer()
+    tracer.start(nframes)
+    return tracer.status()
+
+
+@router.post("/memory/tracemalloc/stop")
+async def stop_tracemalloc():
+    """tracemalloc 중지 (저장된 스냅샷은 유지)"""
+    tracer = get_memory_tracer()
+    tracer.stop()
+    return tracer.status()
+
+
+@router.post("/memory/snapshots")
+def take_memory_snapshot(name: Optional[str] = None):
+    """스냅샷 저장 (같은 이름이면 덮어씀)"""
+    tracer = get_memory_tracer()
+    return {"name": _memory_call(tracer.take_snapshot, name), "snapshots": tracer.snapshots()}
+
+
+@router.delete("/memory/snapshots")
+async def clear_memory_snapshots():
+    """저장된 스냅샷 삭제"""
+    get_memory_tracer().clear()
+    return {"snapshots": []}
+
+
+@router.get("/memory/top")
+def get_memory_top(snapshot: Optional[str] = None, limit: int = 20, key_type: str = _KEY_TYPE):
+    """상위 할당 위치 (snapshot이 없으면 현재 상태)"""
+    return {"top": _memory_call(get_memory_tracer().top, snapshot, limit=limit, key_type=key_type)}
+
+
+@router.get("/memory/diff")
+def get_memory_diff(base: str, other: Optional[str] = None, limit: int = 20, key_type: str = _KEY_TYPE):
+    """스냅샷 간 차이 (other가 없으면 현재 상태와 비교, 증가량 큰 순)"""
+    return {
+        "diff": _memory_call(get_memory_tracer().compare, base, other, limit=limit, key_type=key_type)
+    }
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 시작
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+@router.get("/startup")
+async def get_startup():
+    """앱 시작 구간별 소요 시간 (imports, injector, adapters, workflow, prompts, clients)"""
+    return get_startup_report().to_dict()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 종료
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+@router.post("/drain")
+async def start_drain():
+    """종료 드레인 시작 (/ready 503, 이후 새 요청 503 + Retry-After, 진행 중 요청은 계속 처리)
+
+    진행 상황은 /metrics의 app_in_flight로 확인합니다.
+    """
+    get_shutdown_coordinator().begin_drain()
+    return {"draining": True}
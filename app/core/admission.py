@@ -0,0 +1,267 @@
+"""Admission - 입장 제어 / 부하 차단 (load shedding)
+
+업스트림이 포화되면 요청을 무제한으로 받아도 모두 기한을 넘겨 실패합니다.
+동시 실행 수를 max_concurrency로 제한하고, 초과한 요청은 우선순위 큐에서 기다리게 하되
+기한(Deadline) 안에 끝낼 수 없는 요청은 일찍 거절합니다. (503 + Retry-After)
+
+    - 빈 슬롯이 있고 대기열이 비어 있으면 즉시 입장
+    - 예상 대기 + 예상 처리 시간이 남은 기한을 넘으면 즉시 거절 ("deadline")
+    - 대기열이 가득 차면 가장 낮은 우선순위 대기자를 밀어내거나 (새 요청이 더 높을 때, "shed")
+      새 요청을 거절 ("queue_full")
+    - 대기 중 기한 안에 처리할 시간이 부족해지면 거절 ("deadline")
+
+우선순위는 작을수록 먼저 입장하며, 같은 우선순위는 도착 순서(FIFO)를 따릅니다.
+예상 처리 시간은 비용 등급(cost)별 최근 처리 시간 중앙값(p50)이며, 샘플이 없으면 default_service_time.
+
+Example:
+    >>> admission = get_admission_controller()
+    >>> try:
+    ...     async with admission.admit(priority=0, cost="cheap", deadline=deadline) as waited:
+    ...         response = await service.process_cooking_query(query)
+    ... except AdmissionRejectedError as e:
+    ...     return Response(status_code=503, headers={"Retry-After": str(math.ceil(e.retry_after))})
+"""
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Dict, List, Optional
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+
+from app.core.deadline import Deadline
+from app.core.latency import LatencyTracker
+from app.core.metrics import counter, gauge, histogram
+
+logger = logging.getLogger(__name__)
+
+_in_flight_gauge = gauge("admission_in_flight", "입장 제어 - 실행 중 요청 수").labels()
+_queued_gauge = gauge("admission_queued", "입장 제어 - 대기 중 요청 수").labels()
+_queue_wait = histogram("admission_queue_wait_seconds", "입장 대기 시간 (우선순위별)", ["priority"])
+_rejected = counter("admission_rejected_total", "입장 거절 수 (사유, 우선순위별)", ["reason", "priority"])
+
+
+class AdmissionRejectedError(Exception):
+    """입장 거절 (503 + Retry-After로 응답)
+
+    Attributes:
+        reason: "deadline" | "queue_full" | "shed"
+        retry_after: 재시도 권장 대기 시간 (초)
+    """
+
+    def __init__(self, reason: str, retry_after: float):
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"입장 거절 ({reason}) - {retry_after:.0f}초 후 재시도")
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    seq: int
+    future: "asyncio.Future[None]" = field(compare=False)
+
+
+class AdmissionController:
+    """동시 실행 제한 + 우선순위 대기열 + 기한 기반 조기 거절
+
+    Attributes:
+        enabled: False면 제한 없이 모두 입장
+        max_concurrency: 최대 동시 실행 수
+        max_queue: 최대 대기 수
+        default_service_time: 처리 시간 샘플이 없을 때 예상 처리 시간 (초)
+        in_flight: 실행 중 요청 수
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 32,
+        max_queue: int = 64,
+        default_service_time: float = 20.0,
+        window_size: int = 200,
+        enabled: bool = True
+    ):
+        self.enabled = enabled
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.default_service_time = default_service_time
+        self.in_flight = 0
+        self._waiters: List[_Waiter] = []
+        self._seq = itertools.count()
+        self._service_times = LatencyTracker(window_size)
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    def expected_service_time(self, cost: str) -> float:
+        """비용 등급별 예상 처리 시간 (최근 p50, 샘플이 없으면 default_service_time)"""
+        p50 = self._service_times.percentile(cost, 0.5)
+        return self.default_service_time if p50 is None else p50
+
+    def estimated_wait(self, ahead: int) -> float:
+        """앞선 대기자 수 기준 예상 대기 시간 (초)
+
+        슬롯 하나가 평균 (전체 p50 / 동시 실행 수)마다 비므로 (ahead + 1)번째 빈 슬롯까지의 시간.
+        """
+        samples = [
+            p for p in (self._service_times.percentile(key, 0.5) for key in self._service_times.keys())
+            if p is not None
+        ]
+        service = sum(samples) / len(samples) if samples else self.default_service_time
+        return (ahead + 1) * service / max(1, self.max_concurrency)
+
+    async def acquire(self, priority: int, cost: str = "default", deadline: Optional[Deadline] = None) -> float:
+        """입장 (슬롯을 얻을 때까지 대기)
+
+        Args:
+            priority: 우선순위 (작을수록 먼저)
+            cost: 비용 등급 (예상 처리 시간 구분, release()와 같은 값)
+            deadline: 요청 처리 기한 (None이면 기한 기반 거절 없음)
+
+        Returns:
+            float: 대기 시간 (초)
+
+        Raises:
+            AdmissionRejectedError: 기한 안에 처리 불가 / 대기열 초과 / 더 높은 우선순위에 밀려남
+        """
+        if not self.enabled:
+            return 0.0
+        if self.in_flight < self.max_concurrency and not self._waiters:
+            self._enter()
+            _queue_wait.labels(priority).observe(0.0)
+            return 0.0
+
+        expected = self.expected_service_time(cost)
+        ahead = sum(1 for w in self._waiters if w.priority <= priority)
+        if deadline is not None and self.estimated_wait(ahead) + expected > deadline.remaining():
+            self._reject("deadline", priority)
+
+        if len(self._waiters) >= self.max_queue:
+            worst = max(self._waiters, default=None)
+            if worst is None or worst.priority <= priority:
+                self._reject("queue_full", priority)
+            self._waiters.remove(worst)
+            heapq.heapify(self._waiters)
+            _rejected.labels("shed", worst.priority).inc()
+            worst.future.set_exception(AdmissionRejectedError("shed", self.retry_after()))
+
+        waiter = _Waiter(priority, next(self._seq), asyncio.get_running_loop().create_future())
+        heapq.heappush(self._waiters, waiter)
+        _queued_gauge.set(len(self._waiters))
+        start = time.perf_counter()
+        timeout = None if deadline is None else max(0.0, deadline.remaining() - expected)
+        try:
+            await asyncio.wait_for(asyncio.shield(waiter.future), timeout)
+        except asyncio.TimeoutError:
+            self._abandon(waiter)
+            self._reject("deadline", priority)
+        except asyncio.CancelledError:
+            self._abandon(waiter)
+            raise
+
+        waited = time.perf_counter() - start
+        _queue_wait.labels(priority).observe(waited)
+        return waited
+
+    def release(self, cost: str = "default", service_time: Optional[float] = None) -> None:
+        """퇴장 (처리 시간 기록 후 다음 대기자에게 슬롯 양도)"""
+        if not self.enabled:
+            return
+        if service_time is not None:
+            self._service_times.record(cost, service_time)
+        self.in_flight -= 1
+        self._grant()
+
+    @asynccontextmanager
+    async def admit(
+        self,
+        priority: int,
+        cost: str = "default",
+        deadline: Optional[Deadline] = None
+    ) -> AsyncIterator[float]:
+        """입장 → 블록 실행 → 퇴장 (블록에는 대기 시간(초)이 전달됨)"""
+        waited = await self.acquire(priority, cost, deadline)
+        start = time.perf_counter()
+        try:
+            yield waited
+        finally:
+            self.release(cost, time.perf_counter() - start)
+
+    def retry_after(self) -> float:
+        """현재 대기열이 빠지는 데 걸릴 예상 시간 (초, 최소 1)"""
+        return max(1.0, math.ceil(self.estimated_wait(len(self._waiters))))
+
+    def snapshot(self) -> Dict[str, Any]:
+        """헬스 체크 / 관리자 조회용 상태"""
+        return {
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "service_time_p50": {
+                key: round(self.expected_service_time(key), 3) for key in self._service_times.keys()
+            },
+        }
+
+    def _enter(self) -> None:
+        self.in_flight += 1
+        _in_flight_gauge.set(self.in_flight)
+
+    def _grant(self) -> None:
+        """빈 슬롯을 우선순위가 가장 높은 대기자에게 양도"""
+        while self._waiters and self.in_flight < self.max_concurrency:
+            waiter = heapq.heappop(self._waiters)
+            if waiter.future.done():
+                continue
+            self._enter()
+            waiter.future.set_result(None)
+        _in_flight_gauge.set(self.in_flight)
+        _queued_gauge.set(len(self._waiters))
+
+    def _abandon(self, waiter: _Waiter) -> None:
+        """대기 포기 (타임아웃/취소), 이미 슬롯을 받았으면 반납"""
+        if waiter in self._waiters:
+            self._waiters.remove(waiter)
+            heapq.heapify(self._waiters)
+            _queued_gauge.set(len(self._waiters))
+        if waiter.future.done() and not waiter.future.cancelled() and waiter.future.exception() is None:
+            self.in_flight -= 1
+            self._grant()
+        elif not waiter.future.done():
+            waiter.future.cancel()
+
+    def _reject(self, reason: str, priority: int) -> None:
+        _rejected.labels(reason, priority).inc()
+        logger.info(
+            "[Admission] 거절 (%s) - 우선순위: %s, 실행: %s, 대기: %s",
+            reason, priority, self.in_flight, len(self._waiters)
+        )
+        raise AdmissionRejectedError(reason, self.retry_after())
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 글로벌
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_controller = AdmissionController()
+
+
+def get_admission_controller() -> AdmissionController:
+    return _controller
+
+
+def configure_admission(
+    enabled: bool = True,
+    max_concurrency: int = 32,
+    max_queue: int = 64,
+    default_service_time: float = 20.0
+) -> AdmissionController:
+    """글로벌 입장 제어 설정 (앱 시작 시 1회)"""
+    _controller.enabled = enabled
+    _controller.max_concurrency = max_concurrency
+    _controller.max_queue = max_queue
+    _controller.default_service_time = default_service_time
+    return _controller
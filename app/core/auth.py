@@ -1,15 +1,57 @@
 """JWT 기반 인증 서비스
 
 사용자 인증을 위한 JWT 토큰 생성 및 검증 기능을 제공합니다.
+
+클라이언트(모바일 앱 등)는 같은 토큰을 24시간 동안 재사용하므로,
+검증에 성공한 토큰은 토큰 해시 → (user_id, exp) LRU 캐시에 보관해
+만료(exp) 전까지 디코딩/서명 검증을 생략합니다. (실패한 토큰은 캐시하지 않음)
 """
+from collections import OrderedDict
 from fastapi import HTTPException, status
 from jose import JWTError, jwt
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Dict, Optional, Tuple
+import hashlib
 import logging
+import threading
+import time
+
+from app.core.metrics import counter
 
 logger = logging.getLogger(__name__)
 
+_token_cache = counter("auth_token_cache_total", "검증된 토큰 캐시 조회 수 (hit, miss)", ["result"])
+_cache_hit = _token_cache.labels("hit")
+_cache_miss = _token_cache.labels("miss")
+
+# (token, key, algorithm) -> payload
+JwtDecoder = Callable[[str, str, str], Dict[str, Any]]
+
+
+def _jwt_backend(name: str) -> Tuple[JwtDecoder, Tuple[type, ...]]:
+    """JWT 디코더 선택
+
+    Args:
+        name: "jose" (python-jose, 기본) | "pyjwt" (PyJWT, 선택 의존성, 디코딩 오버헤드가 더 적음)
+
+    Returns:
+        (decode 함수, 검증 실패 예외 타입들)
+    """
+    if name == "pyjwt":
+        try:
+            import jwt as pyjwt  # 선택 의존성: pip install PyJWT
+        except ImportError:
+            logger.warning("[Auth] PyJWT가 설치되지 않아 python-jose로 검증합니다")
+        else:
+            return (
+                lambda token, key, algorithm: pyjwt.decode(token, key, algorithms=[algorithm]),
+                (pyjwt.PyJWTError,)
+            )
+    return (
+        lambda token, key, algorithm: jwt.decode(token, key, algorithms=[algorithm]),
+        (JWTError,)
+    )
+
 
 class AuthService:
     """JWT 기반 인증 서비스
@@ -22,17 +64,31 @@ class AuthService:
     Attributes:
         secret_key: JWT 서명에 사용할 비밀키
         algorithm: JWT 알고리즘 (기본: HS256)
+        cache_size: 검증된 토큰 캐시 최대 항목 수 (0이면 캐시 안 함)
+        token_cache: 토큰 SHA-256 → (user_id, exp epoch 초), LRU 순서
     """
 
-    def __init__(self, secret_key: str, algorithm: str = "HS256"):
+    def __init__(
+        self,
+        secret_key: str,
+        algorithm: str = "HS256",
+        cache_size: int = 1024,
+        backend: str = "jose"
+    ):
         """AuthService 초기화
 
         Args:
             secret_key: JWT 서명 비밀키 (환경 변수에서 주입)
             algorithm: JWT 알고리즘 (기본값: HS256)
+            cache_size: 검증된 토큰 캐시 크기 (0이면 비활성화)
+            backend: JWT 디코더 ("jose" | "pyjwt")
         """
         self.secret_key = secret_key
         self.algorithm = algorithm
+        self.cache_size = cache_size
+        self.token_cache: "OrderedDict[bytes, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._decode, self._decode_errors = _jwt_backend(backend)
 
     def create_access_token(
         self,
@@ -63,13 +119,15 @@ class AuthService:
 
         to_encode.update({"exp": expire})
 
-        logger.debug(f"[Auth] 토큰 생성 - user_id: {user_id}, expire: {expire}")
+        logger.debug("[Auth] 토큰 생성 - user_id: %s, expire: %s", user_id, expire)
 
         return jwt.encode(to_encode, self.secret_key, algorithm=self.algorithm)
 
     def verify_token(self, token: str) -> str:
         """토큰 검증 및 user_id 추출
 
+        캐시에 있고 만료 전이면 디코딩 없이 user_id를 반환합니다.
+
         Args:
             token: JWT 토큰
 
@@ -88,12 +146,22 @@ class AuthService:
             >>> print(user_id)
             'user123'
         """
+        key = hashlib.sha256(token.encode()).digest() if self.cache_size > 0 else None
+        if key is not None:
+            cached = self.token_cache.get(key)
+            if cached is not None and time.time() < cached[1]:
+                _cache_hit.inc()
+                with self._lock:
+                    if key in self.token_cache:
+                        self.token_cache.move_to_end(key)
+                return cached[0]
+            _cache_miss.inc()
+            if cached is not None:  # 만료된 항목 (다시 검증하면 만료 오류)
+                with self._lock:
+                    self.token_cache.pop(key, None)
+
         try:
-            payload = jwt.decode(
-                token,
-                self.secret_key,
-                algorithms=[self.algorithm]
-            )
+            payload = self._decode(token, self.secret_key, self.algorithm)
             user_id: str = payload.get("sub")
 
             if user_id is None:
@@ -104,13 +172,31 @@ class AuthService:
                     headers={"WWW-Authenticate": "Bearer"}
                 )
 
-            logger.debug(f"[Auth] 토큰 검증 성공 - user_id: {user_id}")
-            return user_id
+            logger.debug("[Auth] 토큰 검증 성공 - user_id: %s", user_id)
 
-        except JWTError as e:
-            logger.warning(f"[Auth] 토큰 검증 실패: {e}")
+        except self._decode_errors as e:
+            logger.warning("[Auth] 토큰 검증 실패: %s", e)
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="토큰 검증 실패",
                 headers={"WWW-Authenticate": "Bearer"}
             )
+
+        if key is not None:
+            self._cache_token(key, user_id, payload.get("exp"))
+        return user_id
+
+    def _cache_token(self, key: bytes, user_id: str, exp: Any) -> None:
+        """검증된 토큰 캐시 (exp가 없는 토큰은 만료 시점을 알 수 없으므로 캐시하지 않음)"""
+        if not isinstance(exp, (int, float)):
+            return
+        with self._lock:
+            self.token_cache[key] = (user_id, float(exp))
+            self.token_cache.move_to_end(key)
+            while len(self.token_cache) > self.cache_size:
+                self.token_cache.popitem(last=False)
+
+    def clear_token_cache(self) -> None:
+        """검증된 토큰 캐시 비우기 (비밀키 교체 시 등)"""
+        with self._lock:
+            self.token_cache.clear()
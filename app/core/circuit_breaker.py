@@ -0,0 +1,296 @@
+"""CircuitBreaker - 업스트림별 회로 차단기
+
+외부 API(Anthropic, Replicate 등)가 느려지거나 실패할 때
+매 요청이 타임아웃까지 기다리지 않도록 빠르게 실패시킵니다.
+
+상태 전이:
+    CLOSED ──(실패율/지연율 임계치 초과)──▶ OPEN
+    OPEN ──(open_duration 경과)──▶ HALF_OPEN
+    HALF_OPEN ──(프로브 성공)──▶ CLOSED
+    HALF_OPEN ──(프로브 실패)──▶ OPEN
+"""
+from collections import deque
+from enum import Enum
+from typing import Deque, Dict, Optional, Tuple, Any
+import threading
+import time
+import logging
+
+from app.core.metrics import counter, gauge
+
+logger = logging.getLogger(__name__)
+
+_transitions = counter(
+    "circuit_breaker_transitions_total",
+    "Circuit breaker 상태 전이 횟수",
+    ["upstream", "from_state", "to_state"]
+)
+_state_gauge = gauge(
+    "circuit_breaker_state",
+    "Circuit breaker 현재 상태 (0=closed, 1=half_open, 2=open)",
+    ["upstream"]
+)
+_rejected = counter(
+    "circuit_breaker_rejected_total",
+    "Circuit open으로 즉시 실패 처리된 호출 수",
+    ["upstream"]
+)
+
+
+class CircuitState(str, Enum):
+    """회로 상태"""
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+_STATE_VALUES = {
+    CircuitState.CLOSED: 0,
+    CircuitState.HALF_OPEN: 1,
+    CircuitState.OPEN: 2,
+}
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 호출이 거부됨
+
+    Attributes:
+        upstream: 업스트림 이름
+        retry_after: 다음 프로브까지 남은 시간 (초)
+    """
+
+    def __init__(self, upstream: str, retry_after: float):
+        self.upstream = upstream
+        self.retry_after = retry_after
+        super().__init__(
+            f"{upstream} 회로 차단됨 (약 {retry_after:.0f}초 후 재시도)"
+        )
+
+
+class CircuitBreaker:
+    """카운트 기반 슬라이딩 윈도우 회로 차단기
+
+    최근 window_size개 호출 결과 중
+    - 실패 비율이 failure_rate_threshold 이상이거나
+    - slow_call_threshold초 이상 걸린 호출 비율이 slow_call_rate_threshold 이상이면
+    회로를 엽니다. (최소 minimum_calls개 호출이 쌓인 뒤부터 판단)
+
+    Attributes:
+        name: 업스트림 이름 (예: "anthropic", "replicate")
+        state: 현재 회로 상태
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: float = 60.0,
+        slow_call_rate_threshold: float = 0.8,
+        window_size: int = 20,
+        minimum_calls: int = 5,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 1
+    ):
+        """
+        Args:
+            name: 업스트림 이름
+            failure_rate_threshold: 회로를 여는 실패율 (0.0 ~ 1.0)
+            slow_call_threshold: 느린 호출로 간주할 지연 시간 (초)
+            slow_call_rate_threshold: 회로를 여는 느린 호출 비율 (0.0 ~ 1.0)
+            window_size: 슬라이딩 윈도우 크기 (호출 수)
+            minimum_calls: 판단에 필요한 최소 호출 수
+            open_duration: OPEN 유지 시간 (초), 이후 HALF_OPEN 전환
+            half_open_max_calls: HALF_OPEN에서 동시에 허용할 프로브 수
+        """
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+
+        # (failed, slow) 튜플
+        self._window: Deque[Tuple[bool, bool]] = deque(maxlen=window_size)
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        self._lock = threading.Lock()
+
+        self.last_success_at: Optional[float] = None
+        self.last_failure_at: Optional[float] = None
+
+        _state_gauge.labels(name).set(_STATE_VALUES[self._state])
+
+    @property
+    def state(self) -> CircuitState:
+        """현재 상태 (OPEN 유지 시간이 지났으면 HALF_OPEN으로 전환)"""
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def before_call(self) -> None:
+        """호출 허용 여부 확인
+
+        Raises:
+            CircuitOpenError: 회로가 열려 있거나 HALF_OPEN 프로브가 가득 찬 경우
+        """
+        with self._lock:
+            self._maybe_half_open()
+
+            if self._state is CircuitState.CLOSED:
+                return
+
+            if (
+                self._state is CircuitState.HALF_OPEN
+                and self._half_open_in_flight < self.half_open_max_calls
+            ):
+                self._half_open_in_flight += 1
+                logger.info("[CircuitBreaker:%s] half-open 프로브 호출", self.name)
+                return
+
+            retry_after = max(0.0, self._opened_at + self.open_duration - time.monotonic())
+
+        _rejected.labels(self.name).inc()
+        raise CircuitOpenError(self.name, retry_after)
+
+    def record_success(self, duration: float) -> None:
+        """호출 성공 기록
+
+        Args:
+            duration: 호출 소요 시간 (초)
+        """
+        slow = duration >= self.slow_call_threshold
+        with self._lock:
+            self.last_success_at = time.time()
+
+            if self._state is CircuitState.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                if slow:
+                    self._transition(CircuitState.OPEN)
+                else:
+                    self._transition(CircuitState.CLOSED)
+                return
+
+            self._window.append((False, slow))
+            self._evaluate()
+
+    def record_failure(self, duration: float) -> None:
+        """호출 실패 기록
+
+        Args:
+            duration: 호출 소요 시간 (초)
+        """
+        slow = duration >= self.slow_call_threshold
+        with self._lock:
+            self.last_failure_at = time.time()
+
+            if self._state is CircuitState.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+                self._transition(CircuitState.OPEN)
+                return
+
+            self._window.append((True, slow))
+            self._evaluate()
+
+    def release(self) -> None:
+        """결과 없이 끝난 호출 정리 (예: 취소)
+
+        HALF_OPEN 프로브 슬롯만 반환하고 윈도우에는 기록하지 않습니다.
+        """
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN:
+                self._half_open_in_flight = max(0, self._half_open_in_flight - 1)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 상태 요약 (헬스 체크용)"""
+        with self._lock:
+            self._maybe_half_open()
+            calls = len(self._window)
+            failures = sum(1 for failed, _ in self._window if failed)
+            slow_calls = sum(1 for _, slow in self._window if slow)
+            return {
+                "state": self._state.value,
+                "calls": calls,
+                "failure_rate": round(failures / calls, 3) if calls else 0.0,
+                "slow_call_rate": round(slow_calls / calls, 3) if calls else 0.0,
+                "last_success_at": self.last_success_at,
+                "last_failure_at": self.last_failure_at,
+            }
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Private Methods (lock 보유 상태에서 호출)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+    def _maybe_half_open(self) -> None:
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.open_duration
+        ):
+            self._transition(CircuitState.HALF_OPEN)
+
+    def _evaluate(self) -> None:
+        calls = len(self._window)
+        if self._state is not CircuitState.CLOSED or calls < self.minimum_calls:
+            return
+
+        failures = sum(1 for failed, _ in self._window if failed)
+        slow_calls = sum(1 for _, slow in self._window if slow)
+
+        if (
+            failures / calls >= self.failure_rate_threshold
+            or slow_calls / calls >= self.slow_call_rate_threshold
+        ):
+            self._transition(CircuitState.OPEN)
+
+    def _transition(self, new_state: CircuitState) -> None:
+        old_state = self._state
+        if old_state is new_state:
+            return
+
+        self._state = new_state
+        if new_state is CircuitState.OPEN:
+            self._opened_at = time.monotonic()
+        if new_state is CircuitState.HALF_OPEN:
+            self._half_open_in_flight = 0
+        if new_state is CircuitState.CLOSED:
+            self._window.clear()
+
+        _transitions.labels(self.name, old_state.value, new_state.value).inc()
+        _state_gauge.labels(self.name).set(_STATE_VALUES[new_state])
+
+        log = logger.warning if new_state is CircuitState.OPEN else logger.info
+        log("[CircuitBreaker:%s] %s → %s", self.name, old_state.value, new_state.value)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 업스트림별 레지스트리
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_breakers: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker(name: str, **options) -> CircuitBreaker:
+    """업스트림 이름으로 CircuitBreaker 반환 (없으면 생성)
+
+    같은 업스트림을 쓰는 어댑터들은 하나의 회로를 공유합니다.
+
+    Args:
+        name: 업스트림 이름
+        **options: CircuitBreaker 생성 옵션 (최초 생성 시에만 적용)
+
+    Returns:
+        CircuitBreaker: 업스트림 회로 차단기
+    """
+    with _registry_lock:
+        breaker = _breakers.get(name)
+        if breaker is None:
+            breaker = CircuitBreaker(name, **options)
+            _breakers[name] = breaker
+        return breaker
+
+
+def get_circuit_breakers() -> Dict[str, CircuitBreaker]:
+    """등록된 모든 CircuitBreaker 반환 (헬스 체크용)"""
+    return dict(_breakers)
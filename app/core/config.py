@@ -4,7 +4,7 @@
 """
 from pydantic_settings import BaseSettings
 from functools import lru_cache
-from typing import List
+from typing import List, Dict, Optional
 
 
 class Settings(BaseSettings):
@@ -26,6 +26,8 @@ class Settings(BaseSettings):
     # 인증 (JWT)
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     secret_key: str
+    auth_token_cache_size: int = 1024  # 검증된 토큰 LRU 캐시 크기 (0이면 매 요청 디코딩/서명 검증)
+    jwt_backend: str = "jose"  # "jose" | "pyjwt" (PyJWT 설치 시 사용, 디코딩 오버헤드가 더 적음)
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # LLM 설정 (Anthropic Claude)
@@ -34,6 +36,15 @@ class Settings(BaseSettings):
     llm_timeout: int = 90  # 초
     llm_temperature: float = 0.7
     llm_max_tokens: int = 4096
+    # 100만 토큰당 가격 (USD, 비용 추정용)
+    llm_token_prices: Dict[str, float] = {
+        "input": 3.0,
+        "output": 15.0,
+        "cache_read": 0.3,
+        "cache_creation": 3.75
+    }
+    token_usage_in_response: bool = False  # ResponseMetadata에 토큰 사용량 포함
+    usage_max_users: int = 10_000  # 사용자별 누적 사용량을 보관할 최대 사용자 수 (LRU)
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 이미지 생성 설정 (Replicate Flux Schnell)
@@ -44,6 +55,150 @@ class Settings(BaseSettings):
     image_output_format: str = "jpg"
     image_output_quality: int = 80
     image_num_outputs: int = 1
+    image_timeout: float = 120.0  # 초 (재시도 포함 전체)
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Adapter 모드 (부하 테스트 / 기록·재생)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    adapter_mode: str = "real"  # "real" | "fake" | "record" | "replay"
+    fake_llm_latency: float = 1.5  # 초 (중앙값)
+    fake_llm_latency_overrides: Dict[str, float] = {}  # 메서드별 중앙값 (예: {"classify_intent": 0.8})
+    fake_image_latency: float = 3.0  # 초 (중앙값)
+    fake_latency_sigma: float = 0.4  # 로그정규 분포 sigma (꼬리 두께)
+    fake_llm_error_rate: float = 0.0
+    fake_image_error_rate: float = 0.0
+    fake_seed: Optional[int] = None
+    # record: 실제 호출을 카세트에 기록 / replay: 카세트로 오프라인 재생 (유료 API 호출 없음)
+    cassette_path: str = "data/cassettes/traffic-{pid}.jsonl.gz"  # replay 시 {pid}는 * (워커별 파일 전체)
+    cassette_latency_scale: float = 1.0  # 재생 지연 시간 배율 (0: 대기 없음)
+    cassette_match_prompt_id: bool = True  # 해시 불일치 시 같은 prompt_id 기록으로 대체
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # Circuit Breaker (업스트림별 빠른 실패)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    circuit_failure_rate_threshold: float = 0.5  # 실패율 임계치
+    circuit_slow_call_threshold: float = 60.0  # 초 (이 이상이면 느린 호출)
+    circuit_slow_call_rate_threshold: float = 0.8  # 느린 호출 비율 임계치
+    circuit_window_size: int = 20  # 최근 호출 수 기준
+    circuit_minimum_calls: int = 5  # 판단 전 최소 호출 수
+    circuit_open_duration: float = 30.0  # 초 (OPEN 유지 후 half-open 프로브)
+    circuit_half_open_max_calls: int = 1
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 지연 시간 통계 / Hedged Request (LLM)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    latency_window_size: int = 200  # 메서드별 최근 샘플 수
+    llm_hedging_enabled: bool = False  # opt-in (토큰 비용 증가)
+    llm_hedge_percentile: float = 0.95  # 이 백분위 지연을 넘으면 hedge 발행
+    llm_hedge_min_samples: int = 20  # hedge 시작 전 최소 샘플 수
+    llm_hedge_min_delay: float = 0.5  # 초
+    llm_hedge_max_ratio: float = 0.05  # 전체 호출 대비 최대 hedge 비율
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 적응형 타임아웃 (p99 × factor, [min, llm_timeout/image_timeout]로 제한)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    adaptive_timeout_enabled: bool = True
+    adaptive_timeout_percentile: float = 0.99
+    adaptive_timeout_factor: float = 3.0
+    adaptive_timeout_min: float = 5.0  # 초
+    adaptive_timeout_min_samples: int = 20  # 이전에는 기본 타임아웃 사용
+    # 고정 타임아웃 (키: "method" 또는 "method:prompt_id", 예: {"classify_intent": 10})
+    llm_timeout_overrides: Dict[str, float] = {}
+    image_timeout_overrides: Dict[str, float] = {}
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 요청 기한 (Deadline)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    request_deadline: float = 120.0  # 초 (요청 전체 예산 기본값)
+    request_deadline_max: float = 300.0  # 초 (헤더로 요청 가능한 최대값)
+    request_deadline_overrides: Dict[str, float] = {}  # 경로별 기본값 (예: {"/api/cooking": 60})
+    request_deadline_header: str = "X-Request-Deadline"  # 클라이언트 지정 예산 (초)
+    deadline_optional_reserve: float = 15.0  # 초 (이보다 적게 남으면 이미지/부가 의도 생략)
+    disconnect_poll_interval: float = 0.5  # 초 (클라이언트 연결 종료 확인 주기)
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 입장 제어 / 부하 차단 (/api/cooking)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    admission_enabled: bool = True
+    admission_max_concurrency: int = 32  # 동시 실행 수 (초과분은 우선순위 대기열에서 대기)
+    admission_max_queue: int = 64  # 최대 대기 수 (가득 차면 낮은 우선순위부터 503)
+    admission_default_service_time: float = 20.0  # 초 (처리 시간 샘플이 없을 때 예상 처리 시간)
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 일괄 요청 (/api/cooking/batch, NDJSON 스트리밍)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    batch_max_size: int = 30  # 한 번에 받을 수 있는 최대 쿼리 수
+    batch_concurrency: int = 4  # 배치 하나에서 동시에 실행할 쿼리 수 (입장 제어와 별도)
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 비동기 작업 (/api/cooking/jobs, 워커 프로세스)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    job_db_path: str = "data/jobs.db"  # SQLite 작업 큐 (API/워커 프로세스가 공유)
+    job_deadline: float = 300.0  # 초 (작업 하나의 처리 기한)
+    job_lease_seconds: float = 600.0  # 초 (워커 점유 시간, 만료되면 다른 워커가 재시도, job_deadline보다 길게)
+    job_max_attempts: int = 3  # 리스 만료 재시도 포함 최대 시도 횟수
+    job_worker_concurrency: int = 4  # 워커 프로세스 하나가 동시에 처리할 작업 수
+    job_poll_interval: float = 1.0  # 초 (대기 작업이 없을 때 확인 주기)
+    job_result_ttl: float = 86400.0  # 초 (끝난 작업 보관 기간, 워커가 주기적으로 삭제)
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 사용 한도 (Quota, 0이면 무제한)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    quota_enabled: bool = True
+    quota_backend: str = "memory"  # memory | sqlite (같은 호스트의 여러 워커 공유)
+    quota_sqlite_path: str = "data/quota.db"
+    quota_user_tokens_per_minute: int = 100_000
+    quota_user_tokens_per_day: int = 1_000_000
+    quota_user_images_per_minute: int = 5
+    quota_user_images_per_day: int = 100
+    # 익명 사용자는 하나의 공용 예산을 사용
+    quota_anonymous_tokens_per_minute: int = 200_000
+    quota_anonymous_tokens_per_day: int = 2_000_000
+    quota_anonymous_images_per_minute: int = 10
+    quota_anonymous_images_per_day: int = 200
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 트레이싱 (in-process exporter)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    tracing_enabled: bool = True
+    tracing_sample_rate: float = 1.0  # 루트 span 샘플링 비율 (traceparent가 있으면 그 결정을 따름)
+    tracing_buffer_size: int = 2000  # 메모리에 보관할 최근 span 수
+    tracing_jsonl_path: Optional[str] = None  # 지정 시 종료된 span을 JSONL로 기록
+    server_timing_enabled: bool = True  # /api/cooking 응답에 Server-Timing 헤더 추가
+    server_timing_in_response: bool = False  # ResponseMetadata.timings 포함
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 이벤트 루프 감시
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    loop_monitor_enabled: bool = True
+    loop_monitor_interval: float = 0.5  # 초 (heartbeat 주기)
+    loop_lag_threshold: float = 0.2  # 초 (이 이상 멈추면 루프 스레드 스택 기록)
+    loop_blocking_detection: bool = False  # asyncio debug 모드로 느린 동기 구간 로깅 (진단용, 오버헤드 있음)
+    loop_slow_callback_ms: float = 100.0
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 헬스 체크 / 준비 상태 (/ready)
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    health_check_interval: float = 5.0  # 초 (심층 헬스 체크 백그라운드 갱신 주기)
+    ready_fail_on_degraded: bool = True  # 필수 업스트림 회로 OPEN 등 degraded 상태면 /ready 503
+    ready_critical_upstreams: List[str] = ["anthropic"]  # 회로 OPEN 시 /ready 503 (이미지는 없이도 응답 가능)
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 그레이스풀 종료
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    shutdown_grace_period: float = 60.0  # 초 (진행 중 레시피 생성을 기다릴 최대 시간)
+    shutdown_retry_after: int = 5  # 초 (드레인 중 거절한 요청의 Retry-After)
+
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    # 관리자 / 프로파일링
+    # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+    admin_user_ids: List[str] = []  # /api/admin 접근 가능한 user_id
+    profiling_enabled: bool = False  # 시작 시 샘플링 활성화 여부 (관리자 API로 런타임 변경 가능)
+    profiling_sample_rate: float = 0.01  # 활성화 시 /api/cooking 요청 중 프로파일링 비율
+    profiling_mode: str = "cprofile"  # "cprofile" | "sampling"
+    profiling_buffer_size: int = 20  # 보관할 최근 프로파일 수
+    profiling_sampling_interval: float = 0.005  # 초 (sampling 모드 스택 수집 주기)
+    profiling_header: str = "X-Profile"  # 관리자 요청에 "1"이면 샘플링과 무관하게 프로파일링
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 애플리케이션 설정
@@ -52,11 +207,15 @@ class Settings(BaseSettings):
     app_description: str = "LLM 기반 AI 어시스턴트 서비스"
     app_version: str = "2.0.0"
     cors_origins: List[str] = ["*"]
+    startup_warmup: bool = True  # 요청 수신 전 싱글톤/그래프/템플릿/HTTP 클라이언트 미리 생성
 
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     # 로깅
     # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
     log_level: str = "INFO"
+    log_json: bool = False  # 한 줄 JSON 출력 (request_id, trace_id 포함)
+    log_queue: bool = True  # QueueHandler/QueueListener로 백그라운드 스레드에서 출력
+    log_sample_rates: Dict[str, float] = {}  # 로거 prefix별 INFO 이하 샘플링 (예: {"app.cooking_assistant.workflow": 0.1})
 
     class Config:
         """Pydantic Settings 설정"""
@@ -0,0 +1,98 @@
+"""Deadline - 요청 단위 처리 기한
+
+요청 하나에 허용된 전체 시간 예산을 표현합니다.
+워크플로우 상태(CookingState)에 담겨 노드로 전달되고,
+노드 실행 중에는 contextvar로 어댑터 호출까지 전파됩니다.
+
+Example:
+    >>> deadline = Deadline.after(60.0, optional_reserve=15.0)
+    >>> with deadline_scope(deadline):
+    ...     timeout = effective_timeout(90.0)   # min(90, 남은 시간)
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Iterator, Optional
+import asyncio
+import time
+
+__all__ = [
+    "Deadline",
+    "DeadlineExceededError",
+    "current_deadline",
+    "deadline_scope",
+    "effective_timeout",
+]
+
+
+class DeadlineExceededError(asyncio.TimeoutError):
+    """요청 처리 기한 초과"""
+    pass
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """요청 처리 기한 (time.monotonic 기준 절대 시각)
+
+    Attributes:
+        expires_at: 기한 (time.monotonic() 기준)
+        optional_reserve: 선택 작업(이미지, 부가 의도)을 시작하려면
+                          최소한 남아 있어야 하는 시간 (초)
+    """
+    expires_at: float
+    optional_reserve: float = 0.0
+
+    @classmethod
+    def after(cls, seconds: float, optional_reserve: float = 0.0) -> "Deadline":
+        """지금부터 seconds초 후 만료되는 기한 생성"""
+        return cls(time.monotonic() + seconds, optional_reserve)
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 음수 없음)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def allows_optional_work(self) -> bool:
+        """선택 작업을 시작할 만큼 시간이 남았는지 여부"""
+        return self.remaining() > self.optional_reserve
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar("deadline", default=None)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """현재 실행 컨텍스트의 기한 (없으면 None)"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """기한을 현재 컨텍스트에 설정 (블록 종료 시 복원)
+
+    Args:
+        deadline: 설정할 기한 (None이면 기한 없음)
+    """
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def effective_timeout(default: Optional[float]) -> Optional[float]:
+    """기본 타임아웃과 남은 예산 중 작은 값
+
+    Args:
+        default: 호출 자체의 기본 타임아웃 (None이면 제한 없음)
+
+    Returns:
+        Optional[float]: 적용할 타임아웃 (둘 다 없으면 None)
+    """
+    deadline = _current_deadline.get()
+    if deadline is None:
+        return default
+    remaining = deadline.remaining()
+    return remaining if default is None else min(default, remaining)
@@ -4,17 +4,22 @@
 injector 라이브러리를 기반으로 합니다.
 """
 from injector import singleton, inject
-from typing import Type, Generator, Callable
+from fastapi import Request
+from typing import Any, Type, Callable, Awaitable
 
 __all__ = ['singleton', 'inject', 'get_dependency']
 
 
-def get_dependency(use_case_class: Type) -> Callable:
+def get_dependency(use_case_class: Type) -> Callable[[Request], Awaitable[Any]]:
     """FastAPI Depends용 제네릭 의존성 주입 헬퍼
 
     UseCase 클래스를 받아서 FastAPI Depends에서 사용할 수 있는
     의존성 함수를 반환합니다.
 
+    앱 시작 시 미리 생성해 둔 인스턴스(app.state.services)를 dict 조회 한 번으로 반환합니다.
+    async 함수라 요청마다 스레드풀/제너레이터/Injector 조회를 거치지 않습니다.
+    (워밍업을 하지 않았거나 테스트처럼 미리 생성되지 않은 경우에만 Injector에서 조회)
+
     사용법:
         @router.post("/cooking")
         async def handle_cooking_query(
@@ -28,10 +33,15 @@ def get_dependency(use_case_class: Type) -> Callable:
     Returns:
         FastAPI Depends용 제네릭 함수
     """
-    def dependency() -> Generator:
+    async def dependency(request: Request) -> Any:
+        services = getattr(request.app.state, "services", None)
+        if services:
+            instance = services.get(use_case_class)
+            if instance is not None:
+                return instance
+
         # 순환 참조 방지를 위해 여기서 import
         from app.core.dependencies import get_injector
-        injector = get_injector()
-        yield injector.get(use_case_class)
+        return get_injector().get(use_case_class)
 
     return dependency
@@ -5,15 +5,20 @@ FastAPI의 Depends에서 사용할 의존성 주입 헬퍼 함수들입니다.
 Note:
     - Application 모듈을 등록하여 DI 컨테이너를 초기화합니다
     - UseCase 의존성은 app.core.decorators.get_dependency()를 사용하세요
-    - 이 파일은 Injector 싱글톤 및 인증 관련 의존성만 관리합니다
+    - 앱 시작 시 resolve_dependencies()로 그래프 전체를 생성·검증해 app.state.services에 보관합니다
+    - 이 파일은 Injector 싱글톤, 인증, 요청 기한 관련 의존성만 관리합니다
 """
-from typing import Optional
-from fastapi import Depends
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+import inspect
+import math
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from injector import Injector
+from injector import Injector, get_bindings
 from app.cooking_assistant.module import CookingModule
 from app.core.auth import AuthService
 from app.core.config import get_settings
+from app.core.deadline import Deadline
+from app.core.memory import register_cache
 
 # FastAPI HTTPBearer 스키마
 security = HTTPBearer()
@@ -25,6 +30,8 @@ _injector: Optional[Injector] = None
 # 글로벌 AuthService (싱글톤)
 _auth_service: Optional[AuthService] = None
 
+register_cache("auth.verified_tokens", lambda: get_auth_service().token_cache)
+
 
 def get_injector() -> Injector:
     """Injector 싱글톤 반환
@@ -49,13 +56,89 @@ def get_auth_service() -> AuthService:
     global _auth_service
     if _auth_service is None:
         settings = get_settings()
-        _auth_service = AuthService(secret_key=settings.secret_key)
+        _auth_service = AuthService(
+            secret_key=settings.secret_key,
+            cache_size=settings.auth_token_cache_size,
+            backend=settings.jwt_backend
+        )
     return _auth_service
 
 
+async def _auth_service_dependency() -> AuthService:
+    """Depends용 AuthService (async라 요청마다 스레드풀을 거치지 않음)"""
+    return _auth_service or get_auth_service()
+
+
+class DependencyResolutionError(RuntimeError):
+    """앱 시작 시 DI 그래프 검증 실패
+
+    Attributes:
+        failures: "의존 경로: 오류" 목록
+    """
+
+    def __init__(self, failures: List[str]):
+        self.failures = failures
+        super().__init__("의존성 생성 실패:\n  " + "\n  ".join(failures))
+
+
+def resolve_dependencies(injector: Injector, roots: Sequence[type]) -> Dict[type, Any]:
+    """DI 그래프 전체 생성 + 검증 (앱 시작 시 1회)
+
+    roots부터 @inject 생성자 인자를 따라가며 (서비스 → 워크플로우 → 노드 → 포트/어댑터)
+    의존 대상부터 먼저 생성합니다. 잘못된 바인딩/설정을 첫 요청이 아니라 시작 시점에
+    발견하도록, 실패한 타입을 모두 모아 의존 경로와 함께 보고합니다.
+
+    Args:
+        injector: DI 컨테이너
+        roots: 라우트에서 사용하는 최상위 타입 (예: [CookingService])
+
+    Returns:
+        Dict[type, Any]: 타입 → 인스턴스 (app.state.services에 보관, get_dependency가 사용)
+
+    Raises:
+        DependencyResolutionError: 하나 이상 생성 실패
+    """
+    resolved: Dict[type, Any] = {}
+    failed: Set[type] = set()
+    failures: List[str] = []
+
+    def describe(path: Tuple[type, ...]) -> str:
+        return " → ".join(getattr(cls, "__name__", str(cls)) for cls in path)
+
+    def visit(cls: type, path: Tuple[type, ...]) -> None:
+        if cls in resolved or cls in failed:
+            return
+        path = path + (cls,)
+        if cls in path[:-1]:
+            failed.add(cls)
+            failures.append(f"{describe(path)}: 순환 의존성")
+            return
+
+        init = getattr(cls, "__init__", None)
+        dependencies = get_bindings(init) if inspect.isfunction(init) else {}
+        for dependency in dependencies.values():
+            visit(dependency, path)
+        if any(dependency in failed for dependency in dependencies.values()):
+            failed.add(cls)
+            return
+
+        try:
+            resolved[cls] = injector.get(cls)
+        except Exception as e:
+            failed.add(cls)
+            failures.append(f"{describe(path)}: {type(e).__name__}: {e}")
+
+    for root in roots:
+        visit(root, ())
+
+    if failures:
+        raise DependencyResolutionError(failures)
+    return resolved
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    auth_service: AuthService = Depends(get_auth_service)
+    auth_service: AuthService = Depends(_auth_service_dependency)
 ) -> str:
     """현재 사용자 인증 (필수)
 
@@ -88,7 +171,7 @@ async def get_current_user(
 
 async def get_optional_user(
     credentials: Optional[HTTPAuthorizationCredentials] = Depends(security_optional),
-    auth_service: AuthService = Depends(get_auth_service)
+    auth_service: AuthService = Depends(_auth_service_dependency)
 ) -> Optional[str]:
     """옵셔널 인증 (토큰 없어도 통과)
 
@@ -125,3 +208,70 @@ async def get_optional_user(
     except Exception:
         # 검증 실패해도 통과 (로그는 AuthService에서 이미 남김)
         return None
+
+
+async def get_admin_user(user_id: str = Depends(get_current_user)) -> str:
+    """관리자 인증 (필수)
+
+    인증된 사용자 중 settings.admin_user_ids에 포함된 사용자만 통과합니다.
+
+    Args:
+        user_id: 인증된 사용자 ID (자동 주입)
+
+    Returns:
+        str: 관리자 사용자 ID
+
+    Raises:
+        HTTPException: 401 (토큰 없음 or 검증 실패), 403 (관리자 아님)
+    """
+    if user_id not in get_settings().admin_user_ids:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="관리자 권한이 필요합니다"
+        )
+    return user_id
+
+
+def is_admin(user_id: Optional[str]) -> bool:
+    """선택적 인증 경로에서 관리자 여부 확인"""
+    return user_id is not None and user_id in get_settings().admin_user_ids
+
+
+async def get_request_deadline(request: Request) -> Deadline:
+    """요청 처리 기한 생성
+
+    우선순위:
+    1. 클라이언트 헤더 (request_deadline_header, 초 단위, request_deadline_max로 제한)
+    2. 경로별 설정 (request_deadline_overrides)
+    3. 기본값 (request_deadline)
+
+    Args:
+        request: FastAPI Request (자동 주입)
+
+    Returns:
+        Deadline: 요청 처리 기한
+
+    Example:
+        @router.post("/cooking")
+        async def handle_cooking_query(
+            request: CookingRequest,
+            deadline: Deadline = Depends(get_request_deadline)
+        ):
+            ...
+    """
+    settings = get_settings()
+    seconds = settings.request_deadline_overrides.get(
+        request.url.path, settings.request_deadline
+    )
+
+    header_value = request.headers.get(settings.request_deadline_header)
+    if header_value:
+        try:
+            value = float(header_value)
+            if math.isfinite(value):  # "inf", "nan"도 잘못된 헤더로 취급
+                seconds = value
+        except ValueError:
+            pass  # 잘못된 헤더는 무시하고 기본값 사용
+
+    seconds = min(max(seconds, 0.0), settings.request_deadline_max)
+    return Deadline.after(seconds, optional_reserve=settings.deadline_optional_reserve)
@@ -0,0 +1,116 @@
+"""클라이언트 연결 종료 감지 및 작업 취소
+
+클라이언트가 응답을 기다리지 않고 연결을 끊으면
+진행 중인 워크플로우(LLM/이미지 호출 포함)를 취소하여
+업스트림 비용과 처리 용량을 낭비하지 않도록 합니다.
+
+취소된 요청의 비용/절감량은 요청의 UsageLedger로 집계합니다 (record_cancelled_request).
+    - 취소 전까지 이미 사용한 토큰
+    - 진행 중 취소된 이미지 생성 수
+    - 진행 중 취소된 LLM 호출의 출력 토큰 추정치 (프롬프트별 최근 출력 토큰 p50)
+"""
+from typing import Awaitable, TypeVar
+from fastapi import Request
+import asyncio
+import logging
+
+from app.core.metrics import counter
+from app.core.usage import UsageLedger, typical_output_tokens
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_disconnects = counter(
+    "client_disconnect_cancellations_total",
+    "클라이언트 연결 종료로 취소된 요청 수",
+    ["path"]
+)
+_cancelled_tokens = counter(
+    "cancelled_request_tokens_total",
+    "취소된 요청이 취소 전까지 사용한 LLM 토큰 (kind: input/output)",
+    ["kind"]
+)
+_images_avoided = counter(
+    "cancelled_image_generations_avoided_total",
+    "요청 취소로 중단된 이미지 생성 수"
+)
+_output_tokens_avoided = counter(
+    "cancelled_llm_output_tokens_avoided_total",
+    "요청 취소로 중단된 LLM 호출의 출력 토큰 추정치 (프롬프트별 최근 출력 토큰 p50)",
+    ["prompt_id"]
+)
+
+IMAGE_METHOD = "generate_image"
+
+
+class ClientDisconnectedError(Exception):
+    """클라이언트가 응답 전에 연결을 끊음"""
+    pass
+
+
+async def cancel_on_disconnect(
+    request: Request,
+    awaitable: Awaitable[T],
+    poll_interval: float = 0.5
+) -> T:
+    """클라이언트 연결이 끊기면 작업 취소
+
+    작업을 별도 Task로 실행하면서 poll_interval마다 연결 상태를 확인합니다.
+    취소는 Task 전체로 전파되므로 LangGraph 노드, 어댑터 호출까지 중단됩니다.
+
+    Args:
+        request: FastAPI Request
+        awaitable: 실행할 작업 (예: service.process_cooking_query(...))
+        poll_interval: 연결 상태 확인 주기 (초)
+
+    Returns:
+        T: 작업 결과
+
+    Raises:
+        ClientDisconnectedError: 작업 완료 전에 클라이언트 연결이 끊긴 경우
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+            if done:
+                return task.result()
+
+            if await request.is_disconnected():
+                logger.info("[Disconnect] 클라이언트 연결 종료 → 작업 취소: %s", request.url.path)
+                _disconnects.labels(request.url.path).inc()
+
+                task.cancel()
+                try:
+                    await task  # 취소 정리(업스트림 prediction 취소 등) 완료까지 대기
+                except (asyncio.CancelledError, Exception):
+                    pass
+                raise ClientDisconnectedError(request.url.path)
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+def record_cancelled_request(ledger: UsageLedger) -> None:
+    """취소된 요청의 사용/절감량을 메트릭에 기록 (Service의 CancelledError 경로에서 호출)
+
+    절감량은 진행 중 취소된 호출만 셉니다. (아직 시작하지 않은 노드의 호출은 포함하지 않음)
+    출력 토큰 추정치는 프롬프트의 샘플이 없으면 0으로 계산합니다.
+
+    Args:
+        ledger: 취소된 요청의 사용량 장부
+    """
+    _cancelled_tokens.labels("input").inc(ledger.total.input_tokens)
+    _cancelled_tokens.labels("output").inc(ledger.total.output_tokens)
+
+    for method, prompt_id in ledger.cancelled_calls:
+        if method == IMAGE_METHOD:
+            _images_avoided.labels().inc()
+        else:
+            _output_tokens_avoided.labels(prompt_id).inc(typical_output_tokens(prompt_id) or 0)
+
+    logger.info(
+        "[Disconnect] 취소된 요청 - 사용 토큰: %s, 중단된 호출: %s",
+        ledger.total.total_tokens, ledger.cancelled_calls
+    )
@@ -0,0 +1,220 @@
+"""Health - 준비 상태(readiness) / 캐시된 심층 헬스 체크
+
+/api/health는 프로세스 생존(liveness) 확인용이라 항상 "healthy"입니다.
+로드 밸런서가 콜드/성능 저하 워커를 피해 가도록 /ready는 다음을 모두 만족할 때만 200을 반환합니다.
+    - lifespan 워밍업 완료 (StartupReport.ready), 종료 드레인 중 아님
+    - 심층 체크에 "down" 항목 없음
+    - (fail_on_degraded=True면) "degraded" 항목 없음 (예: 필수 업스트림 회로 OPEN)
+
+업스트림 회로는 프로세스마다 따로지만 장애는 모든 워커에 동시에 닥칩니다.
+그래서 응답 자체를 만들 수 없는 업스트림(critical_upstreams, 기본 LLM "anthropic")의 회로만
+준비 상태에 반영합니다. 이미지(replicate) 회로가 OPEN이어도 레시피는 이미지 없이 응답하므로
+정보로만 보고합니다. (모든 워커가 로드 밸런서에서 빠지지 않도록)
+
+심층 체크는 백그라운드 태스크가 interval마다 갱신하고, 프로브는 캐시된 결과만 읽습니다.
+(프로브 호출당 체크 비용 없음)
+
+체크 함수:
+    () -> dict, "status" 키는 "ok" | "degraded" | "down" (생략 시 "ok")
+    예외가 발생하면 해당 체크는 "down"으로 기록됩니다.
+
+Example:
+    >>> register_health_check("requests", lambda: {"in_flight": gauge_child.value})
+    >>> monitor = configure_health(interval=5.0)
+    >>> monitor.start()                  # lifespan (워밍업 이후)
+    >>> ready, reasons = monitor.readiness()
+"""
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import asyncio
+import logging
+import time
+
+from app.core.circuit_breaker import CircuitState, get_circuit_breakers
+from app.core.metrics import gauge
+from app.core.shutdown import get_shutdown_coordinator
+from app.core.startup import get_startup_report
+from app.core.structured_logging import logging_queue_depth
+
+logger = logging.getLogger(__name__)
+
+OK = "ok"
+DEGRADED = "degraded"
+DOWN = "down"
+_SEVERITY = {OK: 0, DEGRADED: 1, DOWN: 2}
+
+# 로그 큐가 이 이상 쌓이면 출력이 처리량을 못 따라가는 상태
+LOG_QUEUE_DEGRADED = 10_000
+
+_check_status = gauge("health_check_status", "심층 헬스 체크 상태 (0: ok, 1: degraded, 2: down)", ["check"])
+
+HealthCheck = Callable[[], Dict[str, Any]]
+_checks: Dict[str, HealthCheck] = {}
+
+# 회로가 OPEN이면 준비되지 않은 것으로 판단할 업스트림 (configure_health로 변경)
+_critical_upstreams: Tuple[str, ...] = ("anthropic",)
+
+
+def register_health_check(name: str, check: HealthCheck) -> None:
+    """심층 헬스 체크 등록 (같은 이름이면 교체)
+
+    Args:
+        name: 체크 이름 (예: "upstreams", "event_loop")
+        check: 결과 dict를 반환하는 동기 함수 (I/O 없이 빠르게 끝나야 함)
+    """
+    _checks[name] = check
+
+
+def unregister_health_check(name: str) -> None:
+    _checks.pop(name, None)
+
+
+class HealthMonitor:
+    """심층 헬스 체크 주기 실행 + 결과 캐시
+
+    Attributes:
+        interval: 갱신 주기 (초)
+        fail_on_degraded: degraded 항목이 있으면 준비되지 않은 것으로 판단
+        snapshot: 마지막 체크 결과 {"status", "checks", "checked_at"}
+    """
+
+    def __init__(self, interval: float = 5.0, fail_on_degraded: bool = True):
+        self.interval = interval
+        self.fail_on_degraded = fail_on_degraded
+        self.snapshot: Dict[str, Any] = {"status": OK, "checks": {}, "checked_at": None}
+        self._task: Optional[asyncio.Task] = None
+
+    def refresh(self) -> Dict[str, Any]:
+        """등록된 체크를 모두 실행하고 캐시 갱신"""
+        checks: Dict[str, Dict[str, Any]] = {}
+        for name, check in list(_checks.items()):
+            try:
+                result = dict(check())
+                result.setdefault("status", OK)
+            except Exception as e:
+                logger.warning("[Health] 체크 실패: %s - %s", name, e)
+                result = {"status": DOWN, "error": f"{type(e).__name__}: {e}"}
+            checks[name] = result
+            _check_status.labels(name).set(_SEVERITY.get(result["status"], 2))
+
+        status = max((c["status"] for c in checks.values()), key=lambda s: _SEVERITY.get(s, 2), default=OK)
+        self.snapshot = {"status": status, "checks": checks, "checked_at": time.time()}
+        return self.snapshot
+
+    def current(self) -> Dict[str, Any]:
+        """캐시된 결과 (아직 한 번도 실행하지 않았으면 1회 실행)"""
+        if self.snapshot["checked_at"] is None:
+            return self.refresh()
+        return self.snapshot
+
+    def readiness(self) -> Tuple[bool, List[str]]:
+        """준비 여부와 준비되지 않은 이유
+
+        Returns:
+            (ready, reasons): reasons 예) ["warmup", "upstreams: degraded"]
+        """
+        reasons: List[str] = []
+        if not get_startup_report().ready:
+            reasons.append("warmup")
+        if get_shutdown_coordinator().draining:
+            reasons.append("draining")
+
+        for name, result in self.current()["checks"].items():
+            status = result["status"]
+            if status == DOWN or (status == DEGRADED and self.fail_on_degraded):
+                reasons.append(f"{name}: {status}")
+
+        return not reasons, reasons
+
+    def start(self) -> None:
+        """백그라운드 갱신 시작 (실행 중인 이벤트 루프 안에서 호출)"""
+        if self._task is not None:
+            return
+        self.refresh()
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="health-monitor")
+        logger.info("[Health] 시작 - interval: %ss, 체크: %s", self.interval, list(_checks))
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            self.refresh()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 기본 체크
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def check_upstreams() -> Dict[str, Any]:
+    """업스트림별 회로 상태 + 마지막 성공 호출 이후 경과 시간
+
+    필수 업스트림(critical_upstreams)의 회로가 OPEN이면 degraded,
+    그 외 업스트림의 OPEN 회로는 open_circuits에만 표시합니다.
+    """
+    now = time.time()
+    upstreams = {}
+    for name, breaker in get_circuit_breakers().items():
+        snapshot = breaker.snapshot()
+        last_success = snapshot["last_success_at"]
+        snapshot["last_success_age"] = round(now - last_success, 1) if last_success else None
+        upstreams[name] = snapshot
+
+    open_circuits = [
+        name for name, upstream in upstreams.items()
+        if upstream["state"] == CircuitState.OPEN.value
+    ]
+    critical_open = [name for name in open_circuits if name in _critical_upstreams]
+    return {
+        "status": DEGRADED if critical_open else OK,
+        "upstreams": upstreams,
+        "open_circuits": open_circuits,
+        "critical_upstreams": list(_critical_upstreams),
+    }
+
+
+def check_logging_queue() -> Dict[str, Any]:
+    """로그 큐 적재량 (QueueListener가 출력을 못 따라가면 degraded)"""
+    depth = logging_queue_depth()
+    return {"status": DEGRADED if depth >= LOG_QUEUE_DEGRADED else OK, "depth": depth}
+
+
+register_health_check("upstreams", check_upstreams)
+register_health_check("logging_queue", check_logging_queue)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 글로벌
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_monitor = HealthMonitor()
+
+
+def get_health_monitor() -> HealthMonitor:
+    return _monitor
+
+
+def configure_health(
+    interval: float = 5.0,
+    fail_on_degraded: bool = True,
+    critical_upstreams: Sequence[str] = ("anthropic",)
+) -> HealthMonitor:
+    """글로벌 헬스 모니터 설정 (앱 시작 시 1회)
+
+    Args:
+        interval: 심층 체크 갱신 주기 (초)
+        fail_on_degraded: degraded 항목이 있으면 준비되지 않은 것으로 판단
+        critical_upstreams: 회로 OPEN 시 upstreams 체크를 degraded로 만드는 업스트림
+    """
+    global _critical_upstreams
+    _monitor.interval = interval
+    _monitor.fail_on_degraded = fail_on_degraded
+    _critical_upstreams = tuple(critical_upstreams)
+    return _monitor
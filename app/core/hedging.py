@@ -0,0 +1,157 @@
+"""Hedger - 꼬리 지연(tail latency) 완화를 위한 Hedged Request
+
+호출이 해당 메서드의 최근 p95 지연 시간 안에 끝나지 않으면
+동일한 요청을 하나 더 보내고 먼저 끝난 결과를 사용합니다.
+늦은 쪽은 취소합니다.
+
+Note:
+    hedge 요청은 업스트림 비용(토큰)을 추가로 소모하므로
+    max_ratio로 전체 호출 대비 hedge 비율을 제한합니다.
+"""
+from typing import Awaitable, Callable, Optional, TypeVar
+import asyncio
+import threading
+import logging
+
+from app.core.latency import LatencyTracker
+from app.core.tracing import get_current_span
+from app.core.metrics import counter
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_hedges_issued = counter(
+    "llm_hedge_requests_total",
+    "발행된 hedge 요청 수",
+    ["upstream", "method"]
+)
+_hedges_won = counter(
+    "llm_hedge_wins_total",
+    "원 요청보다 먼저 끝난 hedge 요청 수",
+    ["upstream", "method"]
+)
+_hedges_throttled = counter(
+    "llm_hedge_throttled_total",
+    "hedge 비율 제한으로 생략된 hedge 수",
+    ["upstream", "method"]
+)
+
+
+class Hedger:
+    """Hedged Request 실행기
+
+    토큰 버킷으로 hedge 비율을 제한합니다:
+    호출마다 max_ratio만큼 토큰이 쌓이고, hedge 1회에 토큰 1개를 소모합니다.
+
+    Attributes:
+        upstream: 업스트림 이름 (메트릭 라벨)
+        latency: 메서드별 지연 시간 추적기 (hedge 지연 결정용)
+        percentile: hedge 발행 기준 백분위 (기본 p95)
+        min_samples: hedge를 시작하기 위한 최소 샘플 수
+        min_delay: 최소 hedge 지연 (초)
+        max_ratio: 전체 호출 대비 최대 hedge 비율 (기본값은 Settings.llm_hedge_max_ratio 한 곳에서 관리)
+    """
+
+    def __init__(
+        self,
+        upstream: str,
+        latency: LatencyTracker,
+        max_ratio: float,
+        percentile: float = 0.95,
+        min_samples: int = 20,
+        min_delay: float = 0.5,
+        burst: float = 5.0
+    ):
+        self.upstream = upstream
+        self.latency = latency
+        self.percentile = percentile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+        self.burst = burst
+
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+
+    def hedge_delay(self, method: str) -> Optional[float]:
+        """hedge 발행까지 기다릴 시간 (샘플 부족 시 None)"""
+        if self.latency.count(method) < self.min_samples:
+            return None
+        p = self.latency.percentile(method, self.percentile)
+        return max(self.min_delay, p) if p is not None else None
+
+    async def run(self, method: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Hedged 호출 실행
+
+        Args:
+            method: Port 메서드 이름 (지연 통계 키)
+            factory: 동일한 요청을 새로 시작하는 코루틴 팩토리
+
+        Returns:
+            T: 먼저 성공한 호출의 결과
+
+        Raises:
+            Exception: 모든 호출이 실패한 경우 원 요청의 예외
+        """
+        self._earn_token()
+
+        delay = self.hedge_delay(method)
+        if delay is None:
+            return await factory()
+
+        primary = asyncio.ensure_future(factory())
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+            if done:
+                return primary.result()
+
+            if not self._take_token():
+                _hedges_throttled.labels(self.upstream, method).inc()
+                return await primary
+
+            logger.info(
+                "[Hedger:%s] %s %.2fs 초과 → hedge 요청 발행", self.upstream, method, delay
+            )
+            _hedges_issued.labels(self.upstream, method).inc()
+            get_current_span().add_event("hedge_issued", {"delay": round(delay, 3)})
+            hedge = asyncio.ensure_future(factory())
+
+            return await self._first_success(method, primary, hedge)
+
+        finally:
+            if not primary.done():
+                primary.cancel()
+
+    async def _first_success(self, method: str, primary: asyncio.Future, hedge: asyncio.Future):
+        """먼저 성공한 결과 반환 (늦은 쪽 취소)"""
+        pending = {primary, hedge}
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            _hedges_won.labels(self.upstream, method).inc()
+                            get_current_span().set_attribute("llm.hedge_won", True)
+                        return task.result()
+
+            # 둘 다 실패: 원 요청 예외 전달
+            hedge.exception()
+            raise primary.exception()
+
+        finally:
+            for task in (primary, hedge):
+                if not task.done():
+                    task.cancel()
+
+    def _earn_token(self) -> None:
+        with self._lock:
+            self._tokens = min(self.burst, self._tokens + self.max_ratio)
+
+    def _take_token(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return True
+            return False
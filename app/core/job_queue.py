@@ -0,0 +1,256 @@
+"""Job Queue - SQLite 기반 영속 작업 큐
+
+오래 걸리는 요청(복수 레시피 + 이미지)을 API 워커에서 분리하기 위한 로컬 작업 큐입니다.
+API 프로세스는 enqueue()/get()만 수행하고, 별도 워커 프로세스가 claim()으로 작업을 가져가
+처리한 뒤 finish()로 결과를 저장합니다. 파일(WAL)을 공유하므로 같은 호스트의
+여러 API/워커 프로세스가 함께 사용할 수 있고, 재시작해도 작업이 남아 있습니다.
+
+상태:
+    queued → running → succeeded | failed
+
+리스(lease):
+    claim()한 워커는 lease_seconds 동안 작업을 점유합니다. 워커가 죽어 리스가 만료되면
+    다른 워커가 다시 가져가며, max_attempts번 시도해도 끝나지 않으면 failed로 기록합니다.
+    그레이스풀 종료 시에는 release()로 미완료 작업을 즉시 queued로 되돌립니다.
+
+모든 메서드는 동기(블로킹)입니다. 다른 프로세스가 쓰기 잠금을 잡고 있으면 최대 5초(busy timeout)까지
+기다리므로 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+
+Example:
+    >>> queue = JobQueue("data/jobs.db")
+    >>> payload = {"query": "김치찌개, 된장찌개 레시피"}
+    >>> job = await asyncio.to_thread(queue.enqueue, payload, user_id="user1")   # API
+    >>> job = await asyncio.to_thread(queue.claim, "worker-1")                   # 워커
+    >>> result = response.model_dump(mode="json")
+    >>> await asyncio.to_thread(queue.finish, job.id, "worker-1", result=result)
+    >>> (await asyncio.to_thread(queue.get, job.id)).status
+    'succeeded'
+"""
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+
+from app.core.metrics import counter
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+_jobs = counter("jobs_total", "작업 큐 이벤트 수 (enqueued, succeeded, failed, requeued, expired)", ["event"])
+
+_COLUMNS = (
+    "id, status, payload, user_id, result, error, attempts, worker_id, "
+    "lease_expires_at, created_at, started_at, finished_at"
+)
+
+
+@dataclass
+class Job:
+    """작업 (jobs 테이블 한 행)"""
+    id: str
+    status: str
+    payload: Dict[str, Any]
+    user_id: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    worker_id: Optional[str] = None
+    lease_expires_at: Optional[float] = None
+    created_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+
+    @classmethod
+    def from_row(cls, row: tuple) -> "Job":
+        (id_, status, payload, user_id, result, error, attempts, worker_id,
+         lease_expires_at, created_at, started_at, finished_at) = row
+        return cls(
+            id=id_,
+            status=status,
+            payload=json.loads(payload),
+            user_id=user_id,
+            result=json.loads(result) if result is not None else None,
+            error=error,
+            attempts=attempts,
+            worker_id=worker_id,
+            lease_expires_at=lease_expires_at,
+            created_at=created_at,
+            started_at=started_at,
+            finished_at=finished_at,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class JobQueue:
+    """SQLite 영속 작업 큐 (여러 프로세스 공유)
+
+    모든 연산은 짧은 트랜잭션 하나지만 잠금 대기(busy timeout 5초)가 있을 수 있는 블로킹 호출이므로
+    API/워커의 이벤트 루프에서는 asyncio.to_thread로 호출합니다.
+    (claim은 BEGIN IMMEDIATE로 쓰기 잠금을 잡아 여러 워커가 같은 작업을 가져가지 않음)
+
+    Attributes:
+        lease_seconds: claim 후 점유 시간 (초, 작업 기한보다 길어야 함)
+        max_attempts: 리스 만료 후 재시도 포함 최대 시도 횟수
+    """
+
+    def __init__(self, path: str, lease_seconds: float = 600.0, max_attempts: int = 3):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            "id TEXT PRIMARY KEY, status TEXT NOT NULL, payload TEXT NOT NULL, user_id TEXT, "
+            "result TEXT, error TEXT, attempts INTEGER NOT NULL DEFAULT 0, worker_id TEXT, "
+            "lease_expires_at REAL, created_at REAL NOT NULL, started_at REAL, finished_at REAL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS jobs_status_created ON jobs (status, created_at)")
+        self._lock = threading.Lock()
+
+    def enqueue(self, payload: Dict[str, Any], user_id: Optional[str] = None) -> Job:
+        """작업 등록
+
+        Args:
+            payload: 작업 입력 (JSON 직렬화 가능, 예: {"query": "..."})
+            user_id: 요청 사용자 (결과 조회 권한 확인용, 익명이면 None)
+
+        Returns:
+            Job: queued 상태의 작업
+        """
+        job = Job(id=uuid.uuid4().hex, status=QUEUED, payload=payload, user_id=user_id, created_at=time.time())
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO jobs (id, status, payload, user_id, created_at) VALUES (?, ?, ?, ?, ?)",
+                (job.id, job.status, json.dumps(payload, ensure_ascii=False), user_id, job.created_at)
+            )
+        _jobs.labels("enqueued").inc()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(f"SELECT {_COLUMNS} FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return Job.from_row(row) if row else None
+
+    def claim(self, worker_id: str) -> Optional[Job]:
+        """가장 오래된 대기 작업(또는 리스가 만료된 작업) 점유
+
+        Args:
+            worker_id: 워커 식별자 (finish/release 시 점유자 확인)
+
+        Returns:
+            Optional[Job]: running 상태의 작업, 가져갈 작업이 없으면 None
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                # 시도 횟수를 다 쓴 만료 작업은 실패 처리 (워커가 반복해서 죽는 작업)
+                expired = self._conn.execute(
+                    "UPDATE jobs SET status = ?, error = ?, worker_id = NULL, lease_expires_at = NULL, "
+                    "finished_at = ? WHERE status = ? AND lease_expires_at < ? AND attempts >= ?",
+                    (FAILED, f"처리 시간 초과 ({self.max_attempts}회 시도)", now, RUNNING, now, self.max_attempts)
+                ).rowcount
+                row = self._conn.execute(
+                    "SELECT id FROM jobs WHERE status = ? OR (status = ? AND lease_expires_at < ?) "
+                    "ORDER BY created_at LIMIT 1",
+                    (QUEUED, RUNNING, now)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        "UPDATE jobs SET status = ?, worker_id = ?, attempts = attempts + 1, "
+                        "started_at = ?, lease_expires_at = ? WHERE id = ?",
+                        (RUNNING, worker_id, now, now + self.lease_seconds, row[0])
+                    )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        if expired:
+            _jobs.labels("expired").inc(expired)
+            logger.warning("[Jobs] 시도 횟수 초과로 실패 처리: %s건", expired)
+        return self.get(row[0]) if row is not None else None
+
+    def finish(
+        self,
+        job_id: str,
+        worker_id: str,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None
+    ) -> bool:
+        """작업 완료 기록 (error가 있으면 failed, 없으면 succeeded)
+
+        Returns:
+            bool: 기록 여부 (리스가 만료되어 다른 워커가 가져갔으면 False)
+        """
+        status = FAILED if error else SUCCEEDED
+        with self._lock:
+            updated = self._conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, lease_expires_at = NULL "
+                "WHERE id = ? AND worker_id = ? AND status = ?",
+                (
+                    status,
+                    json.dumps(result, ensure_ascii=False) if result is not None else None,
+                    error,
+                    time.time(),
+                    job_id,
+                    worker_id,
+                    RUNNING,
+                )
+            ).rowcount
+        if updated:
+            _jobs.labels(status).inc()
+        else:
+            logger.warning("[Jobs] 점유가 끝난 작업의 결과는 버림: %s (worker: %s)", job_id, worker_id)
+        return bool(updated)
+
+    def release(self, worker_id: str) -> int:
+        """워커가 점유한 미완료 작업을 대기 상태로 되돌림 (그레이스풀 종료 시, 시도 횟수 미포함)
+
+        Returns:
+            int: 되돌린 작업 수
+        """
+        with self._lock:
+            released = self._conn.execute(
+                "UPDATE jobs SET status = ?, worker_id = NULL, lease_expires_at = NULL, started_at = NULL, "
+                "attempts = MAX(attempts - 1, 0) WHERE worker_id = ? AND status = ?",
+                (QUEUED, worker_id, RUNNING)
+            ).rowcount
+        if released:
+            _jobs.labels("requeued").inc(released)
+            logger.info("[Jobs] 미완료 작업 %s건을 대기열로 되돌림 (worker: %s)", released, worker_id)
+        return released
+
+    def purge(self, finished_before: float) -> int:
+        """finished_before(epoch 초) 이전에 끝난 작업 삭제
+
+        Returns:
+            int: 삭제한 작업 수
+        """
+        with self._lock:
+            return self._conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (SUCCEEDED, FAILED, finished_before)
+            ).rowcount
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 작업 수 (헬스 체크용)"""
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = {status: 0 for status in (QUEUED, RUNNING, SUCCEEDED, FAILED)}
+        counts.update(rows)
+        return counts
+
+    def close(self) -> None:
+        self._conn.close()
@@ -0,0 +1,89 @@
+"""LatencyTracker - 키별 롤링 지연 시간 통계
+
+최근 N개 호출의 지연 시간을 키(예: Port 메서드 이름)별로 보관하고
+백분위수(p50, p95, p99 등)를 계산합니다.
+
+Hedging, 적응형 타임아웃 등 지연 시간 기반 정책의 입력으로 사용합니다.
+"""
+from collections import deque
+from typing import Deque, Dict, List, Optional
+import math
+import threading
+
+
+class _Window:
+    """단일 키의 롤링 윈도우 (정렬 결과 캐싱)"""
+
+    __slots__ = ("samples", "_sorted")
+
+    def __init__(self, size: int):
+        self.samples: Deque[float] = deque(maxlen=size)
+        self._sorted: Optional[List[float]] = None
+
+    def add(self, value: float) -> None:
+        self.samples.append(value)
+        self._sorted = None
+
+    def sorted(self) -> List[float]:
+        if self._sorted is None:
+            self._sorted = sorted(self.samples)
+        return self._sorted
+
+
+class LatencyTracker:
+    """키별 롤링 지연 시간 추적기
+
+    Attributes:
+        window_size: 키별 보관할 최근 샘플 수
+
+    Example:
+        >>> tracker = LatencyTracker(window_size=200)
+        >>> tracker.record("classify_intent", 0.8)
+        >>> tracker.percentile("classify_intent", 0.95)
+        0.8
+    """
+
+    def __init__(self, window_size: int = 200):
+        self.window_size = window_size
+        self._windows: Dict[str, _Window] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, seconds: float) -> None:
+        """지연 시간 샘플 기록
+
+        Args:
+            key: 통계 키 (예: "generate_recipe")
+            seconds: 지연 시간 (초)
+        """
+        window = self._windows.get(key)
+        if window is None:
+            with self._lock:
+                window = self._windows.setdefault(key, _Window(self.window_size))
+        window.add(seconds)
+
+    def count(self, key: str) -> int:
+        """키의 현재 샘플 수"""
+        window = self._windows.get(key)
+        return len(window.samples) if window else 0
+
+    def percentile(self, key: str, q: float) -> Optional[float]:
+        """백분위수 계산 (nearest-rank)
+
+        Args:
+            key: 통계 키
+            q: 백분위 (0.0 ~ 1.0, 예: 0.95)
+
+        Returns:
+            Optional[float]: 지연 시간 (초), 샘플이 없으면 None
+        """
+        window = self._windows.get(key)
+        if window is None or not window.samples:
+            return None
+
+        values = window.sorted()
+        rank = max(1, math.ceil(q * len(values)))
+        return values[min(rank, len(values)) - 1]
+
+    def keys(self) -> List[str]:
+        """기록된 키 목록"""
+        return list(self._windows.keys())
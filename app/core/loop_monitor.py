@@ -0,0 +1,207 @@
+"""Event Loop Monitor - 이벤트 루프 지연 감시 / 블로킹 호출 탐지
+
+동기 호출(예: llm.invoke(), replicate.run())이 이벤트 루프를 막으면
+그동안 다른 모든 요청이 멈추지만 로그에는 잘 드러나지 않습니다.
+
+EventLoopMonitor:
+    - 루프 안 heartbeat Task가 interval마다 깨어나며 지연(lag)을 측정 → 게이지/히스토그램
+    - 별도 watchdog 스레드가 heartbeat가 threshold 이상 멈춘 것을 감지하면
+      그 순간 루프 스레드의 스택을 로그로 남김 (무엇이 막고 있는지 확인용)
+
+BlockingCallDetector:
+    - asyncio debug 모드(slow_callback_duration)를 이용해
+      루프 스레드에서 N ms 이상 걸린 동기 구간을 수집
+    - 테스트에서 assert_no_blocking()으로 CI 실패 처리 가능
+
+Example:
+    >>> async with BlockingCallDetector(threshold_ms=50) as detector:
+    ...     await node(state)
+    >>> detector.assert_no_blocking()
+"""
+from dataclasses import dataclass
+from typing import List, Optional
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+
+from app.core.metrics import counter, gauge, histogram
+
+logger = logging.getLogger(__name__)
+
+_lag = gauge("event_loop_lag_seconds", "최근 측정한 이벤트 루프 지연 (초)")
+_lag_histogram = histogram(
+    "event_loop_lag_distribution_seconds",
+    "이벤트 루프 지연 분포 (초)",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+)
+_blocked = counter("event_loop_blocked_total", "watchdog이 감지한 루프 블로킹 횟수")
+_slow_callbacks = counter("event_loop_slow_callbacks_total", "debug 모드에서 감지한 느린 동기 구간 수")
+
+
+class EventLoopMonitor:
+    """이벤트 루프 지연 감시
+
+    Attributes:
+        interval: heartbeat 주기 (초)
+        threshold: 이 이상 heartbeat가 멈추면 블로킹으로 판단하고 스택 기록 (초)
+    """
+
+    def __init__(self, interval: float = 0.5, threshold: float = 0.2):
+        self.interval = interval
+        self.threshold = threshold
+        self.lag: float = 0.0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat_at = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """감시 시작 (실행 중인 이벤트 루프 안에서 호출)"""
+        if self._task is not None:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat_at = time.monotonic()
+        self._stop.clear()
+
+        self._task = self._loop.create_task(self._heartbeat(), name="event-loop-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="event-loop-watchdog", daemon=True)
+        self._watchdog.start()
+        logger.info(
+            "[LoopMonitor] 시작 - interval: %ss, threshold: %ss", self.interval, self.threshold
+        )
+
+    async def stop(self) -> None:
+        """감시 중지"""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            self._watchdog.join(timeout=self.interval * 2)
+            self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.monotonic()
+            self.lag = max(0.0, now - expected)
+            self._heartbeat_at = now
+            _lag.set(self.lag)
+            _lag_histogram.observe(self.lag)
+
+    def _watch(self) -> None:
+        """루프 밖 스레드: heartbeat 정체 시 루프 스레드 스택 기록 (정체 1회당 1번)"""
+        reported_for = 0.0
+        while not self._stop.wait(self.threshold / 2):
+            heartbeat_at = self._heartbeat_at
+            stalled = time.monotonic() - heartbeat_at - self.interval
+            if stalled < self.threshold or reported_for == heartbeat_at:
+                continue
+
+            reported_for = heartbeat_at
+            _blocked.inc()
+            frame = sys._current_frames().get(self._loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "(stack 없음)"
+            logger.warning(
+                "[LoopMonitor] 이벤트 루프가 %.3f초 이상 블로킹됨. 루프 스레드 스택:\n%s", stalled, stack
+            )
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 블로킹 호출 탐지 (asyncio debug 모드)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+@dataclass(frozen=True)
+class SlowCallback:
+    """루프 스레드에서 오래 걸린 동기 구간"""
+    handle: str
+    duration: float
+
+
+class _SlowCallbackHandler(logging.Handler):
+    """asyncio 로거의 "Executing <Handle> took N seconds" 경고 수집"""
+
+    def __init__(self, detector: "BlockingCallDetector"):
+        super().__init__(level=logging.WARNING)
+        self.detector = detector
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if not str(record.msg).startswith("Executing ") or not record.args:
+            return
+        handle, duration = record.args[0], record.args[-1]
+        self.detector.slow_callbacks.append(SlowCallback(repr(handle), float(duration)))
+        _slow_callbacks.inc()
+
+
+class BlockingCallDetector:
+    """루프 스레드에서 threshold_ms 이상 걸린 동기 구간 탐지
+
+    asyncio debug 모드를 켜고 slow_callback_duration을 설정하여,
+    한 번의 콜백(코루틴 한 step)이 오래 걸리면 기록합니다.
+    debug 모드는 오버헤드가 있으므로 테스트/진단용으로만 사용하세요.
+
+    Attributes:
+        threshold_ms: 느린 구간 판단 기준 (ms)
+        slow_callbacks: 탐지된 구간 목록
+    """
+
+    def __init__(self, threshold_ms: float = 100.0):
+        self.threshold_ms = threshold_ms
+        self.slow_callbacks: List[SlowCallback] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._handler = _SlowCallbackHandler(self)
+        self._previous_debug = False
+        self._previous_duration = 0.1
+
+    def install(self, loop: Optional[asyncio.AbstractEventLoop] = None) -> None:
+        """루프에 debug 모드 적용"""
+        self._loop = loop or asyncio.get_running_loop()
+        self._previous_debug = self._loop.get_debug()
+        self._previous_duration = self._loop.slow_callback_duration
+        self._loop.set_debug(True)
+        self._loop.slow_callback_duration = self.threshold_ms / 1000
+        logging.getLogger("asyncio").addHandler(self._handler)
+
+    def uninstall(self) -> None:
+        """debug 모드 설정 복원"""
+        logging.getLogger("asyncio").removeHandler(self._handler)
+        if self._loop is not None:
+            self._loop.set_debug(self._previous_debug)
+            self._loop.slow_callback_duration = self._previous_duration
+            self._loop = None
+
+    async def __aenter__(self) -> "BlockingCallDetector":
+        self.install()
+        # debug 여부는 콜백 시작 시점에 확인되므로, 블록 본문이 다음 step에서 실행되도록 양보
+        await asyncio.sleep(0)
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        # 마지막 콜백의 경고가 기록되도록 한 번 양보
+        await asyncio.sleep(0)
+        self.uninstall()
+
+    def assert_no_blocking(self) -> None:
+        """느린 동기 구간이 있으면 AssertionError
+
+        Raises:
+            AssertionError: threshold_ms 이상 루프를 점유한 구간이 있는 경우
+        """
+        if self.slow_callbacks:
+            details = "\n".join(
+                f"  - {cb.duration * 1000:.1f}ms: {cb.handle}" for cb in self.slow_callbacks
+            )
+            raise AssertionError(
+                f"이벤트 루프 블로킹 감지 ({self.threshold_ms:.0f}ms 이상):\n{details}"
+            )
@@ -0,0 +1,294 @@
+"""Memory - 워커 메모리 진단 (tracemalloc 스냅샷 / 캐시 크기)
+
+캐시, 템플릿, 요청별 LangGraph 상태가 늘어나면서 워커 메모리가 증가하는 원인을
+운영 부하 상태에서 찾기 위한 도구입니다. /api/admin/memory 엔드포인트에서 사용합니다.
+
+MemoryTracer:
+    - tracemalloc 시작/중지 (기본 꺼짐, 켜져 있는 동안 할당마다 오버헤드 발생)
+    - 스냅샷을 이름으로 보관하고 상위 할당 위치, 스냅샷 간 차이를 반환
+
+캐시 크기:
+    - register_cache(name, getter)로 등록한 컨테이너의 항목 수/대략적 바이트 수 보고
+    - 코어 캐시(span/프로파일 버퍼, 사용자별 사용량, 회로, 메트릭)는 기본 등록
+    - Injector 싱글톤(PromptLoader 템플릿, 어댑터, Workflow)은 singleton_report()로 별도 보고
+
+Example:
+    >>> tracer = get_memory_tracer()
+    >>> tracer.start()
+    >>> tracer.take_snapshot("before")
+    >>> ...  # 부하
+    >>> tracer.take_snapshot("after")
+    >>> tracer.compare("before", "after", limit=10)
+"""
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, List, Optional
+import gc
+import logging
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import types
+
+logger = logging.getLogger(__name__)
+
+
+def process_rss_bytes() -> Optional[int]:
+    """현재 프로세스 RSS (바이트, 확인 불가 시 None)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        pass
+    try:
+        import resource
+        # 리눅스 외(macOS)에서는 최대 RSS만 제공 (바이트 단위)
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except ImportError:
+        return None
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# tracemalloc
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class MemoryTracer:
+    """tracemalloc 스냅샷 관리
+
+    Attributes:
+        max_snapshots: 보관할 최대 스냅샷 수 (초과 시 오래된 것부터 제거)
+    """
+
+    def __init__(self, max_snapshots: int = 5):
+        self.max_snapshots = max_snapshots
+        self._snapshots: "OrderedDict[str, tracemalloc.Snapshot]" = OrderedDict()
+        self._taken_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+
+    def start(self, nframes: int = 10) -> None:
+        """tracemalloc 시작 (이미 켜져 있으면 무시)"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(nframes)
+            logger.info("[Memory] tracemalloc 시작 - nframes: %s", nframes)
+
+    def stop(self) -> None:
+        """tracemalloc 중지 (보관 중인 스냅샷은 유지)"""
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+            logger.info("[Memory] tracemalloc 중지")
+
+    def take_snapshot(self, name: Optional[str] = None) -> str:
+        """스냅샷 저장
+
+        Args:
+            name: 스냅샷 이름 (없으면 시각 기반 이름)
+
+        Returns:
+            str: 저장된 스냅샷 이름
+
+        Raises:
+            RuntimeError: tracemalloc이 꺼져 있는 경우
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("tracemalloc이 시작되지 않았습니다")
+        snapshot = self._filter(tracemalloc.take_snapshot())
+        name = name or f"snapshot-{int(time.time() * 1000)}"
+        with self._lock:
+            self._snapshots.pop(name, None)
+            self._snapshots[name] = snapshot
+            self._taken_at[name] = time.time()
+            while len(self._snapshots) > self.max_snapshots:
+                oldest, _ = self._snapshots.popitem(last=False)
+                self._taken_at.pop(oldest, None)
+        return name
+
+    def snapshots(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [
+                {
+                    "name": name,
+                    "taken_at": self._taken_at[name],
+                    "size": sum(stat.size for stat in snapshot.statistics("filename")),
+                }
+                for name, snapshot in self._snapshots.items()
+            ]
+
+    def top(self, name: Optional[str] = None, limit: int = 20, key_type: str = "lineno") -> List[Dict[str, Any]]:
+        """상위 할당 위치 (name이 없으면 지금 스냅샷)"""
+        snapshot = self._get(name)
+        return [_stat_to_dict(stat) for stat in snapshot.statistics(key_type)[:limit]]
+
+    def compare(
+        self,
+        base: str,
+        other: Optional[str] = None,
+        limit: int = 20,
+        key_type: str = "lineno"
+    ) -> List[Dict[str, Any]]:
+        """스냅샷 간 차이 (증가량 큰 순, other가 없으면 지금 스냅샷과 비교)"""
+        base_snapshot = self._get(base)
+        other_snapshot = self._get(other)
+        diffs = other_snapshot.compare_to(base_snapshot, key_type)
+        return [_stat_to_dict(stat) for stat in diffs[:limit]]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+            self._taken_at.clear()
+
+    def status(self) -> Dict[str, Any]:
+        current, peak = tracemalloc.get_traced_memory()
+        return {
+            "tracing": self.tracing,
+            "traced_current": current,
+            "traced_peak": peak,
+            "tracemalloc_overhead": tracemalloc.get_tracemalloc_memory(),
+            "rss": process_rss_bytes(),
+            "gc_objects": len(gc.get_objects()),
+            "snapshots": self.snapshots(),
+        }
+
+    def _get(self, name: Optional[str]) -> tracemalloc.Snapshot:
+        if name is None:
+            if not tracemalloc.is_tracing():
+                raise RuntimeError("tracemalloc이 시작되지 않았습니다")
+            return self._filter(tracemalloc.take_snapshot())
+        with self._lock:
+            snapshot = self._snapshots.get(name)
+        if snapshot is None:
+            raise KeyError(name)
+        return snapshot
+
+    @staticmethod
+    def _filter(snapshot: tracemalloc.Snapshot) -> tracemalloc.Snapshot:
+        # tracemalloc/importlib 자체 할당은 제외
+        return snapshot.filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+
+
+def _stat_to_dict(stat: Any) -> Dict[str, Any]:
+    frame = stat.traceback[0]
+    result = {
+        "location": f"{frame.filename}:{frame.lineno}",
+        "size": stat.size,
+        "count": stat.count,
+    }
+    if isinstance(stat, tracemalloc.StatisticDiff):
+        result["size_diff"] = stat.size_diff
+        result["count_diff"] = stat.count_diff
+    return result
+
+
+_memory_tracer = MemoryTracer()
+
+
+def get_memory_tracer() -> MemoryTracer:
+    """글로벌 tracemalloc 스냅샷 관리자"""
+    return _memory_tracer
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 캐시 크기
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# 크기 계산 시 따라가지 않는 객체 (공유되는 코드/모듈 객체)
+_SKIP_TYPES = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType)
+
+
+def deep_sizeof(obj: Any, max_objects: int = 100_000) -> int:
+    """컨테이너/인스턴스 속성을 따라가며 대략적인 바이트 수 계산
+
+    모듈, 클래스, 함수는 공유 객체이므로 제외합니다.
+    max_objects를 넘으면 그때까지의 합계를 반환합니다 (대략값).
+    """
+    seen = set()
+    stack = [obj]
+    total = 0
+    while stack and len(seen) < max_objects:
+        current = stack.pop()
+        if id(current) in seen or isinstance(current, _SKIP_TYPES):
+            continue
+        seen.add(id(current))
+        total += sys.getsizeof(current, 0)
+
+        if isinstance(current, dict):
+            stack.extend(current.keys())
+            stack.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset, deque)):
+            stack.extend(current)
+        elif not isinstance(current, (str, bytes, bytearray, int, float, bool)):
+            if hasattr(current, "__dict__"):
+                stack.append(vars(current))
+            for slot in getattr(type(current), "__slots__", ()):
+                if hasattr(current, slot):
+                    stack.append(getattr(current, slot))
+    return total
+
+
+_caches: Dict[str, Callable[[], Any]] = {}
+
+
+def register_cache(name: str, getter: Callable[[], Any]) -> None:
+    """캐시 크기 보고 대상 등록
+
+    Args:
+        name: 보고 이름 (예: "tracing.spans")
+        getter: 현재 컨테이너를 반환하는 함수 (교체되는 전역 객체 대응)
+    """
+    _caches[name] = getter
+
+
+def cache_report() -> Dict[str, Dict[str, Any]]:
+    """등록된 캐시별 항목 수/대략적 바이트 수"""
+    report = {}
+    for name, getter in list(_caches.items()):
+        try:
+            container = getter()
+            report[name] = {
+                "entries": len(container) if hasattr(container, "__len__") else None,
+                "bytes": deep_sizeof(container),
+            }
+        except Exception as e:
+            report[name] = {"error": f"{type(e).__name__}: {e}"}
+    return report
+
+
+def singleton_report(injector: Any) -> Dict[str, Dict[str, Any]]:
+    """Injector 싱글톤별 대략적 바이트 수 (PromptLoader 템플릿, 어댑터, Workflow 등)"""
+    from injector import InstanceProvider, SingletonScope
+
+    scope = injector.get(SingletonScope)
+    report = {}
+    for key, provider in list(scope._context.items()):
+        if not isinstance(provider, InstanceProvider):
+            continue
+        instance = provider.get(injector)
+        name = getattr(key, "__name__", str(key))
+        report[name] = {"type": type(instance).__name__, "bytes": deep_sizeof(instance)}
+    return report
+
+
+def _register_core_caches() -> None:
+    from app.core.circuit_breaker import get_circuit_breakers
+    from app.core.metrics import REGISTRY
+    from app.core.profiling import get_request_profiler
+    from app.core.tracing import get_memory_exporter
+    from app.core.usage import get_usage_aggregator
+
+    register_cache("tracing.spans", lambda: get_memory_exporter()._spans)
+    register_cache("profiling.profiles", lambda: get_request_profiler()._profiles)
+    register_cache("usage.by_user", lambda: get_usage_aggregator()._by_user)
+    register_cache("circuit_breakers", get_circuit_breakers)
+    register_cache("metrics.registry", lambda: REGISTRY._metrics)
+
+
+_register_core_caches()
@@ -0,0 +1,328 @@
+"""Metrics - 프로세스 내 경량 메트릭 레지스트리
+
+Counter/Gauge/Histogram을 이름으로 등록하고 라벨별 값을 메모리에 보관합니다.
+외부 의존성 없이 동작하며, Prometheus 텍스트 포맷(/metrics)으로 노출합니다.
+
+핫 패스 비용:
+    labels()로 얻은 child를 미리 보관해 두면 기록은 속성 증가 몇 번뿐입니다.
+    (Histogram.observe: bisect 1회 + 덧셈 2회, 1µs 미만)
+    값 갱신에 lock을 사용하지 않으므로 이벤트 루프 스레드에서 기록하는 것을 전제로 합니다.
+
+Example:
+    >>> transitions = counter(
+    ...     "circuit_breaker_transitions_total",
+    ...     "Circuit breaker 상태 전이 횟수",
+    ...     ["upstream", "from_state", "to_state"]
+    ... )
+    >>> transitions.labels("anthropic", "closed", "open").inc()
+"""
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple, Any
+import math
+import threading
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "REGISTRY",
+    "counter",
+    "gauge",
+    "histogram",
+    "render_prometheus",
+    "PROMETHEUS_CONTENT_TYPE",
+    "LATENCY_BUCKETS",
+]
+
+# 기본 지연 시간 버킷 (초): 수 ms 단위 노드 로직부터 수십 초 LLM 호출까지
+LATENCY_BUCKETS: Tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0, 120.0
+)
+
+
+class _CounterChild:
+    """라벨 값이 고정된 Counter 시계열"""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeChild:
+    """라벨 값이 고정된 Gauge 시계열"""
+
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class _HistogramChild:
+    """라벨 값이 고정된 Histogram 시계열
+
+    counts[i]는 bounds[i-1] < v <= bounds[i] 구간의 개수 (마지막은 +Inf)
+    """
+
+    __slots__ = ("bounds", "counts", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    @property
+    def value(self) -> float:
+        """스냅샷용 대표값 (관측 수)"""
+        return float(self.count)
+
+
+class _Metric:
+    """메트릭 베이스 클래스
+
+    라벨 조합별 child를 캐싱합니다.
+    핫 패스에서는 labels()로 얻은 child를 보관해 두고 재사용하세요.
+
+    Attributes:
+        name: 메트릭 이름
+        documentation: 설명
+        labelnames: 라벨 이름 목록
+    """
+
+    type_name = "untyped"
+    _child_class: Any = None
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames: Tuple[str, ...] = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str):
+        """라벨 값에 해당하는 child 반환 (없으면 생성)
+
+        Raises:
+            ValueError: 라벨 개수가 맞지 않는 경우
+        """
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is not None:
+            return child
+
+        if len(key) != len(self.labelnames):
+            raise ValueError(
+                f"[Metrics] {self.name} 라벨 개수 불일치: "
+                f"expected {self.labelnames}, got {key}"
+            )
+
+        with self._lock:
+            child = self._children.get(key)
+            if child is None:
+                child = self._child_class()
+                self._children[key] = child
+        return child
+
+    def samples(self) -> List[Tuple[Dict[str, str], float]]:
+        """(라벨, 값) 목록 반환"""
+        return [
+            (dict(zip(self.labelnames, key)), child.value)
+            for key, child in list(self._children.items())
+        ]
+
+
+class Counter(_Metric):
+    """단조 증가 카운터"""
+
+    type_name = "counter"
+    _child_class = _CounterChild
+
+    def inc(self, amount: float = 1.0) -> None:
+        """라벨 없는 카운터 증가"""
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    """임의 값 게이지"""
+
+    type_name = "gauge"
+    _child_class = _GaugeChild
+
+    def set(self, value: float) -> None:
+        """라벨 없는 게이지 설정"""
+        self.labels().set(value)
+
+
+class Histogram(_Metric):
+    """누적 버킷 히스토그램 (Prometheus histogram)"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets: Tuple[float, ...] = tuple(sorted(b for b in buckets if b != math.inf))
+
+    def _child_class(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """라벨 없는 히스토그램 기록"""
+        self.labels().observe(value)
+
+    def children(self) -> List[Tuple[Dict[str, str], _HistogramChild]]:
+        return [
+            (dict(zip(self.labelnames, key)), child)
+            for key, child in list(self._children.items())
+        ]
+
+
+class MetricsRegistry:
+    """메트릭 레지스트리
+
+    같은 이름으로 다시 요청하면 기존 메트릭을 반환합니다.
+    (모듈 재임포트, 여러 어댑터 인스턴스에서 안전)
+    """
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                if type(existing) is not type(metric):
+                    raise ValueError(
+                        f"[Metrics] {metric.name}은 이미 {existing.type_name}로 등록되어 있습니다"
+                    )
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def get(self, name: str) -> Optional[_Metric]:
+        return self._metrics.get(name)
+
+    def collect(self) -> List[_Metric]:
+        return list(self._metrics.values())
+
+    def snapshot(self) -> Dict[str, List[Dict[str, Any]]]:
+        """전체 메트릭 값 (디버깅/헬스 체크용)"""
+        return {
+            metric.name: [
+                {"labels": labels, "value": value}
+                for labels, value in metric.samples()
+            ]
+            for metric in self.collect()
+        }
+
+
+# 글로벌 레지스트리 (프로세스당 하나)
+REGISTRY = MetricsRegistry()
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    """글로벌 레지스트리에 Counter 등록 (또는 기존 반환)"""
+    return REGISTRY.register(Counter(name, documentation, labelnames))
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+    """글로벌 레지스트리에 Gauge 등록 (또는 기존 반환)"""
+    return REGISTRY.register(Gauge(name, documentation, labelnames))
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = LATENCY_BUCKETS
+) -> Histogram:
+    """글로벌 레지스트리에 Histogram 등록 (또는 기존 반환)"""
+    return REGISTRY.register(Histogram(name, documentation, labelnames, buckets))
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Prometheus 텍스트 포맷 (exposition format 0.0.4)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    inner = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+    return "{" + inner + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == int(value):
+        return str(int(value))
+    return repr(value)
+
+
+def render_prometheus(registry: Optional[MetricsRegistry] = None) -> str:
+    """레지스트리 전체를 Prometheus 텍스트 포맷으로 변환
+
+    Args:
+        registry: 대상 레지스트리 (기본: 글로벌 REGISTRY)
+
+    Returns:
+        str: /metrics 응답 본문
+    """
+    registry = registry or REGISTRY
+    lines: List[str] = []
+
+    for metric in registry.collect():
+        lines.append(f"# HELP {metric.name} {_escape(metric.documentation)}")
+        lines.append(f"# TYPE {metric.name} {metric.type_name}")
+
+        if isinstance(metric, Histogram):
+            for labels, child in metric.children():
+                cumulative = 0
+                for bound, count in zip(metric.buckets + (math.inf,), child.counts):
+                    cumulative += count
+                    bucket_labels = dict(labels, le=_format_value(bound))
+                    lines.append(
+                        f"{metric.name}_bucket{_format_labels(bucket_labels)} {cumulative}"
+                    )
+                lines.append(f"{metric.name}_sum{_format_labels(labels)} {_format_value(child.sum)}")
+                lines.append(f"{metric.name}_count{_format_labels(labels)} {cumulative}")
+            continue
+
+        for labels, value in metric.samples():
+            lines.append(f"{metric.name}{_format_labels(labels)} {_format_value(value)}")
+
+    return "\n".join(lines) + "\n"
@@ -87,3 +87,16 @@ class ILLMPort(ABC):
             Dict[str, Any]: LLM이 반환한 답변 결과
         """
         pass
+
+    def warmup(self) -> None:
+        """연결 준비 (앱 시작 시 1회, 선택적)
+
+        HTTP 클라이언트 생성 등 첫 요청에서 지연될 초기화를 미리 수행합니다.
+        기본 구현은 아무것도 하지 않습니다.
+        """
+
+    async def aclose(self) -> None:
+        """연결 정리 (앱 종료 시 1회, 선택적)
+
+        풀링된 HTTP 클라이언트를 닫습니다. 기본 구현은 아무것도 하지 않습니다.
+        """
@@ -0,0 +1,305 @@
+"""Profiling - 샘플링된 요청의 온디맨드 프로파일링
+
+재배포 없이 운영 중 느린 요청을 분석하기 위한 도구입니다.
+관리자가 런타임에 켜거나(/api/admin/profiling), 요청 헤더로 강제할 수 있으며
+수집된 프로파일은 쿼리/의도/구간별 시간과 함께 고정 크기 링 버퍼에 보관됩니다.
+
+Mode:
+    - cprofile: 결정적 프로파일러 (함수별 호출 수/누적 시간, .prof 다운로드 → snakeviz 등)
+    - sampling: 별도 스레드가 interval마다 루프 스레드 스택을 수집 (collapsed stack, flamegraph용)
+
+Note:
+    - 비활성화 상태에서는 should_profile()의 bool 비교 1회만 수행 (오버헤드 없음)
+    - 두 방식 모두 루프 스레드 전체를 관찰하므로 같은 시간대의 다른 요청 코드도 포함됨
+    - sys.setprofile은 스레드당 하나이므로 동시에 하나의 프로파일만 수집 (진행 중이면 건너뜀)
+
+Example:
+    >>> profiler = get_request_profiler()
+    >>> capture = profiler.start(query, user_id=user_id, force=False)
+    >>> try:
+    ...     response = await service.process_cooking_query(query)
+    ... finally:
+    ...     if capture is not None:
+    ...         profiler.finish(capture, intent=response.intent, timings=timing.to_dict())
+"""
+from collections import Counter, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional
+import cProfile
+import io
+import itertools
+import logging
+import marshal
+import pstats
+import random
+import sys
+import threading
+import time
+
+from app.core.metrics import counter
+
+logger = logging.getLogger(__name__)
+
+CPROFILE = "cprofile"
+SAMPLING = "sampling"
+MODES = (CPROFILE, SAMPLING)
+
+_profiles = counter("request_profiles_total", "수집된 요청 프로파일 수", ["mode"])
+
+
+@dataclass
+class RequestProfile:
+    """요청 1건의 프로파일 결과
+
+    Attributes:
+        id: 프로파일 ID (다운로드 경로에 사용)
+        mode: "cprofile" 또는 "sampling"
+        query/intent/user_id: 요청 정보
+        duration: 전체 소요 시간 (초)
+        timings: 구간별 소요 시간 (ms, Server-Timing과 동일)
+        data: cprofile → marshal된 pstats, sampling → collapsed stack 텍스트
+    """
+    id: str
+    mode: str
+    query: str
+    user_id: Optional[str]
+    created_at: float
+    intent: Optional[str] = None
+    duration: float = 0.0
+    timings: Dict[str, float] = field(default_factory=dict)
+    data: bytes = b""
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "mode": self.mode,
+            "query": self.query,
+            "intent": self.intent,
+            "user_id": self.user_id,
+            "created_at": self.created_at,
+            "duration_ms": round(self.duration * 1000, 1),
+            "timings": self.timings,
+            "size": len(self.data),
+        }
+
+    def top(self, limit: int = 30) -> str:
+        """사람이 읽을 수 있는 상위 항목 (cprofile: 누적 시간순, sampling: 샘플 수순)"""
+        if self.mode == CPROFILE:
+            stats = pstats.Stats(_StatsSource(marshal.loads(self.data)), stream=io.StringIO())
+            stats.sort_stats("cumulative").print_stats(limit)
+            return stats.stream.getvalue()
+        lines = self.data.decode().splitlines()
+        return "\n".join(sorted(lines, key=lambda line: -int(line.rsplit(" ", 1)[1]))[:limit])
+
+    @property
+    def filename(self) -> str:
+        return f"profile-{self.id}.{'prof' if self.mode == CPROFILE else 'folded'}"
+
+
+class _StatsSource:
+    """marshal된 stats dict를 pstats.Stats에 넘기기 위한 래퍼 (create_stats 프로토콜)"""
+
+    def __init__(self, stats: Dict):
+        self.stats = stats
+
+    def create_stats(self) -> None:
+        pass
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 수집기
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class _StackSampler:
+    """별도 스레드에서 대상 스레드의 스택을 주기적으로 수집 (collapsed stack)"""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> bytes:
+        self._stop.set()
+        self._thread.join()
+        return "\n".join(f"{stack} {count}" for stack, count in self.stacks.items()).encode()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({code.co_filename}:{frame.f_lineno})")
+                frame = frame.f_back
+            if names:
+                self.stacks[";".join(reversed(names))] += 1
+
+
+@dataclass
+class ProfileCapture:
+    """진행 중인 프로파일 (start() 반환값, finish()로 종료)"""
+    profile: RequestProfile
+    start: float
+    collector: Any
+
+
+class RequestProfiler:
+    """요청 샘플링 프로파일러
+
+    Attributes:
+        enabled: 샘플링 활성화 여부 (관리자 API로 런타임 변경)
+        sample_rate: 활성화 시 프로파일링할 요청 비율 (0~1)
+        mode: "cprofile" 또는 "sampling"
+        sampling_interval: sampling 모드 스택 수집 주기 (초)
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        sample_rate: float = 0.01,
+        mode: str = CPROFILE,
+        buffer_size: int = 20,
+        sampling_interval: float = 0.005
+    ):
+        if mode not in MODES:
+            raise ValueError(f"지원하지 않는 프로파일링 모드: {mode}")
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.mode = mode
+        self.sampling_interval = sampling_interval
+        self._profiles: Deque[RequestProfile] = deque(maxlen=buffer_size)
+        self._active = False
+        self._ids = itertools.count(1)
+
+    def configure(
+        self,
+        enabled: Optional[bool] = None,
+        sample_rate: Optional[float] = None,
+        mode: Optional[str] = None
+    ) -> None:
+        """런타임 설정 변경 (None인 항목은 유지)"""
+        if mode is not None:
+            if mode not in MODES:
+                raise ValueError(f"지원하지 않는 프로파일링 모드: {mode}")
+            self.mode = mode
+        if sample_rate is not None:
+            self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        if enabled is not None:
+            self.enabled = enabled
+        logger.info(
+            "[Profiler] 설정 변경 - enabled: %s, sample_rate: %s, mode: %s",
+            self.enabled, self.sample_rate, self.mode
+        )
+
+    def should_profile(self, force: bool = False) -> bool:
+        """이번 요청을 프로파일링할지 결정 (진행 중인 프로파일이 있으면 False)"""
+        if not (force or self.enabled) or self._active:
+            return False
+        return force or random.random() < self.sample_rate
+
+    def start(self, query: str, user_id: Optional[str] = None, force: bool = False) -> Optional[ProfileCapture]:
+        """프로파일 수집 시작 (샘플링되지 않으면 None)
+
+        Args:
+            query: 요청 쿼리
+            user_id: 사용자 ID
+            force: 샘플링 비율과 관계없이 수집 (관리자 헤더)
+        """
+        if not self.should_profile(force):
+            return None
+
+        self._active = True
+        profile = RequestProfile(
+            id=f"{int(time.time())}-{next(self._ids)}",
+            mode=self.mode,
+            query=query,
+            user_id=user_id,
+            created_at=time.time()
+        )
+        if self.mode == CPROFILE:
+            collector = cProfile.Profile()
+            collector.enable()
+        else:
+            collector = _StackSampler(threading.get_ident(), self.sampling_interval)
+            collector.start()
+        return ProfileCapture(profile, time.perf_counter(), collector)
+
+    def finish(
+        self,
+        capture: ProfileCapture,
+        intent: Optional[str] = None,
+        timings: Optional[Dict[str, float]] = None
+    ) -> RequestProfile:
+        """수집 종료 후 링 버퍼에 저장"""
+        profile = capture.profile
+        try:
+            if profile.mode == CPROFILE:
+                capture.collector.disable()
+                capture.collector.create_stats()
+                profile.data = marshal.dumps(capture.collector.stats)
+            else:
+                profile.data = capture.collector.stop()
+        finally:
+            self._active = False
+
+        profile.duration = time.perf_counter() - capture.start
+        profile.intent = intent
+        profile.timings = timings or {}
+        self._profiles.append(profile)
+        _profiles.labels(profile.mode).inc()
+        logger.info(
+            "[Profiler] 프로파일 저장 - id: %s, intent: %s, duration: %.3fs",
+            profile.id, intent, profile.duration
+        )
+        return profile
+
+    def list(self) -> List[Dict[str, Any]]:
+        """보관 중인 프로파일 요약 (최신순)"""
+        return [profile.summary() for profile in reversed(self._profiles)]
+
+    def get(self, profile_id: str) -> Optional[RequestProfile]:
+        return next((p for p in self._profiles if p.id == profile_id), None)
+
+    def clear(self) -> None:
+        self._profiles.clear()
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "sample_rate": self.sample_rate,
+            "mode": self.mode,
+            "stored": len(self._profiles),
+            "capacity": self._profiles.maxlen,
+        }
+
+
+_profiler = RequestProfiler()
+
+
+def get_request_profiler() -> RequestProfiler:
+    """글로벌 요청 프로파일러"""
+    return _profiler
+
+
+def configure_profiling(
+    enabled: bool = False,
+    sample_rate: float = 0.01,
+    mode: str = CPROFILE,
+    buffer_size: int = 20,
+    sampling_interval: float = 0.005
+) -> RequestProfiler:
+    """글로벌 프로파일러 교체 (앱 시작 시 설정값으로 호출)"""
+    global _profiler
+    _profiler = RequestProfiler(
+        enabled=enabled,
+        sample_rate=sample_rate,
+        mode=mode,
+        buffer_size=buffer_size,
+        sampling_interval=sampling_interval
+    )
+    return _profiler
@@ -2,14 +2,29 @@
 
 YAML 파일에서 프롬프트를 로드하고 Jinja2로 렌더링합니다.
 """
-from jinja2 import Environment, BaseLoader, TemplateNotFound
+from jinja2 import Environment, BaseLoader, Template, TemplateNotFound
 import yaml
+from contextvars import ContextVar
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 마지막으로 렌더링된 prompt_id (현재 실행 컨텍스트 기준)
+# Pure Adapter는 렌더링된 문자열만 받으므로, 지연 시간/토큰 통계를
+# 프롬프트별로 집계할 때 이 값을 사용합니다.
+_current_prompt_id: ContextVar[Optional[str]] = ContextVar("prompt_id", default=None)
+
+
+def current_prompt_id() -> Optional[str]:
+    """현재 컨텍스트에서 마지막으로 렌더링된 prompt_id
+
+    Returns:
+        Optional[str]: 예: "cooking.generate_recipe_multiple" (없으면 None)
+    """
+    return _current_prompt_id.get()
+
 
 class PromptLoader:
     """프롬프트 템플릿 로더 (MyBatis SqlSessionFactory와 유사)
@@ -21,6 +36,7 @@ class PromptLoader:
     - Jinja2 템플릿 엔진 통합 (동적 파라미터 바인딩)
     - 네임스페이스 기반 프롬프트 관리 (예: "cooking.classify_intent")
     - 핫 리로드 지원 (개발 모드)
+    - 컴파일된 템플릿 캐싱 (compile_all()로 시작 시 미리 컴파일)
 
     Example:
         >>> loader = PromptLoader()
@@ -44,8 +60,9 @@ class PromptLoader:
 
         self.prompts_dir = prompts_path
         self.prompts: Dict[str, Dict[str, Any]] = {}
+        self._templates: Dict[str, Template] = {}  # prompt_id → 컴파일된 템플릿
 
-        logger.debug(f"[PromptLoader] prompts_dir 초기화: {self.prompts_dir}")
+        logger.debug("[PromptLoader] prompts_dir 초기화: %s", self.prompts_dir)
 
         # Jinja2 환경 설정 (autoescape=False: 프롬프트는 HTML이 아님)
         self.jinja_env = Environment(
@@ -66,7 +83,7 @@ class PromptLoader:
                 common.yaml        # namespace: "common"
         """
         if not self.prompts_dir.exists():
-            logger.warning(f"[PromptLoader] 프롬프트 디렉토리가 없습니다: {self.prompts_dir}")
+            logger.warning("[PromptLoader] 프롬프트 디렉토리가 없습니다: %s", self.prompts_dir)
             return
 
         for yaml_file in self.prompts_dir.glob("*.yaml"):
@@ -75,9 +92,9 @@ class PromptLoader:
                     data = yaml.safe_load(f)
                     namespace = yaml_file.stem  # cooking.yaml -> "cooking"
                     self.prompts[namespace] = data
-                    logger.info(f"[PromptLoader] 로드 완료: {namespace} ({len(data)} prompts)")
+                    logger.info("[PromptLoader] 로드 완료: %s (%s prompts)", namespace, len(data))
             except Exception as e:
-                logger.error(f"[PromptLoader] YAML 로드 실패: {yaml_file} - {e}")
+                logger.error("[PromptLoader] YAML 로드 실패: %s - %s", yaml_file, e)
 
     def render(self, prompt_id: str, **kwargs) -> str:
         """프롬프트 렌더링 (MyBatis의 selectOne과 유사)
@@ -103,6 +120,45 @@ class PromptLoader:
             ...     constraints={"time": "30분"}
             ... )
         """
+        template = self._templates.get(prompt_id)
+        if template is None:
+            template = self._compile(prompt_id)
+
+        # Jinja2 렌더링
+        try:
+            rendered = template.render(**kwargs)
+            _current_prompt_id.set(prompt_id)
+
+            logger.debug("[PromptLoader] 렌더링 완료: %s (params: %s)", prompt_id, list(kwargs.keys()))
+
+            return rendered
+
+        except Exception as e:
+            logger.error("[PromptLoader] 렌더링 실패: %s - %s", prompt_id, e)
+            raise ValueError(f"[PromptLoader] 템플릿 렌더링 오류: {e}")
+
+    def compile_all(self) -> int:
+        """모든 프롬프트 템플릿을 미리 컴파일 (앱 시작 시 워밍업)
+
+        Returns:
+            int: 컴파일된 템플릿 수
+
+        Raises:
+            ValueError: 템플릿이 없거나 문법 오류가 있는 경우
+        """
+        for namespace, prompts in self.prompts.items():
+            for name in prompts:
+                prompt_id = f"{namespace}.{name}"
+                if prompt_id not in self._templates:
+                    self._compile(prompt_id)
+        return len(self._templates)
+
+    def _compile(self, prompt_id: str) -> Template:
+        """prompt_id 검증 후 템플릿 컴파일/캐싱
+
+        Raises:
+            ValueError: prompt_id 형식이 잘못되었거나 프롬프트/템플릿이 없는 경우
+        """
         # prompt_id 파싱 (namespace.name)
         if '.' not in prompt_id:
             raise ValueError(
@@ -134,21 +190,14 @@ class PromptLoader:
                 f"[PromptLoader] 프롬프트에 'template' 필드가 없습니다: {prompt_id}"
             )
 
-        # Jinja2 렌더링
         try:
             template = self.jinja_env.from_string(template_str)
-            rendered = template.render(**kwargs)
-
-            logger.debug(
-                f"[PromptLoader] 렌더링 완료: {prompt_id} "
-                f"(params: {list(kwargs.keys())})"
-            )
-
-            return rendered
-
         except Exception as e:
-            logger.error(f"[PromptLoader] 렌더링 실패: {prompt_id} - {e}")
-            raise ValueError(f"[PromptLoader] 템플릿 렌더링 오류: {e}")
+            logger.error("[PromptLoader] 컴파일 실패: %s - %s", prompt_id, e)
+            raise ValueError(f"[PromptLoader] 템플릿 컴파일 오류: {e}")
+
+        self._templates[prompt_id] = template
+        return template
 
     def get_description(self, prompt_id: str) -> Optional[str]:
         """프롬프트 설명 조회 (디버깅용)
@@ -196,5 +245,6 @@ class PromptLoader:
         """
         logger.info("[PromptLoader] 프롬프트 재로드 시작...")
         self.prompts.clear()
+        self._templates.clear()
         self._load_prompts()
         logger.info("[PromptLoader] 프롬프트 재로드 완료")
\ No newline at end of file
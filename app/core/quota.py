@@ -0,0 +1,321 @@
+"""Quota - 사용자별 토큰/이미지 사용 한도
+
+고정 윈도우(분/일) 카운터로 사용자별, 익명 사용자 공용 예산을 관리합니다.
+Workflow 실행 전에 check()로 한도를 확인하고, 실행 후 charge()로 실제 사용량을 반영합니다.
+(토큰은 요청 전에 알 수 없으므로 "이미 한도에 도달했으면 거절" 방식)
+이미지 한도는 요청을 거절하지 않고 이미지 생성(generate_image)만 생략하는 데 사용합니다.
+(이미지 예산이 소진되어도 텍스트 응답/질문은 처리)
+
+Backend:
+    - InMemoryQuotaBackend: 프로세스 내 dict (단일 워커, 기본값)
+    - SQLiteQuotaBackend: 파일 공유 카운터 (같은 호스트의 여러 워커)
+    - 다른 공유 저장소(Redis 등)는 QuotaBackend를 구현해 교체
+
+Example:
+    >>> manager = QuotaManager(InMemoryQuotaBackend(), user_limits, anonymous_limits)
+    >>> violation = await manager.check("user-1", resources=(TOKENS,))
+    >>> if violation:
+    ...     raise RateLimitExceededError(...)
+    >>> skip_images = await manager.check("user-1", resources=(IMAGES,)) is not None
+    >>> await manager.charge("user-1", tokens=1500, images=1)
+"""
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Any, Collection, Dict, List, Optional, Sequence
+import asyncio
+import sqlite3
+import threading
+import time
+
+from app.core.config import Settings
+from app.core.metrics import counter
+from app.core.usage import ANONYMOUS_USER
+
+TOKENS = "tokens"
+IMAGES = "images"
+
+WINDOWS: Dict[str, int] = {
+    "minute": 60,
+    "day": 86400,
+}
+
+_rejections = counter(
+    "quota_rejections_total",
+    "한도 초과 수 (tokens: 요청 거절, images: 이미지 생성 생략)",
+    ["subject_type", "resource", "window"]
+)
+
+
+@dataclass(frozen=True)
+class QuotaLimit:
+    """단일 한도
+
+    Attributes:
+        resource: "tokens" 또는 "images"
+        window: "minute" 또는 "day"
+        limit: 윈도우당 최대 사용량 (0 이하면 무제한)
+    """
+    resource: str
+    window: str
+    limit: int
+
+
+@dataclass(frozen=True)
+class QuotaViolation:
+    """한도 초과 정보 (RateLimitExceededError details로 사용)"""
+    resource: str
+    window: str
+    limit: int
+    used: float
+    retry_after: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Backend
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class QuotaBackend(ABC):
+    """카운터 저장소 인터페이스
+
+    키는 윈도우 인덱스를 포함하므로(예: "quota:user-1:tokens:day:20380")
+    만료 시각 이후의 키는 조회되지 않고 정리 대상이 됩니다.
+    요청 경로(이벤트 루프)에서 호출되므로 I/O가 있는 구현은 루프를 막지 않아야 합니다.
+    """
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> List[float]:
+        """키별 현재 값 (없으면 0)"""
+        pass
+
+    @abstractmethod
+    async def incr(self, key: str, amount: float, expires_at: float) -> None:
+        """키 값 증가 (없으면 생성)"""
+        pass
+
+
+class InMemoryQuotaBackend(QuotaBackend):
+    """프로세스 내 카운터 (조회 비용: dict 조회 몇 번)"""
+
+    def __init__(self, purge_interval: float = 60.0):
+        self._values: Dict[str, float] = {}
+        self._expires: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._purge_interval = purge_interval
+        self._next_purge = time.time() + purge_interval
+
+    async def get_many(self, keys: Sequence[str]) -> List[float]:
+        values = self._values
+        return [values.get(key, 0.0) for key in keys]
+
+    async def incr(self, key: str, amount: float, expires_at: float) -> None:
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+            self._expires[key] = expires_at
+            self._purge_expired()
+
+    def _purge_expired(self) -> None:
+        now = time.time()
+        if now < self._next_purge:
+            return
+        self._next_purge = now + self._purge_interval
+        expired = [key for key, expires_at in self._expires.items() if expires_at <= now]
+        for key in expired:
+            self._values.pop(key, None)
+            self._expires.pop(key, None)
+
+
+class SQLiteQuotaBackend(QuotaBackend):
+    """SQLite 파일 공유 카운터 (같은 호스트의 여러 uvicorn 워커용)
+
+    요청당 조회 1회 + 증가 몇 회의 짧은 트랜잭션만 수행합니다.
+    다른 프로세스가 쓰기 잠금을 잡고 있으면 최대 5초(busy timeout)까지 기다리므로
+    SQL은 asyncio.to_thread로 스레드에서 실행합니다.
+    """
+
+    def __init__(self, path: str):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=5.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS quota_counters ("
+            "key TEXT PRIMARY KEY, value REAL NOT NULL, expires_at REAL NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    async def get_many(self, keys: Sequence[str]) -> List[float]:
+        if not keys:
+            return []
+        return await asyncio.to_thread(self._get_many, keys)
+
+    async def incr(self, key: str, amount: float, expires_at: float) -> None:
+        await asyncio.to_thread(self._incr, key, amount, expires_at)
+
+    def _get_many(self, keys: Sequence[str]) -> List[float]:
+        placeholders = ",".join("?" for _ in keys)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, value FROM quota_counters WHERE key IN ({placeholders}) AND expires_at > ?",
+                (*keys, time.time())
+            ).fetchall()
+        values = dict(rows)
+        return [values.get(key, 0.0) for key in keys]
+
+    def _incr(self, key: str, amount: float, expires_at: float) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO quota_counters (key, value, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = value + excluded.value",
+                (key, amount, expires_at)
+            )
+            self._conn.execute("DELETE FROM quota_counters WHERE expires_at <= ?", (time.time(),))
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Manager
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class QuotaManager:
+    """사용자별 한도 확인/차감
+
+    인증 사용자는 user_id별로, 익명 사용자는 하나의 공용 예산으로 관리합니다.
+
+    Attributes:
+        backend: 카운터 저장소
+        user_limits: 인증 사용자 한도
+        anonymous_limits: 익명 사용자 공용 한도
+        enabled: False이면 check()는 항상 통과, charge()는 무시
+    """
+
+    def __init__(
+        self,
+        backend: QuotaBackend,
+        user_limits: Sequence[QuotaLimit],
+        anonymous_limits: Sequence[QuotaLimit],
+        enabled: bool = True
+    ):
+        self.backend = backend
+        self.user_limits = [limit for limit in user_limits if limit.limit > 0]
+        self.anonymous_limits = [limit for limit in anonymous_limits if limit.limit > 0]
+        self.enabled = enabled
+
+    async def check(
+        self,
+        user_id: Optional[str],
+        resources: Optional[Collection[str]] = None
+    ) -> Optional[QuotaViolation]:
+        """한도 확인 (Workflow 실행 전)
+
+        Args:
+            user_id: 사용자 ID (None이면 익명)
+            resources: 확인할 자원 (예: (TOKENS,), None이면 전체)
+
+        Returns:
+            Optional[QuotaViolation]: 초과한 한도 (없으면 None)
+        """
+        limits = self._limits_for(user_id)
+        if resources is not None:
+            limits = [limit for limit in limits if limit.resource in resources]
+        if not self.enabled or not limits:
+            return None
+
+        now = time.time()
+        subject = user_id or ANONYMOUS_USER
+        keys = [self._key(subject, limit.resource, limit.window, now) for limit in limits]
+
+        for limit, used in zip(limits, await self.backend.get_many(keys)):
+            if used >= limit.limit:
+                seconds = WINDOWS[limit.window]
+                _rejections.labels(
+                    "user" if user_id else "anonymous", limit.resource, limit.window
+                ).inc()
+                return QuotaViolation(
+                    resource=limit.resource,
+                    window=limit.window,
+                    limit=limit.limit,
+                    used=used,
+                    retry_after=round(seconds - now % seconds, 1)
+                )
+        return None
+
+    async def charge(self, user_id: Optional[str], tokens: int = 0, images: int = 0) -> None:
+        """실제 사용량 반영 (Workflow 실행 후)
+
+        Args:
+            user_id: 사용자 ID (None이면 익명)
+            tokens: 사용한 입력+출력 토큰
+            images: 생성한 이미지 수
+        """
+        if not self.enabled:
+            return
+
+        now = time.time()
+        subject = user_id or ANONYMOUS_USER
+        amounts = {TOKENS: tokens, IMAGES: images}
+
+        for limit in self._limits_for(user_id):
+            amount = amounts.get(limit.resource, 0)
+            if amount <= 0:
+                continue
+            seconds = WINDOWS[limit.window]
+            await self.backend.incr(
+                self._key(subject, limit.resource, limit.window, now),
+                amount,
+                expires_at=(now // seconds + 1) * seconds
+            )
+
+    async def usage(self, user_id: Optional[str]) -> Dict[str, Dict[str, float]]:
+        """현재 윈도우 사용량 (예: {"tokens": {"minute": 1200, "day": 53000}})"""
+        now = time.time()
+        subject = user_id or ANONYMOUS_USER
+        limits = self._limits_for(user_id)
+        keys = [self._key(subject, limit.resource, limit.window, now) for limit in limits]
+
+        result: Dict[str, Dict[str, float]] = {}
+        for limit, used in zip(limits, await self.backend.get_many(keys)):
+            result.setdefault(limit.resource, {})[limit.window] = used
+        return result
+
+    def _limits_for(self, user_id: Optional[str]) -> List[QuotaLimit]:
+        return self.user_limits if user_id else self.anonymous_limits
+
+    @staticmethod
+    def _key(subject: str, resource: str, window: str, now: float) -> str:
+        return f"quota:{subject}:{resource}:{window}:{int(now // WINDOWS[window])}"
+
+
+def create_quota_manager(settings: Settings) -> QuotaManager:
+    """설정 기반 QuotaManager 생성
+
+    Args:
+        settings: 애플리케이션 설정 (quota_* 값 사용)
+
+    Raises:
+        ValueError: 알 수 없는 quota_backend
+    """
+    if settings.quota_backend == "memory":
+        backend: QuotaBackend = InMemoryQuotaBackend()
+    elif settings.quota_backend == "sqlite":
+        backend = SQLiteQuotaBackend(settings.quota_sqlite_path)
+    else:
+        raise ValueError(f"[Quota] 알 수 없는 backend: {settings.quota_backend}")
+
+    user_limits = [
+        QuotaLimit(TOKENS, "minute", settings.quota_user_tokens_per_minute),
+        QuotaLimit(TOKENS, "day", settings.quota_user_tokens_per_day),
+        QuotaLimit(IMAGES, "minute", settings.quota_user_images_per_minute),
+        QuotaLimit(IMAGES, "day", settings.quota_user_images_per_day),
+    ]
+    anonymous_limits = [
+        QuotaLimit(TOKENS, "minute", settings.quota_anonymous_tokens_per_minute),
+        QuotaLimit(TOKENS, "day", settings.quota_anonymous_tokens_per_day),
+        QuotaLimit(IMAGES, "minute", settings.quota_anonymous_images_per_minute),
+        QuotaLimit(IMAGES, "day", settings.quota_anonymous_images_per_day),
+    ]
+    return QuotaManager(backend, user_limits, anonymous_limits, enabled=settings.quota_enabled)
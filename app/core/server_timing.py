@@ -0,0 +1,89 @@
+"""Server-Timing - 요청 처리 구간별 소요 시간
+
+노드/서비스/라우트가 구간(phase)별 소요 시간을 기록하면
+`Server-Timing` 응답 헤더와 ResponseMetadata.timings로 내보냅니다.
+(클라이언트 측 성능 대시보드에서 분류/생성/이미지/직렬화 비중 확인용)
+
+요청 단위 ServerTiming은 contextvar로 전달되므로
+LangGraph 노드처럼 별도 Task에서 실행되는 코드에서도 같은 객체에 기록됩니다.
+기록 비용은 dict 갱신 1회입니다.
+
+Example:
+    >>> timing = ServerTiming()
+    >>> with server_timing_scope(timing):
+    ...     await service.process_cooking_query(query)
+    >>> with timing.measure("serialize"):
+    ...     body = response.model_dump_json()
+    >>> timing.to_header()
+    'classify;dur=812.4, answer;dur=2310.9, dto;dur=0.4, serialize;dur=0.2'
+"""
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Iterator, Optional
+import time
+
+
+class ServerTiming:
+    """요청 단위 구간별 소요 시간 (초, 같은 구간은 누적)"""
+
+    __slots__ = ("_phases",)
+
+    def __init__(self):
+        self._phases: Dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        phases = self._phases
+        phases[phase] = phases.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, time.perf_counter() - start)
+
+    def to_dict(self) -> Dict[str, float]:
+        """구간별 소요 시간 (ms)"""
+        return {phase: round(seconds * 1000, 1) for phase, seconds in self._phases.items()}
+
+    def to_header(self) -> str:
+        """Server-Timing 헤더 값 (예: "classify;dur=812.4, image;dur=3021.0")"""
+        return ", ".join(
+            f"{phase};dur={seconds * 1000:.1f}" for phase, seconds in self._phases.items()
+        )
+
+
+_current_timing: ContextVar[Optional[ServerTiming]] = ContextVar("server_timing", default=None)
+
+
+def current_server_timing() -> Optional[ServerTiming]:
+    """현재 요청의 ServerTiming (없으면 None)"""
+    return _current_timing.get()
+
+
+@contextmanager
+def server_timing_scope(timing: ServerTiming) -> Iterator[ServerTiming]:
+    """블록 안의 구간 기록을 timing에 모음"""
+    token = _current_timing.set(timing)
+    try:
+        yield timing
+    finally:
+        _current_timing.reset(token)
+
+
+def record_phase(phase: str, seconds: float) -> None:
+    """현재 요청의 구간 소요 시간 기록 (요청 범위 밖이면 무시)"""
+    timing = _current_timing.get()
+    if timing is not None:
+        timing.add(phase, seconds)
+
+
+@contextmanager
+def measure_phase(phase: str) -> Iterator[None]:
+    """블록 소요 시간을 현재 요청의 구간으로 기록"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(phase, time.perf_counter() - start)
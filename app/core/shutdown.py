@@ -0,0 +1,203 @@
+"""Shutdown - 그레이스풀 종료 (진행 중 워크플로우 드레인)
+
+재배포 시 30~60초 걸리는 레시피 생성이 중간에 끊기면 사용자가 재시도해
+업스트림 비용이 두 배가 됩니다. lifespan 종료 단계에서 다음 순서로 종료합니다.
+
+    1. 드레인 시작: /ready 503 (로드 밸런서가 새 트래픽을 다른 워커로 보냄)
+       이후 들어온 요청은 503 + Retry-After + Connection: close (DrainMiddleware)
+    2. 진행 중 요청 / 백그라운드 작업이 끝날 때까지 grace_period 동안 대기
+    3. 종료 훅 실행 (미완료 백그라운드 작업 저장, 풀링된 HTTP 클라이언트 close 등)
+       등록 역순으로 실행하며, 훅 하나가 실패해도 나머지는 계속 실행합니다.
+
+배포 도구에서 프로세스 종료 전에 미리 드레인하려면 관리자 API(POST /api/admin/drain)를
+preStop 훅 등에서 호출하세요.
+
+Note:
+    uvicorn은 SIGTERM을 받으면 리스닝 소켓을 닫고 열린 HTTP 연결이 끝나길 기다린 뒤
+    lifespan 종료를 실행합니다. --timeout-graceful-shutdown은 shutdown_grace_period보다
+    길게 설정하세요. (HTTP 연결과 무관한 백그라운드 작업은 2단계에서 기다립니다)
+
+Example:
+    >>> coordinator = get_shutdown_coordinator()
+    >>> async with coordinator.track():           # 진행 중 작업으로 집계
+    ...     await workflow.run(state)
+    >>> register_shutdown_hook("jobs", job_store.persist_pending)
+    >>> await coordinator.shutdown(grace_period=60.0)   # lifespan 종료
+"""
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+import asyncio
+import inspect
+import logging
+import time
+
+from fastapi.responses import JSONResponse
+
+from app.core.metrics import counter, gauge
+
+logger = logging.getLogger(__name__)
+
+_draining_gauge = gauge("app_draining", "종료 드레인 중 여부 (1: 드레인 중)").labels()
+_in_flight_gauge = gauge("app_in_flight", "드레인 대상 진행 중 요청/작업 수").labels()
+_rejected = counter("app_drain_rejected_total", "드레인 중 거절한 요청 수")
+
+ShutdownHook = Callable[[], Union[None, Awaitable[None]]]
+
+
+class ShutdownCoordinator:
+    """진행 중 작업 집계 + 드레인 + 종료 훅 실행
+
+    Attributes:
+        draining: 드레인 시작 여부 (True면 새 요청 거절)
+        in_flight: 진행 중 요청/작업 수
+    """
+
+    def __init__(self):
+        self.draining = False
+        self.in_flight = 0
+        self._hooks: List[Tuple[str, ShutdownHook]] = []
+
+    @asynccontextmanager
+    async def track(self) -> AsyncIterator[None]:
+        """블록 실행 동안 진행 중 작업으로 집계"""
+        self.in_flight += 1
+        _in_flight_gauge.set(self.in_flight)
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            _in_flight_gauge.set(self.in_flight)
+
+    def begin_drain(self) -> None:
+        """드레인 시작 (새 요청 거절, /ready 503)"""
+        if not self.draining:
+            self.draining = True
+            _draining_gauge.set(1)
+            logger.info("[Shutdown] 드레인 시작 - 진행 중: %s건", self.in_flight)
+
+    async def wait_idle(self, timeout: float, poll_interval: float = 0.05) -> bool:
+        """진행 중 작업이 모두 끝날 때까지 대기
+
+        종료 시 1회만 호출되므로 이벤트 루프에 묶이는 asyncio.Event 대신 짧게 폴링합니다.
+
+        Returns:
+            timeout 안에 모두 끝났으면 True
+        """
+        deadline = time.monotonic() + timeout
+        while self.in_flight > 0:
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(poll_interval)
+        return True
+
+    def register_hook(self, name: str, hook: ShutdownHook) -> None:
+        """종료 훅 등록 (드레인 이후 등록 역순 실행, 같은 이름이면 교체)"""
+        self._hooks = [(n, h) for n, h in self._hooks if n != name]
+        self._hooks.append((name, hook))
+
+    async def shutdown(self, grace_period: float) -> Dict[str, Any]:
+        """드레인 → 대기 → 종료 훅 실행
+
+        Args:
+            grace_period: 진행 중 작업을 기다릴 최대 시간 (초)
+
+        Returns:
+            {"drained": bool, "abandoned": int, "waited": float, "hook_errors": {...}}
+        """
+        self.begin_drain()
+        start = time.perf_counter()
+        drained = await self.wait_idle(grace_period)
+        waited = time.perf_counter() - start
+        if drained:
+            logger.info("[Shutdown] 드레인 완료 (%.2fs)", waited)
+        else:
+            logger.warning(
+                "[Shutdown] 유예 시간 %.0fs 초과 - 미완료 %s건을 두고 종료", grace_period, self.in_flight
+            )
+
+        hook_errors: Dict[str, str] = {}
+        for name, hook in reversed(self._hooks):
+            try:
+                result = hook()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                hook_errors[name] = f"{type(e).__name__}: {e}"
+                logger.exception("[Shutdown] 종료 훅 실패: %s", name)
+
+        return {
+            "drained": drained,
+            "abandoned": self.in_flight,
+            "waited": round(waited, 4),
+            "hook_errors": hook_errors,
+        }
+
+    def reset(self) -> None:
+        """드레인 해제 (같은 프로세스에서 앱을 다시 시작할 때, 주로 테스트)"""
+        self.draining = False
+        _draining_gauge.set(0)
+
+
+class DrainMiddleware:
+    """진행 중 요청 집계 + 드레인 중 새 요청 거절 (순수 ASGI)
+
+    헬스/준비 상태/메트릭 경로는 드레인 중에도 응답합니다. (/ready는 503으로 드레인 상태 보고)
+    """
+
+    def __init__(
+        self,
+        app,
+        coordinator: Optional[ShutdownCoordinator] = None,
+        retry_after: int = 5,
+        exempt_paths: Tuple[str, ...] = ("/ready", "/api/health", "/metrics")
+    ):
+        self.app = app
+        self.coordinator = coordinator or get_shutdown_coordinator()
+        self.retry_after = retry_after
+        self.exempt_paths = frozenset(exempt_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in self.exempt_paths:
+            await self.app(scope, receive, send)
+            return
+
+        if self.coordinator.draining:
+            _rejected.inc()
+            response = JSONResponse(
+                {"detail": "서버가 종료 중입니다. 잠시 후 다시 시도해 주세요."},
+                status_code=503,
+                headers={"Retry-After": str(self.retry_after), "Connection": "close"}
+            )
+            await response(scope, receive, send)
+            return
+
+        # 요청마다 지나는 경로라 track()(제너레이터 기반 컨텍스트 매니저) 대신 직접 집계
+        coordinator = self.coordinator
+        coordinator.in_flight += 1
+        _in_flight_gauge.set(coordinator.in_flight)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            coordinator.in_flight -= 1
+            _in_flight_gauge.set(coordinator.in_flight)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 글로벌
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_coordinator = ShutdownCoordinator()
+
+
+def get_shutdown_coordinator() -> ShutdownCoordinator:
+    return _coordinator
+
+
+def register_shutdown_hook(name: str, hook: ShutdownHook) -> None:
+    """글로벌 종료 훅 등록
+
+    Args:
+        name: 훅 이름 (로그/결과 표시용, 같은 이름이면 교체)
+        hook: 인자 없는 동기/비동기 함수
+    """
+    _coordinator.register_hook(name, hook)
@@ -0,0 +1,103 @@
+"""Startup - 앱 시작 구간별 소요 시간 리포트
+
+배포 직후 첫 요청이 그래프 빌드/무거운 import 비용을 내지 않도록
+lifespan에서 워밍업을 마친 뒤 요청을 받습니다. 이 모듈은 그 과정의
+구간별 소요 시간을 기록해 로그/메트릭/관리자 API(/api/admin/startup)로 노출합니다.
+
+구간 예시:
+    imports   app.main import (FastAPI, 라우터, 설정)
+    configure 로깅/트레이싱/프로파일러 설정
+    injector  DI 컨테이너 생성
+    adapters  LLM/이미지 어댑터 생성 (langchain_anthropic, replicate import)
+    workflow  노드 + LangGraph 그래프 컴파일 (langgraph import)
+    prompts   프롬프트 템플릿 컴파일
+    clients   HTTP 클라이언트 생성
+
+Example:
+    >>> report = get_startup_report()  # 시작 시각 = 이 모듈의 첫 import 시점
+    >>> with report.phase("workflow"):
+    ...     injector.get(CookingWorkflow)
+    >>> report.mark_ready()
+    [Startup] 준비 완료 2.31s (imports 0.90s, workflow 0.61s, ...)
+"""
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+import logging
+import time
+
+from app.core.metrics import gauge
+
+logger = logging.getLogger(__name__)
+
+_phase_seconds = gauge("app_startup_phase_seconds", "앱 시작 구간별 소요 시간 (초)", ["phase"])
+_startup_seconds = gauge("app_startup_seconds", "app.main import부터 준비 완료까지 소요 시간 (초)")
+
+
+class StartupReport:
+    """앱 시작 구간별 소요 시간
+
+    Attributes:
+        started_at: 시작 시각 (epoch 초)
+        phases: 구간명 → 소요 시간 (초, 기록 순서 유지)
+        errors: 실패한 구간명 → 오류 메시지
+        ready: 워밍업 완료 여부
+        total: 시작 → 준비 완료 소요 시간 (초)
+    """
+
+    def __init__(self):
+        self.started_at = time.time()
+        self._start = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+        self.ready = False
+        self.total: Optional[float] = None
+
+    def elapsed(self) -> float:
+        """시작 후 경과 시간 (초)"""
+        return time.perf_counter() - self._start
+
+    def record(self, name: str, seconds: float) -> None:
+        self.phases[name] = seconds
+        _phase_seconds.labels(name).set(seconds)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """구간 소요 시간 기록 (예외는 errors에 남기고 그대로 전파)"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            self.errors[name] = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def mark_ready(self) -> None:
+        """준비 완료 (총 소요 시간 기록 + 요약 로그)"""
+        self.ready = True
+        self.total = self.elapsed()
+        _startup_seconds.set(self.total)
+        logger.info("[Startup] 준비 완료 %s", self.summary())
+
+    def summary(self) -> str:
+        total = self.total if self.total is not None else self.elapsed()
+        phases = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.phases.items())
+        return f"{total:.2f}s ({phases})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "started_at": self.started_at,
+            "total_seconds": round(self.total, 4) if self.total is not None else None,
+            "phases": {name: round(seconds, 4) for name, seconds in self.phases.items()},
+            "errors": dict(self.errors),
+        }
+
+
+# 글로벌 리포트 (프로세스당 1개)
+_report = StartupReport()
+
+
+def get_startup_report() -> StartupReport:
+    """글로벌 시작 리포트"""
+    return _report
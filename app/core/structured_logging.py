@@ -0,0 +1,266 @@
+"""Structured Logging - 이벤트 루프를 막지 않는 구조화 로깅
+
+노드/어댑터/서비스가 요청마다 여러 줄의 INFO 로그를 남기는데,
+기본 StreamHandler는 루프 스레드에서 포맷팅과 I/O를 동기로 수행합니다.
+
+구성:
+    - QueueHandler(루프 스레드): 필터만 실행하고 레코드를 큐에 넣음 (포맷팅/I/O 없음)
+    - QueueListener(백그라운드 스레드): 포맷팅 + 출력
+    - JsonFormatter: 한 줄 JSON (request_id, trace_id 포함)
+    - RequestIdMiddleware: X-Request-ID 헤더(없으면 생성)를 contextvar에 저장, 응답 헤더로 반환
+    - SamplingFilter: 로거 prefix별 INFO 이하 로그 샘플링 (WARNING 이상은 항상 기록)
+
+Note:
+    - 포맷팅은 백그라운드 스레드에서 하므로 logger.info("... %s", value)처럼
+      인자를 넘기면 문자열 생성 비용도 루프 스레드에서 빠집니다 (지연 포맷팅)
+    - 대신 인자로 넘긴 가변 객체가 출력 전에 바뀌면 바뀐 값이 기록될 수 있습니다
+
+Example:
+    >>> listener = configure_logging(level="INFO", json_format=True,
+    ...                              sample_rates={"app.cooking_assistant.workflow": 0.1})
+    >>> app.add_middleware(RequestIdMiddleware)
+    >>> ...
+    >>> shutdown_logging()
+"""
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Dict, Optional
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+import uuid
+
+from app.core.tracing import get_current_span
+
+REQUEST_ID_HEADER = "X-Request-ID"
+
+# LogRecord 기본 속성 (extra로 넘긴 필드 구분용)
+_RECORD_ATTRS = frozenset(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {
+    "message", "asctime", "request_id", "trace_id",
+}
+
+_request_id: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+
+def current_request_id() -> Optional[str]:
+    """현재 요청 ID (요청 범위 밖이면 None)"""
+    return _request_id.get()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Filter / Formatter
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class RequestContextFilter(logging.Filter):
+    """레코드에 request_id, trace_id 추가 (로그를 남긴 스레드/컨텍스트에서 실행)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = _request_id.get()
+        record.trace_id = _current_trace_id()
+        return True
+
+
+def _current_trace_id() -> Optional[str]:
+    span = get_current_span()
+    return span.context.trace_id if span.is_recording() else None
+
+
+class SamplingFilter(logging.Filter):
+    """로거 prefix별 INFO 이하 로그 샘플링
+
+    가장 길게 일치하는 prefix의 비율을 사용합니다.
+    WARNING 이상은 샘플링하지 않습니다.
+
+    Attributes:
+        rates: {"app.cooking_assistant.workflow": 0.1, ...} (0~1, 일치 없으면 1.0)
+    """
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = dict(rates)
+        self._resolved: Dict[str, float] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO or not self.rates:
+            return True
+        rate = self._resolved.get(record.name)
+        if rate is None:
+            rate = self._resolve(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+    def _resolve(self, name: str) -> float:
+        matches = [
+            prefix for prefix in self.rates
+            if name == prefix or name.startswith(prefix + ".")
+        ]
+        rate = self.rates[max(matches, key=len)] if matches else 1.0
+        self._resolved[name] = rate
+        return rate
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄 JSON 포맷
+
+    기본 필드: ts, level, logger, message, request_id, trace_id
+    extra={"key": value}로 넘긴 필드와 예외 정보(exc_info)도 포함합니다.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        trace_id = getattr(record, "trace_id", None)
+        if trace_id:
+            entry["trace_id"] = trace_id
+
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+TEXT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s"
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Queue 기반 Handler
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class _LazyQueueHandler(logging.handlers.QueueHandler):
+    """포맷팅 없이 레코드를 그대로 큐에 넣는 QueueHandler
+
+    기본 QueueHandler.prepare()는 큐에 넣기 전에 메시지를 포맷팅하므로
+    (프로세스 간 큐 대비) 루프 스레드에서 문자열 생성 비용이 그대로 남습니다.
+    같은 프로세스의 QueueListener만 사용하므로 포맷팅을 리스너 스레드로 미룹니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def configure_logging(
+    level: str = "INFO",
+    json_format: bool = False,
+    use_queue: bool = True,
+    sample_rates: Optional[Dict[str, float]] = None,
+    stream=None
+) -> Optional[logging.handlers.QueueListener]:
+    """루트 로거 구성 (앱 시작 시 1회 호출, 다시 호출하면 교체)
+
+    Args:
+        level: 로그 레벨
+        json_format: True면 JsonFormatter, False면 기존 텍스트 포맷 (+ request_id)
+        use_queue: True면 QueueHandler/QueueListener로 백그라운드 출력
+        sample_rates: 로거 prefix별 INFO 이하 샘플링 비율
+        stream: 출력 스트림 (기본 stderr)
+
+    Returns:
+        QueueListener (use_queue=False면 None)
+    """
+    global _listener
+    shutdown_logging()
+
+    # 포맷에 쓰지 않는 정보는 LogRecord 생성 시 수집하지 않음 (logging HOWTO "Optimization")
+    # 호출 위치(funcName/lineno) 탐색은 레코드당 프레임 순회 비용이 가장 큼
+    logging._srcfile = None
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT))
+
+    if use_queue:
+        # SimpleQueue: C 구현, put이 락 대기 없이 끝남 (크기 제한 없음)
+        handler: logging.Handler = _LazyQueueHandler(queue.SimpleQueue())
+        _listener = logging.handlers.QueueListener(handler.queue, output, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+    else:
+        handler = output
+
+    # 필터는 로그를 남긴 컨텍스트(요청 contextvar)에서 실행되어야 하므로 입구 handler에 부착
+    handler.addFilter(RequestContextFilter())
+    if sample_rates:
+        handler.addFilter(SamplingFilter(sample_rates))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level.upper())
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """QueueListener 중지 (남은 레코드를 모두 출력한 뒤 종료)"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def logging_queue_depth() -> int:
+    """출력 대기 중인 로그 레코드 수 (큐를 쓰지 않으면 0)"""
+    if _listener is None:
+        return 0
+    return _listener.queue.qsize()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Request ID Middleware (ASGI)
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class RequestIdMiddleware:
+    """요청 ID를 contextvar에 저장하고 응답 헤더로 반환
+
+    클라이언트가 X-Request-ID를 보내면 그대로 사용하고(최대 128자), 없으면 생성합니다.
+    BaseHTTPMiddleware 대신 순수 ASGI로 구현하여 요청당 추가 Task를 만들지 않습니다.
+    """
+
+    def __init__(self, app, header_name: str = REQUEST_ID_HEADER):
+        self.app = app
+        self.header_name = header_name.lower().encode("latin-1")
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == self.header_name:
+                request_id = value.decode("latin-1")[:128]
+                break
+        request_id = request_id or uuid.uuid4().hex
+        raw_id = request_id.encode("latin-1", errors="replace")
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message.setdefault("headers", [])
+                message["headers"] = list(message["headers"]) + [(self.header_name, raw_id)]
+            await send(message)
+
+        token = _request_id.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            _request_id.reset(token)
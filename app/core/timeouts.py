@@ -0,0 +1,69 @@
+"""AdaptiveTimeoutPolicy - 관측 지연 시간 기반 적응형 타임아웃
+
+메서드/프롬프트별 최근 지연 시간의 p99 × factor를 타임아웃으로 사용합니다.
+1초짜리 의도 분류와 40초짜리 복수 레시피 생성이 같은 고정 타임아웃을 쓰지 않도록
+멈춘 호출은 빨리 포기하고, 원래 오래 걸리는 호출은 끊지 않습니다.
+
+우선순위:
+    1. 설정 override ("method:prompt_id" → "method")
+    2. 샘플이 충분하면 clamp(p99 × factor, min_timeout, default)
+    3. 기본 타임아웃 (예: llm_timeout)
+"""
+from typing import Dict, Optional
+
+from app.core.latency import LatencyTracker
+
+
+class AdaptiveTimeoutPolicy:
+    """적응형 타임아웃 정책
+
+    Attributes:
+        latency: 키별 지연 시간 추적기
+        default: 기본 타임아웃이자 상한 (초)
+        overrides: 고정 타임아웃 (키: "method" 또는 "method:prompt_id")
+        enabled: False이면 override 또는 기본값만 사용
+    """
+
+    def __init__(
+        self,
+        latency: LatencyTracker,
+        default: float,
+        overrides: Optional[Dict[str, float]] = None,
+        enabled: bool = True,
+        percentile: float = 0.99,
+        factor: float = 3.0,
+        min_timeout: float = 5.0,
+        min_samples: int = 20
+    ):
+        self.latency = latency
+        self.default = default
+        self.overrides = overrides or {}
+        self.enabled = enabled
+        self.percentile = percentile
+        self.factor = factor
+        self.min_timeout = min_timeout
+        self.min_samples = min_samples
+
+    def timeout_for(self, method: str, key: str) -> float:
+        """호출에 적용할 타임아웃 (초)
+
+        Args:
+            method: Port 메서드 이름 (예: "generate_recipe")
+            key: 통계 키 (예: "generate_recipe:cooking.generate_recipe_multiple")
+        """
+        override = self.overrides.get(key, self.overrides.get(method))
+        if override is not None:
+            return override
+
+        if not self.enabled or self.latency.count(key) < self.min_samples:
+            return self.default
+
+        observed = self.latency.percentile(key, self.percentile)
+        return min(self.default, max(self.min_timeout, observed * self.factor))
+
+    def snapshot(self) -> Dict[str, float]:
+        """키별 현재 타임아웃 (디버깅용)"""
+        return {
+            key: round(self.timeout_for(key.split(":", 1)[0], key), 3)
+            for key in self.latency.keys()
+        }
@@ -0,0 +1,422 @@
+"""Tracing - 요청 단위 트레이싱 (OpenTelemetry 호환 API)
+
+route → service → graph node → adapter 호출을 span 트리로 기록합니다.
+API 형태(get_tracer, start_as_current_span, set_attribute, trace_id/span_id 포맷)는
+OpenTelemetry와 동일하게 맞춰 두어 추후 opentelemetry-sdk로 교체할 수 있습니다.
+
+Exporter:
+    - InMemorySpanExporter: 최근 span을 메모리 ring buffer에 보관 (오프라인 분석, 테스트)
+    - JsonLinesSpanExporter: 종료된 span을 JSONL 파일에 추가 (백그라운드 스레드에서 기록)
+    - 둘 다 외부 의존성/네트워크 없이 동작
+
+컨텍스트 전파:
+    - 프로세스 내부: contextvar (asyncio Task 생성 시 자동 복사)
+    - 외부: W3C traceparent 헤더 (parse_traceparent)
+
+Example:
+    >>> tracer = get_tracer(__name__)
+    >>> with tracer.start_as_current_span("cooking.request", attributes={"http.route": "/api/cooking"}) as span:
+    ...     span.set_attribute("intent", "recipe_create")
+"""
+from abc import ABC, abstractmethod
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Iterator, List, Mapping, Optional, Sequence
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+AttributeValue = Any
+
+
+@dataclass(frozen=True)
+class SpanContext:
+    """Span 식별자 (W3C trace context)"""
+    trace_id: str
+    span_id: str
+    sampled: bool = True
+
+    def to_traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.sampled else '00'}"
+
+
+class Span:
+    """실행 구간
+
+    Attributes:
+        name: span 이름 (예: "node.RecipeGeneratorNode")
+        context: 이 span의 식별자
+        parent_id: 부모 span_id (루트면 None)
+        attributes: 속성 (prompt_id, 토큰 수, 재시도 횟수 등)
+        events: 구간 내 이벤트 (이름, 시각, 속성)
+        status: "UNSET" | "OK" | "ERROR"
+    """
+
+    def __init__(self, name: str, context: SpanContext, parent_id: Optional[str] = None):
+        self.name = name
+        self.context = context
+        self.parent_id = parent_id
+        self.attributes: Dict[str, AttributeValue] = {}
+        self.events: List[Dict[str, Any]] = []
+        self.status = "UNSET"
+        self.status_description: Optional[str] = None
+        self.start_time = time.time()
+        self._start = time.perf_counter()
+        self.duration: Optional[float] = None
+
+    def is_recording(self) -> bool:
+        return True
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes: Mapping[str, AttributeValue]) -> None:
+        self.attributes.update(attributes)
+
+    def add_event(self, name: str, attributes: Optional[Mapping[str, AttributeValue]] = None) -> None:
+        self.events.append({"name": name, "timestamp": time.time(), "attributes": dict(attributes or {})})
+
+    def record_exception(self, exc: BaseException) -> None:
+        self.add_event("exception", {
+            "exception.type": type(exc).__name__,
+            "exception.message": str(exc)
+        })
+
+    def set_status(self, status: str, description: Optional[str] = None) -> None:
+        self.status = status
+        self.status_description = description
+
+    def end(self) -> None:
+        if self.duration is None:
+            self.duration = time.perf_counter() - self._start
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.context.trace_id,
+            "span_id": self.context.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration_ms": round((self.duration or 0.0) * 1000, 3),
+            "status": self.status,
+            "status_description": self.status_description,
+            "attributes": self.attributes,
+            "events": self.events,
+        }
+
+
+class _NonRecordingSpan(Span):
+    """비활성화/비샘플링 시 사용하는 no-op span (기록 비용 없음)"""
+
+    def __init__(self, context: Optional[SpanContext] = None):
+        self.name = ""
+        self.context = context or SpanContext("0" * 32, "0" * 16, sampled=False)
+        self.parent_id = None
+        self.attributes = {}
+        self.events = []
+        self.status = "UNSET"
+        self.status_description = None
+        self.duration = 0.0
+
+    def is_recording(self) -> bool:
+        return False
+
+    def set_attribute(self, key: str, value: AttributeValue) -> None:
+        pass
+
+    def set_attributes(self, attributes: Mapping[str, AttributeValue]) -> None:
+        pass
+
+    def add_event(self, name: str, attributes: Optional[Mapping[str, AttributeValue]] = None) -> None:
+        pass
+
+    def set_status(self, status: str, description: Optional[str] = None) -> None:
+        pass
+
+    def end(self) -> None:
+        pass
+
+
+INVALID_SPAN = _NonRecordingSpan()
+
+_current_span: ContextVar[Span] = ContextVar("current_span", default=INVALID_SPAN)
+
+
+def get_current_span() -> Span:
+    """현재 활성 span (없으면 no-op span)"""
+    return _current_span.get()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Exporter
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class SpanExporter(ABC):
+    """종료된 span 내보내기 인터페이스"""
+
+    @abstractmethod
+    def export(self, spans: Sequence[Span]) -> None:
+        pass
+
+    def shutdown(self) -> None:
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    """최근 span을 메모리에 보관 (ring buffer)"""
+
+    def __init__(self, max_spans: int = 2000):
+        self._spans: Deque[Span] = deque(maxlen=max_spans)
+        self._lock = threading.Lock()
+
+    def export(self, spans: Sequence[Span]) -> None:
+        with self._lock:
+            self._spans.extend(spans)
+
+    def get_finished_spans(self, trace_id: Optional[str] = None) -> List[Span]:
+        with self._lock:
+            spans = list(self._spans)
+        if trace_id is None:
+            return spans
+        return [span for span in spans if span.context.trace_id == trace_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+
+class JsonLinesSpanExporter(SpanExporter):
+    """종료된 span을 JSONL 파일에 추가
+
+    구조 (structured_logging의 QueueHandler/QueueListener와 같은 방식):
+        - export() (루프 스레드): span을 큐에 넣기만 함 (직렬화/I/O 없음)
+        - 백그라운드 스레드: 큐에 쌓인 span을 모아 직렬화 → 한 번에 write + flush
+    shutdown() 시 남은 span을 모두 기록한 뒤 파일을 닫습니다.
+    """
+
+    _STOP = object()
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(path, "a", encoding="utf-8")
+        # SimpleQueue: C 구현, put이 락 대기 없이 끝남 (크기 제한 없음)
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._drain, name="span-exporter", daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def export(self, spans: Sequence[Span]) -> None:
+        for span in spans:
+            self._queue.put(span)
+
+    def shutdown(self) -> None:
+        if not self._thread.is_alive():
+            return
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def _drain(self) -> None:
+        """큐를 비울 때마다 모인 span을 한 번에 기록 (백그라운드 스레드)"""
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stopping = any(item is self._STOP for item in batch)
+            lines = "".join(
+                json.dumps(item.to_dict(), ensure_ascii=False, default=str) + "\n"
+                for item in batch if item is not self._STOP
+            )
+            try:
+                self._file.write(lines)
+                self._file.flush()
+            except Exception as e:
+                logger.warning("[Tracing] JSONL 기록 실패: %s", e)
+        self._file.close()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# Tracer
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class TracerProvider:
+    """Tracer 공통 설정 (활성화 여부, 샘플링 비율, exporter)"""
+
+    def __init__(
+        self,
+        exporters: Optional[Sequence[SpanExporter]] = None,
+        enabled: bool = True,
+        sample_rate: float = 1.0
+    ):
+        self.exporters: List[SpanExporter] = list(exporters or [])
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+
+    def add_exporter(self, exporter: SpanExporter) -> None:
+        self.exporters.append(exporter)
+
+    def export(self, span: Span) -> None:
+        for exporter in self.exporters:
+            try:
+                exporter.export((span,))
+            except Exception as e:
+                logger.warning("[Tracing] span export 실패 (%s): %s", type(exporter).__name__, e)
+
+    def shutdown(self) -> None:
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+    def get_tracer(self, name: str) -> "Tracer":
+        return Tracer(name, self)
+
+
+class Tracer:
+    """Span 생성기 (OpenTelemetry Tracer와 같은 사용법)"""
+
+    def __init__(self, name: str, provider: TracerProvider):
+        self.name = name
+        self.provider = provider
+
+    @contextmanager
+    def start_as_current_span(
+        self,
+        name: str,
+        attributes: Optional[Mapping[str, AttributeValue]] = None,
+        parent: Optional[SpanContext] = None
+    ) -> Iterator[Span]:
+        """span을 생성해 현재 span으로 설정
+
+        블록에서 예외가 발생하면 span에 기록하고(status=ERROR) 그대로 전파합니다.
+
+        Args:
+            name: span 이름
+            attributes: 시작 속성
+            parent: 원격 부모 (traceparent 헤더). 없으면 현재 span을 부모로 사용
+        """
+        span = self._start_span(name, parent)
+        if span is INVALID_SPAN or not span.is_recording():
+            token = _current_span.set(span)
+            try:
+                yield span
+            finally:
+                _current_span.reset(token)
+            return
+
+        if attributes:
+            span.set_attributes(attributes)
+
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as exc:
+            span.record_exception(exc)
+            span.set_status("ERROR", f"{type(exc).__name__}: {exc}")
+            raise
+        finally:
+            _current_span.reset(token)
+            span.end()
+            self.provider.export(span)
+
+    def _start_span(self, name: str, parent: Optional[SpanContext]) -> Span:
+        provider = self.provider
+        if not provider.enabled:
+            return INVALID_SPAN
+
+        if parent is None:
+            current = _current_span.get()
+            if current is not INVALID_SPAN:
+                parent = current.context
+
+        if parent is not None:
+            # 부모의 샘플링 결정을 따름 (트레이스 단위로 전부 기록하거나 전부 생략)
+            if not parent.sampled:
+                return _NonRecordingSpan(parent)
+            context = SpanContext(parent.trace_id, _new_id(16))
+            return Span(name, context, parent_id=parent.span_id)
+
+        if provider.sample_rate < 1.0 and random.random() >= provider.sample_rate:
+            return _NonRecordingSpan(SpanContext(_new_id(32), _new_id(16), sampled=False))
+
+        return Span(name, SpanContext(_new_id(32), _new_id(16)))
+
+
+def _new_id(length: int) -> str:
+    return os.urandom(length // 2).hex()
+
+
+_TRACEPARENT = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+
+def parse_traceparent(header: Optional[str]) -> Optional[SpanContext]:
+    """W3C traceparent 헤더 → SpanContext (형식이 틀리면 None)"""
+    if not header:
+        return None
+    match = _TRACEPARENT.match(header.strip().lower())
+    if not match or match.group(1) == "0" * 32:
+        return None
+    return SpanContext(match.group(1), match.group(2), sampled=bool(int(match.group(3), 16) & 1))
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 글로벌 Provider
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_memory_exporter = InMemorySpanExporter()
+_provider = TracerProvider(exporters=[_memory_exporter])
+
+
+def get_tracer_provider() -> TracerProvider:
+    return _provider
+
+
+def get_tracer(name: str) -> Tracer:
+    """글로벌 Provider의 Tracer"""
+    return Tracer(name, _provider)
+
+
+def get_memory_exporter() -> InMemorySpanExporter:
+    """최근 span 조회용 in-memory exporter"""
+    return _memory_exporter
+
+
+def configure_tracing(
+    enabled: bool = True,
+    sample_rate: float = 1.0,
+    buffer_size: int = 2000,
+    jsonl_path: Optional[str] = None
+) -> TracerProvider:
+    """글로벌 트레이싱 설정 (앱 시작 시 1회)
+
+    Args:
+        enabled: False이면 모든 span이 no-op
+        sample_rate: 루트 span 샘플링 비율 (0.0 ~ 1.0)
+        buffer_size: in-memory exporter 보관 span 수
+        jsonl_path: 지정 시 JSONL 파일 exporter 추가
+    """
+    global _memory_exporter
+
+    _provider.shutdown()
+    _memory_exporter = InMemorySpanExporter(max_spans=buffer_size)
+    exporters: List[SpanExporter] = [_memory_exporter]
+    if jsonl_path:
+        exporters.append(JsonLinesSpanExporter(jsonl_path))
+
+    _provider.exporters = exporters
+    _provider.enabled = enabled
+    _provider.sample_rate = sample_rate
+    return _provider
@@ -0,0 +1,281 @@
+"""Token Usage - LLM 토큰 사용량 집계
+
+LLM Adapter가 응답의 usage 메타데이터를 기록하면
+요청 단위(UsageLedger), 프로세스 단위(UsageAggregator), 메트릭으로 동시에 집계합니다.
+
+집계 기준:
+    - 요청: usage_scope()로 설정된 UsageLedger (CookingState["token_usage"]로 전달)
+    - 프롬프트: 호출 직전 렌더링된 prompt_id (current_prompt_id)
+    - 의도: 호출한 노드의 intent (usage_intent_scope)
+    - 사용자: 요청 종료 시 Service가 UsageAggregator에 반영
+
+Example:
+    >>> ledger = UsageLedger()
+    >>> with usage_scope(ledger):
+    ...     await workflow.run(state)
+    >>> ledger.total.input_tokens
+"""
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict, field
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+import threading
+
+from app.core.latency import LatencyTracker
+from app.core.metrics import counter
+from app.core.prompt_loader import current_prompt_id
+from app.core.tracing import get_current_span
+
+ANONYMOUS_USER = "anonymous"
+
+_tokens = counter(
+    "llm_tokens_total",
+    "LLM 토큰 사용량 (kind: input/output/cache_read/cache_creation)",
+    ["upstream", "prompt_id", "intent", "kind"]
+)
+_calls = counter(
+    "llm_usage_calls_total",
+    "usage 메타데이터가 기록된 LLM 호출 수",
+    ["upstream", "prompt_id", "intent"]
+)
+
+# prompt_id별 최근 출력 토큰 수 (취소로 아낀 출력 토큰 추정에 사용, 값은 초 대신 토큰 수)
+_output_tokens = LatencyTracker(window_size=200)
+
+
+@dataclass
+class TokenUsage:
+    """토큰 사용량
+
+    Attributes:
+        input_tokens: 입력 토큰 (캐시 적중분 포함)
+        output_tokens: 출력 토큰
+        cache_read_tokens: 프롬프트 캐시에서 읽은 입력 토큰
+        cache_creation_tokens: 프롬프트 캐시에 기록한 입력 토큰
+        calls: LLM 호출 수
+    """
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_creation_tokens: int = 0
+    calls: int = 0
+
+    @classmethod
+    def from_usage_metadata(cls, usage: Optional[Mapping[str, Any]]) -> "TokenUsage":
+        """LangChain usage_metadata → TokenUsage
+
+        Args:
+            usage: AIMessage.usage_metadata
+                   (input_tokens, output_tokens, input_token_details.cache_read/cache_creation)
+        """
+        if not usage:
+            return cls(calls=1)
+        details = usage.get("input_token_details") or {}
+        return cls(
+            input_tokens=usage.get("input_tokens") or 0,
+            output_tokens=usage.get("output_tokens") or 0,
+            cache_read_tokens=details.get("cache_read") or 0,
+            cache_creation_tokens=details.get("cache_creation") or 0,
+            calls=1
+        )
+
+    def add(self, other: "TokenUsage") -> None:
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cache_read_tokens += other.cache_read_tokens
+        self.cache_creation_tokens += other.cache_creation_tokens
+        self.calls += other.calls
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def cost(self, prices: Mapping[str, float]) -> float:
+        """추정 비용 (USD)
+
+        캐시 적중/기록 토큰은 input_tokens에 포함되어 있으므로
+        해당 분량만 캐시 단가로 다시 계산합니다.
+
+        Args:
+            prices: 100만 토큰당 가격 (input, output, cache_read, cache_creation)
+        """
+        uncached = self.input_tokens - self.cache_read_tokens - self.cache_creation_tokens
+        total = (
+            max(uncached, 0) * prices.get("input", 0.0)
+            + self.output_tokens * prices.get("output", 0.0)
+            + self.cache_read_tokens * prices.get("cache_read", 0.0)
+            + self.cache_creation_tokens * prices.get("cache_creation", 0.0)
+        )
+        return total / 1_000_000
+
+    def to_dict(self) -> Dict[str, int]:
+        return asdict(self)
+
+
+@dataclass
+class UsageLedger:
+    """요청 단위 토큰 사용량 장부
+
+    Attributes:
+        total: 요청 전체 사용량
+        by_prompt: prompt_id별 사용량
+        by_intent: 호출한 노드의 intent별 사용량
+        cancelled_calls: 진행 중 취소된 업스트림 호출 (method, prompt_id)
+    """
+    total: TokenUsage = field(default_factory=TokenUsage)
+    by_prompt: Dict[str, TokenUsage] = field(default_factory=dict)
+    by_intent: Dict[str, TokenUsage] = field(default_factory=dict)
+    cancelled_calls: List[Tuple[str, str]] = field(default_factory=list)
+
+    def record(self, prompt_id: str, intent: str, usage: TokenUsage) -> None:
+        self.total.add(usage)
+        self.by_prompt.setdefault(prompt_id, TokenUsage()).add(usage)
+        self.by_intent.setdefault(intent, TokenUsage()).add(usage)
+
+    def to_dict(self, prices: Optional[Mapping[str, float]] = None) -> Dict[str, Any]:
+        """응답/상태 저장용 dict
+
+        Args:
+            prices: 100만 토큰당 가격 (지정 시 estimated_cost_usd 포함)
+        """
+        result: Dict[str, Any] = {
+            **self.total.to_dict(),
+            "by_prompt": {k: v.to_dict() for k, v in self.by_prompt.items()},
+            "by_intent": {k: v.to_dict() for k, v in self.by_intent.items()},
+        }
+        if prices:
+            result["estimated_cost_usd"] = round(self.total.cost(prices), 6)
+        return result
+
+
+class UsageAggregator:
+    """프로세스 단위 사용자별 누적 사용량
+
+    프롬프트/의도별 누적은 llm_tokens_total 메트릭으로 노출하고,
+    카디널리티가 큰 사용자별 누적은 메모리에만 보관합니다.
+    사용자 수만큼 계속 늘어나지 않도록 최근 사용한 max_users명만 LRU로 보관합니다.
+    (한도 집행은 QuotaManager가 담당하므로 여기서 밀려난 누적은 관측용 값만 사라짐)
+
+    Attributes:
+        max_users: 보관할 최대 사용자 수
+    """
+
+    def __init__(self, max_users: int = 10_000):
+        self.max_users = max_users
+        self._by_user: "OrderedDict[str, TokenUsage]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, user_id: Optional[str], usage: TokenUsage) -> None:
+        key = user_id or ANONYMOUS_USER
+        with self._lock:
+            total = self._by_user.get(key)
+            if total is None:
+                total = self._by_user[key] = TokenUsage()
+            else:
+                self._by_user.move_to_end(key)
+            total.add(usage)
+            while len(self._by_user) > self.max_users:
+                self._by_user.popitem(last=False)
+
+    def get(self, user_id: Optional[str]) -> TokenUsage:
+        return self._by_user.get(user_id or ANONYMOUS_USER, TokenUsage())
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {user: usage.to_dict() for user, usage in self._by_user.items()}
+
+
+_aggregator = UsageAggregator()
+
+
+def get_usage_aggregator() -> UsageAggregator:
+    """글로벌 사용자별 사용량 집계기"""
+    return _aggregator
+
+
+def configure_usage(max_users: int = 10_000) -> UsageAggregator:
+    """글로벌 사용량 집계기 설정 (앱 시작 시 1회)"""
+    _aggregator.max_users = max_users
+    return _aggregator
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# 요청/의도 컨텍스트
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_current_ledger: ContextVar[Optional[UsageLedger]] = ContextVar("usage_ledger", default=None)
+_current_intent: ContextVar[str] = ContextVar("usage_intent", default="unknown")
+
+
+def current_usage_ledger() -> Optional[UsageLedger]:
+    """현재 요청의 사용량 장부 (없으면 None)"""
+    return _current_ledger.get()
+
+
+@contextmanager
+def usage_scope(ledger: UsageLedger) -> Iterator[UsageLedger]:
+    """블록 안의 LLM 호출 사용량을 ledger에 기록"""
+    token = _current_ledger.set(ledger)
+    try:
+        yield ledger
+    finally:
+        _current_ledger.reset(token)
+
+
+@contextmanager
+def usage_intent_scope(intent: str) -> Iterator[None]:
+    """블록 안의 LLM 호출을 intent로 분류 (노드 실행 단위)"""
+    token = _current_intent.set(intent)
+    try:
+        yield
+    finally:
+        _current_intent.reset(token)
+
+
+def record_token_usage(upstream: str, usage: TokenUsage) -> None:
+    """LLM 호출 1회의 사용량 기록 (Adapter에서 호출)
+
+    Args:
+        upstream: 업스트림 이름 (예: "anthropic")
+        usage: 호출 사용량
+    """
+    prompt_id = current_prompt_id() or "unknown"
+    intent = _current_intent.get()
+
+    _calls.labels(upstream, prompt_id, intent).inc()
+    _tokens.labels(upstream, prompt_id, intent, "input").inc(usage.input_tokens)
+    _tokens.labels(upstream, prompt_id, intent, "output").inc(usage.output_tokens)
+    if usage.cache_read_tokens:
+        _tokens.labels(upstream, prompt_id, intent, "cache_read").inc(usage.cache_read_tokens)
+    if usage.cache_creation_tokens:
+        _tokens.labels(upstream, prompt_id, intent, "cache_creation").inc(usage.cache_creation_tokens)
+
+    get_current_span().set_attributes({
+        "llm.input_tokens": usage.input_tokens,
+        "llm.output_tokens": usage.output_tokens,
+        "llm.cache_read_tokens": usage.cache_read_tokens,
+        "llm.cache_hit": usage.cache_read_tokens > 0,
+    })
+
+    _output_tokens.record(prompt_id, usage.output_tokens)
+
+    ledger = _current_ledger.get()
+    if ledger is not None:
+        ledger.record(prompt_id, intent, usage)
+
+
+def record_cancelled_call(method: str) -> None:
+    """진행 중 취소된 업스트림 호출 기록 (AdapterGuard에서 호출)
+
+    Args:
+        method: Port 메서드 이름 (예: "generate_recipe", "generate_image")
+    """
+    ledger = _current_ledger.get()
+    if ledger is not None:
+        ledger.cancelled_calls.append((method, current_prompt_id() or "unknown"))
+
+
+def typical_output_tokens(prompt_id: str) -> Optional[float]:
+    """prompt_id 호출의 최근 출력 토큰 중앙값 (p50, 샘플이 없으면 None)"""
+    return _output_tokens.percentile(prompt_id, 0.5)
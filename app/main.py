@@ -1,31 +1,219 @@
+import asyncio
 import os
-import logging
+from contextlib import asynccontextmanager
+from typing import Any, Dict
 from dotenv import load_dotenv
 
 # 환경 변수 로드 (다른 import 전에 먼저 실행)
 load_dotenv()
 
-from fastapi import FastAPI
+# 시작 시간 측정 (다른 import보다 먼저, 시작 시각 = 이 시점)
+from app.core.startup import get_startup_report
+startup = get_startup_report()
+
+from fastapi import FastAPI, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from app.cooking_assistant.api.routes import router
+from app.core.admin import router as admin_router
 from app.core.config import get_settings
+from app.core.metrics import render_prometheus, PROMETHEUS_CONTENT_TYPE
+from app.core.tracing import configure_tracing
+from app.core.profiling import configure_profiling
+from app.core.loop_monitor import EventLoopMonitor, BlockingCallDetector
+from app.core.admission import configure_admission
+from app.core.usage import configure_usage
+from app.core.health import configure_health, get_health_monitor, register_health_check, unregister_health_check, DEGRADED, DOWN, OK
+from app.core.shutdown import DrainMiddleware, get_shutdown_coordinator, register_shutdown_hook
+from app.core.structured_logging import configure_logging, RequestIdMiddleware
+from app.core.dependencies import get_injector, get_auth_service, resolve_dependencies
+from app.core.prompt_loader import PromptLoader
+from app.core.ports.llm_port import ILLMPort
+from app.core.ports.image_port import IImagePort
+from app.cooking_assistant.services.cooking_service import CookingService
+from app.core.job_queue import JobQueue
 
-# 로깅 설정
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+startup.record("imports", startup.elapsed())
 
 # 설정 로드
 settings = get_settings()
 
+configure_start = startup.elapsed()
+
+# 로깅 설정 (백그라운드 스레드 출력, request_id 포함)
+configure_logging(
+    level=settings.log_level,
+    json_format=settings.log_json,
+    use_queue=settings.log_queue,
+    sample_rates=settings.log_sample_rates
+)
+
+# 트레이싱 설정 (route → service → node → adapter span)
+configure_tracing(
+    enabled=settings.tracing_enabled,
+    sample_rate=settings.tracing_sample_rate,
+    buffer_size=settings.tracing_buffer_size,
+    jsonl_path=settings.tracing_jsonl_path
+)
+
+# 요청 프로파일러 설정 (관리자 API로 런타임 on/off)
+configure_profiling(
+    enabled=settings.profiling_enabled,
+    sample_rate=settings.profiling_sample_rate,
+    mode=settings.profiling_mode,
+    buffer_size=settings.profiling_buffer_size,
+    sampling_interval=settings.profiling_sampling_interval
+)
+
+# 심층 헬스 체크 (/ready, /api/health가 캐시된 결과를 읽음)
+configure_health(
+    interval=settings.health_check_interval,
+    fail_on_degraded=settings.ready_fail_on_degraded,
+    critical_upstreams=settings.ready_critical_upstreams
+)
+
+# 사용자별 누적 사용량 (최근 사용자만 LRU로 보관)
+configure_usage(max_users=settings.usage_max_users)
+
+# 입장 제어 (/api/cooking 동시 실행 제한 + 우선순위 대기열)
+configure_admission(
+    enabled=settings.admission_enabled,
+    max_concurrency=settings.admission_max_concurrency,
+    max_queue=settings.admission_max_queue,
+    default_service_time=settings.admission_default_service_time
+)
+
+startup.record("configure", startup.elapsed() - configure_start)
+
+
+# 라우트가 Depends(get_dependency(...))로 사용하는 최상위 타입 (시작 시 그래프 전체 생성·검증)
+ROUTE_SERVICES = (CookingService, JobQueue)
+
+
+def warmup(app: FastAPI) -> None:
+    """첫 요청 전에 싱글톤 전부 생성 (lifespan에서 요청 수신 전 1회)
+
+    DI 컨테이너, 어댑터(무거운 SDK import), 워크플로우 그래프 컴파일,
+    프롬프트 템플릿 컴파일, HTTP 클라이언트 생성을 미리 수행하고
+    구간별 소요 시간을 시작 리포트에 기록합니다.
+    생성한 서비스는 app.state.services에 보관해 요청마다 Injector를 조회하지 않습니다.
+    실패하면 예외를 그대로 전파해 앱이 시작되지 않도록 합니다 (잘못된 프롬프트, DI 바인딩 등).
+    """
+    with startup.phase("injector"):
+        injector = get_injector()
+        get_auth_service()
+
+    with startup.phase("adapters"):
+        llm = injector.get(ILLMPort)
+        image = injector.get(IImagePort)
+
+    with startup.phase("workflow"):
+        # 서비스 → 워크플로우 → 노드 → 포트 전체 생성·검증 (실패 시 DependencyResolutionError)
+        app.state.services = resolve_dependencies(injector, ROUTE_SERVICES)
+
+    with startup.phase("prompts"):
+        injector.get(PromptLoader).compile_all()
+
+    with startup.phase("clients"):
+        llm.warmup()
+        image.warmup()
+
+
+async def close_clients() -> None:
+    """어댑터의 풀링된 HTTP 클라이언트 close (종료 훅, 드레인 이후 실행)"""
+    injector = get_injector()
+    await injector.get(ILLMPort).aclose()
+    await injector.get(IImagePort).aclose()
+
+
+async def refresh_job_counts(queue: JobQueue, result: Dict[str, Any], interval: float) -> None:
+    """상태별 작업 수 주기 갱신 (SQLite 조회는 스레드에서, "jobs" 헬스 체크는 이 값만 읽음)"""
+    while True:
+        try:
+            counts: Dict[str, Any] = await asyncio.to_thread(queue.counts)
+        except Exception as e:
+            counts = {"status": DOWN, "error": f"{type(e).__name__}: {e}"}
+        result.clear()
+        result.update(counts)
+        await asyncio.sleep(interval)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 수명 주기 (워밍업, 이벤트 루프 감시 / 헬스 체크 시작/중지, 그레이스풀 종료)
+
+    워밍업은 요청을 받기 전에 루프 스레드에서 동기로 수행합니다.
+    (루프 감시는 워밍업 이후 시작하므로 시작 구간이 블로킹으로 보고되지 않음)
+    종료 시에는 드레인 → 진행 중 요청 대기(shutdown_grace_period) → 종료 훅 순서로 정리합니다.
+    """
+    monitor = None
+    detector = None
+    shutdown = get_shutdown_coordinator()
+    register_shutdown_hook("clients", close_clients)
+
+    if settings.startup_warmup:
+        warmup(app)
+    startup.mark_ready()
+
+    # 상태별 작업 수 (대기열 적체 확인, 처리는 워커 프로세스)
+    job_counts: Dict[str, Any] = {}
+    job_counts_task = asyncio.create_task(
+        refresh_job_counts(get_injector().get(JobQueue), job_counts, settings.health_check_interval),
+        name="job-counts"
+    )
+    register_health_check("jobs", lambda: dict(job_counts))
+
+    if settings.loop_monitor_enabled:
+        monitor = EventLoopMonitor(
+            interval=settings.loop_monitor_interval,
+            threshold=settings.loop_lag_threshold
+        )
+        monitor.start()
+        register_health_check("event_loop", lambda: {
+            "status": DEGRADED if monitor.lag >= monitor.threshold else OK,
+            "lag": round(monitor.lag, 4)
+        })
+
+    health = get_health_monitor()
+    health.start()
+
+    if settings.loop_blocking_detection:
+        detector = BlockingCallDetector(threshold_ms=settings.loop_slow_callback_ms)
+        detector.install()
+
+    yield
+
+    await shutdown.shutdown(settings.shutdown_grace_period)
+    app.state.services = {}
+
+    if detector is not None:
+        detector.uninstall()
+    await health.stop()
+    unregister_health_check("jobs")
+    job_counts_task.cancel()
+    await asyncio.gather(job_counts_task, return_exceptions=True)
+    if monitor is not None:
+        unregister_health_check("event_loop")
+        await monitor.stop()
+
+    # 같은 프로세스에서 앱을 다시 시작하는 경우 대비 (테스트 등)
+    shutdown.reset()
+
+
 # FastAPI 앱 생성 (설정 기반)
 app = FastAPI(
     title=settings.app_title,
     description=settings.app_description,
-    version=settings.app_version
+    version=settings.app_version,
+    lifespan=lifespan
 )
 
+# 미리 생성된 서비스 (lifespan 워밍업에서 채움, get_dependency가 사용)
+app.state.services = {}
+
+# 그레이스풀 종료 (진행 중 요청 집계, 드레인 중 새 요청 503)
+app.add_middleware(DrainMiddleware, retry_after=settings.shutdown_retry_after)
+
 # CORS 설정 (설정 기반)
 app.add_middleware(
     CORSMiddleware,
@@ -33,10 +221,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Request-ID", "Server-Timing"],
 )
 
+# 요청 ID (로그 상관관계, X-Request-ID 응답 헤더)
+app.add_middleware(RequestIdMiddleware)
+
 # API 라우터 등록
 app.include_router(router, prefix="/api", tags=["cooking"])
+app.include_router(admin_router, prefix="/api/admin", tags=["admin"])
 
 
 @app.get("/")
@@ -49,6 +242,32 @@ async def root():
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭 노출 엔드포인트 (text exposition format)"""
+    return Response(content=render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+
+@app.get("/ready", include_in_schema=False)
+async def ready():
+    """준비 상태(readiness) 엔드포인트 (로드 밸런서 / k8s readinessProbe용)
+
+    워밍업이 끝나고 심층 체크(업스트림 회로, 이벤트 루프 지연, 로그 큐 등)에
+    문제가 없을 때만 200, 아니면 503과 이유를 반환합니다.
+    (백그라운드에서 갱신된 캐시를 읽으므로 호출당 체크 비용 없음)
+    """
+    health = get_health_monitor()
+    is_ready, reasons = health.readiness()
+    return JSONResponse(
+        status_code=200 if is_ready else 503,
+        content={
+            "status": "ready" if is_ready else "not_ready",
+            "reasons": reasons,
+            "checked_at": health.snapshot["checked_at"]
+        }
+    )
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(
@@ -0,0 +1,121 @@
+"""로깅 오버헤드 벤치마크
+
+요청 1건이 남기는 로그(서비스/워크플로우/라우터/노드/어댑터, 약 15줄)를
+루프 스레드에서 호출하는 비용을 구성별로 비교합니다. 출력은 임시 파일로 보냅니다.
+
+    - before: logging.basicConfig (동기 StreamHandler, f-string)
+    - queue: QueueHandler/QueueListener + 지연 포맷팅
+    - queue+json: 위 + JsonFormatter (포맷 비용은 리스너 스레드)
+    - queue+json+sampling: 위 + 노드/워크플로우 INFO 10% 샘플링
+
+Usage:
+    python scripts/bench_logging.py
+    python scripts/bench_logging.py --requests 20000
+"""
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Tuple
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.core.structured_logging import configure_logging, shutdown_logging
+
+QUERY = "파스타 카르보나라 만드는 법 알려줘, 그리고 어울리는 와인도 추천해줘"
+
+service = logging.getLogger("app.cooking_assistant.services.cooking_service")
+workflow = logging.getLogger("app.cooking_assistant.workflow.cooking_workflow")
+router = logging.getLogger("app.cooking_assistant.workflow.edges.intent_router")
+node = logging.getLogger("app.cooking_assistant.workflow.nodes.base_node")
+adapter = logging.getLogger("app.core.adapters.llm.anthropic_adapter")
+
+
+def request_fstring() -> None:
+    """변경 전: f-string (호출 시점에 문자열 생성)"""
+    service.info(f"[Service] 쿼리 처리 시작 - user_id: {None}, query: {QUERY[:50]}...")
+    workflow.info(f"[Workflow] 시작: {QUERY[:50]}...")
+    for name in ("IntentClassifierNode", "RecipeGeneratorNode", "ImageGeneratorNode"):
+        node.info(f"[Node:{name}] 시작")
+        adapter.info("[Anthropic] 요청")
+        adapter.info(f"[Anthropic] 완료: {name}")
+        node.info(f"[Node:{name}] 완료")
+    router.info(f"[Router] primary_intent={'recipe_create'} → {'recipe_generator'}")
+    workflow.info(f"[Workflow] 완료")
+    service.info(f"[Service] DTO 변환 완료 - intent: {'recipe_create'}")
+
+
+def request_lazy() -> None:
+    """변경 후: 지연 포맷팅 (인자만 전달)"""
+    service.info("[Service] 쿼리 처리 시작 - user_id: %s, query: %s...", None, QUERY[:50])
+    workflow.info("[Workflow] 시작: %s...", QUERY[:50])
+    for name in ("IntentClassifierNode", "RecipeGeneratorNode", "ImageGeneratorNode"):
+        node.info("[Node:%s] 시작", name)
+        adapter.info("[Anthropic] 요청")
+        adapter.info("[Anthropic] 완료: %s", name)
+        node.info("[Node:%s] 완료", name)
+    router.info("[Router] primary_intent=%s → %s", "recipe_create", "recipe_generator")
+    workflow.info("[Workflow] 완료")
+    service.info("[Service] DTO 변환 완료 - intent: %s", "recipe_create")
+
+
+def measure(requests: int, emit) -> Tuple[float, float]:
+    """요청당 (호출 스레드 CPU 시간, 경과 시간) (마이크로초)
+
+    실제 서버의 루프 스레드는 대부분 I/O를 기다리므로 리스너 스레드의 포맷팅과 겹치지 않지만,
+    이 벤치마크는 쉬지 않고 로그만 남기므로 경과 시간에는 GIL 경합이 포함됩니다.
+    루프 스레드가 직접 쓰는 비용은 CPU 시간(thread_time)으로 비교하세요.
+    """
+    cpu_start, wall_start = time.thread_time(), time.perf_counter()
+    for _ in range(requests):
+        emit()
+    cpu = (time.thread_time() - cpu_start) / requests * 1e6
+    wall = (time.perf_counter() - wall_start) / requests * 1e6
+    return cpu, wall
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로깅 오버헤드 벤치마크")
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # before: basicConfig + 동기 파일 출력
+        with open(os.path.join(tmp, "before.log"), "w") as stream:
+            root = logging.getLogger()
+            root.handlers[:] = []
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                stream=stream,
+                force=True
+            )
+            results["before (sync, f-string)"] = measure(args.requests, request_fstring)
+
+        configs = {
+            "queue": dict(json_format=False),
+            "queue+json": dict(json_format=True),
+            "queue+json+sampling": dict(
+                json_format=True,
+                sample_rates={"app.cooking_assistant.workflow": 0.1, "app.core.adapters": 0.1}
+            ),
+        }
+        for label, options in configs.items():
+            with open(os.path.join(tmp, f"{label}.log"), "w") as stream:
+                configure_logging(level="INFO", stream=stream, **options)
+                results[label] = measure(args.requests, request_lazy)
+                shutdown_logging()
+
+    baseline, _ = results["before (sync, f-string)"]
+    print(f"요청당 로깅 오버헤드 ({args.requests}건)")
+    print(f"  {'':<26} {'CPU(호출 스레드)':>16} {'경과':>10}")
+    for label, (cpu, wall) in results.items():
+        print(f"  {label:<26} {cpu:10.1f} µs ({cpu / baseline:4.2f}x) {wall:8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""부하 테스트 스크립트
+
+/api/cooking에 목표 RPS로 요청을 보내고(open-loop) 지연 시간 분포와 처리량,
+의도별 오류 현황을 출력합니다. 유료 API 없이 앱 자체 처리량을 재려면
+서버를 ADAPTER_MODE=fake로 띄우거나 --in-process 옵션을 사용하세요.
+(익명 요청은 공용 사용 한도에 걸리므로 서버는 QUOTA_ENABLED=false 또는 --token 사용)
+
+Usage:
+    # 별도 서버 대상
+    ADAPTER_MODE=fake QUOTA_ENABLED=false uvicorn app.main:app --workers 1
+    python scripts/load_test.py --url http://localhost:8000 --rps 50 --duration 30
+
+    # 같은 프로세스에서 앱 실행 (ADAPTER_MODE=fake, QUOTA_ENABLED=false 자동 설정)
+    python scripts/load_test.py --in-process --rps 100 --duration 10 --fake-llm-latency 0.2
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+import httpx
+
+# 프로젝트 루트를 sys.path에 추가
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+SUCCESS_CODES = {"RECIPE_CREATED", "RECOMMENDATION_SUCCESS", "QUESTION_ANSWERED"}
+
+# 의도별 쿼리 (순서대로 반복)
+QUERIES = [
+    "김치찌개 만드는 법 알려줘",
+    "파스타 카르보나라 레시피",
+    "매운 음식 추천해줘",
+    "김치찌개 칼로리는?",
+    "김치찌개, 된장찌개 레시피 조회",
+    "불고기 만드는 법 알려주고 어울리는 메뉴도 추천해줘",
+]
+
+
+@dataclass
+class Result:
+    intent: str
+    code: str
+    status: int
+    latency: float
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(q * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+async def send(client: httpx.AsyncClient, query: str, token: Optional[str], results: List[Result]) -> None:
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    start = time.perf_counter()
+    try:
+        response = await client.post("/api/cooking", json={"query": query}, headers=headers)
+        latency = time.perf_counter() - start
+        try:
+            body = response.json()
+            intent, code = body.get("intent") or "unknown", body.get("code", "UNKNOWN")
+        except ValueError:
+            intent, code = "unknown", f"HTTP_{response.status_code}"
+        results.append(Result(intent, code, response.status_code, latency))
+    except httpx.HTTPError as e:
+        results.append(Result("unknown", type(e).__name__, 0, time.perf_counter() - start))
+
+
+async def run(client: httpx.AsyncClient, rps: float, duration: float, max_in_flight: int, token: Optional[str]):
+    """open-loop: 응답을 기다리지 않고 1/rps 간격으로 요청 발사 (max_in_flight 초과 시 건너뜀)"""
+    results: List[Result] = []
+    tasks = set()
+    skipped = 0
+    interval = 1.0 / rps
+    start = time.perf_counter()
+    sent = 0
+
+    while (now := time.perf_counter()) - start < duration:
+        target = start + sent * interval
+        if now < target:
+            await asyncio.sleep(target - now)
+        if len(tasks) >= max_in_flight:
+            skipped += 1
+        else:
+            task = asyncio.create_task(send(client, QUERIES[sent % len(QUERIES)], token, results))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        sent += 1
+
+    if tasks:
+        await asyncio.gather(*tasks)
+    return results, time.perf_counter() - start, skipped
+
+
+def report(results: List[Result], elapsed: float, skipped: int, rps: float) -> None:
+    ok = [r for r in results if r.status == 200 and r.code in SUCCESS_CODES]
+    print(f"\n목표 {rps:.1f} RPS / {elapsed:.1f}초 - 완료 {len(results)}건, 성공 {len(ok)}건, "
+          f"동시 요청 제한으로 건너뜀 {skipped}건")
+    print(f"처리량: {len(results) / elapsed:.1f} req/s (성공 {len(ok) / elapsed:.1f} req/s)\n")
+
+    by_intent: Dict[str, List[Result]] = defaultdict(list)
+    for r in results:
+        by_intent[r.intent].append(r)
+
+    print(f"{'intent':<16} {'count':>6} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'max(ms)':>9}")
+    for intent, group in sorted(by_intent.items()) + [("(all)", results)]:
+        latencies = sorted(r.latency * 1000 for r in group)
+        print(
+            f"{intent:<16} {len(group):>6} {percentile(latencies, 0.5):>9.1f} "
+            f"{percentile(latencies, 0.95):>9.1f} {percentile(latencies, 0.99):>9.1f} "
+            f"{(latencies[-1] if latencies else 0):>9.1f}"
+        )
+
+    errors = Counter((r.intent, r.code) for r in results if r.code not in SUCCESS_CODES)
+    if errors:
+        print("\n오류 (intent, code):")
+        for (intent, code), count in errors.most_common():
+            print(f"  {intent:<16} {code:<28} {count}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="/api/cooking 부하 테스트")
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--rps", type=float, default=20.0)
+    parser.add_argument("--duration", type=float, default=30.0, help="초")
+    parser.add_argument("--max-in-flight", type=int, default=1000)
+    parser.add_argument("--token", default=None, help="Bearer 토큰 (scripts/generate_token.py)")
+    parser.add_argument("--timeout", type=float, default=180.0)
+    parser.add_argument("--in-process", action="store_true", help="같은 프로세스에서 앱 실행 (fake 어댑터)")
+    parser.add_argument("--fake-llm-latency", type=float, default=None, help="--in-process 전용, 초")
+    parser.add_argument("--fake-image-latency", type=float, default=None, help="--in-process 전용, 초")
+    args = parser.parse_args()
+
+    if args.in_process:
+        os.environ["ADAPTER_MODE"] = "fake"
+        os.environ.setdefault("QUOTA_ENABLED", "false")
+        if args.fake_llm_latency is not None:
+            os.environ["FAKE_LLM_LATENCY"] = str(args.fake_llm_latency)
+        if args.fake_image_latency is not None:
+            os.environ["FAKE_IMAGE_LATENCY"] = str(args.fake_image_latency)
+        from app.main import app
+        transport = httpx.ASGITransport(app=app)
+        base_url = "http://loadtest"
+    else:
+        transport = None
+        base_url = args.url
+
+    limits = httpx.Limits(max_connections=args.max_in_flight, max_keepalive_connections=args.max_in_flight)
+    async with httpx.AsyncClient(
+        base_url=base_url, transport=transport, timeout=args.timeout, limits=limits
+    ) as client:
+        results, elapsed, skipped = await run(
+            client, args.rps, args.duration, args.max_in_flight, args.token
+        )
+
+    report(results, elapsed, skipped, args.rps)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
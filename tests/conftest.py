@@ -2,6 +2,7 @@
 
 전역 픽스처 및 설정을 정의합니다.
 """
+import gc
 import pytest
 import sys
 from pathlib import Path
@@ -11,6 +12,32 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+def pytest_collection_modifyitems(config, items):
+    """성능 테스트(perf 마커)는 -m perf로 선택했을 때만 실행"""
+    if "perf" in (config.getoption("-m") or ""):
+        return
+    skip_perf = pytest.mark.skip(reason="성능 테스트는 -m perf로 실행")
+    for item in items:
+        if "perf" in item.keywords:
+            item.add_marker(skip_perf)
+
+
+@pytest.fixture
+async def blocking_detector():
+    """이벤트 루프를 50ms 이상 막는 동기 호출이 있으면 테스트 실패
+
+    사용법:
+        async def test_node_does_not_block(blocking_detector):
+            await node(state)
+    """
+    from app.core.loop_monitor import BlockingCallDetector
+    # 앞선 테스트가 쌓은 객체의 전체 GC(큰 힙에서 ~100ms)가 측정 구간에 걸리지 않도록 미리 수행
+    gc.collect()
+    async with BlockingCallDetector(threshold_ms=50) as detector:
+        yield detector
+    detector.assert_no_blocking()
+
+
 @pytest.fixture(scope="session")
 def event_loop_policy():
     """asyncio 이벤트 루프 정책 설정"""
@@ -8,6 +8,14 @@ from unittest.mock import Mock, patch, AsyncMock
 from app.main import app
 from app.core.auth import AuthService
 from app.core.config import get_settings
+from app.core.health import get_health_monitor
+from app.core.admission import AdmissionController
+from app.cooking_assistant.models.schemas import QuestionResponse, QuestionResponseData
+from app.cooking_assistant.services.cooking_service import CookingService
+from app.core.job_queue import JobQueue
+from app.core.deadline import Deadline
+from app.cooking_assistant.api.routes import _stream_batch
+import asyncio
 import json
 
 
@@ -37,6 +45,20 @@ class TestHealthCheck:
         assert response.status_code == 200
         data = response.json()
         assert data["status"] == "healthy"
+        assert "upstreams" in data["checks"]
+
+    def test_ready_after_warmup(self, monkeypatch):
+        """lifespan 워밍업이 끝나면 /ready 200 (업스트림 상태는 다른 테스트 영향이 없도록 제외)"""
+        # Given
+        monkeypatch.setattr(get_health_monitor(), "fail_on_degraded", False)
+
+        # When: with 블록 → lifespan 실행 (워밍업 + 헬스 모니터 시작)
+        with TestClient(app) as client:
+            response = client.get("/ready")
+
+        # Then
+        assert response.status_code == 200
+        assert response.json()["status"] == "ready"
 
 
 class TestRootEndpoint:
@@ -54,6 +76,69 @@ class TestRootEndpoint:
         assert "/docs" in data["docs"]
 
 
+class TestMetricsEndpoint:
+    """Prometheus 메트릭 엔드포인트 테스트"""
+
+    def test_metrics(self, client):
+        """텍스트 포맷으로 메트릭 노출"""
+        # When
+        response = client.get("/metrics")
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE workflow_node_duration_seconds histogram" in response.text
+        assert "# TYPE upstream_call_duration_seconds histogram" in response.text
+
+
+class TestAdminEndpoint:
+    """관리자 엔드포인트 테스트"""
+
+    def test_requires_admin(self, client, auth_token):
+        """관리자가 아니면 403, 토큰이 없으면 401/403"""
+        assert client.get("/api/admin/profiling").status_code in (401, 403)
+
+        response = client.get(
+            "/api/admin/profiling",
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+        assert response.status_code == 403
+
+    def test_configure_profiling(self, client, auth_token, monkeypatch):
+        """관리자는 프로파일러 설정 변경 가능"""
+        # Given
+        monkeypatch.setattr(get_settings(), "admin_user_ids", ["test_user"])
+        headers = {"Authorization": f"Bearer {auth_token}"}
+
+        # When
+        response = client.post(
+            "/api/admin/profiling",
+            json={"enabled": False, "sample_rate": 0.5},
+            headers=headers
+        )
+
+        # Then
+        assert response.status_code == 200
+        assert response.json()["sample_rate"] == 0.5
+        assert client.get("/api/admin/profiles/missing", headers=headers).status_code == 404
+
+    def test_startup_report_after_warmup(self, auth_token, monkeypatch):
+        """lifespan 워밍업 후 시작 리포트에 구간별 소요 시간 기록"""
+        # Given
+        monkeypatch.setattr(get_settings(), "admin_user_ids", ["test_user"])
+        headers = {"Authorization": f"Bearer {auth_token}"}
+
+        # When: with 블록 → lifespan 실행 (워밍업 후 요청 수신)
+        with TestClient(app) as client:
+            response = client.get("/api/admin/startup", headers=headers)
+
+        # Then
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ready"] is True
+        assert {"imports", "adapters", "workflow", "prompts"} <= set(data["phases"])
+
+
 class TestCookingEndpoint:
     """요리 AI 엔드포인트 테스트"""
 
@@ -181,6 +266,124 @@ class TestCookingEndpoint:
         assert data["intent"] == "question"
 
 
+class TestBatchEndpoint:
+    """일괄 요청 (NDJSON) 테스트"""
+
+    def test_streams_in_completion_order_and_deduplicates(self, client):
+        """끝나는 순서대로 전송하고, 동일 쿼리는 한 번만 실행해 결과 공유"""
+        # Given: "느린 질문"만 0.2초 걸림
+        calls = []
+
+        async def process(self, query, user_id=None, deadline=None):
+            calls.append(query)
+            await asyncio.sleep(0.2 if query == "느린 질문" else 0)
+            return QuestionResponse(code="QUESTION_ANSWERED", data=QuestionResponseData(answer=query))
+
+        # When
+        with patch.object(CookingService, "process_cooking_query", process):
+            response = client.post(
+                "/api/cooking/batch",
+                json={"requests": [{"query": "느린 질문"}, {"query": "빠른 질문"}, {"query": " 빠른  질문 "}]}
+            )
+
+        # Then
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["index"] for line in lines] == [1, 2, 0]
+        assert lines[2]["response"]["data"]["answer"] == "느린 질문"
+        assert sorted(calls) == ["느린 질문", "빠른 질문"]
+
+    def test_too_many_queries(self, client):
+        """최대 개수 초과 시 422"""
+        # Given
+        size = get_settings().batch_max_size + 1
+
+        # When
+        response = client.post("/api/cooking/batch", json={"requests": [{"query": "김치찌개"}] * size})
+
+        # Then
+        assert response.status_code == 422
+
+    async def test_closing_stream_waits_for_cancelled_queries(self):
+        """스트림이 중단되면 남은 쿼리를 취소하고, 취소 처리가 끝난 뒤 반환"""
+        # Given: "느린 질문"은 취소 시 정리 작업(업스트림 취소 등)을 수행
+        cleaned_up = []
+
+        class SlowService:
+            async def process_cooking_query(self, query, user_id=None, deadline=None):
+                try:
+                    await asyncio.sleep(0 if query == "빠른 질문" else 10)
+                except asyncio.CancelledError:
+                    await asyncio.sleep(0.01)
+                    cleaned_up.append(query)
+                    raise
+                return QuestionResponse(code="QUESTION_ANSWERED", data=QuestionResponseData(answer=query))
+
+        stream = _stream_batch(
+            {"빠른 질문": [0], "느린 질문": [1]}, SlowService(), None, Deadline.after(30.0), concurrency=2
+        )
+
+        # When: 첫 줄을 받은 뒤 연결 종료
+        first = await stream.__anext__()
+        await stream.aclose()
+
+        # Then
+        assert json.loads(first)["index"] == 0
+        assert cleaned_up == ["느린 질문"]
+
+
+class TestJobsEndpoint:
+    """비동기 작업 API 테스트"""
+
+    @pytest.fixture
+    def queue(self, tmp_path, monkeypatch):
+        """임시 파일 작업 큐 (app.state.services로 주입)"""
+        queue = JobQueue(str(tmp_path / "jobs.db"))
+        monkeypatch.setattr(app.state, "services", {JobQueue: queue})
+        return queue
+
+    def test_create_and_poll(self, client, queue, auth_token):
+        """등록 시 202 + Location, 워커 처리 후 결과 조회"""
+        # When
+        created = client.post(
+            "/api/cooking/jobs",
+            json={"query": "김치찌개, 된장찌개 레시피"},
+            headers={"Authorization": f"Bearer {auth_token}"}
+        )
+
+        # Then
+        assert created.status_code == 202
+        job = created.json()
+        assert job["status"] == "queued"
+        assert created.headers["Location"] == f"/api/cooking/jobs/{job['job_id']}"
+
+        # When: 워커가 처리
+        claimed = queue.claim("worker-1")
+        queue.finish(claimed.id, "worker-1", result={
+            "status": "success", "code": "QUESTION_ANSWERED", "intent": "question", "data": {"answer": "답변"}
+        })
+        polled = client.get(created.headers["Location"], headers={"Authorization": f"Bearer {auth_token}"})
+
+        # Then
+        assert polled.status_code == 200
+        assert polled.json()["status"] == "succeeded"
+        assert polled.json()["result"]["data"]["answer"] == "답변"
+
+    def test_other_users_job_not_found(self, client, queue, auth_token):
+        """토큰으로 등록한 작업은 다른 사용자(익명 포함)에게 404"""
+        # Given
+        job = queue.enqueue({"query": "불고기"}, user_id="someone-else")
+
+        # When
+        response = client.get(f"/api/cooking/jobs/{job.id}", headers={"Authorization": f"Bearer {auth_token}"})
+        missing = client.get("/api/cooking/jobs/unknown")
+
+        # Then
+        assert response.status_code == 404
+        assert missing.status_code == 404
+
+
 class TestAuthenticationEndpoint:
     """인증 테스트"""
 
@@ -312,6 +515,24 @@ class TestErrorResponse:
         data = response.json()
         assert data["status"] == "error"
 
+    def test_overloaded(self, client, monkeypatch):
+        """입장 불가 시 업스트림 호출 없이 503 + Retry-After"""
+        # Given: 슬롯/대기열 없음
+        monkeypatch.setattr(
+            "app.cooking_assistant.api.routes.get_admission_controller",
+            lambda: AdmissionController(max_concurrency=0, max_queue=0)
+        )
+
+        # When
+        response = client.post("/api/cooking", json={"query": "김치찌개 레시피"})
+
+        # Then
+        assert response.status_code == 503
+        assert int(response.headers["Retry-After"]) >= 1
+        data = response.json()
+        assert data["code"] == "SERVER_OVERLOADED"
+        assert data["data"]["reason"] == "queue_full"
+
 
 class TestCORS:
     """CORS 테스트"""
@@ -0,0 +1 @@
+"""Performance regression tests package"""
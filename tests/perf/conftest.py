@@ -0,0 +1,198 @@
+"""성능 회귀 테스트 설정
+
+핫 패스의 1회 호출 시간을 측정해 tests/perf/baselines.json의 기준값과 비교합니다.
+기준값보다 threshold배 이상 느려지면 실패합니다.
+
+머신마다, 그리고 같은 머신에서도 실행 시점마다 속도가 다르므로 각 측정마다
+보정 작업(순수 파이썬 루프)을 함께 측정하고, 기준값을 기록할 때의 보정 작업 시간과의
+비율로 기준값을 보정해서 비교합니다. (보정 작업은 측정 전후에 실행해 같은 시점의 속도를 반영)
+
+기준값은 고정입니다. PERF_UPDATE_BASELINE=1은 기준값이 없는 새 항목만 기록하고, 기존 항목은
+이름을 지정했을 때만 갱신합니다. (갱신 사유를 커밋 메시지에 적을 것)
+
+실행:
+    pytest tests/perf -m perf --no-cov              # 기준값과 비교
+    PERF_UPDATE_BASELINE=1 pytest tests/perf -m perf --no-cov   # 새 항목만 기록 (커밋)
+    PERF_UPDATE_BASELINE=api.health,di.prebuilt pytest tests/perf -m perf --no-cov  # 지정 항목 갱신
+    PERF_THRESHOLD=3.0 pytest tests/perf -m perf --no-cov       # 허용 배율 조정
+
+Note:
+    커버리지(--cov)가 켜져 있으면 측정값이 크게 부풀려지므로 --no-cov로 실행하세요.
+"""
+import gc
+import json
+import os
+import time
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List, Set
+
+import pytest
+
+BASELINE_PATH = Path(__file__).parent / "baselines.json"
+# 공유 CI 러너의 노이즈(±30%)로는 실패하지 않고, 2배 이상의 회귀는 잡는 값
+DEFAULT_THRESHOLD = 2.0
+MIN_ROUND_SECONDS = 0.02
+
+
+def _calibration_work() -> int:
+    """보정 작업: 머신 속도 측정용 순수 파이썬 루프"""
+    total = 0
+    for i in range(20000):
+        total += i * i % 7
+    return total
+
+
+def measure_calibration(rounds: int = 5) -> float:
+    """지금 시점의 보정 작업 시간 (µs, min-of-rounds)"""
+    return min(_time_sync(_calibration_work, 1) for _ in range(rounds))
+
+
+class PerfBaselines:
+    """기준값 로드/비교/기록
+
+    항목마다 기록 당시의 보정 작업 시간을 함께 저장하므로, 한 항목을 기록해도
+    다른 항목의 보정 기준은 바뀌지 않습니다.
+
+    Attributes:
+        benchmarks: 이름 → {"us": 1회 호출 시간 (µs), "calibration_us": 기록 당시 보정 작업 시간 (µs)}
+        threshold: 허용 배율
+        record_new: 기준값이 없는 항목을 기록
+        update_names: 기준값을 다시 기록할 항목 이름
+        results: 이번 실행 측정값 (기록 대상만)
+    """
+
+    def __init__(self, path: Path, threshold: float, record_new: bool, update_names: Set[str]):
+        self.path = path
+        self.threshold = threshold
+        self.record_new = record_new
+        self.update_names = update_names
+        data = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+        self.benchmarks: Dict[str, Dict[str, float]] = data.get("benchmarks", {})
+        self.results: Dict[str, Dict[str, float]] = {}
+
+    def check(self, name: str, per_call_us: float, calibration_us: float) -> None:
+        """측정값을 기준값과 비교 (기록 대상이면 기록만)
+
+        Args:
+            name: 항목 이름
+            per_call_us: 1회 호출 시간 (µs)
+            calibration_us: 측정 전후의 보정 작업 시간 평균 (µs)
+        """
+        baseline = self.benchmarks.get(name)
+        if name in self.update_names or (baseline is None and self.record_new):
+            self.results[name] = {"us": round(per_call_us, 2), "calibration_us": round(calibration_us, 2)}
+            return
+        if baseline is None:
+            return
+
+        speed_ratio = calibration_us / baseline["calibration_us"]
+        allowed = baseline["us"] * speed_ratio * self.threshold
+        if per_call_us > allowed:
+            pytest.fail(
+                f"[perf] {name} 성능 저하: {per_call_us:.1f}µs "
+                f"(기준 {baseline['us']:.1f}µs × 속도 보정 {speed_ratio:.2f} × 허용 {self.threshold:.2f} "
+                f"= {allowed:.1f}µs)",
+                pytrace=False
+            )
+
+    def save(self) -> None:
+        """기록 대상 측정값만 기준값 파일에 반영"""
+        benchmarks = dict(self.benchmarks)
+        benchmarks.update(self.results)
+        data = {"benchmarks": dict(sorted(benchmarks.items()))}
+        self.path.write_text(json.dumps(data, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+
+
+def _time_sync(fn: Callable[[], object], number: int) -> float:
+    """fn을 number번 호출한 1회 평균 시간 (µs)"""
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number * 1e6
+
+
+async def _time_async(fn: Callable[[], Awaitable[object]], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        await fn()
+    return (time.perf_counter() - start) / number * 1e6
+
+
+class Benchmark:
+    """측정기 (min-of-rounds)
+
+    한 라운드가 MIN_ROUND_SECONDS 이상이 되도록 반복 횟수를 정하고,
+    rounds번 측정한 값 중 최솟값을 1회 호출 시간으로 사용합니다. (노이즈에 가장 덜 민감)
+    측정 중에는 GC를 끄고, 측정 전후의 보정 작업 시간 평균을 함께 기록합니다.
+    """
+
+    def __init__(self, baselines: PerfBaselines):
+        self.baselines = baselines
+
+    def __call__(self, name: str, fn: Callable[[], object], rounds: int = 7) -> float:
+        fn()  # warmup (import/캐시 등 1회성 비용 제외)
+        number = max(1, int(MIN_ROUND_SECONDS * 1e6 / max(_time_sync(fn, 1), 0.01)))
+        before = measure_calibration()
+        samples = self._measure(lambda: _time_sync(fn, number), rounds)
+        calibration_us = (before + measure_calibration()) / 2
+        return self._report(name, samples, calibration_us)
+
+    async def run_async(self, name: str, fn: Callable[[], Awaitable[object]], rounds: int = 7) -> float:
+        await fn()
+        number = max(1, int(MIN_ROUND_SECONDS * 1e6 / max(await _time_async(fn, 1), 0.01)))
+        before = measure_calibration()
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            samples = [await _time_async(fn, number) for _ in range(rounds)]
+        finally:
+            if gc_enabled:
+                gc.enable()
+        calibration_us = (before + measure_calibration()) / 2
+        return self._report(name, samples, calibration_us)
+
+    def _measure(self, measure_round: Callable[[], float], rounds: int) -> List[float]:
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return [measure_round() for _ in range(rounds)]
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def _report(self, name: str, samples: List[float], calibration_us: float) -> float:
+        best = min(samples)
+        print(
+            f"\n[perf] {name}: {best:.1f}µs (median {sorted(samples)[len(samples) // 2]:.1f}µs, "
+            f"보정 {calibration_us:.1f}µs)"
+        )
+        self.baselines.check(name, best, calibration_us)
+        return best
+
+
+@pytest.fixture(scope="session")
+def perf_baselines():
+    update = os.environ.get("PERF_UPDATE_BASELINE", "")
+    baselines = PerfBaselines(
+        BASELINE_PATH,
+        threshold=float(os.environ.get("PERF_THRESHOLD", DEFAULT_THRESHOLD)),
+        record_new=update == "1",
+        update_names={name.strip() for name in update.split(",") if name.strip() and name.strip() != "1"}
+    )
+    yield baselines
+    if baselines.results:
+        baselines.save()
+
+
+@pytest.fixture
+def benchmark(perf_baselines):
+    """핫 패스 측정 픽스처
+
+    사용법:
+        def test_render(benchmark):
+            benchmark("prompt_loader.render", lambda: loader.render(...))
+
+        async def test_graph(benchmark):
+            await benchmark.run_async("workflow.run", lambda: workflow.run(state))
+    """
+    return Benchmark(perf_baselines)
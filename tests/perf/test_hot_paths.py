@@ -0,0 +1,126 @@
+"""핫 패스 마이크로 벤치마크 (프롬프트 렌더링, JSON 정제, DTO 변환, 엔티티 검증, 인증)"""
+import random
+import pytest
+from app.core.auth import AuthService
+from app.core.config import Settings
+from app.core.prompt_loader import PromptLoader
+from app.core.adapters.llm.anthropic_adapter import AnthropicLLMAdapter
+from app.core.adapters.llm.fake_adapter import _recipe
+from app.cooking_assistant.entities.recipe import Recipe
+from app.cooking_assistant.entities.recommendation import Recommendation, DishRecommendation
+from app.cooking_assistant.services.cooking_service import CookingService
+from app.cooking_assistant.workflow.states.cooking_state import create_initial_state
+import json
+
+pytestmark = pytest.mark.perf
+
+DISHES = ["김치찌개", "된장찌개", "불고기"]
+
+
+@pytest.fixture(scope="module")
+def loader():
+    return PromptLoader(prompts_dir="app/cooking_assistant/prompts")
+
+
+@pytest.fixture(scope="module")
+def settings():
+    return Settings(anthropic_api_key="x", replicate_api_token="x", secret_key="s")
+
+
+class TestPromptRendering:
+    """PromptLoader.render"""
+
+    def test_render_classify_intent(self, benchmark, loader):
+        benchmark(
+            "prompt_loader.render.classify_intent",
+            lambda: loader.render("cooking.classify_intent", query="김치찌개 만드는 법 알려줘")
+        )
+
+    def test_render_generate_recipe_multiple(self, benchmark, loader):
+        benchmark(
+            "prompt_loader.render.generate_recipe_multiple",
+            lambda: loader.render(
+                "cooking.generate_recipe_multiple",
+                query="김치찌개, 된장찌개, 불고기 레시피",
+                dishes=DISHES,
+                ingredients=["돼지고기", "두부"],
+                constraints={"time": "30분"},
+                dietary=[],
+                count=len(DISHES)
+            )
+        )
+
+
+class TestJsonExtraction:
+    """AnthropicLLMAdapter._extract_json (+ json.loads)"""
+
+    def test_extract_json_code_block(self, benchmark):
+        # ChatAnthropic 생성 없이 순수 함수 부분만 측정
+        adapter = object.__new__(AnthropicLLMAdapter)
+        content = "```json\n" + json.dumps(_recipe("김치찌개"), ensure_ascii=False) + "\n```"
+        benchmark("anthropic.extract_json", lambda: json.loads(adapter._extract_json(content)))
+
+
+class TestEntities:
+    """엔티티 생성/검증"""
+
+    def test_recipe_construct_and_validate(self, benchmark):
+        raw = [_recipe(d) for d in DISHES]
+
+        def build():
+            for data in raw:
+                Recipe(**data).validate()
+
+        benchmark("entities.recipe_x3", build)
+
+    def test_recommendation_construct(self, benchmark):
+        raw = [{"name": d, "description": f"{d} 설명", "reason": "추천 이유"} for d in DISHES * 2]
+        benchmark(
+            "entities.recommendation_x6",
+            lambda: Recommendation(recommendations=[DishRecommendation(**r) for r in raw]).get_dish_names()
+        )
+
+
+class TestDtoConversion:
+    """CookingService._to_dto"""
+
+    def test_to_dto_multiple_recipes(self, benchmark, settings):
+        # Given: 복수 레시피 + 이미지 + 부가 의도 처리 완료 상태
+        service = CookingService(workflow=None, settings=settings, quota=None)
+        state = create_initial_state("김치찌개, 된장찌개, 불고기 레시피")
+        state.update({
+            "primary_intent": "recipe_create",
+            "entities": {"dishes": DISHES, "count": len(DISHES)},
+            "confidence": 0.9,
+            "recipes": [Recipe(**_recipe(d)) for d in DISHES],
+            "image_url": "https://images.fake.local/a.webp",
+            "token_usage": {"total": {"input_tokens": 1200, "output_tokens": 800}},
+        })
+
+        benchmark("cooking_service.to_dto.recipes_x3", lambda: service._to_dto(state))
+
+
+class TestAuth:
+    """AuthService.verify_token (모바일 앱처럼 사용자별 토큰을 24시간 재사용하는 패턴)"""
+
+    USERS = 200
+    REQUESTS = 1000
+
+    @pytest.fixture(scope="class")
+    def requests(self):
+        """200명 토큰, 소수 활성 사용자가 대부분의 요청을 보내는 분포 (Zipf), 요청 1000건"""
+        issuer = AuthService(secret_key="s")
+        tokens = [issuer.create_access_token(user_id=f"user{i}") for i in range(self.USERS)]
+        weights = [1 / (rank + 1) for rank in range(self.USERS)]
+        return random.Random(7).choices(tokens, weights=weights, k=self.REQUESTS)
+
+    @pytest.mark.parametrize("cache_size", [0, 1024], ids=["uncached", "cached"])
+    def test_verify_token_reuse(self, benchmark, requests, cache_size):
+        service = AuthService(secret_key="s", cache_size=cache_size)
+
+        def verify_all():
+            for token in requests:
+                service.verify_token(token)
+
+        name = "cached" if cache_size else "uncached"
+        benchmark(f"auth.verify_token.{name}_x{self.REQUESTS}", verify_all, rounds=5)
@@ -0,0 +1,111 @@
+"""요청 경로 벤치마크 (지연 0 Fake 어댑터로 그래프/FastAPI 오버헤드만 측정)"""
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from injector import Injector
+from app.core.config import Settings
+from app.core import dependencies
+from app.core.decorators import get_dependency
+from app.cooking_assistant.services.cooking_service import CookingService
+from app.cooking_assistant.module import CookingModule
+from app.cooking_assistant.workflow.cooking_workflow import CookingWorkflow
+from app.cooking_assistant.workflow.states.cooking_state import create_initial_state
+
+pytestmark = pytest.mark.perf
+
+QUERIES = {
+    "recipe_create": "김치찌개 만드는 법 알려줘",
+    "recipe_multi": "김치찌개, 된장찌개 레시피",
+    "recommend": "매운 음식 추천해줘",
+    "question": "김치찌개 칼로리는?",
+}
+
+
+@pytest.fixture(scope="module")
+def fake_injector():
+    """adapter_mode=fake, 지연/한도 없음"""
+    settings = Settings(
+        anthropic_api_key="x",
+        replicate_api_token="x",
+        secret_key="s",
+        adapter_mode="fake",
+        fake_llm_latency=0.0,
+        fake_image_latency=0.0,
+        quota_enabled=False
+    )
+    return Injector([CookingModule(), lambda binder: binder.bind(Settings, to=settings)])
+
+
+class TestWorkflow:
+    """CookingWorkflow.run (노드 + 라우팅 + LangGraph 오버헤드)"""
+
+    @pytest.mark.parametrize("intent", list(QUERIES))
+    async def test_workflow_run(self, benchmark, fake_injector, intent):
+        workflow = fake_injector.get(CookingWorkflow)
+
+        async def run():
+            result = await workflow.run(create_initial_state(QUERIES[intent]))
+            assert not result["error"]
+
+        await benchmark.run_async(f"workflow.run.{intent}", run, rounds=5)
+
+
+class TestApi:
+    """FastAPI 요청 1건 (미들웨어 + 인증 + 서비스 + 직렬화)"""
+
+    @pytest.fixture
+    async def client(self, fake_injector, monkeypatch):
+        from app.main import app
+        monkeypatch.setattr(dependencies, "_injector", fake_injector)
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://perf") as client:
+            yield client
+
+    async def test_health(self, benchmark, client):
+        """프레임워크 기본 오버헤드 (비교 기준)"""
+        await benchmark.run_async("api.health", lambda: client.get("/api/health"))
+
+    async def test_cooking_recipe(self, benchmark, client):
+        async def post():
+            response = await client.post("/api/cooking", json={"query": QUERIES["recipe_create"]})
+            assert response.json()["code"] == "RECIPE_CREATED"
+
+        await benchmark.run_async("api.cooking.recipe_create", post, rounds=5)
+
+
+class TestDependencyInjection:
+    """요청당 DI 오버헤드 (의존성 없음 / 미리 생성된 인스턴스 / 이전 방식 제너레이터 + Injector 조회)"""
+
+    @pytest.fixture
+    async def client(self, fake_injector, monkeypatch):
+        monkeypatch.setattr(dependencies, "_injector", fake_injector)
+        app = FastAPI()
+        app.state.services = dependencies.resolve_dependencies(fake_injector, [CookingService])
+
+        def generator_dependency():
+            # 이전 get_dependency: 동기 제너레이터 (요청마다 스레드풀 + Injector 조회)
+            yield dependencies.get_injector().get(CookingService)
+
+        @app.get("/none")
+        async def no_dependency():
+            return {}
+
+        @app.get("/prebuilt")
+        async def prebuilt(service: CookingService = Depends(get_dependency(CookingService))):
+            return {}
+
+        @app.get("/generator")
+        async def generator(service: CookingService = Depends(generator_dependency)):
+            return {}
+
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://perf") as client:
+            yield client
+
+    async def test_per_request_overhead(self, benchmark, client):
+        # When
+        base = await benchmark.run_async("di.no_dependency", lambda: client.get("/none"))
+        prebuilt = await benchmark.run_async("di.prebuilt", lambda: client.get("/prebuilt"))
+        generator = await benchmark.run_async("di.generator", lambda: client.get("/generator"))
+
+        # Then
+        print(f"[perf] DI 오버헤드: 미리 생성 {prebuilt - base:.1f}µs, 제너레이터 {generator - base:.1f}µs")
+        assert prebuilt < generator
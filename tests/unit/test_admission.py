@@ -0,0 +1,146 @@
+"""입장 제어 / 부하 차단 단위 테스트"""
+import asyncio
+import pytest
+from app.core.admission import AdmissionController, AdmissionRejectedError
+from app.core.deadline import Deadline
+from app.cooking_assistant.api.admission import admission_priority, estimate_cost
+
+
+async def _occupy(controller: AdmissionController, n: int) -> None:
+    """슬롯 n개 점유"""
+    for _ in range(n):
+        await controller.acquire(priority=0)
+
+
+class TestAdmissionController:
+    """우선순위 대기열 / 조기 거절 테스트"""
+
+    async def test_higher_priority_admitted_first(self):
+        """슬롯이 비면 도착 순서와 무관하게 우선순위가 높은 대기자부터 입장 (같으면 FIFO)"""
+        # Given: 슬롯 1개 점유
+        controller = AdmissionController(max_concurrency=1, max_queue=10)
+        await _occupy(controller, 1)
+        order = []
+
+        async def request(name, priority):
+            await controller.acquire(priority)
+            order.append(name)
+            controller.release()
+
+        tasks = [
+            asyncio.create_task(request("anonymous-multi", 4)),
+            asyncio.create_task(request("user-question-1", 0)),
+            asyncio.create_task(request("user-recipe", 1)),
+            asyncio.create_task(request("user-question-2", 0)),
+        ]
+        await asyncio.sleep(0)
+
+        # When
+        controller.release()
+        await asyncio.gather(*tasks)
+
+        # Then
+        assert order == ["user-question-1", "user-question-2", "user-recipe", "anonymous-multi"]
+        assert controller.in_flight == 0
+        assert controller.queued == 0
+
+    async def test_full_queue_sheds_lowest_priority(self):
+        """대기열이 가득 차면 더 낮은 우선순위 대기자를 밀어내고, 아니면 새 요청 거절"""
+        # Given
+        controller = AdmissionController(max_concurrency=1, max_queue=1)
+        await _occupy(controller, 1)
+        anonymous = asyncio.create_task(controller.acquire(priority=4))
+        await asyncio.sleep(0)
+
+        # When: 더 높은 우선순위가 도착
+        authenticated = asyncio.create_task(controller.acquire(priority=0))
+        await asyncio.sleep(0)
+
+        # Then
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            await anonymous
+        assert exc_info.value.reason == "shed"
+
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            await controller.acquire(priority=4)
+        assert exc_info.value.reason == "queue_full"
+
+        controller.release()
+        await authenticated
+        assert controller.in_flight == 1
+
+    async def test_rejects_when_deadline_cannot_be_met(self):
+        """예상 대기 + 처리 시간이 남은 기한을 넘으면 대기 없이 즉시 거절"""
+        # Given: 최근 처리 시간 10초, 슬롯 모두 사용 중
+        controller = AdmissionController(max_concurrency=2, max_queue=10)
+        controller._service_times.record("standard", 10.0)
+        await _occupy(controller, 2)
+
+        # When
+        with pytest.raises(AdmissionRejectedError) as exc_info:
+            await controller.acquire(priority=1, cost="standard", deadline=Deadline.after(12.0))
+
+        # Then
+        assert exc_info.value.reason == "deadline"
+        assert exc_info.value.retry_after >= 1
+        assert controller.queued == 0
+
+    async def test_idle_slot_ignores_deadline(self):
+        """빈 슬롯이 있으면 기한과 무관하게 즉시 입장 (부분 응답은 Deadline이 처리)"""
+        controller = AdmissionController(max_concurrency=1, default_service_time=60.0)
+
+        waited = await controller.acquire(priority=4, deadline=Deadline.after(1.0))
+
+        assert waited == 0.0
+        assert controller.in_flight == 1
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        """대기 중 취소(클라이언트 연결 종료)되면 대기열에서 제거되고 슬롯은 다음 대기자에게"""
+        # Given
+        controller = AdmissionController(max_concurrency=1, max_queue=10)
+        await _occupy(controller, 1)
+        cancelled = asyncio.create_task(controller.acquire(priority=0))
+        waiting = asyncio.create_task(controller.acquire(priority=1))
+        await asyncio.sleep(0)
+
+        # When
+        cancelled.cancel()
+        await asyncio.sleep(0)
+        controller.release()
+        await waiting
+
+        # Then
+        assert cancelled.cancelled()
+        assert controller.in_flight == 1
+        assert controller.queued == 0
+
+    async def test_disabled_admits_everything(self):
+        """비활성화 시 제한 없이 입장"""
+        controller = AdmissionController(max_concurrency=1, max_queue=0, enabled=False)
+
+        for _ in range(5):
+            await controller.acquire(priority=4)
+
+        assert controller.in_flight == 0
+
+
+class TestAdmissionPriority:
+    """쿼리 비용 추정 / 우선순위 테스트"""
+
+    @pytest.mark.parametrize("query, cost", [
+        ("김치찌개 칼로리는?", "cheap"),
+        ("매운 음식 추천해줘", "standard"),
+        ("파스타 카르보나라 만드는 법", "standard"),
+        ("김치찌개, 된장찌개 레시피 알려줘", "expensive"),
+        ("불고기랑 잡채 만드는 법", "expensive"),
+    ])
+    def test_estimate_cost(self, query, cost):
+        assert estimate_cost(query) == cost
+
+    def test_authenticated_cheap_first(self):
+        """인증 사용자의 질문이 가장 먼저, 익명 사용자의 복수 레시피가 가장 나중"""
+        best, _ = admission_priority("김치찌개 칼로리는?", "user1")
+        anonymous_question, _ = admission_priority("김치찌개 칼로리는?", None)
+        worst, _ = admission_priority("김치찌개, 된장찌개 레시피", None)
+
+        assert best < anonymous_question < worst
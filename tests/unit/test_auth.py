@@ -0,0 +1,109 @@
+"""검증된 JWT 캐시 / JWT 백엔드 단위 테스트"""
+import sys
+import pytest
+from fastapi import HTTPException
+from app.core import auth
+from app.core.auth import AuthService
+
+
+def _counting(service: AuthService) -> list:
+    """디코딩 호출 기록"""
+    calls = []
+    decode = service._decode
+
+    def counted(*args):
+        calls.append(args[0])
+        return decode(*args)
+    service._decode = counted
+    return calls
+
+
+class TestVerifiedTokenCache:
+    """토큰 해시 LRU 캐시 테스트"""
+
+    def test_reused_token_skips_decode(self):
+        """같은 토큰 재사용 시 디코딩 1회"""
+        # Given
+        service = AuthService(secret_key="s")
+        token = service.create_access_token(user_id="user1")
+        calls = _counting(service)
+
+        # When
+        results = [service.verify_token(token) for _ in range(5)]
+
+        # Then
+        assert results == ["user1"] * 5
+        assert len(calls) == 1
+        assert token not in str(service.token_cache)  # 원문 토큰은 보관하지 않음
+
+    def test_expired_entry_is_verified_again(self, monkeypatch):
+        """캐시 항목이 exp를 지나면 다시 디코딩"""
+        # Given
+        service = AuthService(secret_key="s")
+        token = service.create_access_token(user_id="user1")
+        calls = _counting(service)
+        service.verify_token(token)
+        [(_, expires_at)] = service.token_cache.values()
+
+        # When: 캐시 기준 시각만 exp 이후로 이동
+        monkeypatch.setattr(auth.time, "time", lambda: expires_at + 1)
+        service.verify_token(token)
+
+        # Then
+        assert len(calls) == 2
+
+    def test_bounded_lru(self):
+        """최대 크기를 넘으면 가장 오래 안 쓴 토큰부터 제거"""
+        # Given
+        service = AuthService(secret_key="s", cache_size=2)
+        tokens = [service.create_access_token(user_id=f"user{i}") for i in range(3)]
+        calls = _counting(service)
+
+        # When
+        service.verify_token(tokens[0])
+        service.verify_token(tokens[1])
+        service.verify_token(tokens[0])  # user0 최근 사용
+        service.verify_token(tokens[2])  # user1 제거
+        service.verify_token(tokens[0])
+
+        # Then
+        assert len(service.token_cache) == 2
+        assert calls == [tokens[0], tokens[1], tokens[2]]
+
+    def test_invalid_token_not_cached(self):
+        """검증 실패한 토큰은 캐시하지 않고 매번 401"""
+        service = AuthService(secret_key="s")
+        forged = AuthService(secret_key="other").create_access_token(user_id="user1")
+
+        for _ in range(2):
+            with pytest.raises(HTTPException) as exc_info:
+                service.verify_token(forged)
+            assert exc_info.value.status_code == 401
+        assert not service.token_cache
+
+    def test_cache_disabled(self):
+        """cache_size=0이면 매번 디코딩"""
+        service = AuthService(secret_key="s", cache_size=0)
+        token = service.create_access_token(user_id="user1")
+        calls = _counting(service)
+
+        service.verify_token(token)
+        service.verify_token(token)
+
+        assert len(calls) == 2
+        assert not service.token_cache
+
+
+class TestJwtBackend:
+    """JWT 디코더 선택 테스트"""
+
+    def test_pyjwt_falls_back_to_jose_when_missing(self, monkeypatch):
+        """PyJWT가 없으면 python-jose로 검증"""
+        # Given
+        monkeypatch.setitem(sys.modules, "jwt", None)  # import 시 ImportError
+
+        # When
+        service = AuthService(secret_key="s", backend="pyjwt")
+
+        # Then
+        assert service.verify_token(service.create_access_token(user_id="user1")) == "user1"
@@ -0,0 +1,157 @@
+"""카세트 기록/재생 어댑터 단위 테스트"""
+import pytest
+from app.core.prompt_loader import PromptLoader
+from app.core.adapters.cassette import (
+    Cassette,
+    CassetteEntry,
+    CassetteWriter,
+    CassetteReplayer,
+    CassetteMissError,
+    ReplayedUpstreamError,
+)
+from app.core.adapters.llm.cassette_adapter import RecordingLLMAdapter, ReplayLLMAdapter
+from app.core.adapters.image.cassette_adapter import RecordingImageAdapter, ReplayImageAdapter
+
+
+class StubLLM:
+    """호출 횟수를 세는 LLM 스텁"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def classify_intent(self, prompt):
+        self.calls += 1
+        return {"primary_intent": "recipe_create", "call": self.calls}
+
+    async def answer_question(self, prompt):
+        raise TimeoutError("upstream timeout")
+
+
+class StubImage:
+    async def generate_image(self, prompt):
+        return None
+
+
+@pytest.fixture
+def loader():
+    return PromptLoader(prompts_dir="app/cooking_assistant/prompts")
+
+
+async def _record(path, loader):
+    """classify_intent 2건 + answer_question 실패 1건 + 이미지 1건 기록"""
+    writer = CassetteWriter(str(path))
+    llm = RecordingLLMAdapter(StubLLM(), writer)
+    image = RecordingImageAdapter(StubImage(), writer)
+
+    await llm.classify_intent(loader.render("cooking.classify_intent", query="김치찌개 레시피"))
+    await llm.classify_intent(loader.render("cooking.classify_intent", query="김치찌개 레시피"))
+    with pytest.raises(TimeoutError):
+        await llm.answer_question(loader.render("cooking.answer_question", query="칼로리는?"))
+    await image.generate_image(loader.render("cooking.image_prompt", dish_name="김치찌개"))
+    writer.close()
+
+
+class TestRecord:
+    """기록 테스트"""
+
+    async def test_entries_have_prompt_id_and_hash(self, tmp_path, loader):
+        """prompt_id / 해시 / 오류 / None 응답까지 기록"""
+        # Given
+        path = tmp_path / "traffic.jsonl.gz"
+
+        # When
+        await _record(path, loader)
+        cassette = Cassette.load(str(path))
+
+        # Then
+        assert [e.method for e in cassette.entries] == [
+            "classify_intent", "classify_intent", "answer_question", "generate_image"
+        ]
+        first = cassette.entries[0]
+        assert first.prompt_id == "cooking.classify_intent"
+        assert first.prompt_hash == cassette.entries[1].prompt_hash
+        assert cassette.entries[2].error.startswith("TimeoutError")
+        assert cassette.entries[3].kind == "image" and cassette.entries[3].response is None
+
+    async def test_append_mode_keeps_previous_entries(self, tmp_path, loader):
+        """같은 파일에 다시 기록하면 이어 붙임"""
+        path = tmp_path / "traffic.jsonl.gz"
+        await _record(path, loader)
+        await _record(path, loader)
+        assert len(Cassette.load(str(path)).entries) == 8
+
+    async def test_close_flushes_queue_and_stops_writer_thread(self, tmp_path):
+        """기록은 백그라운드 스레드가 담당, close는 남은 기록을 쓰고 스레드 종료"""
+        # Given
+        path = tmp_path / "traffic.jsonl.gz"
+        writer = CassetteWriter(str(path), flush_every=1000)
+        for i in range(3):
+            writer.write(CassetteEntry(kind="llm", method="classify_intent", prompt_id=None,
+                                       prompt_hash=str(i), latency=0.1))
+        assert writer._thread.is_alive()
+
+        # When
+        writer.close()
+        writer.write(CassetteEntry(kind="llm", method="classify_intent", prompt_id=None,
+                                   prompt_hash="late", latency=0.1))
+
+        # Then
+        assert not writer._thread.is_alive()
+        assert [e.prompt_hash for e in Cassette.load(str(path)).entries] == ["0", "1", "2"]
+        assert writer.count == 3
+
+
+class TestReplay:
+    """재생 테스트"""
+
+    async def test_replays_in_recorded_order(self, tmp_path, loader):
+        """같은 프롬프트의 기록은 순서대로 반환"""
+        # Given
+        path = tmp_path / "traffic.jsonl.gz"
+        await _record(path, loader)
+        llm = ReplayLLMAdapter(CassetteReplayer(Cassette.load(str(path)), latency_scale=0))
+        prompt = loader.render("cooking.classify_intent", query="김치찌개 레시피")
+
+        # When
+        first = await llm.classify_intent(prompt)
+        second = await llm.classify_intent(prompt)
+
+        # Then
+        assert (first["call"], second["call"]) == (1, 2)
+
+    async def test_fallback_to_prompt_id(self, tmp_path, loader):
+        """해시가 다르면 같은 prompt_id 기록으로 대체, 비활성화 시 CassetteMissError"""
+        # Given
+        path = tmp_path / "traffic.jsonl.gz"
+        await _record(path, loader)
+        other = loader.render("cooking.classify_intent", query="된장찌개 레시피")
+
+        # When
+        result = await ReplayLLMAdapter(
+            CassetteReplayer(Cassette.load(str(path)), latency_scale=0)
+        ).classify_intent(other)
+
+        # Then
+        assert result["primary_intent"] == "recipe_create"
+        strict = ReplayLLMAdapter(
+            CassetteReplayer(Cassette.load(str(path), fallback_to_prompt_id=False), latency_scale=0)
+        )
+        with pytest.raises(CassetteMissError):
+            await strict.classify_intent(loader.render("cooking.classify_intent", query="된장찌개 레시피"))
+
+    async def test_recorded_error_and_none_image(self, tmp_path, loader):
+        """기록 당시 실패는 ReplayedUpstreamError, 이미지 None은 그대로"""
+        # Given
+        path = tmp_path / "traffic.jsonl.gz"
+        await _record(path, loader)
+        replayer = CassetteReplayer(Cassette.load(str(path)), latency_scale=0)
+
+        # Then
+        with pytest.raises(ReplayedUpstreamError):
+            await ReplayLLMAdapter(replayer).answer_question(
+                loader.render("cooking.answer_question", query="칼로리는?")
+            )
+        image = await ReplayImageAdapter(replayer).generate_image(
+            loader.render("cooking.image_prompt", dish_name="김치찌개")
+        )
+        assert image is None
@@ -0,0 +1,146 @@
+"""CircuitBreaker / Guarded Adapter 단위 테스트
+
+업스트림 장애 시 빠른 실패 및 half-open 프로브 동작을 검증합니다.
+"""
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from app.core.circuit_breaker import CircuitBreaker, CircuitOpenError, CircuitState
+from app.core.adapters.llm.guarded_adapter import GuardedLLMAdapter
+from app.core.adapters.image.guarded_adapter import GuardedImageAdapter
+from app.core.config import Settings
+
+
+@pytest.fixture
+def breaker():
+    """테스트용 CircuitBreaker (작은 윈도우)"""
+    return CircuitBreaker(
+        "test-upstream",
+        failure_rate_threshold=0.5,
+        slow_call_threshold=1.0,
+        slow_call_rate_threshold=0.5,
+        window_size=4,
+        minimum_calls=4,
+        open_duration=10.0
+    )
+
+
+@pytest.fixture
+def settings():
+    """회로가 빨리 열리도록 설정한 Settings"""
+    return Settings(
+        anthropic_api_key="test",
+        replicate_api_token="test",
+        secret_key="test",
+        circuit_minimum_calls=2,
+        circuit_window_size=2,
+        circuit_open_duration=60.0
+    )
+
+
+class TestCircuitBreakerTransitions:
+    """상태 전이 테스트"""
+
+    def test_stays_closed_below_minimum_calls(self, breaker):
+        """최소 호출 수 전에는 실패해도 닫힌 상태 유지"""
+        # When
+        for _ in range(3):
+            breaker.record_failure(0.1)
+
+        # Then
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_opens_on_failure_rate(self, breaker):
+        """실패율 임계치 초과 시 OPEN"""
+        # When
+        breaker.record_success(0.1)
+        breaker.record_success(0.1)
+        breaker.record_failure(0.1)
+        breaker.record_failure(0.1)
+
+        # Then
+        assert breaker.state == CircuitState.OPEN
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_opens_on_slow_call_rate(self, breaker):
+        """성공하더라도 느린 호출 비율이 높으면 OPEN"""
+        # When
+        for _ in range(4):
+            breaker.record_success(2.0)
+
+        # Then
+        assert breaker.state == CircuitState.OPEN
+
+    def test_half_open_probe_success_closes(self, breaker):
+        """OPEN 유지 시간 경과 후 프로브 성공 시 CLOSED"""
+        # Given
+        for _ in range(4):
+            breaker.record_failure(0.1)
+
+        # When
+        with patch("app.core.circuit_breaker.time.monotonic", return_value=1e12):
+            assert breaker.state == CircuitState.HALF_OPEN
+            breaker.before_call()
+
+            # 프로브는 1개만 허용
+            with pytest.raises(CircuitOpenError):
+                breaker.before_call()
+
+            breaker.record_success(0.1)
+
+        # Then
+        assert breaker.state == CircuitState.CLOSED
+
+    def test_half_open_probe_failure_reopens(self, breaker):
+        """프로브 실패 시 다시 OPEN"""
+        # Given
+        for _ in range(4):
+            breaker.record_failure(0.1)
+
+        # When
+        with patch("app.core.circuit_breaker.time.monotonic", return_value=1e12):
+            breaker.before_call()
+            breaker.record_failure(0.1)
+
+            # Then
+            assert breaker.state == CircuitState.OPEN
+
+
+class TestGuardedAdapters:
+    """Guarded Adapter 빠른 실패 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_llm_fast_fails_when_open(self, settings):
+        """LLM 회로가 열리면 내부 어댑터를 호출하지 않음"""
+        # Given
+        inner = Mock()
+        inner.classify_intent = AsyncMock(side_effect=RuntimeError("upstream down"))
+        adapter = GuardedLLMAdapter(inner, settings, upstream="test-llm-fast-fail")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                await adapter.classify_intent("prompt")
+
+        # When / Then
+        with pytest.raises(CircuitOpenError):
+            await adapter.classify_intent("prompt")
+        assert inner.classify_intent.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_image_returns_none_when_open(self, settings):
+        """이미지 회로가 열리면 None 반환 (우아한 성능 저하)"""
+        # Given
+        inner = Mock()
+        inner.generate_image = AsyncMock(return_value=None)
+        adapter = GuardedImageAdapter(inner, settings, upstream="test-image-fast-fail")
+
+        for _ in range(2):
+            assert await adapter.generate_image("prompt") is None
+
+        # When
+        result = await adapter.generate_image("prompt")
+
+        # Then
+        assert result is None
+        assert inner.generate_image.await_count == 2
+        assert adapter.guard.breaker.state == CircuitState.OPEN
@@ -0,0 +1,165 @@
+"""요청 기한(Deadline) 단위 테스트
+
+BaseNode의 기한 적용, secondary intent 생략(부분 응답),
+어댑터 호출 타임아웃 전파를 검증합니다.
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from app.core.deadline import Deadline, DeadlineExceededError, deadline_scope, effective_timeout
+from app.core.dependencies import get_request_deadline
+from app.core.adapters.llm.guarded_adapter import GuardedLLMAdapter
+from app.core.config import Settings, get_settings
+from app.cooking_assistant.workflow.nodes.base_node import BaseNode
+from app.cooking_assistant.workflow.states.cooking_state import create_initial_state
+
+
+class SleepyNode(BaseNode):
+    """지정 시간만큼 걸리는 테스트 노드"""
+
+    def __init__(self, intent_name: str, duration: float):
+        super().__init__(intent_name=intent_name)
+        self.duration = duration
+        self.executed = False
+
+    async def execute(self, state):
+        self.executed = True
+        await asyncio.sleep(self.duration)
+        state["image_url"] = "https://example.com/image.jpg"
+        return state
+
+
+class TestDeadline:
+    """Deadline 값 객체 테스트"""
+
+    def test_effective_timeout_uses_smaller_value(self):
+        """기본 타임아웃과 남은 예산 중 작은 값"""
+        # Given
+        deadline = Deadline.after(5.0)
+
+        # When / Then
+        assert effective_timeout(90.0) == 90.0
+        with deadline_scope(deadline):
+            assert effective_timeout(90.0) <= 5.0
+            assert effective_timeout(1.0) == 1.0
+        assert effective_timeout(None) is None
+
+    def test_optional_work_reserve(self):
+        """남은 시간이 reserve 이하이면 선택 작업 불가"""
+        assert Deadline.after(30.0, optional_reserve=15.0).allows_optional_work()
+        assert not Deadline.after(10.0, optional_reserve=15.0).allows_optional_work()
+
+
+class TestRequestDeadline:
+    """요청 헤더 → Deadline 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("header", ["abc", "inf", "-inf", "nan"])
+    async def test_invalid_header_falls_back_to_default(self, header):
+        """숫자가 아니거나 유한하지 않은 헤더는 무시하고 기본 기한 사용"""
+        # Given
+        settings = get_settings()
+        request = Mock()
+        request.url.path = "/api/test-deadline"
+        request.headers = {settings.request_deadline_header: header}
+
+        # When
+        deadline = await get_request_deadline(request)
+
+        # Then
+        assert deadline.remaining() == pytest.approx(settings.request_deadline, abs=1.0)
+
+
+class TestBaseNodeDeadline:
+    """BaseNode 기한 적용 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_secondary_intent_skipped_when_budget_low(self):
+        """예산 부족 시 secondary intent 생략 및 기록"""
+        # Given
+        node = SleepyNode("generate_image", 0.0)
+        state = create_initial_state("김치찌개 만드는 법")
+        state["secondary_intents"] = ["generate_image"]
+        state["deadline"] = Deadline.after(5.0, optional_reserve=15.0)
+
+        # When
+        result = await node(state)
+
+        # Then
+        assert not node.executed
+        assert result["secondary_intents"] == []
+        assert result["skipped_intents"] == ["generate_image"]
+        assert result["processed_secondary_intents"] == []
+
+    @pytest.mark.asyncio
+    async def test_blocked_secondary_intent_skipped(self):
+        """한도 초과로 막힌 secondary intent는 기한과 무관하게 생략"""
+        # Given
+        node = SleepyNode("generate_image", 0.0)
+        state = create_initial_state("김치찌개 만드는 법")
+        state["secondary_intents"] = ["generate_image"]
+        state["blocked_intents"] = ["generate_image"]
+
+        # When
+        result = await node(state)
+
+        # Then
+        assert not node.executed
+        assert result["image_url"] is None
+        assert result["skipped_intents"] == ["generate_image"]
+
+    @pytest.mark.asyncio
+    async def test_secondary_intent_timeout_is_partial(self):
+        """secondary intent 실행 중 기한 초과는 에러가 아닌 부분 응답"""
+        # Given
+        node = SleepyNode("generate_image", 1.0)
+        state = create_initial_state("김치찌개 만드는 법")
+        state["secondary_intents"] = ["generate_image"]
+        state["deadline"] = Deadline.after(0.05)
+
+        # When
+        result = await node(state)
+
+        # Then
+        assert result["error"] is None
+        assert result["skipped_intents"] == ["generate_image"]
+        assert result["processed_secondary_intents"] == []
+
+    @pytest.mark.asyncio
+    async def test_primary_timeout_sets_error(self):
+        """primary 노드 기한 초과는 에러로 기록"""
+        # Given
+        node = SleepyNode("recipe_create", 1.0)
+        state = create_initial_state("김치찌개 만드는 법")
+        state["deadline"] = Deadline.after(0.05)
+
+        # When
+        result = await node(state)
+
+        # Then
+        assert result["error"] is not None
+
+
+class TestAdapterDeadline:
+    """어댑터 호출 기한 전파 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_guarded_call_times_out_at_deadline(self):
+        """남은 예산을 넘기면 DeadlineExceededError (회로 통계에는 미반영)"""
+        # Given
+        settings = Settings(anthropic_api_key="test", replicate_api_token="test", secret_key="test")
+
+        async def slow(prompt):
+            await asyncio.sleep(1.0)
+            return {}
+
+        inner = Mock()
+        inner.generate_recipe = AsyncMock(side_effect=slow)
+        adapter = GuardedLLMAdapter(inner, settings, upstream="test-deadline")
+
+        # When / Then
+        with deadline_scope(Deadline.after(0.05)):
+            with pytest.raises(DeadlineExceededError):
+                await adapter.generate_recipe("prompt")
+
+        assert adapter.guard.breaker.snapshot()["calls"] == 0
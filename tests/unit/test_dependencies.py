@@ -0,0 +1,86 @@
+"""DI 그래프 사전 생성 / 검증 단위 테스트"""
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from injector import Injector
+from app.core import dependencies
+from app.core.config import Settings
+from app.core.decorators import get_dependency
+from app.core.dependencies import resolve_dependencies, DependencyResolutionError
+from app.core.ports.image_port import IImagePort
+from app.core.ports.llm_port import ILLMPort
+from app.cooking_assistant.module import CookingModule
+from app.cooking_assistant.services.cooking_service import CookingService
+from app.cooking_assistant.workflow.cooking_workflow import CookingWorkflow
+from app.cooking_assistant.workflow.nodes.image_generator_node import ImageGeneratorNode
+
+
+@pytest.fixture
+def settings():
+    return Settings(
+        anthropic_api_key="x",
+        replicate_api_token="x",
+        secret_key="s",
+        adapter_mode="fake",
+        quota_enabled=False
+    )
+
+
+def _injector(settings, *extra):
+    return Injector([CookingModule(), lambda binder: binder.bind(Settings, to=settings), *extra])
+
+
+class TestResolveDependencies:
+    """그래프 전체 생성 / 실패 보고 테스트"""
+
+    def test_resolves_whole_graph(self, settings):
+        """서비스부터 워크플로우, 노드, 포트까지 모두 생성"""
+        # Given
+        injector = _injector(settings)
+
+        # When
+        resolved = resolve_dependencies(injector, [CookingService])
+
+        # Then
+        assert {CookingService, CookingWorkflow, ImageGeneratorNode, ILLMPort, IImagePort} <= set(resolved)
+        assert resolved[CookingService] is injector.get(CookingService)
+
+    def test_reports_failure_with_dependency_path(self, settings):
+        """바인딩 실패는 의존 경로와 함께 모아서 보고"""
+        # Given: 이미지 어댑터 생성 실패
+        def broken_image(binder):
+            def fail() -> IImagePort:
+                raise RuntimeError("토큰 없음")
+            binder.bind(IImagePort, to=fail)
+        injector = _injector(settings, broken_image)
+
+        # When
+        with pytest.raises(DependencyResolutionError) as exc_info:
+            resolve_dependencies(injector, [CookingService])
+
+        # Then
+        [failure] = exc_info.value.failures
+        assert failure.startswith("CookingService → CookingWorkflow → ImageGeneratorNode → IImagePort")
+        assert "토큰 없음" in failure
+
+
+class TestGetDependency:
+    """미리 생성된 인스턴스 사용 테스트"""
+
+    def test_prefers_prebuilt_instance(self, monkeypatch):
+        """app.state.services에 있으면 Injector를 조회하지 않음"""
+        # Given
+        prebuilt = object()
+        monkeypatch.setattr(dependencies, "get_injector", lambda: pytest.fail("Injector 조회"))
+        app = FastAPI()
+        app.state.services = {CookingService: prebuilt}
+
+        @app.get("/probe")
+        async def probe(service=Depends(get_dependency(CookingService))):
+            return {"prebuilt": service is prebuilt}
+
+        # When
+        response = TestClient(app).get("/probe")
+
+        # Then
+        assert response.json() == {"prebuilt": True}
@@ -0,0 +1,149 @@
+"""클라이언트 연결 종료 시 작업 취소 단위 테스트"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from app.core import disconnect, usage
+from app.core.adapters.llm.guarded_adapter import GuardedLLMAdapter
+from app.core.adapters.image.guarded_adapter import GuardedImageAdapter
+from app.core.config import Settings
+from app.core.disconnect import cancel_on_disconnect, record_cancelled_request, ClientDisconnectedError
+from app.core.latency import LatencyTracker
+from app.core.prompt_loader import _current_prompt_id
+from app.core.usage import TokenUsage, UsageLedger, usage_scope
+
+
+def make_request(disconnected: bool) -> Mock:
+    """is_disconnected()만 구현한 Request Mock"""
+    request = Mock()
+    request.url.path = "/api/cooking"
+    request.is_disconnected = AsyncMock(return_value=disconnected)
+    return request
+
+
+class TestCancelOnDisconnect:
+    """연결 종료 감지 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_returns_result_when_connected(self):
+        """연결 유지 시 작업 결과 반환"""
+        # Given
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        # When
+        result = await cancel_on_disconnect(make_request(False), work(), poll_interval=0.01)
+
+        # Then
+        assert result == "done"
+
+    @pytest.mark.asyncio
+    async def test_cancels_work_when_disconnected(self):
+        """연결 종료 시 작업 취소 및 정리 완료 대기"""
+        # Given
+        cleaned_up = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cleaned_up.set()
+                raise
+
+        # When / Then
+        with pytest.raises(ClientDisconnectedError):
+            await cancel_on_disconnect(make_request(True), work(), poll_interval=0.01)
+
+        assert cleaned_up.is_set()
+
+
+@pytest.fixture
+def output_tokens(monkeypatch):
+    """프롬프트별 출력 토큰 통계를 테스트 전용으로 교체"""
+    tracker = LatencyTracker()
+    monkeypatch.setattr(usage, "_output_tokens", tracker)
+    return tracker
+
+
+@pytest.fixture
+def settings():
+    return Settings(anthropic_api_key="test", replicate_api_token="test", secret_key="test")
+
+
+class TestCancelledRequestSavings:
+    """취소된 요청의 사용/절감량 집계 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_guard_records_cancelled_calls_in_ledger(self, settings):
+        """진행 중 취소된 LLM/이미지 호출은 요청 장부에 (method, prompt_id)로 기록"""
+        # Given
+        async def hang(_prompt):
+            await asyncio.sleep(10)
+
+        inner = Mock(generate_recipe=hang, generate_image=hang)
+        llm = GuardedLLMAdapter(inner, settings, upstream="test-cancel-llm")
+        image = GuardedImageAdapter(inner, settings, upstream="test-cancel-image")
+        ledger = UsageLedger()
+
+        async def work():
+            _current_prompt_id.set("cooking.generate_recipe_single")
+            await asyncio.gather(llm.generate_recipe("prompt"), image.generate_image("prompt"))
+
+        # When
+        with usage_scope(ledger):
+            task = asyncio.ensure_future(work())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        # Then
+        assert sorted(ledger.cancelled_calls) == [
+            ("generate_image", "cooking.generate_recipe_single"),
+            ("generate_recipe", "cooking.generate_recipe_single"),
+        ]
+
+    def test_records_spent_tokens_and_avoided_work(self, output_tokens):
+        """이미 사용한 토큰, 중단된 이미지 생성, 출력 토큰 추정치(p50) 기록"""
+        # Given
+        for tokens in (100, 300, 900):
+            output_tokens.record("cooking.generate_recipe_single", tokens)
+
+        ledger = UsageLedger()
+        ledger.record("cooking.classify_intent", "classify", TokenUsage(input_tokens=500, output_tokens=20, calls=1))
+        ledger.cancelled_calls = [
+            ("generate_recipe", "cooking.generate_recipe_single"),
+            ("generate_image", "unknown"),
+            ("answer_question", "cooking.answer_question"),  # 샘플 없음 → 0
+        ]
+
+        spent_input = disconnect._cancelled_tokens.labels("input").value
+        spent_output = disconnect._cancelled_tokens.labels("output").value
+        images = disconnect._images_avoided.labels().value
+        avoided = disconnect._output_tokens_avoided.labels("cooking.generate_recipe_single").value
+        avoided_unknown = disconnect._output_tokens_avoided.labels("cooking.answer_question").value
+
+        # When
+        record_cancelled_request(ledger)
+
+        # Then
+        assert disconnect._cancelled_tokens.labels("input").value - spent_input == 500
+        assert disconnect._cancelled_tokens.labels("output").value - spent_output == 20
+        assert disconnect._images_avoided.labels().value - images == 1
+        assert disconnect._output_tokens_avoided.labels("cooking.generate_recipe_single").value - avoided == 300
+        assert disconnect._output_tokens_avoided.labels("cooking.answer_question").value == avoided_unknown
+
+    def test_record_token_usage_feeds_output_token_p50(self, output_tokens):
+        """LLM 호출 사용량 기록 시 프롬프트별 출력 토큰 샘플 추가"""
+        # Given
+        token = _current_prompt_id.set("cooking.answer_question")
+
+        # When
+        try:
+            for tokens in (40, 60, 80):
+                usage.record_token_usage("anthropic", TokenUsage(output_tokens=tokens, calls=1))
+        finally:
+            _current_prompt_id.reset(token)
+
+        # Then
+        assert usage.typical_output_tokens("cooking.answer_question") == 60
@@ -0,0 +1,96 @@
+"""Fake 어댑터(부하 테스트용) 단위 테스트"""
+import pytest
+from app.core.config import Settings
+from app.core.prompt_loader import PromptLoader
+from app.core.adapters.fake import LatencyModel, FakeUpstreamError
+from app.core.adapters.llm.fake_adapter import FakeLLMAdapter
+from app.core.adapters.image.fake_adapter import FakeImageAdapter
+from app.cooking_assistant.entities.recipe import Recipe
+
+
+@pytest.fixture
+def settings():
+    return Settings(
+        anthropic_api_key="x",
+        replicate_api_token="x",
+        secret_key="s",
+        adapter_mode="fake",
+        fake_llm_latency=0.0,
+        fake_image_latency=0.0,
+        fake_seed=7
+    )
+
+
+@pytest.fixture
+def loader():
+    return PromptLoader(prompts_dir="app/cooking_assistant/prompts")
+
+
+class TestLatencyModel:
+    """지연 시간 분포 / 오류 주입 테스트"""
+
+    def test_same_seed_same_samples(self):
+        """seed가 같으면 샘플이 재현됨"""
+        # Given
+        a = LatencyModel(median=1.0, sigma=0.5, seed=42)
+        b = LatencyModel(median=1.0, sigma=0.5, seed=42)
+
+        # Then
+        assert [a.sample("m") for _ in range(5)] == [b.sample("m") for _ in range(5)]
+
+    def test_override_and_zero_sigma(self):
+        """메서드별 재정의, sigma=0이면 항상 중앙값"""
+        model = LatencyModel(median=1.0, sigma=0.0, overrides={"classify_intent": 0.2})
+        assert model.sample("classify_intent") == 0.2
+        assert model.sample("generate_recipe") == 1.0
+
+    async def test_error_rate_raises(self):
+        """error_rate=1이면 항상 FakeUpstreamError"""
+        model = LatencyModel(median=0.0, error_rate=1.0)
+        with pytest.raises(FakeUpstreamError):
+            await model.wait("generate_image")
+
+
+class TestFakeLLMAdapter:
+    """렌더링된 프롬프트에 맞는 응답 형식 테스트"""
+
+    async def test_classify_multi_intent(self, settings, loader):
+        """입력 쿼리 키워드로 의도/요리명 추출"""
+        # Given
+        adapter = FakeLLMAdapter(settings)
+        prompt = loader.render("cooking.classify_intent", query="불고기 만드는 법 알려주고 메뉴도 추천해줘")
+
+        # When
+        result = await adapter.classify_intent(prompt)
+
+        # Then
+        assert result["primary_intent"] == "recipe_create"
+        assert result["secondary_intents"] == ["recommend"]
+        assert result["entities"]["dishes"] == ["불고기"]
+
+    async def test_generate_recipe_single_and_multiple(self, settings, loader):
+        """단일 프롬프트는 dict, 복수 프롬프트는 list (Recipe 검증 통과)"""
+        # Given
+        adapter = FakeLLMAdapter(settings)
+        single = loader.render(
+            "cooking.generate_recipe_single", query="김치찌개 레시피", dishes=["김치찌개"],
+            ingredients=[], constraints={}, dietary=[], count=1
+        )
+        multiple = loader.render(
+            "cooking.generate_recipe_multiple", query="김치찌개, 된장찌개 레시피",
+            dishes=["김치찌개", "된장찌개"], ingredients=[], constraints={}, dietary=[], count=2
+        )
+
+        # When
+        one = await adapter.generate_recipe(single)
+        many = await adapter.generate_recipe(multiple)
+
+        # Then
+        assert isinstance(one, dict)
+        Recipe(**one).validate()
+        assert [r["title"] for r in many] == ["김치찌개", "된장찌개"]
+
+    async def test_image_url_is_deterministic(self, settings):
+        """같은 프롬프트 → 같은 URL"""
+        adapter = FakeImageAdapter(settings)
+        assert await adapter.generate_image("김치찌개") == await adapter.generate_image("김치찌개")
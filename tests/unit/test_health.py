@@ -0,0 +1,136 @@
+"""준비 상태 / 캐시된 심층 헬스 체크 단위 테스트"""
+import asyncio
+import pytest
+from app.core import health, circuit_breaker
+from app.core.circuit_breaker import CircuitBreaker
+from app.core.health import HealthMonitor, register_health_check, check_upstreams, DEGRADED, DOWN, OK
+
+
+@pytest.fixture
+def checks(monkeypatch):
+    """등록된 체크를 테스트 전용 레지스트리로 교체"""
+    registry = {}
+    monkeypatch.setattr(health, "_checks", registry)
+    return registry
+
+
+@pytest.fixture
+def ready_startup(monkeypatch):
+    """워밍업 완료 상태"""
+    monkeypatch.setattr(health.get_startup_report(), "ready", True)
+
+
+class TestHealthMonitor:
+    """체크 실행 / 캐시 / 준비 판정 테스트"""
+
+    def test_overall_status_is_worst_check(self, checks):
+        """전체 상태는 가장 나쁜 체크 상태, 예외는 down으로 기록"""
+        # Given
+        register_health_check("a", lambda: {"value": 1})
+        register_health_check("b", lambda: {"status": DEGRADED})
+        register_health_check("c", lambda: 1 / 0)
+
+        # When
+        snapshot = HealthMonitor().refresh()
+
+        # Then
+        assert snapshot["checks"]["a"] == {"value": 1, "status": OK}
+        assert snapshot["checks"]["c"]["status"] == DOWN
+        assert "ZeroDivisionError" in snapshot["checks"]["c"]["error"]
+        assert snapshot["status"] == DOWN
+
+    def test_current_serves_cached_snapshot(self, checks):
+        """프로브는 캐시만 읽음 (첫 호출만 체크 실행)"""
+        # Given
+        calls = []
+        register_health_check("counted", lambda: calls.append(1) or {})
+        monitor = HealthMonitor()
+
+        # When
+        for _ in range(5):
+            monitor.current()
+
+        # Then
+        assert len(calls) == 1
+
+    def test_readiness_reasons(self, checks, monkeypatch):
+        """워밍업 전 / degraded 항목이 있으면 준비되지 않음 (fail_on_degraded=False면 degraded 허용)"""
+        # Given
+        register_health_check("upstreams", lambda: {"status": DEGRADED})
+        monkeypatch.setattr(health.get_startup_report(), "ready", False)
+
+        # When
+        ready, reasons = HealthMonitor().readiness()
+        lenient_ready, lenient_reasons = HealthMonitor(fail_on_degraded=False).readiness()
+
+        # Then
+        assert ready is False
+        assert reasons == ["warmup", "upstreams: degraded"]
+        assert lenient_reasons == ["warmup"]
+
+    def test_ready_when_warm_and_healthy(self, checks, ready_startup):
+        """워밍업 완료 + 모든 체크 ok → 준비 완료"""
+        register_health_check("requests", lambda: {"in_flight": 0})
+        assert HealthMonitor().readiness() == (True, [])
+
+    async def test_background_refresh(self, checks):
+        """start 후 interval마다 캐시 갱신, stop으로 중지"""
+        # Given
+        state = {"status": OK}
+        register_health_check("flappy", lambda: dict(state))
+        monitor = HealthMonitor(interval=0.01)
+
+        # When
+        monitor.start()
+        state["status"] = DEGRADED
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        # Then
+        assert monitor.snapshot["status"] == DEGRADED
+
+
+class TestCoreChecks:
+    """기본 체크 테스트"""
+
+    @staticmethod
+    def _open_circuit(monkeypatch, name: str) -> None:
+        """name 업스트림의 회로를 OPEN 상태로 등록"""
+        breaker = CircuitBreaker(name, minimum_calls=1, window_size=2)
+        monkeypatch.setitem(circuit_breaker._breakers, name, breaker)
+        breaker.record_success(0.1)
+        breaker.record_failure(0.1)
+        breaker.record_failure(0.1)
+
+    def test_open_critical_circuit_degrades_upstreams(self, monkeypatch):
+        """필수 업스트림 회로가 OPEN이면 degraded + 마지막 성공 이후 경과 시간 포함"""
+        # Given
+        monkeypatch.setattr(health, "_critical_upstreams", ("health-test",))
+        self._open_circuit(monkeypatch, "health-test")
+
+        # When
+        result = check_upstreams()
+
+        # Then
+        assert result["status"] == DEGRADED
+        assert "health-test" in result["open_circuits"]
+        assert result["upstreams"]["health-test"]["last_success_age"] >= 0
+
+    def test_open_image_circuit_keeps_worker_ready(self, monkeypatch, checks, ready_startup):
+        """이미지(replicate) 회로 OPEN은 정보로만 보고, 워커는 준비 상태 유지"""
+        # Given: 기본 필수 업스트림은 anthropic
+        assert health._critical_upstreams == ("anthropic",)
+        self._open_circuit(monkeypatch, "replicate")
+        register_health_check("upstreams", check_upstreams)
+        monitor = HealthMonitor(fail_on_degraded=True)
+        monitor.refresh()
+
+        # When
+        ready, reasons = monitor.readiness()
+
+        # Then
+        result = monitor.current()["checks"]["upstreams"]
+        assert result["status"] == OK
+        assert "replicate" in result["open_circuits"]
+        assert ready is True
+        assert reasons == []
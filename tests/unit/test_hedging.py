@@ -0,0 +1,141 @@
+"""Hedger / LatencyTracker 단위 테스트
+
+느린 호출에 대한 hedge 발행, 비율 제한, 늦은 요청 취소를 검증합니다.
+"""
+import asyncio
+import pytest
+from app.core.hedging import Hedger
+from app.core.latency import LatencyTracker
+
+
+def make_hedger(samples: float = 0.01, max_ratio: float = 1.0) -> Hedger:
+    """p95 ≈ samples초인 Hedger 생성"""
+    tracker = LatencyTracker(window_size=50)
+    for _ in range(20):
+        tracker.record("generate_recipe", samples)
+    return Hedger(
+        "test",
+        tracker,
+        min_samples=20,
+        min_delay=0.0,
+        max_ratio=max_ratio,
+        burst=5.0
+    )
+
+
+class TestLatencyTracker:
+    """롤링 백분위수 테스트"""
+
+    def test_percentile(self):
+        """nearest-rank 백분위수"""
+        # Given
+        tracker = LatencyTracker(window_size=100)
+        for i in range(1, 101):
+            tracker.record("m", i / 100)
+
+        # Then
+        assert tracker.percentile("m", 0.5) == 0.5
+        assert tracker.percentile("m", 0.95) == 0.95
+        assert tracker.percentile("unknown", 0.95) is None
+
+    def test_window_is_bounded(self):
+        """오래된 샘플은 윈도우에서 밀려남"""
+        # Given
+        tracker = LatencyTracker(window_size=3)
+
+        # When
+        for value in (10.0, 1.0, 1.0, 1.0):
+            tracker.record("m", value)
+
+        # Then
+        assert tracker.count("m") == 3
+        assert tracker.percentile("m", 1.0) == 1.0
+
+
+class TestHedger:
+    """Hedged Request 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_fast_call_is_not_hedged(self):
+        """p95 안에 끝나면 hedge 없음"""
+        # Given
+        hedger = make_hedger(samples=1.0)
+        calls = []
+
+        async def call():
+            calls.append(1)
+            return "ok"
+
+        # When
+        result = await hedger.run("generate_recipe", call)
+
+        # Then
+        assert result == "ok"
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_call_hedge_wins_and_loser_cancelled(self):
+        """원 요청이 느리면 hedge 결과 사용, 원 요청은 취소"""
+        # Given
+        hedger = make_hedger(samples=0.01)
+        cancelled = asyncio.Event()
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            if len(attempts) == 1:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+                return "slow"
+            return "hedged"
+
+        # When
+        result = await hedger.run("generate_recipe", call)
+        await asyncio.sleep(0)
+
+        # Then
+        assert result == "hedged"
+        assert len(attempts) == 2
+        assert cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_hedge_rate_is_capped(self):
+        """토큰이 없으면 hedge 없이 원 요청을 기다림"""
+        # Given
+        hedger = make_hedger(samples=0.001, max_ratio=0.0)
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            await asyncio.sleep(0.02)
+            return "primary"
+
+        # When
+        result = await hedger.run("generate_recipe", call)
+
+        # Then
+        assert result == "primary"
+        assert len(attempts) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_hedge_falls_back_to_primary(self):
+        """hedge가 실패하면 원 요청 결과를 기다림"""
+        # Given
+        hedger = make_hedger(samples=0.01)
+        attempts = []
+
+        async def call():
+            attempts.append(1)
+            if len(attempts) == 1:
+                await asyncio.sleep(0.05)
+                return "primary"
+            raise RuntimeError("hedge failed")
+
+        # When
+        result = await hedger.run("generate_recipe", call)
+
+        # Then
+        assert result == "primary"
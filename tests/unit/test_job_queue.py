@@ -0,0 +1,152 @@
+"""SQLite 작업 큐 / 워커 단위 테스트"""
+import asyncio
+import pytest
+from app.core import job_queue
+from app.core.config import Settings
+from app.core.job_queue import JobQueue, QUEUED, RUNNING, SUCCEEDED, FAILED
+from app.core.shutdown import ShutdownCoordinator
+from app.cooking_assistant.models.schemas import QuestionResponse, QuestionResponseData
+from app.cooking_assistant.worker import CookingWorker
+
+
+@pytest.fixture
+def path(tmp_path):
+    return str(tmp_path / "jobs.db")
+
+
+class TestJobQueue:
+    """등록 / 점유 / 완료 / 재시도 테스트"""
+
+    def test_round_trip(self, path):
+        """등록 → 점유 → 완료 결과 조회"""
+        # Given
+        queue = JobQueue(path)
+        job = queue.enqueue({"query": "김치찌개 레시피"}, user_id="user1")
+
+        # When
+        claimed = queue.claim("worker-1")
+        queue.finish(claimed.id, "worker-1", result={"status": "success"})
+
+        # Then
+        assert claimed.id == job.id
+        assert claimed.status == RUNNING
+        assert claimed.attempts == 1
+        done = queue.get(job.id)
+        assert done.status == SUCCEEDED
+        assert done.result == {"status": "success"}
+        assert done.user_id == "user1"
+
+    def test_survives_restart_and_shared_between_processes(self, path):
+        """다른 연결(재시작, 다른 프로세스)에서도 같은 작업을 보며, 한 작업은 한 워커만 점유"""
+        # Given
+        JobQueue(path).enqueue({"query": "불고기"})
+
+        # When
+        first = JobQueue(path).claim("worker-1")
+        second = JobQueue(path).claim("worker-2")
+
+        # Then
+        assert first.payload == {"query": "불고기"}
+        assert second is None
+
+    def test_expired_lease_is_retried_then_failed(self, path, monkeypatch):
+        """워커가 죽어 리스가 만료되면 재시도하고, 시도 횟수를 다 쓰면 실패 처리"""
+        # Given
+        now = [1000.0]
+        monkeypatch.setattr(job_queue.time, "time", lambda: now[0])
+        queue = JobQueue(path, lease_seconds=10, max_attempts=2)
+        job = queue.enqueue({"query": "잡채"})
+        queue.claim("worker-1")
+
+        # When: 리스 만료 후 다른 워커가 재시도, 다시 만료
+        now[0] += 11
+        retried = queue.claim("worker-2")
+        now[0] += 11
+        nothing = queue.claim("worker-3")
+
+        # Then
+        assert retried.id == job.id
+        assert retried.attempts == 2
+        assert nothing is None
+        assert queue.get(job.id).status == FAILED
+        assert queue.finish(job.id, "worker-2", result={}) is False  # 점유가 끝난 워커의 결과는 버림
+
+    def test_release_requeues_without_counting_attempt(self, path):
+        """그레이스풀 종료 시 미완료 작업을 대기열로 되돌림"""
+        # Given
+        queue = JobQueue(path)
+        job = queue.enqueue({"query": "비빔밥"})
+        queue.claim("worker-1")
+
+        # When
+        released = queue.release("worker-1")
+
+        # Then
+        assert released == 1
+        assert queue.get(job.id).status == QUEUED
+        assert queue.claim("worker-2").attempts == 1
+
+
+class TestCookingWorker:
+    """작업 처리 / 종료 테스트"""
+
+    @pytest.fixture
+    def settings(self, path):
+        return Settings(
+            anthropic_api_key="x",
+            replicate_api_token="x",
+            secret_key="s",
+            job_db_path=path,
+            job_poll_interval=0.01,
+            shutdown_grace_period=1.0
+        )
+
+    class FakeService:
+        def __init__(self, delay: float = 0.0):
+            self.delay = delay
+            self.calls = []
+
+        async def process_cooking_query(self, query, user_id=None, deadline=None):
+            self.calls.append((query, user_id, deadline is not None))
+            await asyncio.sleep(self.delay)
+            return QuestionResponse(code="QUESTION_ANSWERED", data=QuestionResponseData(answer=query))
+
+    async def test_processes_job(self, settings, path):
+        """작업을 가져와 CookingService로 처리하고 결과 저장"""
+        # Given
+        queue = JobQueue(path)
+        job = queue.enqueue({"query": "김치찌개 칼로리는?"}, user_id="user1")
+        service = self.FakeService()
+        worker = CookingWorker(queue, service, settings, worker_id="w1", coordinator=ShutdownCoordinator())
+
+        # When
+        processed = await worker.run_once()
+
+        # Then
+        assert processed is True
+        assert service.calls == [("김치찌개 칼로리는?", "user1", True)]
+        done = queue.get(job.id)
+        assert done.status == SUCCEEDED
+        assert done.result["data"]["answer"] == "김치찌개 칼로리는?"
+        assert await worker.run_once() is False
+
+    async def test_stop_waits_for_running_job(self, settings, path):
+        """종료 시 새 작업은 가져가지 않고 처리 중 작업은 끝까지 처리"""
+        # Given
+        queue = JobQueue(path)
+        first = queue.enqueue({"query": "첫 번째"})
+        second = queue.enqueue({"query": "두 번째"})
+        worker = CookingWorker(
+            queue, self.FakeService(delay=0.1), settings,
+            worker_id="w1", concurrency=1, coordinator=ShutdownCoordinator()
+        )
+        running = asyncio.create_task(worker.run())
+        await asyncio.sleep(0.05)
+
+        # When
+        worker.stop()
+        await running
+
+        # Then
+        assert queue.get(first.id).status == SUCCEEDED
+        assert queue.get(second.id).status == QUEUED
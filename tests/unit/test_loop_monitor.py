@@ -0,0 +1,76 @@
+"""이벤트 루프 감시 / 블로킹 호출 탐지 단위 테스트"""
+import asyncio
+import logging
+import time
+import pytest
+from unittest.mock import AsyncMock
+from app.core.loop_monitor import EventLoopMonitor, BlockingCallDetector
+from app.core.prompt_loader import PromptLoader
+from app.cooking_assistant.workflow.nodes.question_answerer_node import QuestionAnswererNode
+from app.cooking_assistant.workflow.states.cooking_state import create_initial_state
+
+
+class TestBlockingCallDetector:
+    """asyncio debug 모드 기반 블로킹 탐지 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_detects_sync_sleep(self):
+        """루프 스레드의 동기 sleep 탐지"""
+        # When
+        async with BlockingCallDetector(threshold_ms=20) as detector:
+            time.sleep(0.05)
+            await asyncio.sleep(0)
+
+        # Then
+        assert detector.slow_callbacks
+        with pytest.raises(AssertionError):
+            detector.assert_no_blocking()
+
+    @pytest.mark.asyncio
+    async def test_async_sleep_is_not_blocking(self):
+        """await로 양보하는 대기는 블로킹이 아님"""
+        async with BlockingCallDetector(threshold_ms=20) as detector:
+            await asyncio.sleep(0.05)
+
+        detector.assert_no_blocking()
+
+    @pytest.mark.asyncio
+    async def test_node_does_not_block_loop(self, blocking_detector):
+        """노드 실행(프롬프트 렌더링 + 어댑터 호출)이 루프를 막지 않음"""
+        # Given
+        llm_port = AsyncMock()
+        llm_port.answer_question.return_value = {"answer": "약 400kcal", "additional_tips": []}
+        node = QuestionAnswererNode(
+            llm_port=llm_port,
+            prompt_loader=PromptLoader(prompts_dir="app/cooking_assistant/prompts")
+        )
+        state = create_initial_state("김치찌개 칼로리는?")
+        state["primary_intent"] = "question"
+
+        # When
+        result = await node(state)
+
+        # Then
+        assert result["answer"].answer == "약 400kcal"
+
+
+class TestEventLoopMonitor:
+    """루프 지연 감시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_logs_stack_of_blocking_call(self, caplog):
+        """heartbeat가 멈추면 루프 스레드 스택을 기록"""
+        # Given
+        monitor = EventLoopMonitor(interval=0.02, threshold=0.05)
+        monitor.start()
+        await asyncio.sleep(0.05)
+
+        # When
+        with caplog.at_level(logging.WARNING, logger="app.core.loop_monitor"):
+            time.sleep(0.3)
+            await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        # Then
+        assert "블로킹" in caplog.text
+        assert "test_logs_stack_of_blocking_call" in caplog.text
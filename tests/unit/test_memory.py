@@ -0,0 +1,98 @@
+"""메모리 진단 단위 테스트"""
+import pytest
+from injector import Injector, Module, provider, singleton
+from app.core import memory
+from app.core.memory import (
+    MemoryTracer,
+    cache_report,
+    deep_sizeof,
+    register_cache,
+    singleton_report,
+)
+
+
+@pytest.fixture
+def tracer():
+    tracer = MemoryTracer(max_snapshots=2)
+    tracer.start()
+    yield tracer
+    tracer.stop()
+
+
+class TestMemoryTracer:
+    """tracemalloc 스냅샷 테스트"""
+
+    def test_diff_shows_new_allocations(self, tracer):
+        """스냅샷 사이에 할당한 위치가 차이 목록 상위에 나타남"""
+        # Given
+        tracer.take_snapshot("before")
+
+        # When
+        leaked = [bytearray(1024) for _ in range(200)]
+        tracer.take_snapshot("after")
+        diff = tracer.compare("before", "after", limit=5)
+
+        # Then
+        assert "test_memory.py" in diff[0]["location"]
+        assert diff[0]["size_diff"] >= 200 * 1024
+        assert leaked
+
+    def test_snapshots_are_bounded(self, tracer):
+        """max_snapshots를 넘으면 오래된 스냅샷부터 제거"""
+        for name in ("a", "b", "c"):
+            tracer.take_snapshot(name)
+
+        assert [s["name"] for s in tracer.snapshots()] == ["b", "c"]
+        with pytest.raises(KeyError):
+            tracer.top("a")
+
+    def test_snapshot_requires_tracing(self):
+        """tracemalloc이 꺼져 있으면 스냅샷 불가"""
+        with pytest.raises(RuntimeError):
+            MemoryTracer().take_snapshot()
+
+
+class TestCacheReport:
+    """캐시/싱글톤 크기 보고 테스트"""
+
+    def test_registered_cache(self, monkeypatch):
+        """등록한 캐시의 항목 수와 바이트 수 보고"""
+        # Given
+        monkeypatch.setattr(memory, "_caches", dict(memory._caches))
+        cache = {f"key-{i}": str(i) * 100 for i in range(10)}
+        register_cache("test.cache", lambda: cache)
+
+        # When
+        report = cache_report()
+
+        # Then
+        assert report["test.cache"]["entries"] == 10
+        assert report["test.cache"]["bytes"] >= 10 * 100
+        assert "tracing.spans" in report
+
+    def test_deep_sizeof_follows_attributes(self):
+        """인스턴스 속성까지 따라가며 계산"""
+        class Holder:
+            def __init__(self):
+                self.payload = "x" * 10_000
+
+        assert deep_sizeof(Holder()) >= 10_000
+
+    def test_singleton_report(self):
+        """Injector 싱글톤별 크기 보고"""
+        class Templates:
+            def __init__(self):
+                self.prompts = {"cooking": {"classify_intent": "x" * 5000}}
+
+        class TestModule(Module):
+            @singleton
+            @provider
+            def provide_templates(self) -> Templates:
+                return Templates()
+
+        injector = Injector([TestModule()])
+        injector.get(Templates)
+
+        report = singleton_report(injector)
+
+        assert report["Templates"]["bytes"] >= 5000
@@ -0,0 +1,85 @@
+"""메트릭 레지스트리 / Prometheus 노출 포맷 단위 테스트"""
+import time
+import pytest
+from app.core.metrics import MetricsRegistry, Counter, Histogram, render_prometheus
+
+
+class TestHistogram:
+    """히스토그램 버킷 테스트"""
+
+    def test_observe_places_value_in_bucket(self):
+        """값은 v <= bound인 첫 버킷에 기록 (경계값 포함)"""
+        # Given
+        hist = Histogram("h", "test", buckets=(0.1, 1.0))
+        child = hist.labels()
+
+        # When
+        for value in (0.05, 0.1, 0.5, 5.0):
+            child.observe(value)
+
+        # Then
+        assert child.counts == [2, 1, 1]
+        assert child.count == 4
+        assert child.sum == pytest.approx(5.65)
+
+    def test_label_count_mismatch(self):
+        """라벨 개수가 다르면 ValueError"""
+        hist = Histogram("h", "test", ["node"])
+
+        with pytest.raises(ValueError):
+            hist.labels("a", "b")
+
+    def test_observe_is_cheap(self):
+        """미리 보관한 child 기록은 호출당 1µs 미만 (여유 있게 5µs로 검증)"""
+        # Given
+        child = Histogram("h", "test", ["node"]).labels("RecipeGeneratorNode")
+        iterations = 100_000
+
+        # When
+        start = time.perf_counter()
+        for _ in range(iterations):
+            child.observe(0.3)
+        per_call = (time.perf_counter() - start) / iterations
+
+        # Then
+        assert per_call < 5e-6
+
+
+class TestRenderPrometheus:
+    """Prometheus 텍스트 포맷 테스트"""
+
+    def test_renders_counter_and_cumulative_histogram(self):
+        """카운터 값과 누적 버킷/sum/count 출력"""
+        # Given
+        registry = MetricsRegistry()
+        calls = registry.register(Counter("calls_total", "호출 수", ["upstream"]))
+        latency = registry.register(Histogram("latency_seconds", "지연", ["method"], buckets=(0.1, 1.0)))
+        calls.labels("anthropic").inc(3)
+        latency.labels("classify_intent").observe(0.05)
+        latency.labels("classify_intent").observe(0.5)
+
+        # When
+        text = render_prometheus(registry)
+
+        # Then
+        assert "# TYPE calls_total counter" in text
+        assert 'calls_total{upstream="anthropic"} 3' in text
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{method="classify_intent",le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{method="classify_intent",le="1"} 2' in text
+        assert 'latency_seconds_bucket{method="classify_intent",le="+Inf"} 2' in text
+        assert 'latency_seconds_count{method="classify_intent"} 2' in text
+        assert text.endswith("\n")
+
+    def test_escapes_label_values(self):
+        """라벨 값의 따옴표/역슬래시/개행 이스케이프"""
+        # Given
+        registry = MetricsRegistry()
+        errors = registry.register(Counter("errors_total", "에러", ["message"]))
+        errors.labels('bad "value"\n').inc()
+
+        # When
+        text = render_prometheus(registry)
+
+        # Then
+        assert 'errors_total{message="bad \\"value\\"\\n"} 1' in text
@@ -0,0 +1,105 @@
+"""요청 프로파일러 단위 테스트"""
+import marshal
+import time
+import pytest
+from app.core.profiling import RequestProfiler, CPROFILE, SAMPLING
+
+
+def busy_work(seconds: float = 0.03) -> int:
+    end = time.perf_counter() + seconds
+    total = 0
+    while time.perf_counter() < end:
+        total += 1
+    return total
+
+
+class TestSampling:
+    """샘플링 결정 테스트"""
+
+    def test_disabled_profiles_nothing(self):
+        """비활성화 시 수집하지 않음"""
+        profiler = RequestProfiler(enabled=False, sample_rate=1.0)
+
+        assert profiler.start("query") is None
+
+    def test_force_overrides_disabled(self):
+        """관리자 강제 요청은 비활성화 상태에서도 수집"""
+        # Given
+        profiler = RequestProfiler(enabled=False)
+
+        # When
+        capture = profiler.start("query", force=True)
+        profiler.finish(capture)
+
+        # Then
+        assert len(profiler.list()) == 1
+
+    def test_single_active_profile(self):
+        """진행 중인 프로파일이 있으면 다음 요청은 건너뜀"""
+        # Given
+        profiler = RequestProfiler(enabled=True, sample_rate=1.0)
+        capture = profiler.start("first")
+
+        # When
+        second = profiler.start("second")
+        profiler.finish(capture)
+
+        # Then
+        assert second is None
+        third = profiler.start("third")
+        assert third is not None
+        profiler.finish(third)
+
+    def test_ring_buffer_is_bounded(self):
+        """버퍼 크기를 넘으면 오래된 프로파일부터 제거"""
+        # Given
+        profiler = RequestProfiler(enabled=True, sample_rate=1.0, buffer_size=2)
+
+        # When
+        for query in ("a", "b", "c"):
+            profiler.finish(profiler.start(query))
+
+        # Then
+        assert [p["query"] for p in profiler.list()] == ["c", "b"]
+
+    def test_invalid_mode(self):
+        """지원하지 않는 모드는 거절"""
+        with pytest.raises(ValueError):
+            RequestProfiler(mode="perf")
+
+
+class TestCapture:
+    """수집 결과 테스트"""
+
+    def test_cprofile_records_functions(self):
+        """cprofile 모드: pstats 데이터 + 누적 시간순 요약"""
+        # Given
+        profiler = RequestProfiler(enabled=True, sample_rate=1.0, mode=CPROFILE)
+
+        # When
+        capture = profiler.start("김치찌개 레시피", user_id="user-1")
+        busy_work()
+        profile = profiler.finish(capture, intent="recipe_create", timings={"generate": 30.0})
+
+        # Then
+        assert "busy_work" in profile.top()
+        assert any(key[2] == "busy_work" for key in marshal.loads(profile.data))
+        assert profile.filename.endswith(".prof")
+        assert profile.summary()["intent"] == "recipe_create"
+        assert profile.summary()["timings"] == {"generate": 30.0}
+
+    def test_sampling_collects_stacks(self):
+        """sampling 모드: 루프 스레드 collapsed stack 수집"""
+        # Given
+        profiler = RequestProfiler(
+            enabled=True, sample_rate=1.0, mode=SAMPLING, sampling_interval=0.001
+        )
+
+        # When
+        capture = profiler.start("query")
+        busy_work(0.05)
+        profile = profiler.finish(capture)
+
+        # Then
+        assert "busy_work" in profile.data.decode()
+        assert profile.filename.endswith(".folded")
@@ -0,0 +1,115 @@
+"""사용 한도(Quota) 단위 테스트"""
+import pytest
+from app.core.quota import (
+    QuotaManager,
+    QuotaLimit,
+    InMemoryQuotaBackend,
+    SQLiteQuotaBackend,
+    TOKENS,
+    IMAGES,
+)
+
+
+def make_manager(backend=None, enabled: bool = True) -> QuotaManager:
+    """사용자: 토큰 1000/분, 이미지 2/일 · 익명: 토큰 100/분"""
+    return QuotaManager(
+        backend or InMemoryQuotaBackend(),
+        user_limits=[
+            QuotaLimit(TOKENS, "minute", 1000),
+            QuotaLimit(IMAGES, "day", 2),
+            QuotaLimit(TOKENS, "day", 0),  # 무제한
+        ],
+        anonymous_limits=[QuotaLimit(TOKENS, "minute", 100)],
+        enabled=enabled
+    )
+
+
+class TestQuotaManager:
+    """한도 확인/차감 테스트"""
+
+    async def test_allows_within_budget(self):
+        """한도 이내면 통과"""
+        # Given
+        manager = make_manager()
+        await manager.charge("user-1", tokens=999)
+
+        # Then
+        assert await manager.check("user-1") is None
+
+    async def test_rejects_when_token_budget_exhausted(self):
+        """토큰 한도에 도달하면 거절 (재시도 시점 포함)"""
+        # Given
+        manager = make_manager()
+        await manager.charge("user-1", tokens=1000)
+
+        # When
+        violation = await manager.check("user-1")
+
+        # Then
+        assert violation is not None
+        assert violation.resource == TOKENS
+        assert violation.window == "minute"
+        assert 0 < violation.retry_after <= 60
+
+    async def test_rejects_when_image_budget_exhausted(self):
+        """이미지 한도 도달 시 거절"""
+        # Given
+        manager = make_manager()
+        await manager.charge("user-1", images=2)
+
+        # When
+        violation = await manager.check("user-1")
+
+        # Then
+        assert violation.resource == IMAGES
+        assert violation.window == "day"
+
+    async def test_checks_only_requested_resources(self):
+        """이미지 한도만 소진되면 토큰 한도 확인은 통과 (텍스트 요청은 거절하지 않음)"""
+        # Given
+        manager = make_manager()
+        await manager.charge("user-1", tokens=10, images=2)
+
+        # When
+        token_violation = await manager.check("user-1", resources=(TOKENS,))
+        image_violation = await manager.check("user-1", resources=(IMAGES,))
+
+        # Then
+        assert token_violation is None
+        assert image_violation.resource == IMAGES
+
+    async def test_users_and_anonymous_are_separate(self):
+        """사용자별 예산은 독립, 익명은 공용 예산"""
+        # Given
+        manager = make_manager()
+        await manager.charge(None, tokens=100)
+
+        # Then
+        assert await manager.check(None) is not None
+        assert await manager.check("user-1") is None
+        assert await manager.usage(None) == {TOKENS: {"minute": 100}}
+
+    async def test_disabled_manager_never_rejects(self):
+        """비활성화 시 항상 통과"""
+        manager = make_manager(enabled=False)
+        await manager.charge("user-1", tokens=10_000)
+        assert await manager.check("user-1") is None
+
+
+class TestSQLiteQuotaBackend:
+    """공유 backend 테스트"""
+
+    async def test_counters_shared_between_managers(self, tmp_path):
+        """같은 파일을 쓰는 manager(워커)끼리 사용량 공유"""
+        # Given
+        path = str(tmp_path / "quota.db")
+        worker_a = make_manager(SQLiteQuotaBackend(path))
+        worker_b = make_manager(SQLiteQuotaBackend(path))
+
+        # When
+        await worker_a.charge("user-1", tokens=600)
+        await worker_b.charge("user-1", tokens=400)
+
+        # Then
+        assert (await worker_a.usage("user-1"))[TOKENS]["minute"] == pytest.approx(1000)
+        assert await worker_b.check("user-1") is not None
@@ -0,0 +1,51 @@
+"""Server-Timing 구간 기록 단위 테스트"""
+import asyncio
+import pytest
+from app.core.server_timing import (
+    ServerTiming,
+    server_timing_scope,
+    record_phase,
+    measure_phase,
+    current_server_timing,
+)
+
+
+class TestServerTiming:
+    """구간 기록 및 헤더 포맷 테스트"""
+
+    def test_header_format_and_accumulation(self):
+        """같은 구간은 누적, 기록 순서대로 헤더 생성"""
+        # Given
+        timing = ServerTiming()
+
+        # When
+        timing.add("classify", 0.8124)
+        timing.add("generate", 1.0)
+        timing.add("generate", 0.5)
+
+        # Then
+        assert timing.to_header() == "classify;dur=812.4, generate;dur=1500.0"
+        assert timing.to_dict() == {"classify": 812.4, "generate": 1500.0}
+
+    @pytest.mark.asyncio
+    async def test_records_from_tasks_inside_scope(self):
+        """별도 Task(LangGraph 노드)에서 기록해도 요청의 timing에 반영"""
+        # Given
+        timing = ServerTiming()
+
+        async def node():
+            with measure_phase("image"):
+                await asyncio.sleep(0.01)
+
+        # When
+        with server_timing_scope(timing):
+            await asyncio.create_task(node())
+
+        # Then
+        assert timing.to_dict()["image"] >= 10
+        assert current_server_timing() is None
+
+    def test_record_outside_scope_is_ignored(self):
+        """요청 범위 밖 기록은 무시"""
+        record_phase("classify", 1.0)
+        assert current_server_timing() is None
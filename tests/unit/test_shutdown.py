@@ -0,0 +1,164 @@
+"""그레이스풀 종료 (드레인 / 종료 훅) 단위 테스트"""
+import asyncio
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+from app.core import health
+from app.core.adapters.image.replicate_adapter import ReplicateImageAdapter
+from app.core.adapters.llm.anthropic_adapter import AnthropicLLMAdapter
+from app.core.config import Settings
+from app.core.shutdown import ShutdownCoordinator, DrainMiddleware
+
+
+async def _slow_app(scope, receive, send):
+    """0.05초 걸리는 ASGI 앱"""
+    await asyncio.sleep(0.05)
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+class TestShutdownCoordinator:
+    """드레인 대기 / 종료 훅 실행 테스트"""
+
+    async def test_waits_for_in_flight_then_runs_hooks(self):
+        """진행 중 작업이 끝난 뒤 종료 훅을 등록 역순으로 실행"""
+        # Given
+        coordinator = ShutdownCoordinator()
+        order = []
+        coordinator.register_hook("clients", lambda: order.append("clients"))
+
+        async def persist():
+            order.append("jobs")
+        coordinator.register_hook("jobs", persist)
+
+        async def job():
+            async with coordinator.track():
+                await asyncio.sleep(0.1)
+                order.append("job done")
+        task = asyncio.create_task(job())
+        await asyncio.sleep(0)
+
+        # When
+        result = await coordinator.shutdown(grace_period=2.0)
+
+        # Then
+        await task
+        assert result["drained"] is True
+        assert order == ["job done", "jobs", "clients"]
+
+    async def test_grace_period_exceeded(self):
+        """유예 시간을 넘기면 미완료 작업을 두고 종료 훅 실행 (훅 실패는 다른 훅에 영향 없음)"""
+        # Given
+        coordinator = ShutdownCoordinator()
+        closed = []
+        coordinator.register_hook("clients", lambda: closed.append(True))
+        coordinator.register_hook("jobs", lambda: 1 / 0)
+        started = asyncio.Event()
+
+        async def stuck():
+            async with coordinator.track():
+                started.set()
+                await asyncio.sleep(10)
+        task = asyncio.create_task(stuck())
+        await started.wait()
+
+        # When
+        result = await coordinator.shutdown(grace_period=0.1)
+
+        # Then
+        assert result["drained"] is False
+        assert result["abandoned"] == 1
+        assert "ZeroDivisionError" in result["hook_errors"]["jobs"]
+        assert closed == [True]
+        task.cancel()
+
+    def test_draining_fails_readiness(self, monkeypatch):
+        """드레인 중이면 /ready 준비되지 않음"""
+        # Given
+        coordinator = ShutdownCoordinator()
+        coordinator.begin_drain()
+        monkeypatch.setattr(health, "get_shutdown_coordinator", lambda: coordinator)
+        monkeypatch.setattr(health.get_startup_report(), "ready", True)
+        monkeypatch.setattr(health, "_checks", {})
+
+        # When
+        ready, reasons = health.HealthMonitor().readiness()
+
+        # Then
+        assert ready is False
+        assert reasons == ["draining"]
+
+
+class TestDrainMiddleware:
+    """진행 중 요청 집계 / 드레인 중 거절 테스트"""
+
+    @pytest.fixture
+    def coordinator(self):
+        return ShutdownCoordinator()
+
+    @pytest.fixture
+    def client(self, coordinator):
+        app = DrainMiddleware(_slow_app, coordinator=coordinator, retry_after=3)
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    async def test_counts_in_flight(self, client, coordinator):
+        """처리 중인 요청 수 집계"""
+        # When
+        request = asyncio.create_task(client.post("/api/cooking"))
+        await asyncio.sleep(0.02)
+        during = coordinator.in_flight
+        response = await request
+
+        # Then
+        assert response.status_code == 200
+        assert during == 1
+        assert coordinator.in_flight == 0
+
+    async def test_rejects_new_requests_while_draining(self, client, coordinator):
+        """드레인 중 새 요청은 503 + Retry-After, 헬스/준비 상태 경로는 통과"""
+        # Given
+        coordinator.begin_drain()
+
+        # When
+        rejected = await client.post("/api/cooking")
+        probe = await client.get("/ready")
+
+        # Then
+        assert rejected.status_code == 503
+        assert rejected.headers["Retry-After"] == "3"
+        assert probe.status_code == 200
+
+
+class TestAdapterClients:
+    """어댑터가 소유한 HTTP 클라이언트 close 테스트"""
+
+    @pytest.fixture
+    def settings(self):
+        return Settings(anthropic_api_key="x", replicate_api_token="x", secret_key="s")
+
+    async def test_anthropic_adapter_closes_only_its_own_client(self, settings):
+        """한 어댑터를 닫아도 다른 인스턴스의 클라이언트는 그대로 사용 가능"""
+        # Given
+        first = AnthropicLLMAdapter(settings)
+        second = AnthropicLLMAdapter(settings)
+
+        # When
+        await first.aclose()
+
+        # Then
+        assert first.http_client.is_closed
+        assert not second.http_client.is_closed
+        await second.aclose()
+
+    async def test_replicate_adapter_closes_its_transport(self, settings, monkeypatch):
+        """aclose()는 어댑터가 만든 transport(연결 풀)를 닫음"""
+        # Given
+        adapter = ReplicateImageAdapter(settings)
+        close = AsyncMock()
+        monkeypatch.setattr(adapter.transport, "aclose", close)
+
+        # When
+        await adapter.aclose()
+
+        # Then
+        close.assert_awaited_once()
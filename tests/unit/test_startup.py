@@ -0,0 +1,62 @@
+"""시작 리포트 / 프롬프트 템플릿 사전 컴파일 단위 테스트"""
+import pytest
+from app.core.startup import StartupReport
+from app.core.prompt_loader import PromptLoader
+
+
+class TestStartupReport:
+    """구간별 소요 시간 기록 테스트"""
+
+    def test_phases_recorded_in_order(self):
+        """구간이 기록 순서대로 남고 준비 완료 시 총 시간 기록"""
+        # Given
+        report = StartupReport()
+
+        # When
+        report.record("imports", 0.5)
+        with report.phase("workflow"):
+            pass
+        report.mark_ready()
+
+        # Then
+        data = report.to_dict()
+        assert list(data["phases"]) == ["imports", "workflow"]
+        assert data["ready"] is True
+        assert data["total_seconds"] is not None
+        assert "imports 0.50s" in report.summary()
+
+    def test_failed_phase_recorded_and_raised(self):
+        """실패한 구간은 errors에 남기고 예외 전파 (앱 시작 실패)"""
+        report = StartupReport()
+
+        with pytest.raises(ValueError):
+            with report.phase("prompts"):
+                raise ValueError("템플릿 오류")
+
+        assert "prompts" in report.phases
+        assert report.errors["prompts"] == "ValueError: 템플릿 오류"
+        assert report.ready is False
+
+
+class TestPromptPrecompile:
+    """PromptLoader 템플릿 캐싱 테스트"""
+
+    def test_compile_all_caches_templates(self):
+        """compile_all 후에는 render가 같은 컴파일 결과를 재사용"""
+        # Given
+        loader = PromptLoader(prompts_dir="app/cooking_assistant/prompts")
+
+        # When
+        count = loader.compile_all()
+        template = loader._templates["cooking.classify_intent"]
+        loader.render("cooking.classify_intent", query="김치찌개")
+
+        # Then
+        assert count == sum(len(prompts) for prompts in loader.prompts.values())
+        assert loader._templates["cooking.classify_intent"] is template
+
+    def test_unknown_prompt_still_raises(self):
+        """없는 프롬프트는 기존과 같이 ValueError"""
+        loader = PromptLoader(prompts_dir="app/cooking_assistant/prompts")
+        with pytest.raises(ValueError):
+            loader.render("cooking.not_exists")
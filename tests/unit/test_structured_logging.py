@@ -0,0 +1,129 @@
+"""구조화 로깅 단위 테스트"""
+import io
+import json
+import logging
+import threading
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.core import structured_logging
+from app.core.structured_logging import (
+    JsonFormatter,
+    RequestIdMiddleware,
+    SamplingFilter,
+    configure_logging,
+    current_request_id,
+    shutdown_logging,
+)
+
+
+def make_record(name: str = "app.test", level: int = logging.INFO, msg: str = "hello %s", args=("world",)):
+    return logging.LogRecord(name, level, __file__, 1, msg, args, None)
+
+
+@pytest.fixture
+def restore_root_logger():
+    root = logging.getLogger()
+    handlers, level = list(root.handlers), root.level
+    yield
+    shutdown_logging()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+class TestJsonFormatter:
+    """JSON 포맷 테스트"""
+
+    def test_includes_context_and_extra(self):
+        """request_id, extra 필드, 지연 포맷팅된 메시지 포함"""
+        # Given
+        record = make_record()
+        record.request_id = "req-1"
+        record.intent = "recipe_create"
+
+        # When
+        entry = json.loads(JsonFormatter().format(record))
+
+        # Then
+        assert entry["message"] == "hello world"
+        assert entry["request_id"] == "req-1"
+        assert entry["intent"] == "recipe_create"
+        assert entry["level"] == "INFO"
+
+
+class TestSamplingFilter:
+    """로거별 샘플링 테스트"""
+
+    def test_longest_prefix_wins(self):
+        """가장 길게 일치하는 prefix의 비율 사용"""
+        sampler = SamplingFilter({"app": 1.0, "app.cooking_assistant.workflow": 0.0})
+
+        assert sampler.filter(make_record("app.cooking_assistant.workflow.nodes.base_node")) is False
+        assert sampler.filter(make_record("app.cooking_assistant.services")) is True
+        assert sampler.filter(make_record("other")) is True
+
+    def test_warnings_are_never_sampled(self):
+        """WARNING 이상은 항상 기록"""
+        sampler = SamplingFilter({"app": 0.0})
+
+        assert sampler.filter(make_record("app.x", level=logging.WARNING)) is True
+
+
+class TestQueuePipeline:
+    """QueueHandler/QueueListener 파이프라인 테스트"""
+
+    def test_formatting_happens_off_the_calling_thread(self, restore_root_logger):
+        """포맷팅은 리스너 스레드에서, request_id는 로그를 남긴 시점 값"""
+        # Given
+        stream = io.StringIO()
+        configure_logging(level="INFO", json_format=True, stream=stream)
+        format_threads = []
+
+        class Payload:
+            def __str__(self):
+                format_threads.append(threading.get_ident())
+                return "payload"
+
+        # When
+        logger = logging.getLogger("app.test.queue")
+        token = structured_logging._request_id.set("req-42")
+        try:
+            logger.info("value: %s", Payload())
+        finally:
+            structured_logging._request_id.reset(token)
+        shutdown_logging()
+
+        # Then
+        entry = json.loads(stream.getvalue().strip().splitlines()[-1])
+        assert entry["message"] == "value: payload"
+        assert entry["request_id"] == "req-42"
+        assert format_threads and format_threads[0] != threading.get_ident()
+
+
+class TestRequestIdMiddleware:
+    """요청 ID 미들웨어 테스트"""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        app.add_middleware(RequestIdMiddleware)
+
+        @app.get("/id")
+        async def read_id():
+            return {"request_id": current_request_id()}
+
+        return TestClient(app)
+
+    def test_generates_request_id(self, client):
+        """헤더가 없으면 생성하여 contextvar/응답 헤더에 설정"""
+        response = client.get("/id")
+
+        assert response.json()["request_id"] == response.headers["X-Request-ID"]
+        assert len(response.headers["X-Request-ID"]) == 32
+
+    def test_propagates_client_request_id(self, client):
+        """클라이언트가 보낸 X-Request-ID를 그대로 사용"""
+        response = client.get("/id", headers={"X-Request-ID": "client-abc"})
+
+        assert response.json()["request_id"] == "client-abc"
+        assert response.headers["X-Request-ID"] == "client-abc"
@@ -0,0 +1,47 @@
+"""AdaptiveTimeoutPolicy 단위 테스트
+
+관측 지연 시간(p99 × factor) 기반 타임아웃 계산과 설정 override를 검증합니다.
+"""
+from app.core.latency import LatencyTracker
+from app.core.timeouts import AdaptiveTimeoutPolicy
+
+
+class TestAdaptiveTimeoutPolicy:
+    """적응형 타임아웃 테스트"""
+
+    def make_policy(self, **overrides) -> AdaptiveTimeoutPolicy:
+        tracker = LatencyTracker(window_size=100)
+        for _ in range(20):
+            tracker.record("classify_intent:cooking.classify_intent", 1.0)
+            tracker.record("generate_recipe:cooking.generate_recipe_multiple", 40.0)
+        return AdaptiveTimeoutPolicy(
+            tracker, default=90.0, factor=3.0, min_timeout=5.0, min_samples=20, **overrides
+        )
+
+    def test_uses_default_without_samples(self):
+        """샘플이 부족하면 기본 타임아웃"""
+        policy = self.make_policy()
+        assert policy.timeout_for("answer_question", "answer_question:cooking.answer_question") == 90.0
+
+    def test_derives_from_percentile_and_clamps(self):
+        """p99 × factor, [min, default]로 제한"""
+        policy = self.make_policy()
+
+        # 1초 × 3 = 3초 → 최소 5초
+        assert policy.timeout_for("classify_intent", "classify_intent:cooking.classify_intent") == 5.0
+        # 40초 × 3 = 120초 → 상한 90초
+        assert policy.timeout_for(
+            "generate_recipe", "generate_recipe:cooking.generate_recipe_multiple"
+        ) == 90.0
+
+    def test_overrides_take_precedence(self):
+        """설정 override 우선 (prompt 키 > method 키)"""
+        policy = self.make_policy(overrides={
+            "classify_intent": 10.0,
+            "generate_recipe:cooking.generate_recipe_multiple": 60.0
+        })
+
+        assert policy.timeout_for("classify_intent", "classify_intent:cooking.classify_intent") == 10.0
+        assert policy.timeout_for(
+            "generate_recipe", "generate_recipe:cooking.generate_recipe_multiple"
+        ) == 60.0
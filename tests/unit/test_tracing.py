@@ -0,0 +1,146 @@
+"""트레이싱 단위 테스트
+
+span 부모-자식 관계(asyncio Task 포함), 예외 기록, traceparent 전파,
+어댑터 호출 span 속성을 검증합니다.
+"""
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock
+from app.core.tracing import (
+    TracerProvider,
+    InMemorySpanExporter,
+    JsonLinesSpanExporter,
+    SpanContext,
+    get_current_span,
+    parse_traceparent,
+    get_memory_exporter,
+)
+from app.core.adapters.llm.guarded_adapter import GuardedLLMAdapter
+from app.core.config import Settings
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer(exporter):
+    return TracerProvider(exporters=[exporter]).get_tracer("test")
+
+
+class TestSpanTree:
+    """span 트리 구성 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_children_share_trace_across_tasks(self, tracer, exporter):
+        """Task로 실행한 하위 작업도 같은 trace의 자식 span"""
+        # Given
+        async def child(name):
+            with tracer.start_as_current_span(name):
+                await asyncio.sleep(0)
+
+        # When
+        with tracer.start_as_current_span("root") as root:
+            await asyncio.gather(child("a"), asyncio.create_task(child("b")))
+
+        # Then
+        spans = {span.name: span for span in exporter.get_finished_spans()}
+        assert spans["a"].parent_id == root.context.span_id
+        assert spans["b"].parent_id == root.context.span_id
+        assert {s.context.trace_id for s in spans.values()} == {root.context.trace_id}
+        assert get_current_span().is_recording() is False
+
+    def test_exception_marks_span_error(self, tracer, exporter):
+        """예외는 span에 기록하고 그대로 전파"""
+        with pytest.raises(ValueError):
+            with tracer.start_as_current_span("failing"):
+                raise ValueError("boom")
+
+        span = exporter.get_finished_spans()[0]
+        assert span.status == "ERROR"
+        assert span.events[0]["attributes"]["exception.type"] == "ValueError"
+
+    def test_disabled_provider_records_nothing(self, exporter):
+        """비활성화 시 no-op span"""
+        tracer = TracerProvider(exporters=[exporter], enabled=False).get_tracer("test")
+
+        with tracer.start_as_current_span("noop") as span:
+            span.set_attribute("ignored", True)
+
+        assert exporter.get_finished_spans() == []
+
+    def test_jsonl_exporter_writes_in_background(self, tmp_path):
+        """JSONL exporter는 큐에 넣기만 하고, shutdown 시 남은 span을 모두 기록"""
+        # Given
+        path = tmp_path / "spans.jsonl"
+        jsonl = JsonLinesSpanExporter(str(path))
+        tracer = TracerProvider(exporters=[jsonl]).get_tracer("test")
+
+        # When
+        for name in ("first", "second"):
+            with tracer.start_as_current_span(name):
+                pass
+        jsonl.shutdown()
+
+        # Then
+        lines = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+        assert [line["name"] for line in lines] == ["first", "second"]
+
+
+class TestTraceparent:
+    """W3C traceparent 전파 테스트"""
+
+    def test_parse_and_continue_remote_trace(self, tracer, exporter):
+        """헤더의 trace_id를 이어서 사용"""
+        # Given
+        header = "00-4bf92f3577b34da6a3ce929d0e0e4736-00f067aa0ba902b7-01"
+
+        # When
+        with tracer.start_as_current_span("request", parent=parse_traceparent(header)):
+            pass
+
+        # Then
+        span = exporter.get_finished_spans()[0]
+        assert span.context.trace_id == "4bf92f3577b34da6a3ce929d0e0e4736"
+        assert span.parent_id == "00f067aa0ba902b7"
+
+    def test_invalid_header_is_ignored(self):
+        """형식이 틀린 헤더는 무시"""
+        assert parse_traceparent("garbage") is None
+        assert parse_traceparent(None) is None
+
+    def test_unsampled_parent_is_not_recorded(self, tracer, exporter):
+        """부모가 샘플링되지 않았으면 기록하지 않음"""
+        parent = SpanContext("4bf92f3577b34da6a3ce929d0e0e4736", "00f067aa0ba902b7", sampled=False)
+
+        with tracer.start_as_current_span("request", parent=parent):
+            pass
+
+        assert exporter.get_finished_spans() == []
+
+
+class TestAdapterSpan:
+    """어댑터 호출 span 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_guarded_call_creates_span(self):
+        """보호 계층 호출마다 upstream.method span 생성"""
+        # Given
+        settings = Settings(anthropic_api_key="test", replicate_api_token="test", secret_key="test")
+        inner = AsyncMock()
+        inner.classify_intent.return_value = {"primary_intent": "recipe_create"}
+        adapter = GuardedLLMAdapter(inner, settings, upstream="test-tracing")
+        get_memory_exporter().clear()
+
+        # When
+        await adapter.classify_intent("prompt")
+
+        # Then
+        span = next(
+            s for s in get_memory_exporter().get_finished_spans()
+            if s.name == "test-tracing.classify_intent"
+        )
+        assert span.attributes["outcome"] == "success"
+        assert span.attributes["circuit.state"] == "closed"
@@ -0,0 +1,112 @@
+"""토큰 사용량 집계 단위 테스트"""
+import pytest
+from app.core.prompt_loader import PromptLoader
+from app.core.usage import (
+    TokenUsage,
+    UsageLedger,
+    UsageAggregator,
+    usage_scope,
+    usage_intent_scope,
+    record_token_usage,
+)
+
+
+class TestTokenUsage:
+    """usage_metadata 변환 및 비용 계산 테스트"""
+
+    def test_from_usage_metadata(self):
+        """LangChain usage_metadata에서 캐시 토큰까지 추출"""
+        # Given
+        metadata = {
+            "input_tokens": 1200,
+            "output_tokens": 300,
+            "total_tokens": 1500,
+            "input_token_details": {"cache_read": 1000, "cache_creation": 0}
+        }
+
+        # When
+        usage = TokenUsage.from_usage_metadata(metadata)
+
+        # Then
+        assert usage.input_tokens == 1200
+        assert usage.output_tokens == 300
+        assert usage.cache_read_tokens == 1000
+        assert usage.calls == 1
+
+    def test_missing_metadata_counts_call_only(self):
+        """usage 메타데이터가 없으면 호출 수만 기록"""
+        usage = TokenUsage.from_usage_metadata(None)
+        assert usage.total_tokens == 0
+        assert usage.calls == 1
+
+    def test_cost_uses_cache_price_for_cached_tokens(self):
+        """캐시 적중 토큰은 cache_read 단가로 계산"""
+        # Given
+        usage = TokenUsage(input_tokens=1_000_000, output_tokens=0, cache_read_tokens=500_000)
+        prices = {"input": 3.0, "output": 15.0, "cache_read": 0.3}
+
+        # Then: 50만 × $3 + 50만 × $0.3
+        assert usage.cost(prices) == pytest.approx(1.65)
+
+
+class TestRecordTokenUsage:
+    """요청 장부 / 사용자 집계 테스트"""
+
+    def test_records_by_prompt_and_intent(self):
+        """렌더링된 prompt_id와 노드 intent 기준으로 장부에 기록"""
+        # Given
+        ledger = UsageLedger()
+        loader = PromptLoader(prompts_dir="app/cooking_assistant/prompts")
+
+        # When
+        with usage_scope(ledger):
+            with usage_intent_scope("intent_classification"):
+                loader.render("cooking.classify_intent", query="김치찌개 만드는 법")
+                record_token_usage("anthropic", TokenUsage(input_tokens=100, output_tokens=10, calls=1))
+            with usage_intent_scope("recipe_create"):
+                loader.render("cooking.image_prompt", dish_name="김치찌개")
+                record_token_usage("anthropic", TokenUsage(input_tokens=200, output_tokens=800, calls=1))
+
+        # Then
+        assert ledger.total.input_tokens == 300
+        assert ledger.total.output_tokens == 810
+        assert ledger.by_prompt["cooking.image_prompt"].output_tokens == 800
+        assert ledger.by_intent["intent_classification"].input_tokens == 100
+
+        data = ledger.to_dict({"input": 3.0, "output": 15.0})
+        assert data["calls"] == 2
+        assert data["estimated_cost_usd"] > 0
+
+    def test_outside_scope_does_not_fail(self):
+        """요청 장부가 없어도 기록은 메트릭에만 반영"""
+        record_token_usage("anthropic", TokenUsage(input_tokens=1, calls=1))
+
+    def test_aggregates_per_user(self):
+        """사용자별 누적 (익명 포함)"""
+        # Given
+        aggregator = UsageAggregator()
+
+        # When
+        aggregator.record("user-1", TokenUsage(input_tokens=10, calls=1))
+        aggregator.record("user-1", TokenUsage(input_tokens=5, calls=1))
+        aggregator.record(None, TokenUsage(output_tokens=7, calls=1))
+
+        # Then
+        assert aggregator.get("user-1").input_tokens == 15
+        assert aggregator.get(None).output_tokens == 7
+        assert set(aggregator.snapshot()) == {"user-1", "anonymous"}
+
+    def test_per_user_totals_are_bounded(self):
+        """최근 사용한 max_users명만 보관 (가장 오래 안 쓴 사용자부터 제거)"""
+        # Given
+        aggregator = UsageAggregator(max_users=2)
+
+        # When
+        aggregator.record("user-1", TokenUsage(input_tokens=1, calls=1))
+        aggregator.record("user-2", TokenUsage(input_tokens=1, calls=1))
+        aggregator.record("user-1", TokenUsage(input_tokens=1, calls=1))  # user-1 최근 사용
+        aggregator.record("user-3", TokenUsage(input_tokens=1, calls=1))  # user-2 제거
+
+        # Then
+        assert set(aggregator.snapshot()) == {"user-1", "user-3"}
+        assert aggregator.get("user-1").input_tokens == 2